@@ -28,6 +28,8 @@ if config.config_file_name is not None:
 from app.models import (  # noqa: E402, F401
     Schedule,
     ScheduleException,
+    ScheduleOccurrence,
+    ScheduleOccurrenceCoverage,
     TimerSession,
     TagGroup,
     Tag,
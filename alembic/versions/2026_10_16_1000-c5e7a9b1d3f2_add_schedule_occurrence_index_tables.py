@@ -0,0 +1,90 @@
+"""add_schedule_occurrence_index_tables
+
+Revision ID: c5e7a9b1d3f2
+Revises: b9e4d2a1c3f5
+Create Date: 2026-10-16 10:00:00.000000+09:00
+
+반복 일정 인스턴스 인덱스 (선택 기능, SCHEDULE_OCCURRENCE_INDEX_ENABLED).
+- schedule_occurrence: 미리 확장한 (owner_id, parent_id, instance_start, instance_end)
+- schedule_occurrence_coverage: 일정별로 인덱스가 채워진 기간
+기능을 켜면 백그라운드 태스크가 기존 반복 일정의 인덱스를 채우므로 데이터 이관은 없다.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e7a9b1d3f2'
+down_revision: Union[str, None] = 'b9e4d2a1c3f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = inspector.get_table_names()
+
+    if 'schedule_occurrence' not in tables:
+        op.create_table(
+            'schedule_occurrence',
+            sa.Column('parent_id', sa.Uuid(), nullable=False),
+            sa.Column('instance_start', sa.DateTime(), nullable=False),
+            sa.Column('instance_end', sa.DateTime(), nullable=False),
+            sa.Column('owner_id', sa.String(), nullable=False),
+            sa.Column('is_deleted', sa.Boolean(), nullable=False),
+            sa.ForeignKeyConstraint(['parent_id'], ['schedule.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('parent_id', 'instance_start'),
+        )
+        op.create_index(
+            'ix_schedule_occurrence_owner_range',
+            'schedule_occurrence',
+            ['owner_id', 'instance_start', 'instance_end'],
+            unique=False,
+        )
+
+    if 'schedule_occurrence_coverage' not in tables:
+        op.create_table(
+            'schedule_occurrence_coverage',
+            sa.Column('parent_id', sa.Uuid(), nullable=False),
+            sa.Column('owner_id', sa.String(), nullable=False),
+            sa.Column('covered_from', sa.DateTime(), nullable=False),
+            sa.Column('covered_until', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['parent_id'], ['schedule.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('parent_id'),
+        )
+        op.create_index(
+            op.f('ix_schedule_occurrence_coverage_owner_id'),
+            'schedule_occurrence_coverage',
+            ['owner_id'],
+            unique=False,
+        )
+        op.create_index(
+            op.f('ix_schedule_occurrence_coverage_covered_until'),
+            'schedule_occurrence_coverage',
+            ['covered_until'],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = inspector.get_table_names()
+
+    if 'schedule_occurrence_coverage' in tables:
+        op.drop_index(
+            op.f('ix_schedule_occurrence_coverage_covered_until'),
+            table_name='schedule_occurrence_coverage',
+        )
+        op.drop_index(
+            op.f('ix_schedule_occurrence_coverage_owner_id'),
+            table_name='schedule_occurrence_coverage',
+        )
+        op.drop_table('schedule_occurrence_coverage')
+
+    if 'schedule_occurrence' in tables:
+        op.drop_index('ix_schedule_occurrence_owner_range', table_name='schedule_occurrence')
+        op.drop_table('schedule_occurrence')
@@ -0,0 +1,82 @@
+"""add_composite_query_indexes
+
+Revision ID: d6f8b0c2e4a1
+Revises: c5e7a9b1d3f2
+Create Date: 2026-10-16 11:00:00.000000+09:00
+
+자주 쓰는 조회 형태에 맞춘 복합/부분 인덱스.
+- schedule (owner_id, start_time, end_time): 날짜 범위 조회
+- schedule (owner_id, start_time) WHERE recurrence_rule IS NOT NULL: 반복 일정(원본) 조회
+- scheduleexception (owner_id, parent_id, exception_date): 인스턴스별 예외 조회
+- scheduleexception (parent_id, exception_date) WHERE is_deleted: 전체 인스턴스 삭제 여부 확인
+- timersession (owner_id, status, started_at): 상태/시작 시간 필터 조회
+- friendship (requester_id, status): 보낸 친구 요청 조회
+벤치마크: python -m benchmarks.query_indexes
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy import inspect
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6f8b0c2e4a1'
+down_revision: Union[str, None] = 'c5e7a9b1d3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (인덱스 이름, 테이블, 컬럼, sqlite 부분 조건, postgresql 부분 조건)
+INDEXES = [
+    ('ix_schedule_owner_range', 'schedule', ['owner_id', 'start_time', 'end_time'], None, None),
+    (
+        'ix_schedule_owner_recurring', 'schedule', ['owner_id', 'start_time'],
+        'recurrence_rule IS NOT NULL', 'recurrence_rule IS NOT NULL',
+    ),
+    (
+        'ix_scheduleexception_owner_parent_date', 'scheduleexception',
+        ['owner_id', 'parent_id', 'exception_date'], None, None,
+    ),
+    (
+        'ix_scheduleexception_parent_deleted', 'scheduleexception', ['parent_id', 'exception_date'],
+        'is_deleted IS 1', 'is_deleted IS true',
+    ),
+    (
+        'ix_timersession_owner_status_started', 'timersession',
+        ['owner_id', 'status', 'started_at'], None, None,
+    ),
+    ('ix_friendship_requester_status', 'friendship', ['requester_id', 'status'], None, None),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = inspector.get_table_names()
+
+    for name, table, columns, sqlite_where, postgresql_where in INDEXES:
+        if table not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if name in existing:
+            continue
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            sqlite_where=sa.text(sqlite_where) if sqlite_where else None,
+            postgresql_where=sa.text(postgresql_where) if postgresql_where else None,
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = inspect(bind)
+    tables = inspector.get_table_names()
+
+    for name, table, _, _, _ in reversed(INDEXES):
+        if table not in tables:
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if name in existing:
+            op.drop_index(name, table_name=table)
@@ -11,7 +11,7 @@ from fastapi.responses import JSONResponse
 from sqlmodel import Session
 
 from app.core.auth import CurrentUser, get_current_user
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.friend.exceptions import FriendCodeNotFoundError
 from app.domain.friend.schema.dto import (
     FriendRequest,
@@ -32,8 +32,8 @@ router = APIRouter(prefix="/friends", tags=["Friends"])
 # ============================================================
 
 @router.get("", response_model=List[FriendRead])
-async def list_friends(
-        session: Session = Depends(get_db_transactional),
+def list_friends(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -46,8 +46,8 @@ async def list_friends(
 
 
 @router.get("/ids", response_model=List[str])
-async def list_friend_ids(
-        session: Session = Depends(get_db_transactional),
+def list_friend_ids(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -64,8 +64,8 @@ async def list_friend_ids(
 # ============================================================
 
 @router.get("/requests/received", response_model=List[PendingRequestRead])
-async def list_received_requests(
-        session: Session = Depends(get_db_transactional),
+def list_received_requests(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -78,8 +78,8 @@ async def list_received_requests(
 
 
 @router.get("/requests/sent", response_model=List[PendingRequestRead])
-async def list_sent_requests(
-        session: Session = Depends(get_db_transactional),
+def list_sent_requests(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -100,7 +100,7 @@ async def list_sent_requests(
         404: {"description": "Friend code not found"},
     },
 )
-async def send_friend_request(
+def send_friend_request(
         data: FriendRequest,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -134,7 +134,7 @@ async def send_friend_request(
 
 
 @router.post("/requests/{friendship_id}/accept", response_model=FriendshipRead)
-async def accept_friend_request(
+def accept_friend_request(
         friendship_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -151,7 +151,7 @@ async def accept_friend_request(
 
 
 @router.post("/requests/{friendship_id}/reject", status_code=status.HTTP_200_OK)
-async def reject_friend_request(
+def reject_friend_request(
         friendship_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -168,7 +168,7 @@ async def reject_friend_request(
 
 
 @router.delete("/requests/{friendship_id}", status_code=status.HTTP_200_OK)
-async def cancel_friend_request(
+def cancel_friend_request(
         friendship_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -189,7 +189,7 @@ async def cancel_friend_request(
 # ============================================================
 
 @router.delete("/{friendship_id}", status_code=status.HTTP_200_OK)
-async def remove_friend(
+def remove_friend(
         friendship_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -206,9 +206,9 @@ async def remove_friend(
 
 
 @router.get("/check/{user_id}", response_model=bool)
-async def check_friendship(
+def check_friendship(
         user_id: str,
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -225,7 +225,7 @@ async def check_friendship(
 # ============================================================
 
 @router.post("/block/{user_id}", response_model=FriendshipRead)
-async def block_user(
+def block_user(
         user_id: str,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -242,7 +242,7 @@ async def block_user(
 
 
 @router.delete("/block/{user_id}", status_code=status.HTTP_200_OK)
-async def unblock_user(
+def unblock_user(
         user_id: str,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
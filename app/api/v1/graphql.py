@@ -7,15 +7,15 @@ GraphQL Router
 - 최신 Strawberry 패턴 적용 (2025 기준)
 - OIDC 인증 통합
 """
+import functools
 from typing import Any, Coroutine
 
 from fastapi import HTTPException, Request
-from sqlmodel import Session
 from strawberry.fastapi import GraphQLRouter
 
 from app.core.auth import CurrentUser, oidc_client
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import read_only_session, read_your_writes_requested
 from app.domain.schedule.schema.query import schema
 
 
@@ -23,23 +23,20 @@ async def get_context(request: Request) -> dict:
     """
     GraphQL 컨텍스트 생성 (인증 포함)
     
-    Bug Fix: Generator 패턴을 사용하여 세션 생명주기 안전하게 관리
-    - get_db()의 Generator를 사용하여 세션 생성 (읽기 전용, commit 불필요)
-    - GraphQL resolver에서 try-finally를 통해 cleanup 보장
-    - 요청 종료 시 자동으로 세션 정리됨
+    세션은 여기서 열지 않고 세션 팩토리만 전달합니다.
+    - resolver가 스레드풀에서 read_only_session()을 열고 조회 후 정리 (읽기 전용, commit 불필요)
+    - 이벤트 루프에서 커넥션 풀 대기나 SET TRANSACTION 왕복이 일어나지 않음
+    - 인증 실패 요청은 세션을 열지 않음
+    - 스키마가 Query 전용이므로 POST 요청도 replica 조회 (read-your-writes 헤더가 있으면 primary)
     
     인증:
     - Authorization 헤더에서 Bearer 토큰 추출
     - OIDC Provider를 통해 JWT 검증
     - CurrentUser 객체를 컨텍스트에 추가
-    
-    주의: Strawberry는 context를 자동으로 cleanup하지 않으므로
-    GraphQL resolver에서 try-finally를 통해 cleanup을 보장해야 합니다.
     """
-    # Generator를 사용하여 세션 생성
-    # get_db()는 읽기 전용 세션 (commit 불필요)
-    session_gen = get_db()
-    session: Session = next(session_gen)
+    session_factory = functools.partial(
+        read_only_session, use_replica=not read_your_writes_requested(request)
+    )
 
     # 인증 처리
     current_user: CurrentUser | None = None
@@ -72,9 +69,8 @@ async def get_context(request: Request) -> dict:
 
     return {
         "request": request,
-        "session": session,
+        "session_factory": session_factory,  # resolver가 스레드풀에서 세션 생성
         "current_user": current_user,
-        "_session_gen": session_gen,  # 정리를 위한 Generator 참조
     }
 
 
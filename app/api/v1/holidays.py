@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
 
 from app.db.session import get_db
@@ -74,8 +75,8 @@ async def get_holidays(
         # 자동 동기화 포함 조회 (async)
         holidays = await read_service.get_holidays_with_auto_sync(s, e)
     else:
-        # 단순 조회 (sync)
-        holidays = read_service.get_holidays(s, e)
+        # 단순 조회 (sync, 스레드풀에서 실행)
+        holidays = await run_in_threadpool(read_service.get_holidays, s, e)
 
     if not holidays:
         raise HolidayDataNotAvailable(
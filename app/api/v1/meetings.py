@@ -10,7 +10,8 @@ from fastapi import APIRouter, Depends, Query, status
 from sqlmodel import Session
 
 from app.core.auth import CurrentUser, get_current_user, get_optional_current_user
-from app.db.session import get_db_transactional
+from app.core.error_handlers import AuthenticationRequiredError
+from app.db.session import get_db, get_db_transactional
 from app.domain.dateutil.service import parse_timezone
 from app.domain.meeting.result_service import MeetingResultService
 from app.domain.meeting.schema.dto import (
@@ -30,7 +31,7 @@ router = APIRouter(prefix="/meetings", tags=["Meetings"])
 
 
 @router.post("", response_model=MeetingRead, status_code=status.HTTP_201_CREATED)
-async def create_meeting(
+def create_meeting(
         data: MeetingCreate,
         tz: Optional[str] = Query(
             None,
@@ -55,13 +56,13 @@ async def create_meeting(
 
 
 @router.get("", response_model=List[MeetingRead])
-async def read_meetings(
+def read_meetings(
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -78,14 +79,14 @@ async def read_meetings(
 
 
 @router.get("/{meeting_id}", response_model=MeetingRead)
-async def read_meeting(
+def read_meeting(
         meeting_id: UUID,
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
 ):
     """
@@ -115,7 +116,7 @@ async def read_meeting(
 
 
 @router.patch("/{meeting_id}", response_model=MeetingRead)
-async def update_meeting(
+def update_meeting(
         meeting_id: UUID,
         data: MeetingUpdate,
         tz: Optional[str] = Query(
@@ -141,7 +142,7 @@ async def update_meeting(
 
 
 @router.delete("/{meeting_id}", status_code=status.HTTP_200_OK)
-async def delete_meeting(
+def delete_meeting(
         meeting_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -157,7 +158,7 @@ async def delete_meeting(
 
 
 @router.post("/{meeting_id}/participate", response_model=ParticipantRead, status_code=status.HTTP_201_CREATED)
-async def create_participant(
+def create_participant(
         meeting_id: UUID,
         data: ParticipantCreate,
         tz: Optional[str] = Query(
@@ -183,7 +184,7 @@ async def create_participant(
 
 
 @router.put("/{meeting_id}/availability", response_model=List[TimeSlotRead])
-async def set_availability(
+def set_availability(
         meeting_id: UUID,
         participant_id: UUID = Query(..., description="참여자 ID"),
         time_slots: List[TimeSlotCreate] = ...,
@@ -206,14 +207,14 @@ async def set_availability(
 
 
 @router.get("/{meeting_id}/availability", response_model=List[AvailabilityRead])
-async def get_availability(
+def get_availability(
         meeting_id: UUID,
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
 ):
     """
@@ -222,8 +223,7 @@ async def get_availability(
     인증 선택적: 접근 권한이 있는 경우 조회 가능합니다.
     """
     if not current_user:
-        from app.core.auth import get_current_user as require_auth
-        current_user = await require_auth(None, None)
+        raise AuthenticationRequiredError()
 
     result_service = MeetingResultService(session, current_user)
     availability = result_service.get_availability(meeting_id)
@@ -247,14 +247,14 @@ async def get_availability(
 
 
 @router.get("/{meeting_id}/result", response_model=MeetingResultRead)
-async def get_meeting_result(
+def get_meeting_result(
         meeting_id: UUID,
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: Optional[CurrentUser] = Depends(get_optional_current_user),
 ):
     """
@@ -264,8 +264,7 @@ async def get_meeting_result(
     모든 참여자의 시간 선택을 집계하여 겹치는 시간대와 인원 수를 계산합니다.
     """
     if not current_user:
-        from app.core.auth import get_current_user as require_auth
-        current_user = await require_auth(None, None)
+        raise AuthenticationRequiredError()
 
     result_service = MeetingResultService(session, current_user)
     result = result_service.get_meeting_result(meeting_id)
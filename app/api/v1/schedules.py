@@ -2,7 +2,7 @@
 Schedule Router
 
 FastAPI Best Practices:
-- 모든 라우트는 async
+- DB를 쓰는 라우트는 def (FastAPI가 스레드풀에서 실행)
 - Dependencies를 활용한 검증
 - Service는 session을 받아서 CRUD 직접 사용
 """
@@ -15,7 +15,7 @@ from sqlmodel import Session
 
 from app.core.auth import CurrentUser, get_current_user
 from app.core.constants import ResourceScope
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.dateutil.service import parse_timezone
 from app.domain.schedule.schema.dto import (
     ScheduleCreate,
@@ -30,7 +30,7 @@ router = APIRouter(prefix="/schedules", tags=["Schedules"])
 
 
 @router.post("", response_model=ScheduleRead, status_code=status.HTTP_201_CREATED)
-async def create_schedule(
+def create_schedule(
         data: ScheduleCreate,
         tz: Optional[str] = Query(
             None,
@@ -44,7 +44,7 @@ async def create_schedule(
     새 일정 생성
     
     FastAPI Best Practices:
-    - async 라우트 사용
+    - def 라우트 사용 (동기 DB 작업은 스레드풀에서 실행)
     - 트랜잭션 자동 관리 (context manager)
     - Exception Handler가 예외 처리
     """
@@ -60,7 +60,7 @@ async def create_schedule(
 
 
 @router.get("", response_model=list[ScheduleRead])
-async def read_schedules(
+def read_schedules(
         start_date: datetime = Query(
             ...,
             description="조회 시작 날짜/시간 (ISO 8601 형식)"
@@ -86,7 +86,7 @@ async def read_schedules(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -102,13 +102,13 @@ async def read_schedules(
     - end_date: 조회 종료 날짜/시간 (필수)
     - 지정된 날짜 범위와 겹치는 모든 일정을 반환 (반복 일정은 가상 인스턴스로 확장)
     
-    태그 필터링:
+    태그 필터링 (공유된 일정에도 적용):
     - tag_ids: AND 방식 (모든 지정 태그를 포함한 일정만 반환)
     - group_ids: 해당 그룹의 태그 중 하나라도 있는 일정 반환
     - 둘 다 지정 시: 그룹 필터링 후 태그 필터링 적용
     
     FastAPI Best Practices:
-    - async 라우트 사용
+    - def 라우트 사용 (동기 DB 작업은 스레드풀에서 실행)
     """
     service = ScheduleService(session, current_user)
     tz_obj = parse_timezone(tz) if tz else None
@@ -128,29 +128,29 @@ async def read_schedules(
 
     # 공유된 일정 조회 (scope=shared 또는 scope=all)
     if scope in (ResourceScope.SHARED, ResourceScope.ALL):
-        from app.domain.dateutil.service import ensure_utc_naive
-        start_date_naive = ensure_utc_naive(start_date)
-        end_date_naive = ensure_utc_naive(end_date)
-
-        shared_schedules = service.get_shared_schedules()
-        for schedule in shared_schedules:
-            # 날짜 범위 필터링 (shared에도 적용)
-            if schedule.start_time <= end_date_naive and schedule.end_time >= start_date_naive:
-                schedule_read = service.to_read_dto(schedule, is_shared=True)
-                result.append(schedule_read.to_timezone(tz_obj))
+        # 날짜 범위/태그 필터는 SQL에서 적용, 반복 일정은 가상 인스턴스로 확장
+        # 접근권한 레벨은 후보 조회 쿼리의 결과를 원본 일정 ID로 매핑해 재사용
+        shared_reads = service.get_shared_schedule_reads_by_date_range(
+            start_date=start_date,
+            end_date=end_date,
+            tag_ids=tag_ids,
+            group_ids=group_ids,
+        )
+        for schedule_read in shared_reads:
+            result.append(schedule_read.to_timezone(tz_obj))
 
     return result
 
 
 @router.get("/{schedule_id}", response_model=ScheduleRead)
-async def read_schedule(
+def read_schedule(
         schedule_id: UUID,
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -171,7 +171,7 @@ async def read_schedule(
 
 
 @router.patch("/{schedule_id}", response_model=ScheduleRead)
-async def update_schedule(
+def update_schedule(
         schedule_id: UUID,
         data: ScheduleUpdate,
         instance_start: datetime | None = Query(None, description="반복 일정 인스턴스 시작 시간 (ISO 8601 형식)"),
@@ -216,7 +216,7 @@ async def update_schedule(
 
 
 @router.delete("/{schedule_id}", status_code=status.HTTP_200_OK)
-async def delete_schedule(
+def delete_schedule(
         schedule_id: UUID,
         instance_start: datetime | None = Query(None, description="반복 일정 인스턴스 시작 시간 (ISO 8601 형식)"),
         session: Session = Depends(get_db_transactional),
@@ -243,7 +243,7 @@ async def delete_schedule(
 
 
 @router.get("/{schedule_id}/timers", response_model=list[TimerRead])
-async def get_schedule_timers(
+def get_schedule_timers(
         schedule_id: UUID,
         include_schedule: bool = Query(
             False,
@@ -254,7 +254,7 @@ async def get_schedule_timers(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -286,7 +286,7 @@ async def get_schedule_timers(
 
 
 @router.get("/{schedule_id}/timers/active", response_model=TimerRead)
-async def get_active_timer(
+def get_active_timer(
         schedule_id: UUID,
         include_schedule: bool = Query(
             False,
@@ -297,7 +297,7 @@ async def get_active_timer(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -335,7 +335,7 @@ async def get_active_timer(
 
 
 @router.post("/{schedule_id}/todo", status_code=status.HTTP_201_CREATED)
-async def create_todo_from_schedule(
+def create_todo_from_schedule(
         schedule_id: UUID,
         tag_group_id: UUID = Query(
             ...,
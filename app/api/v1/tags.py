@@ -2,7 +2,7 @@
 Tag Router
 
 FastAPI Best Practices:
-- 모든 라우트는 async
+- DB를 쓰는 라우트는 def (FastAPI가 스레드풀에서 실행)
 - Service는 session을 받아서 CRUD 직접 사용
 
 Note: Schedule-Tag 관계는 Schedule 생성/수정 시 tag_ids 필드로 처리됩니다.
@@ -15,7 +15,7 @@ from fastapi import APIRouter, Depends, status
 from sqlmodel import Session
 
 from app.core.auth import CurrentUser, get_current_user
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.tag.schema.dto import (
     TagGroupCreate,
     TagGroupRead,
@@ -35,7 +35,7 @@ router = APIRouter(prefix="/tags", tags=["Tags"])
 # ============================================================
 
 @router.post("/groups", response_model=TagGroupRead, status_code=status.HTTP_201_CREATED)
-async def create_tag_group(
+def create_tag_group(
         data: TagGroupCreate,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -46,8 +46,8 @@ async def create_tag_group(
 
 
 @router.get("/groups", response_model=List[TagGroupReadWithTags])
-async def read_tag_groups(
-        session: Session = Depends(get_db_transactional),
+def read_tag_groups(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """모든 태그 그룹 조회 (태그 포함)"""
@@ -56,9 +56,9 @@ async def read_tag_groups(
 
 
 @router.get("/groups/{group_id}", response_model=TagGroupReadWithTags)
-async def read_tag_group(
+def read_tag_group(
         group_id: UUID,
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """태그 그룹 조회 (태그 포함)"""
@@ -67,7 +67,7 @@ async def read_tag_group(
 
 
 @router.patch("/groups/{group_id}", response_model=TagGroupRead)
-async def update_tag_group(
+def update_tag_group(
         group_id: UUID,
         data: TagGroupUpdate,
         session: Session = Depends(get_db_transactional),
@@ -79,7 +79,7 @@ async def update_tag_group(
 
 
 @router.delete("/groups/{group_id}", status_code=status.HTTP_200_OK)
-async def delete_tag_group(
+def delete_tag_group(
         group_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -95,7 +95,7 @@ async def delete_tag_group(
 # ============================================================
 
 @router.post("", response_model=TagRead, status_code=status.HTTP_201_CREATED)
-async def create_tag(
+def create_tag(
         data: TagCreate,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -106,8 +106,8 @@ async def create_tag(
 
 
 @router.get("", response_model=List[TagRead])
-async def read_tags(
-        session: Session = Depends(get_db_transactional),
+def read_tags(
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """모든 태그 조회"""
@@ -116,9 +116,9 @@ async def read_tags(
 
 
 @router.get("/{tag_id}", response_model=TagRead)
-async def read_tag(
+def read_tag(
         tag_id: UUID,
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """태그 조회"""
@@ -127,7 +127,7 @@ async def read_tag(
 
 
 @router.patch("/{tag_id}", response_model=TagRead)
-async def update_tag(
+def update_tag(
         tag_id: UUID,
         data: TagUpdate,
         session: Session = Depends(get_db_transactional),
@@ -139,7 +139,7 @@ async def update_tag(
 
 
 @router.delete("/{tag_id}", status_code=status.HTTP_200_OK)
-async def delete_tag(
+def delete_tag(
         tag_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
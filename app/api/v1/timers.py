@@ -2,7 +2,7 @@
 Timer Router
 
 FastAPI Best Practices:
-- 모든 라우트는 async
+- DB를 쓰는 라우트는 def (FastAPI가 스레드풀에서 실행)
 - Dependencies를 활용한 검증
 - Service는 session을 받아서 CRUD 직접 사용
 
@@ -30,7 +30,7 @@ from sqlmodel import Session
 from app.core.auth import CurrentUser, get_current_user
 from app.core.constants import TagIncludeMode, ResourceScope
 from app.crud import schedule as schedule_crud
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.dateutil.service import parse_timezone
 from app.domain.schedule.service import ScheduleService
 from app.domain.timer.schema.dto import (
@@ -117,7 +117,7 @@ def _build_timer_read_with_relations(
 
 
 @router.get("", response_model=List[TimerRead])
-async def list_timers(
+def list_timers(
         scope: ResourceScope = Query(
             ResourceScope.MINE,
             description="조회 범위: mine(내 타이머만), shared(공유된 타이머만), all(모두)"
@@ -157,7 +157,7 @@ async def list_timers(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -236,7 +236,7 @@ async def list_timers(
 
 
 @router.get("/active", response_model=TimerRead)
-async def get_user_active_timer(
+def get_user_active_timer(
         include_schedule: bool = Query(
             False,
             description="Schedule 정보 포함 여부 (기본값: false)"
@@ -254,7 +254,7 @@ async def get_user_active_timer(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -293,7 +293,7 @@ async def get_user_active_timer(
 
 
 @router.get("/{timer_id}", response_model=TimerRead)
-async def get_timer(
+def get_timer(
         timer_id: UUID,
         include_schedule: bool = Query(
             False,
@@ -312,7 +312,7 @@ async def get_timer(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -345,7 +345,7 @@ async def get_timer(
 
 
 @router.patch("/{timer_id}", response_model=TimerRead)
-async def update_timer(
+def update_timer(
         timer_id: UUID,
         data: TimerUpdate,
         include_schedule: bool = Query(
@@ -403,7 +403,7 @@ async def update_timer(
 
 
 @router.delete("/{timer_id}", status_code=status.HTTP_200_OK)
-async def delete_timer(
+def delete_timer(
         timer_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
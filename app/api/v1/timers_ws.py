@@ -8,6 +8,7 @@ import json
 import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.auth import CurrentUser
 from app.db.session import _session_manager
@@ -22,6 +23,40 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["Timer WebSocket"])
 
 
+def _build_active_timers_sync(current_user: CurrentUser, tz_obj) -> WSServerMessage:
+    """
+    활성 타이머 동기화 메시지 생성 (동기, 스레드풀에서 실행)
+
+    :param current_user: 현재 사용자
+    :param tz_obj: 타임존 (None이면 UTC)
+    :return: 동기화 결과 메시지
+    """
+    from app.core.constants import TimerStatus
+    from app.domain.timer.service import TimerService
+    from app.domain.timer.schema.ws import TimerData, TimerWSMessageType
+
+    with _session_manager.get_session() as session:
+        timer_service = TimerService(session, current_user)
+        active_timers = timer_service.get_all_timers(status=[TimerStatus.RUNNING.value, TimerStatus.PAUSED.value])
+
+        # 타임존 변환 적용
+        timer_list = []
+        for t in active_timers:
+            timer_data = TimerData.from_model(t)
+            if tz_obj:
+                timer_data = timer_data.to_timezone(tz_obj)
+            timer_list.append(timer_data)
+
+    return WSServerMessage(
+        type=TimerWSMessageType.SYNC_RESULT.value,
+        payload={
+            "timers": [t.model_dump(mode="json") for t in timer_list],
+            "count": len(timer_list),
+        },
+        from_user=current_user.sub,
+    )
+
+
 @router.websocket("/ws/timers")
 async def timer_websocket(
         websocket: WebSocket,
@@ -93,37 +128,14 @@ async def timer_websocket(
     )
     await connection_manager.send_to_websocket(websocket, connected_msg)
 
-    # 활성 타이머 자동 동기화 (항상 수행)
-    with _session_manager.get_session() as session:
-        try:
-            from app.core.constants import TimerStatus
-            from app.domain.timer.service import TimerService
-            from app.domain.timer.schema.ws import TimerData, TimerWSMessageType
-
-            timer_service = TimerService(session, current_user)
-            active_timers = timer_service.get_all_timers(status=[TimerStatus.RUNNING.value, TimerStatus.PAUSED.value])
-
-            # 타임존 변환 적용
-            timer_list = []
-            for t in active_timers:
-                timer_data = TimerData.model_validate(t)
-                if tz_obj:
-                    timer_data = timer_data.to_timezone(tz_obj)
-                timer_list.append(timer_data)
-
-            sync_msg = WSServerMessage(
-                type=TimerWSMessageType.SYNC_RESULT.value,
-                payload={
-                    "timers": [t.model_dump(mode="json") for t in timer_list],
-                    "count": len(timer_list),
-                },
-                from_user=current_user.sub,
-            )
-            await connection_manager.send_to_websocket(websocket, sync_msg)
-            logger.info(f"Auto-synced {len(timer_list)} active timers for user {current_user.sub}")
-        except Exception as e:
-            logger.error(f"Auto-sync failed: {e}")
-            # 자동 동기화 실패는 치명적이지 않으므로 연결은 유지
+    # 활성 타이머 자동 동기화 (항상 수행, DB 조회는 스레드풀에서 실행)
+    try:
+        sync_msg = await run_in_threadpool(_build_active_timers_sync, current_user, tz_obj)
+        await connection_manager.send_to_websocket(websocket, sync_msg)
+        logger.info(f"Auto-synced {sync_msg.payload['count']} active timers for user {current_user.sub}")
+    except Exception as e:
+        logger.error(f"Auto-sync failed: {e}")
+        # 자동 동기화 실패는 치명적이지 않으므로 연결은 유지
 
     try:
         while True:
@@ -169,10 +181,10 @@ async def timer_websocket(
                         await connection_manager.send_to_websocket(websocket, response)
 
                     # 트랜잭션 커밋
-                    session.commit()
+                    await run_in_threadpool(session.commit)
 
                 except Exception as e:
-                    session.rollback()
+                    await run_in_threadpool(session.rollback)
                     logger.error(f"Error handling WebSocket message: {e}")
                     error_msg = WSServerMessage(
                         type=WSMessageType.ERROR,
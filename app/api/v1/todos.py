@@ -2,7 +2,7 @@
 Todo Router
 
 FastAPI Best Practices:
-- 모든 라우트는 async
+- DB를 쓰는 라우트는 def (FastAPI가 스레드풀에서 실행)
 - Service는 session을 받아서 CRUD 직접 사용
 - Todo 전용 엔드포인트 (Schedule과 분리)
 
@@ -22,7 +22,7 @@ from sqlmodel import Session
 from app.core.auth import CurrentUser, get_current_user
 from app.core.constants import ResourceScope
 from app.crud import schedule as schedule_crud
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.dateutil.service import parse_timezone
 from app.domain.schedule.schema.dto import ScheduleRead
 from app.domain.schedule.service import ScheduleService
@@ -72,7 +72,7 @@ def _get_related_schedule_reads(
 
 
 @router.post("", response_model=TodoRead, status_code=status.HTTP_201_CREATED)
-async def create_todo(
+def create_todo(
         data: TodoCreate,
         tz: Optional[str] = Query(
             None,
@@ -103,7 +103,7 @@ async def create_todo(
 
 
 @router.get("", response_model=list[TodoRead])
-async def read_todos(
+def read_todos(
         scope: ResourceScope = Query(
             ResourceScope.MINE,
             description="조회 범위: mine(내 Todo만), shared(공유된 Todo만), all(모두)"
@@ -121,7 +121,7 @@ async def read_todos(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -190,12 +190,12 @@ async def read_todos(
 
 
 @router.get("/stats", response_model=TodoStats)
-async def get_todo_stats(
+def get_todo_stats(
         group_id: Optional[UUID] = Query(
             None,
             description="필터링할 태그 그룹 ID"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -209,14 +209,14 @@ async def get_todo_stats(
 
 
 @router.get("/{todo_id}", response_model=TodoRead)
-async def read_todo(
+def read_todo(
         todo_id: UUID,
         tz: Optional[str] = Query(
             None,
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -240,7 +240,7 @@ async def read_todo(
 
 
 @router.patch("/{todo_id}", response_model=TodoRead)
-async def update_todo(
+def update_todo(
         todo_id: UUID,
         data: TodoUpdate,
         tz: Optional[str] = Query(
@@ -276,7 +276,7 @@ async def update_todo(
 
 
 @router.delete("/{todo_id}", status_code=status.HTTP_200_OK)
-async def delete_todo(
+def delete_todo(
         todo_id: UUID,
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
@@ -290,7 +290,7 @@ async def delete_todo(
 
 
 @router.get("/{todo_id}/timers", response_model=list[TimerRead])
-async def get_todo_timers(
+def get_todo_timers(
         todo_id: UUID,
         include_todo: bool = Query(
             False,
@@ -301,7 +301,7 @@ async def get_todo_timers(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -335,7 +335,7 @@ async def get_todo_timers(
 
 
 @router.get("/{todo_id}/timers/active", response_model=TimerRead)
-async def get_todo_active_timer(
+def get_todo_active_timer(
         todo_id: UUID,
         include_todo: bool = Query(
             False,
@@ -346,7 +346,7 @@ async def get_todo_active_timer(
             alias="timezone",
             description="타임존 (예: UTC, +09:00, Asia/Seoul). 지정하지 않으면 UTC로 반환"
         ),
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
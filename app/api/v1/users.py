@@ -19,7 +19,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/me", response_model=MyProfileRead)
-async def get_my_profile(
+def get_my_profile(
         session: Session = Depends(get_db_transactional),
         current_user: CurrentUser = Depends(get_current_user),
 ):
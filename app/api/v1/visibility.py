@@ -14,7 +14,7 @@ from app.crud import meeting as meeting_crud
 from app.crud import schedule as schedule_crud
 from app.crud import timer as timer_crud
 from app.crud import todo as todo_crud
-from app.db.session import get_db_transactional
+from app.db.session import get_db, get_db_transactional
 from app.domain.visibility.enums import ResourceType
 from app.domain.visibility.exceptions import AccessDeniedError, VisibilityNotFoundError
 from app.domain.visibility.schema.dto import VisibilityUpdate, VisibilityRead
@@ -50,7 +50,7 @@ def _require_resource_owner(
     response_model=VisibilityRead,
     status_code=status.HTTP_200_OK,
 )
-async def set_visibility(
+def set_visibility(
         resource_type: ResourceType,
         resource_id: UUID,
         data: VisibilityUpdate,
@@ -81,10 +81,10 @@ async def set_visibility(
     "/{resource_type}/{resource_id}",
     response_model=VisibilityRead,
 )
-async def get_visibility(
+def get_visibility(
         resource_type: ResourceType,
         resource_id: UUID,
-        session: Session = Depends(get_db_transactional),
+        session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
 ):
     """
@@ -106,7 +106,7 @@ async def get_visibility(
     "/{resource_type}/{resource_id}",
     status_code=status.HTTP_200_OK,
 )
-async def delete_visibility(
+def delete_visibility(
         resource_type: ResourceType,
         resource_id: UUID,
         session: Session = Depends(get_db_transactional),
@@ -6,6 +6,8 @@ CurrentUser 컨텍스트를 제공한다. 책임별로 분리:
 
 - model:        CurrentUser (인증 주체 모델)
 - client:       OIDCClient / oidc_client (discovery·JWKS·토큰 검증)
+- token_cache:  VerifiedTokenCache (검증된 토큰 클레임 캐시)
+- profile_sync_cache: ProfileSyncCache / profile_sync_cache (프로필 동기화 생략용 fingerprint 캐시)
 - dependencies: get_current_user / get_optional_current_user / get_current_user_synced
 - middleware:   AuthMiddleware (request.state 사전 설정)
 
@@ -20,11 +22,16 @@ from app.core.auth.dependencies import (
 )
 from app.core.auth.middleware import AuthMiddleware
 from app.core.auth.model import CurrentUser
+from app.core.auth.profile_sync_cache import ProfileSyncCache, profile_sync_cache
+from app.core.auth.token_cache import VerifiedTokenCache
 
 __all__ = [
     "CurrentUser",
     "OIDCClient",
     "oidc_client",
+    "VerifiedTokenCache",
+    "ProfileSyncCache",
+    "profile_sync_cache",
     "security",
     "get_current_user",
     "get_optional_current_user",
@@ -1,20 +1,23 @@
 """
 OIDC 클라이언트
 
-joserfc를 사용한 OIDC discovery, JWKS 캐싱, JWT Access Token 검증.
+joserfc를 사용한 OIDC discovery, JWKS 캐싱, JWT Access Token 검증 (검증 결과 캐싱).
 이 서버는 OIDC Resource Server(Relying Party)로서 외부 Provider 발급 토큰을 검증한다.
 """
+import asyncio
 import logging
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
 
 import httpx
-from cachetools import TTLCache
-from joserfc import jwt
+from joserfc import jws, jwt
 from joserfc.errors import JoseError
 from joserfc.jwk import KeySet
 from joserfc.jwt import JWTClaimsRegistry
 from fastapi import HTTPException, status
 
+from app.core.auth.token_cache import VerifiedTokenCache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -25,28 +28,57 @@ ALLOWED_JWT_ALGORITHMS = ["RS256", "RS384", "RS512", "ES256", "ES384", "ES512"]
 # JWT 표준 클레임(exp/nbf/iat) 검증 레지스트리
 _claims_registry = JWTClaimsRegistry()
 
+# TTL 중 이 비율이 지나면 캐시 값을 그대로 반환하면서 백그라운드에서 미리 갱신
+REFRESH_AHEAD_RATIO = 0.8
+# 모르는 kid로 인한 JWKS 강제 재조회 최소 간격 (초)
+# 임의 kid를 넣은 토큰으로 IdP 호출을 반복 유발하는 것을 막음
+UNKNOWN_KID_REFRESH_INTERVAL_SECONDS = 30.0
+# IdP HTTP 요청 타임아웃 (초)
+HTTP_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass
+class _CachedDocument:
+    """IdP에서 받은 문서(메타데이터/JWKS) 캐시 항목"""
+    value: Any = None
+    fetched_at: float = 0.0  # time.monotonic()
+    refresh_task: asyncio.Task | None = None
+
 
 class OIDCClient:
     """
     외부 OIDC Provider와 통신하는 클라이언트
 
     - OIDC discovery를 통해 issuer 메타데이터 로딩
-    - JWKS 캐싱 (TTL 기반)
-    - JWT Access Token 검증
+    - JWKS 캐싱 (TTL 기반, 만료 전 백그라운드 갱신)
+    - JWT Access Token 검증 (검증된 클레임은 token_cache에 보관, JWKS 교체 시 무효화)
+
+    IdP 요청:
+    - 연결 풀을 유지하는 httpx.AsyncClient 하나를 재사용 (종료 시 aclose)
+    - 갱신은 single-flight: 동시에 캐시를 놓친 요청들은 진행 중인 한 번의 조회를 함께 기다림
+    - TTL의 REFRESH_AHEAD_RATIO가 지나면 캐시 값을 반환하고 백그라운드에서 갱신
+      (정상 상태에서는 요청 지연에 IdP 왕복이 포함되지 않음)
+    - 만료 후 갱신이 실패하면 마지막 값을 계속 사용 (IdP 장애 시 인증 유지)
+    - 토큰의 kid가 JWKS에 없으면 즉시 JWKS를 다시 조회 (키 교체 대응)
 
     Note: 이 서버는 OIDC Resource Server (Relying Party)입니다.
     외부 OIDC Provider(Keycloak, Auth0 등)에서 발급한 토큰을 검증합니다.
     """
 
-    def __init__(self):
-        self._metadata_cache: TTLCache = TTLCache(
-            maxsize=1,
-            ttl=settings.OIDC_JWKS_CACHE_TTL_SECONDS
-        )
-        self._jwks_cache: TTLCache = TTLCache(
-            maxsize=1,
-            ttl=settings.OIDC_JWKS_CACHE_TTL_SECONDS
-        )
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None):
+        """
+        :param transport: httpx 전송 계층 (테스트용 stub IdP 주입, 기본은 네트워크)
+        """
+        self._transport = transport
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self._metadata = _CachedDocument()
+        self._jwks = _CachedDocument()
+        self._last_unknown_kid_refresh = float("-inf")
+        # 마지막으로 받은 JWKS 원본 (키 교체 감지용)
+        self._jwks_data: dict[str, Any] | None = None
+        # 검증된 토큰 캐시 (HTTP 미들웨어, GraphQL, WebSocket이 이 인스턴스를 공유)
+        self.token_cache = VerifiedTokenCache()
 
     @property
     def discovery_url(self) -> str:
@@ -55,6 +87,110 @@ class OIDCClient:
             return settings.OIDC_DISCOVERY_URL
         return f"{settings.OIDC_ISSUER_URL.rstrip('/')}/.well-known/openid-configuration"
 
+    def _http(self) -> httpx.AsyncClient:
+        """연결 풀을 공유하는 HTTP 클라이언트 (이벤트 루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_loop is not loop:
+            self._http_client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT_SECONDS,
+                transport=self._transport,
+            )
+            self._http_loop = loop
+        return self._http_client
+
+    async def aclose(self) -> None:
+        """진행 중인 갱신 취소 및 HTTP 클라이언트 종료 (shutdown 시 호출)"""
+        for document in (self._metadata, self._jwks):
+            task = document.refresh_task
+            if task is not None and not task.done():
+                task.cancel()
+            document.refresh_task = None
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._http_loop = None
+
+    @staticmethod
+    def _log_refresh_failure(task: asyncio.Task) -> None:
+        """백그라운드 갱신 실패 로깅 (기다리는 요청이 없어도 예외를 회수)"""
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("OIDC refresh failed: %s", task.exception())
+
+    def _start_refresh(
+            self,
+            document: _CachedDocument,
+            fetch: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        """갱신 태스크 시작 (이미 진행 중이면 그 태스크 반환 - single-flight)"""
+        task = document.refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._refresh(document, fetch))
+            task.add_done_callback(self._log_refresh_failure)
+            document.refresh_task = task
+        return task
+
+    @staticmethod
+    async def _refresh(document: _CachedDocument, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        value = await fetch()
+        document.value = value
+        document.fetched_at = time.monotonic()
+        return value
+
+    async def _get_cached(
+            self,
+            document: _CachedDocument,
+            fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        캐시된 문서 반환 (stale-while-revalidate)
+
+        - TTL 이내: 캐시 값 반환, REFRESH_AHEAD_RATIO를 지났으면 백그라운드 갱신 시작
+        - 값이 없거나 만료: 진행 중인 갱신을 함께 기다림 (실패 시 마지막 값 사용)
+        """
+        ttl = settings.OIDC_JWKS_CACHE_TTL_SECONDS
+        if document.value is not None:
+            age = time.monotonic() - document.fetched_at
+            if age < ttl:
+                if age >= ttl * REFRESH_AHEAD_RATIO:
+                    self._start_refresh(document, fetch)
+                return document.value
+
+        try:
+            # shield: 기다리던 요청이 취소되어도 다른 요청이 기다리는 갱신은 계속
+            return await asyncio.shield(self._start_refresh(document, fetch))
+        except httpx.HTTPError:
+            if document.value is None:
+                raise
+            logger.warning("OIDC refresh failed, using cached value past its TTL")
+            return document.value
+
+    async def _fetch_metadata(self) -> dict[str, Any]:
+        response = await self._http().get(self.discovery_url)
+        response.raise_for_status()
+        metadata = response.json()
+        logger.info(f"OIDC metadata loaded from {self.discovery_url}")
+        return metadata
+
+    async def _fetch_jwks(self) -> KeySet:
+        metadata = await self.get_metadata()
+        jwks_uri = metadata.get("jwks_uri")
+        if not jwks_uri:
+            raise ValueError("OIDC metadata does not contain jwks_uri")
+
+        response = await self._http().get(jwks_uri)
+        response.raise_for_status()
+        jwks_data = response.json()
+        jwks = KeySet.import_key_set(jwks_data)
+
+        # 키가 교체되었으면 이전 키로 검증한 토큰 캐시 무효화
+        if self._jwks_data is not None and jwks_data != self._jwks_data:
+            self.token_cache.invalidate()
+            logger.info("JWKS changed, verified token cache invalidated")
+        self._jwks_data = jwks_data
+
+        logger.info(f"JWKS loaded from {jwks_uri}")
+        return jwks
+
     async def get_metadata(self) -> dict[str, Any]:
         """
         OIDC Provider 메타데이터 조회 (캐싱됨)
@@ -62,18 +198,7 @@ class OIDCClient:
         Returns:
             OpenID Provider Configuration (issuer, jwks_uri, etc.)
         """
-        cache_key = "metadata"
-        if cache_key in self._metadata_cache:
-            return self._metadata_cache[cache_key]
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(self.discovery_url)
-            response.raise_for_status()
-            metadata = response.json()
-
-        self._metadata_cache[cache_key] = metadata
-        logger.info(f"OIDC metadata loaded from {self.discovery_url}")
-        return metadata
+        return await self._get_cached(self._metadata, self._fetch_metadata)
 
     async def get_jwks(self) -> KeySet:
         """
@@ -82,29 +207,31 @@ class OIDCClient:
         Returns:
             joserfc KeySet 객체
         """
-        cache_key = "jwks"
-        if cache_key in self._jwks_cache:
-            return self._jwks_cache[cache_key]
-
-        metadata = await self.get_metadata()
-        jwks_uri = metadata.get("jwks_uri")
-        if not jwks_uri:
-            raise ValueError("OIDC metadata does not contain jwks_uri")
+        return await self._get_cached(self._jwks, self._fetch_jwks)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(jwks_uri)
-            response.raise_for_status()
-            jwks_data = response.json()
+    async def _refresh_jwks_for_unknown_kid(self, jwks: KeySet) -> KeySet:
+        """
+        토큰의 kid가 JWKS에 없을 때 JWKS 즉시 재조회 (single-flight)
 
-        jwks = KeySet.import_key_set(jwks_data)
-        self._jwks_cache[cache_key] = jwks
-        logger.info(f"JWKS loaded from {jwks_uri}")
-        return jwks
+        UNKNOWN_KID_REFRESH_INTERVAL_SECONDS 안에 이미 재조회했다면 현재 JWKS를 그대로 사용
+        재조회가 실패해도 현재 JWKS를 사용 (모르는 kid는 503이 아니라 검증 실패 401)
+        """
+        now = time.monotonic()
+        if now - self._last_unknown_kid_refresh < UNKNOWN_KID_REFRESH_INTERVAL_SECONDS:
+            return jwks
+        self._last_unknown_kid_refresh = now
+        try:
+            return await asyncio.shield(self._start_refresh(self._jwks, self._fetch_jwks))
+        except httpx.HTTPError as e:
+            logger.warning(f"JWKS refetch for unknown kid failed, using cached keys: {e}")
+            return jwks
 
     async def verify_token(self, token: str) -> dict[str, Any]:
         """
         JWT Access Token 검증
 
+        같은 토큰을 이미 검증했다면 token_cache의 클레임을 반환한다 (min(exp, TTL)까지).
+
         Args:
             token: Bearer 토큰 문자열
 
@@ -114,9 +241,18 @@ class OIDCClient:
         Raises:
             HTTPException: 토큰 검증 실패 시
         """
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+
         try:
             jwks = await self.get_jwks()
 
+            # 모르는 kid면 키 교체로 보고 JWKS 재조회
+            kid = jws.extract_compact(token.encode()).headers().get("kid")
+            if kid is not None and all(key.kid != kid for key in jwks.keys):
+                jwks = await self._refresh_jwks_for_unknown_kid(jwks)
+
             # JWT 디코딩 및 서명 검증 (허용된 비대칭 알고리즘만)
             decoded = jwt.decode(token, jwks, algorithms=ALLOWED_JWT_ALGORITHMS)
             claims = decoded.claims
@@ -144,6 +280,7 @@ class OIDCClient:
                     detail="Invalid audience",
                 )
 
+            self.token_cache.set(token, claims)
             return dict(claims)
 
         except JoseError as e:
@@ -9,12 +9,12 @@ import logging
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session
 
 from app.core.auth.client import oidc_client
 from app.core.auth.model import CurrentUser
+from app.core.auth.profile_sync_cache import profile_fingerprint, profile_sync_cache
 from app.core.config import settings
-from app.db.session import get_db_transactional
+from app.db.session import _session_manager
 
 logger = logging.getLogger(__name__)
 
@@ -92,7 +92,6 @@ async def get_optional_current_user(
 
 def get_current_user_synced(
         current_user: CurrentUser = Depends(get_current_user),
-        session: Session = Depends(get_db_transactional),
 ) -> CurrentUser:
     """
     FastAPI Dependency: 인증된 사용자 반환 + 표시 프로필 JIT 동기화
@@ -101,18 +100,27 @@ def get_current_user_synced(
     UserProfile을 upsert하여, 프론트가 별도 프로필 조회를 호출하지 않아도 친구 목록/
     받은 요청 표시정보와 이메일 친추 인덱스를 준비한다.
 
-    - `get_db_transactional`은 요청 내 1회만 평가(FastAPI 캐시)되므로 엔드포인트와
-      **동일 세션**을 공유하고 요청 끝에 함께 commit된다.
-    - 동기화는 SAVEPOINT(begin_nested) 안에서 수행한다. 동기화가 실패해도 엔드포인트
-      트랜잭션을 오염시키지 않고 best-effort로 넘어간다(표시정보는 None으로 degrade).
+    - 표시 프로필 클레임의 fingerprint가 마지막 동기화와 같으면(profile_sync_cache)
+      DB에 접근하지 않는다. 읽기 요청은 쓰기 트랜잭션 없이 get_db 세션만 사용한다.
+    - fingerprint가 바뀌었거나 캐시 항목이 만료된 경우에만 별도 세션에서 동기화하고
+      바로 commit한다. commit된 뒤에만 fingerprint를 기록한다.
+    - 동기화가 실패해도 요청은 막지 않고 best-effort로 넘어간다(표시정보는 None으로
+      degrade, 다음 요청에서 재시도).
     """
+    fingerprint = profile_fingerprint(current_user)
+    if profile_sync_cache.is_synced(current_user.sub, fingerprint):
+        return current_user
+
     # 지연 import: domain.user.service가 app.core.auth.CurrentUser를 import하므로 순환 회피
     from app.domain.user.service import UserProfileService
 
     try:
-        with session.begin_nested():
+        with _session_manager.get_session() as session:
             UserProfileService(session, current_user).sync_from_current_user()
+            session.commit()
     except Exception as e:  # noqa: BLE001 - 동기화 실패는 요청을 막지 않는다
         logger.warning("User profile sync failed for sub=%s: %s", current_user.sub, e)
+    else:
+        profile_sync_cache.mark_synced(current_user.sub, fingerprint)
 
     return current_user
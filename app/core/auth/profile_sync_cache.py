@@ -0,0 +1,110 @@
+"""
+프로필 동기화 fingerprint 캐시
+
+get_current_user_synced가 인증 요청마다 UserProfile을 조회/갱신하지 않도록,
+마지막으로 DB에 반영한 표시 프로필 클레임의 fingerprint를 sub별로 보관한다.
+fingerprint가 같고 항목이 만료되지 않았으면 동기화를 건너뛴다.
+"""
+import hashlib
+import json
+import threading
+import time
+
+from cachetools import LRUCache
+
+from app.core.auth.model import CurrentUser
+from app.core.config import settings
+
+
+def profile_fingerprint(current_user: CurrentUser) -> str:
+    """
+    프로필 동기화에 쓰이는 클레임의 fingerprint
+
+    iss, name, preferred_username(표시명 폴백), picture, email, email_verified
+    """
+    claims = current_user.raw_claims or {}
+    values = [
+        claims.get("iss"),
+        current_user.name,
+        claims.get("preferred_username"),
+        current_user.picture,
+        current_user.email,
+        current_user.email_verified,
+    ]
+    return hashlib.sha256(json.dumps(values).encode()).hexdigest()
+
+
+class ProfileSyncCache:
+    """
+    sub → 마지막으로 동기화한 fingerprint 캐시 (LRU, 항목별 만료)
+
+    - 동기화가 commit된 뒤에만 기록 (실패/rollback된 동기화는 다음 요청에서 재시도)
+    - 만료(TTL) 후에는 fingerprint가 같아도 다시 동기화 (DB에서 프로필이 지워진 경우 복구)
+    - get_current_user_synced는 threadpool에서 실행되므로 잠금으로 보호
+    """
+
+    def __init__(self, maxsize: int | None = None, ttl_seconds: int | None = None):
+        if maxsize is None:
+            maxsize = settings.USER_PROFILE_SYNC_CACHE_SIZE
+        if ttl_seconds is None:
+            ttl_seconds = settings.USER_PROFILE_SYNC_CACHE_TTL_SECONDS
+        self.enabled = maxsize > 0 and ttl_seconds > 0
+        self.ttl_seconds = ttl_seconds
+        self._cache: LRUCache = LRUCache(maxsize=max(1, maxsize))
+        self._lock = threading.Lock()
+        self.skipped = 0
+        self.synced = 0
+
+    def is_synced(self, sub: str, fingerprint: str) -> bool:
+        """
+        같은 fingerprint로 이미 동기화했는지 확인 (True면 동기화 생략으로 집계)
+
+        :param sub: 사용자 sub
+        :param fingerprint: profile_fingerprint() 값
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            entry = self._cache.get(sub)
+            if entry is not None:
+                cached_fingerprint, expires_at = entry
+                if cached_fingerprint == fingerprint and time.monotonic() < expires_at:
+                    self.skipped += 1
+                    return True
+            return False
+
+    def mark_synced(self, sub: str, fingerprint: str) -> None:
+        """
+        동기화 완료 기록 (commit 이후 호출)
+
+        :param sub: 사용자 sub
+        :param fingerprint: 동기화한 클레임의 fingerprint
+        """
+        with self._lock:
+            self.synced += 1
+            if self.enabled:
+                self._cache[sub] = (fingerprint, time.monotonic() + self.ttl_seconds)
+
+    def stats(self) -> dict[str, int | float]:
+        """동기화 생략/수행 통계"""
+        with self._lock:
+            total = self.skipped + self.synced
+            return {
+                "skipped": self.skipped,
+                "synced": self.synced,
+                "skip_rate": self.skipped / total if total else 0.0,
+                "size": len(self._cache),
+                "maxsize": int(self._cache.maxsize),
+            }
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._cache.clear()
+            self.skipped = 0
+            self.synced = 0
+
+
+# 프로세스 전역 인스턴스
+profile_sync_cache = ProfileSyncCache()
@@ -0,0 +1,103 @@
+"""
+검증된 토큰 캐시
+
+같은 Access Token이 요청마다(HTTP 미들웨어, GraphQL 컨텍스트, WebSocket 연결)
+서명/클레임 검증을 다시 거치지 않도록 검증 결과(클레임)를 보관한다.
+"""
+import hashlib
+import time
+from typing import Any
+
+from cachetools import LRUCache
+
+from app.core.config import settings
+
+
+class VerifiedTokenCache:
+    """
+    검증된 JWT 클레임 캐시 (LRU, 항목별 만료)
+
+    - 키는 토큰 원문이 아니라 SHA-256 해시 (메모리에 토큰을 남기지 않음)
+    - 항목은 min(exp, 저장 시각 + TTL)까지만 유효
+    - 검증에 실패한 토큰은 저장하지 않음
+    - JWKS가 바뀌면(키 교체) invalidate()로 전체 무효화
+    - 이벤트 루프에서만 사용하므로 잠금 없음
+    """
+
+    def __init__(self, maxsize: int | None = None, ttl_seconds: int | None = None):
+        if maxsize is None:
+            maxsize = settings.OIDC_TOKEN_CACHE_SIZE
+        if ttl_seconds is None:
+            ttl_seconds = settings.OIDC_TOKEN_CACHE_TTL_SECONDS
+        self.enabled = maxsize > 0 and ttl_seconds > 0
+        self.ttl_seconds = ttl_seconds
+        self._cache: LRUCache = LRUCache(maxsize=max(1, maxsize))
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """
+        캐시된 클레임 조회
+
+        :param token: Bearer 토큰 문자열
+        :return: 클레임 사본 (없거나 만료되었으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        key = self._key(token)
+        entry = self._cache.get(key)
+        if entry is not None:
+            claims, expires_at = entry
+            if time.time() < expires_at:
+                self.hits += 1
+                return dict(claims)
+            del self._cache[key]
+        self.misses += 1
+        return None
+
+    def set(self, token: str, claims: dict[str, Any]) -> None:
+        """
+        검증된 클레임 저장
+
+        :param token: Bearer 토큰 문자열
+        :param claims: 검증을 통과한 클레임
+        """
+        if not self.enabled:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        self._cache[self._key(token)] = (dict(claims), expires_at)
+
+    def invalidate(self) -> None:
+        """모든 항목 무효화 (JWKS 교체 시)"""
+        if self._cache:
+            self.invalidations += 1
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        """캐시 적중/미스 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "size": len(self._cache),
+            "maxsize": int(self._cache.maxsize),
+        }
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
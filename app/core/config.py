@@ -27,6 +27,8 @@ class Settings(BaseSettings):
     # 데이터베이스
     DATABASE_URL: str = "sqlite:///./schedule.db"
     TEST_DATABASE_URL: str | None = None  # 테스트용 데이터베이스 URL
+    # 읽기 replica URL (설정 시 읽기 전용 GET 요청의 조회를 replica로 보냄, 미설정 시 primary)
+    DATABASE_REPLICA_URL: str | None = None
     POOL_SIZE: int = 5
     MAX_OVERFLOW: int = 10
     DB_POOL_PRE_PING: bool = True  # 연결 유효성 검사 (PostgreSQL 권장)
@@ -35,6 +37,24 @@ class Settings(BaseSettings):
     # 주기적으로 가벼운 쿼리(SELECT 1)를 실행. 0 이하면 비활성화.
     # (예: 무료 호스팅 DB의 유휴 자동 정지 방지)
     DB_KEEPALIVE_INTERVAL_SECONDS: int = 0  # 주기(초), 0 이하면 비활성화
+    # SQLite 성능 프로필 (DATABASE_URL이 sqlite일 때 연결마다 PRAGMA로 적용)
+    # WAL: 읽기와 쓰기가 서로 막지 않음. WAL + synchronous=NORMAL은 커밋마다 fsync를 생략
+    # (전원 장애 시 마지막 커밋만 유실될 수 있고 DB 파일은 손상되지 않음)
+    SQLITE_JOURNAL_MODE: Literal["WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "OFF"] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_CACHE_SIZE_KIB: int = 16384  # 연결당 페이지 캐시 크기 (KiB), 0 이하면 SQLite 기본값
+    SQLITE_MMAP_SIZE: int = 134217728  # 메모리 맵 I/O 크기 (바이트), 0이면 비활성화
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"  # 임시 테이블/인덱스 저장 위치
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000  # 잠금 대기 시간 (밀리초), 초과 시 "database is locked"
+
+    # 반복 일정
+    RRULE_CACHE_SIZE: int = 1024  # 파싱된 RRULE 객체 캐시 크기 (LRU)
+    # 반복 일정 인스턴스 인덱스 (schedule_occurrence 테이블)
+    # 켜면 반복 일정의 인스턴스를 미리 확장해 저장하고, 날짜 범위 조회를 인덱스 범위 스캔으로 처리
+    SCHEDULE_OCCURRENCE_INDEX_ENABLED: bool = False
+    SCHEDULE_OCCURRENCE_LOOKBACK_DAYS: int = 90  # 현재 기준 과거 저장 기간 (일)
+    SCHEDULE_OCCURRENCE_HORIZON_DAYS: int = 400  # 현재 기준 미래 저장 기간 (일)
+    SCHEDULE_OCCURRENCE_REFRESH_INTERVAL_SECONDS: int = 3600  # horizon 연장 태스크 주기 (초)
 
     # 로깅
     LOG_LEVEL: str = "INFO"
@@ -59,11 +79,34 @@ class Settings(BaseSettings):
     OIDC_AUDIENCE: str = ""  # Client ID (Access Token의 aud 클레임과 매칭)
     OIDC_DISCOVERY_URL: str | None = None  # 기본: OIDC_ISSUER_URL/.well-known/openid-configuration
     OIDC_JWKS_CACHE_TTL_SECONDS: int = 3600  # JWKS 캐시 TTL (기본 1시간)
+    # 검증된 토큰 캐시: 같은 토큰의 서명/클레임 재검증 생략 (min(exp, TTL)까지 유효)
+    OIDC_TOKEN_CACHE_SIZE: int = 10000  # 최대 토큰 수, 0 이하면 비활성화
+    OIDC_TOKEN_CACHE_TTL_SECONDS: int = 300  # 캐시 항목 최대 유효 시간 (초), 0 이하면 비활성화
+    # 프로필 동기화 캐시: 표시 프로필 클레임이 그대로면 요청마다 UserProfile 동기화 생략
+    USER_PROFILE_SYNC_CACHE_SIZE: int = 10000  # 최대 사용자 수, 0 이하면 비활성화
+    USER_PROFILE_SYNC_CACHE_TTL_SECONDS: int = 3600  # 이 시간이 지나면 클레임이 같아도 재동기화 (초)
 
     # Rate Limit 설정
     RATE_LIMIT_ENABLED: bool = True  # False로 설정하면 레이트 리밋 비활성화
     RATE_LIMIT_DEFAULT_WINDOW: int = 60  # 기본 윈도우 크기 (초)
     RATE_LIMIT_DEFAULT_REQUESTS: int = 60  # 기본 최대 요청 수
+    # 인메모리 저장소 알고리즘
+    # - sliding_log: 키마다 요청 타임스탬프 목록 저장 (정확, 메모리/연산이 한도에 비례)
+    # - sliding_window_counter: 키마다 현재/직전 구간 카운터만 저장 (근사, 키당 상태 크기 일정)
+    RATE_LIMIT_ALGORITHM: Literal["sliding_log", "sliding_window_counter"] = "sliding_log"
+    # 저장소 백엔드
+    # - memory: 프로세스별 인메모리 (워커가 여러 개면 한도가 워커 수만큼 늘어남)
+    # - sqlite: 같은 호스트의 워커가 SQLite 파일 하나를 공유 (uvicorn --workers N)
+    RATE_LIMIT_BACKEND: Literal["memory", "sqlite"] = "memory"
+    RATE_LIMIT_SQLITE_PATH: str = "./ratelimit.db"  # RATE_LIMIT_BACKEND=sqlite일 때 파일 경로
+    # 인메모리 저장소 키 수 상한 (초과 시 가장 오래 사용하지 않은 키 제거), 0 이하면 상한 없음
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    # 만료된 키 정리 주기 (초), 0 이하면 정리 태스크 비활성화
+    RATE_LIMIT_CLEANUP_INTERVAL_SECONDS: int = 60
+    # 엔드포인트 규칙 JSON 파일 (RateLimitRule 목록). 미설정 시 app/ratelimit/config.py의 기본 규칙
+    # 파일이 바뀌면 정리 태스크 주기마다 다시 읽어 재시작 없이 적용
+    RATE_LIMIT_RULES_FILE: str | None = None
+    RATE_LIMIT_RULE_CACHE_SIZE: int = 4096  # (메서드, 경로) → 규칙 매칭 결과 캐시 크기 (LRU)
 
     # WebSocket Rate Limit 설정
     WS_RATE_LIMIT_ENABLED: bool = True  # WebSocket 레이트 리밋 활성화
@@ -71,6 +114,19 @@ class Settings(BaseSettings):
     WS_CONNECT_MAX: int = 10  # 윈도우 내 최대 연결 횟수
     WS_MESSAGE_WINDOW: int = 60  # 메시지 제한 윈도우 (초)
     WS_MESSAGE_MAX: int = 120  # 윈도우 내 최대 메시지 수
+    # WebSocket 송신 큐 (연결별, 느린 클라이언트가 브로드캐스트를 막지 않도록)
+    WS_SEND_QUEUE_SIZE: int = 256  # 연결당 대기 메시지 수 상한
+    # 큐가 넘칠 때: drop_oldest(가장 오래된 메시지 버림) | disconnect(연결 종료, close code 1013)
+    WS_SEND_OVERFLOW_POLICY: Literal["drop_oldest", "disconnect"] = "disconnect"
+    # WebSocket 이벤트 버스 (워커 간 send_to_user/broadcast_to_friends 전달)
+    # - memory: 프로세스 내 (단일 워커)
+    # - sqlite: 같은 호스트의 워커가 SQLite 파일 하나를 공유 (uvicorn --workers N)
+    # - postgres: PostgreSQL LISTEN/NOTIFY (여러 호스트)
+    WS_EVENT_BUS: Literal["memory", "sqlite", "postgres"] = "memory"
+    WS_EVENT_BUS_SQLITE_PATH: str = "./ws_events.db"  # WS_EVENT_BUS=sqlite일 때 파일 경로
+    WS_EVENT_BUS_SQLITE_POLL_MS: int = 10  # WS_EVENT_BUS=sqlite일 때 폴링 주기 (밀리초)
+    WS_EVENT_BUS_POSTGRES_URL: str | None = None  # WS_EVENT_BUS=postgres일 때 URL (없으면 DATABASE_URL)
+    WS_EVENT_BUS_CHANNEL: str = "ws_events"  # WS_EVENT_BUS=postgres일 때 LISTEN/NOTIFY 채널
 
     # 프록시 설정
     PROXY_FORCE: bool = False  # 프록시/Cloudflare 경유 강제 (request.client.host 기준으로 프록시가 아니면 차단)
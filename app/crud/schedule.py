@@ -1,11 +1,19 @@
 from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, delete, update, func, exists
 
 from app.domain.dateutil.service import get_datetime_range
 from app.domain.schedule.schema.dto import ScheduleCreate, ScheduleUpdate
-from app.models.schedule import Schedule, ScheduleException
+from app.models.schedule import (
+    Schedule,
+    ScheduleException,
+    ScheduleOccurrence,
+    ScheduleOccurrenceCoverage,
+)
+from app.models.tag import Tag, ScheduleTag
+from app.models.visibility import ResourceVisibility, ResourceType, VisibilityLevel
 
 
 def create_schedule(session: Session, data: ScheduleCreate, owner_id: str) -> Schedule:
@@ -30,11 +38,23 @@ def create_schedule(session: Session, data: ScheduleCreate, owner_id: str) -> Sc
     return schedule
 
 
-def get_schedules(session: Session, owner_id: str) -> list[Schedule]:
+def get_schedules(
+        session: Session,
+        owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
+) -> list[Schedule]:
     """
     소유자의 모든 Schedule 객체를 조회합니다.
+
+    :param session: DB 세션
+    :param owner_id: 소유자 ID
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
+    :return: 일정 리스트
     """
     statement = select(Schedule).where(Schedule.owner_id == owner_id)
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
     results = session.exec(statement)
     return results.all()
 
@@ -44,6 +64,8 @@ def get_schedules_by_date_range(
         start_date: datetime,
         end_date: datetime,
         owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
 ) -> list[Schedule]:
     """
     날짜 범위로 Schedule 객체를 조회합니다.
@@ -52,6 +74,8 @@ def get_schedules_by_date_range(
     :param start_date: 시작 날짜 (이 날짜 이후에 시작하는 일정 포함)
     :param end_date: 종료 날짜 (이 날짜 이전에 종료하는 일정 포함)
     :param owner_id: 소유자 ID
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
     :return: 해당 날짜 범위와 겹치는 모든 일정
     """
     # 일정이 주어진 날짜 범위와 겹치는 경우를 조회
@@ -63,6 +87,7 @@ def get_schedules_by_date_range(
         .where(Schedule.end_time >= start_date)
         .order_by(Schedule.start_time)
     )
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
     results = session.exec(statement)
     return results.all()
 
@@ -152,6 +177,8 @@ def get_recurring_schedules(
         start_date: datetime,
         end_date: datetime,
         owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
 ) -> list[Schedule]:
     """
     반복 일정을 조회합니다 (원본만, 가상 인스턴스 제외).
@@ -162,6 +189,8 @@ def get_recurring_schedules(
     :param start_date: 조회 시작 날짜
     :param end_date: 조회 종료 날짜
     :param owner_id: 소유자 ID
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
     :return: 반복 일정 리스트 (recurrence_rule이 있는 일정)
     """
     # 반복 일정은 원본의 start_time이 조회 범위 이전이거나 겹치면 포함
@@ -181,6 +210,7 @@ def get_recurring_schedules(
         )
         .order_by(Schedule.start_time)
     )
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
     results = session.exec(statement)
     return results.all()
 
@@ -356,3 +386,401 @@ def get_schedules_by_source_todo_id(session: Session, todo_id: UUID, owner_id: s
     )
     results = session.exec(statement)
     return list(results.all())
+
+
+def get_shared_schedules_by_date_range(
+        session: Session,
+        start_date: datetime,
+        end_date: datetime,
+        exclude_owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
+) -> list[tuple[Schedule, ResourceVisibility]]:
+    """
+    날짜 범위와 겹칠 수 있는 타인 소유의 공개된(visibility != PRIVATE) 일정을 조회합니다.
+
+    visibility 조인과 날짜 조건을 한 번의 쿼리로 처리하므로, 공유된 일정 전체가 아니라
+    조회 범위에 해당하는 일정만 읽습니다. 접근 가능 여부는 호출 측에서
+    VisibilityService.filter_accessible_resources()로 추가 확인해야 합니다.
+
+    - 일반 일정: start_time <= end_date AND end_time >= start_date
+    - 반복 일정(원본): get_recurring_schedules와 같은 조건 (확장은 호출 측에서 처리)
+
+    :param session: DB 세션
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :param exclude_owner_id: 제외할 소유자 ID (본인)
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
+    :return: (일정, 접근권한 설정) 리스트
+    """
+    statement = (
+        select(Schedule, ResourceVisibility)
+        .join(ResourceVisibility, ResourceVisibility.resource_id == Schedule.id)
+        .where(ResourceVisibility.resource_type == ResourceType.SCHEDULE)
+        .where(ResourceVisibility.owner_id != exclude_owner_id)
+        .where(ResourceVisibility.level != VisibilityLevel.PRIVATE)
+        .where(Schedule.owner_id != exclude_owner_id)
+        .where(Schedule.start_time <= end_date)
+        .where(
+            (Schedule.recurrence_rule.is_(None) & (Schedule.end_time >= start_date))
+            | (
+                Schedule.recurrence_rule.isnot(None)
+                & (
+                    (Schedule.recurrence_end.is_(None))
+                    | (Schedule.recurrence_end >= start_date)
+                )
+            )
+        )
+        .order_by(Schedule.start_time)
+    )
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
+    return list(session.exec(statement).all())
+
+
+def get_schedule_exceptions_by_parents(
+        session: Session,
+        parent_ids: list[UUID],
+        start_date: datetime,
+        end_date: datetime,
+) -> list[ScheduleException]:
+    """
+    여러 원본 일정의 날짜 범위 내 예외 인스턴스를 조회합니다 (소유자 검증 없음).
+
+    공유된 반복 일정 확장 시 사용합니다. 접근 제어는 Service에서 처리합니다.
+
+    :param session: DB 세션
+    :param parent_ids: 원본 일정 ID 목록
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :return: 예외 인스턴스 리스트
+    """
+    if not parent_ids:
+        return []
+    statement = (
+        select(ScheduleException)
+        .where(ScheduleException.parent_id.in_(parent_ids))
+        .where(ScheduleException.exception_date >= start_date)
+        .where(ScheduleException.exception_date <= end_date)
+    )
+    return list(session.exec(statement).all())
+
+
+def _apply_tag_filter(
+        statement,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
+):
+    """
+    Schedule 조회에 태그/그룹 필터 조건 추가
+
+    반복 일정은 원본(Schedule.id) 기준으로 필터링되므로, 조건에 맞는 원본만
+    조회되고 확장됩니다. 가상 인스턴스는 원본의 태그를 상속합니다.
+
+    - group_ids: 해당 그룹의 태그 중 하나라도 가진 일정 (EXISTS)
+    - tag_ids: 지정한 태그를 모두 가진 일정 (GROUP BY ... HAVING COUNT(DISTINCT tag_id) = n)
+
+    :param statement: Schedule을 포함하는 select 문
+    :param tag_ids: 태그 ID 리스트 (AND 방식)
+    :param group_ids: 그룹 ID 리스트
+    :return: 조건이 추가된 select 문
+    """
+    if group_ids:
+        statement = statement.where(
+            exists()
+            .where(ScheduleTag.schedule_id == Schedule.id)
+            .where(ScheduleTag.tag_id == Tag.id)
+            .where(Tag.group_id.in_(group_ids))
+        )
+    if tag_ids:
+        unique_tag_ids = set(tag_ids)
+        statement = statement.where(
+            Schedule.id.in_(
+                select(ScheduleTag.schedule_id)
+                .where(ScheduleTag.tag_id.in_(unique_tag_ids))
+                .group_by(ScheduleTag.schedule_id)
+                .having(func.count(func.distinct(ScheduleTag.tag_id)) == len(unique_tag_ids))
+            )
+        )
+    return statement
+
+
+# ============================================================
+# 반복 일정 인스턴스 인덱스 (schedule_occurrence)
+# ============================================================
+
+def get_schedule_occurrences(
+        session: Session,
+        start_date: datetime,
+        end_date: datetime,
+        owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
+) -> list[tuple[ScheduleOccurrence, Schedule]]:
+    """
+    날짜 범위와 겹치는 인덱스 인스턴스를 원본 일정과 함께 조회합니다.
+
+    (owner_id, instance_start, instance_end) 인덱스 범위 스캔 한 번으로 처리하며,
+    coverage가 조회 범위를 모두 덮는 원본의 인스턴스만 반환합니다.
+    삭제된 인스턴스(is_deleted)는 제외합니다.
+
+    :param session: DB 세션
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :param owner_id: 소유자 ID
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
+    :return: (인스턴스, 원본 일정) 리스트
+    """
+    statement = (
+        select(ScheduleOccurrence, Schedule)
+        .join(Schedule, Schedule.id == ScheduleOccurrence.parent_id)
+        .join(
+            ScheduleOccurrenceCoverage,
+            ScheduleOccurrenceCoverage.parent_id == ScheduleOccurrence.parent_id,
+        )
+        .where(ScheduleOccurrence.owner_id == owner_id)
+        .where(ScheduleOccurrence.instance_start <= end_date)
+        .where(ScheduleOccurrence.instance_end >= start_date)
+        .where(ScheduleOccurrence.is_deleted.is_(False))
+        .where(_occurrence_coverage_contains(start_date, end_date))
+        .order_by(ScheduleOccurrence.instance_start)
+    )
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
+    return list(session.exec(statement).all())
+
+
+def get_uncovered_recurring_schedules(
+        session: Session,
+        start_date: datetime,
+        end_date: datetime,
+        owner_id: str,
+        tag_ids: Optional[List[UUID]] = None,
+        group_ids: Optional[List[UUID]] = None,
+) -> list[Schedule]:
+    """
+    조회 범위를 인덱스가 덮지 않는 반복 일정을 조회합니다.
+
+    get_recurring_schedules와 같은 조건에 coverage가 없거나 범위를 벗어난
+    원본만 남깁니다. 이 일정들은 RRULE 확장으로 처리합니다.
+
+    :param session: DB 세션
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :param owner_id: 소유자 ID
+    :param tag_ids: 태그 필터 (AND 방식, 선택)
+    :param group_ids: 그룹 필터 (선택)
+    :return: 반복 일정 리스트
+    """
+    statement = (
+        select(Schedule)
+        .outerjoin(
+            ScheduleOccurrenceCoverage,
+            ScheduleOccurrenceCoverage.parent_id == Schedule.id,
+        )
+        .where(Schedule.owner_id == owner_id)
+        .where(Schedule.recurrence_rule.isnot(None))
+        .where(Schedule.start_time <= end_date)
+        .where(
+            (Schedule.recurrence_end.is_(None))
+            | (Schedule.recurrence_end >= start_date)
+        )
+        .where(
+            (ScheduleOccurrenceCoverage.parent_id.is_(None))
+            | ~_occurrence_coverage_contains(start_date, end_date)
+        )
+        .order_by(Schedule.start_time)
+    )
+    statement = _apply_tag_filter(statement, tag_ids, group_ids)
+    return list(session.exec(statement).all())
+
+
+def _occurrence_coverage_contains(start_date: datetime, end_date: datetime):
+    """coverage가 [start_date, end_date]를 모두 덮는 조건 (시리즈 처음부터 저장된 경우 포함)"""
+    return (
+        (ScheduleOccurrenceCoverage.covered_until >= end_date)
+        & (
+            (ScheduleOccurrenceCoverage.covered_from <= start_date)
+            | (ScheduleOccurrenceCoverage.covered_from <= Schedule.start_time)
+        )
+    )
+
+
+def lock_schedule_occurrences(session: Session, parent_id: UUID) -> None:
+    """
+    반복 일정의 인덱스 갱신을 직렬화하기 위해 원본 일정 행을 잠급니다 (SELECT ... FOR UPDATE).
+
+    coverage 행은 첫 인덱스 생성 전에는 없으므로 항상 존재하는 원본 행을 잠급니다.
+    재계산(refresh)과 인스턴스 삭제 반영(mark_deleted)이 같은 잠금을 잡아,
+    재계산 도중 커밋된 삭제가 덮어써지지 않습니다. SQLite는 FOR UPDATE를 무시합니다.
+
+    :param session: DB 세션
+    :param parent_id: 원본 일정 ID
+    """
+    session.exec(select(Schedule.id).where(Schedule.id == parent_id).with_for_update())
+
+
+def replace_schedule_occurrences(
+        session: Session,
+        schedule: Schedule,
+        instances: list[tuple[datetime, datetime, bool]],
+        covered_from: datetime,
+        covered_until: datetime,
+) -> None:
+    """
+    반복 일정의 인덱스 인스턴스를 교체하고 coverage를 갱신합니다.
+
+    :param session: DB 세션
+    :param schedule: 원본 반복 일정
+    :param instances: [(instance_start, instance_end, is_deleted), ...]
+    :param covered_from: 인덱스 적용 시작
+    :param covered_until: 인덱스 적용 종료
+    """
+    session.exec(delete(ScheduleOccurrence).where(ScheduleOccurrence.parent_id == schedule.id))
+    session.add_all([
+        ScheduleOccurrence(
+            parent_id=schedule.id,
+            owner_id=schedule.owner_id,
+            instance_start=instance_start,
+            instance_end=instance_end,
+            is_deleted=is_deleted,
+        )
+        for instance_start, instance_end, is_deleted in instances
+    ])
+
+    coverage = session.get(ScheduleOccurrenceCoverage, schedule.id)
+    if coverage is None:
+        coverage = ScheduleOccurrenceCoverage(parent_id=schedule.id, owner_id=schedule.owner_id)
+        session.add(coverage)
+    coverage.covered_from = covered_from
+    coverage.covered_until = covered_until
+    session.flush()
+
+
+def delete_schedule_occurrences(session: Session, parent_id: UUID) -> None:
+    """
+    반복 일정의 인덱스 인스턴스와 coverage를 삭제합니다.
+
+    원본 삭제 시에는 DB 레벨 CASCADE로 자동 삭제되므로,
+    반복 일정이 일반 일정으로 바뀐 경우나 인덱스가 꺼진 상태에서 일정이 바뀐 경우에만 사용합니다.
+    """
+    session.exec(delete(ScheduleOccurrence).where(ScheduleOccurrence.parent_id == parent_id))
+    session.exec(
+        delete(ScheduleOccurrenceCoverage).where(ScheduleOccurrenceCoverage.parent_id == parent_id)
+    )
+    session.flush()
+
+
+def set_schedule_occurrence_deleted(
+        session: Session,
+        parent_id: UUID,
+        instance_start: datetime,
+        is_deleted: bool,
+) -> None:
+    """
+    특정 인스턴스의 삭제 여부를 인덱스에 반영합니다 (1분 이내 허용 오차).
+
+    :param session: DB 세션
+    :param parent_id: 원본 일정 ID
+    :param instance_start: 인스턴스 시작 시간
+    :param is_deleted: 삭제 여부
+    """
+    start_range, end_range = get_datetime_range(instance_start)
+    session.exec(
+        update(ScheduleOccurrence)
+        .where(ScheduleOccurrence.parent_id == parent_id)
+        .where(ScheduleOccurrence.instance_start >= start_range)
+        .where(ScheduleOccurrence.instance_start <= end_range)
+        .values(is_deleted=is_deleted)
+    )
+
+
+def get_deleted_schedule_exception_dates(
+        session: Session,
+        parent_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+) -> list[datetime]:
+    """
+    반복 일정의 삭제된 예외 인스턴스 날짜를 조회합니다.
+
+    :param session: DB 세션
+    :param parent_id: 원본 일정 ID
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :return: exception_date 리스트 (오름차순)
+    """
+    statement = (
+        select(ScheduleException.exception_date)
+        .where(ScheduleException.parent_id == parent_id)
+        .where(ScheduleException.is_deleted.is_(True))
+        .where(ScheduleException.exception_date >= start_date)
+        .where(ScheduleException.exception_date <= end_date)
+        .order_by(ScheduleException.exception_date)
+    )
+    return list(session.exec(statement).all())
+
+
+def count_deleted_schedule_exceptions(
+        session: Session,
+        parent_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+) -> int:
+    """
+    반복 일정의 삭제된 예외 인스턴스 개수를 조회합니다.
+
+    :param session: DB 세션
+    :param parent_id: 원본 일정 ID
+    :param start_date: 조회 시작 날짜
+    :param end_date: 조회 종료 날짜
+    :return: 삭제된 예외 인스턴스 개수
+    """
+    statement = (
+        select(func.count())
+        .select_from(ScheduleException)
+        .where(ScheduleException.parent_id == parent_id)
+        .where(ScheduleException.is_deleted.is_(True))
+        .where(ScheduleException.exception_date >= start_date)
+        .where(ScheduleException.exception_date <= end_date)
+    )
+    return session.exec(statement).one()
+
+
+def get_stale_occurrence_schedules(
+        session: Session,
+        covered_until: datetime,
+        limit: int,
+) -> list[Schedule]:
+    """
+    인덱스 coverage가 없거나 covered_until 이전에서 끝나는 반복 일정을 조회합니다.
+
+    이미 반복이 끝난 일정(recurrence_end가 현재 coverage 이전)은 제외합니다.
+    horizon 연장 태스크가 배치 단위로 사용합니다.
+
+    :param session: DB 세션
+    :param covered_until: 목표 coverage 종료
+    :param limit: 최대 조회 개수
+    :return: 반복 일정 리스트
+    """
+    statement = (
+        select(Schedule)
+        .outerjoin(
+            ScheduleOccurrenceCoverage,
+            ScheduleOccurrenceCoverage.parent_id == Schedule.id,
+        )
+        .where(Schedule.recurrence_rule.isnot(None))
+        .where(
+            (ScheduleOccurrenceCoverage.parent_id.is_(None))
+            | (
+                (ScheduleOccurrenceCoverage.covered_until < covered_until)
+                & (
+                    Schedule.recurrence_end.is_(None)
+                    | (Schedule.recurrence_end > ScheduleOccurrenceCoverage.covered_until)
+                )
+            )
+        )
+        .order_by(Schedule.id)
+        .limit(limit)
+    )
+    return list(session.exec(statement).all())
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager, contextmanager
 from typing import AsyncGenerator, Generator
 from urllib.parse import urlparse
 
+from fastapi import Request
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlmodel import SQLModel, create_engine, Session
@@ -17,6 +18,11 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 읽기 전용 세션이 replica 대신 primary를 읽도록 강제하는 요청 헤더 (read-your-writes)
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+# replica에서 읽어도 되는 HTTP 메서드 (그 외 쓰기 요청의 검증 조회는 항상 primary)
+_REPLICA_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
 
 def _is_sqlite() -> bool:
     """SQLite 데이터베이스 여부 확인"""
@@ -28,12 +34,58 @@ def _is_postgresql() -> bool:
     return settings.DATABASE_URL.startswith("postgresql")
 
 
+def _is_sqlite_memory() -> bool:
+    """SQLite 메모리 DB 여부 확인 (연결 풀 크기 설정 불가)"""
+    url = settings.DATABASE_URL
+    return url in ("sqlite://", "sqlite:///") or ":memory:" in url or "mode=memory" in url
+
+
+def _sqlite_pragmas() -> list[str]:
+    """
+    SQLite 연결마다 실행할 PRAGMA 목록 (설정의 SQLite 성능 프로필)
+
+    :return: "name=value" 형식의 PRAGMA 리스트
+    """
+    pragmas = [
+        "foreign_keys=ON",
+        f"busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"journal_mode={settings.SQLITE_JOURNAL_MODE}",
+        f"synchronous={settings.SQLITE_SYNCHRONOUS}",
+        f"temp_store={settings.SQLITE_TEMP_STORE}",
+        f"mmap_size={settings.SQLITE_MMAP_SIZE}",
+    ]
+    if settings.SQLITE_CACHE_SIZE_KIB > 0:
+        # 음수 값은 페이지 수가 아닌 KiB 단위
+        pragmas.append(f"cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}")
+    return pragmas
+
+
+def set_sqlite_pragmas(dbapi_conn, connection_record):
+    """SQLite 연결 이벤트 핸들러 - 성능 프로필 PRAGMA 적용 (동기/비동기 엔진 공용)"""
+    cursor = dbapi_conn.cursor()
+    for pragma in _sqlite_pragmas():
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
+
+
+def _sqlite_pool_kwargs() -> dict:
+    """SQLite 파일 DB의 연결 풀 크기 설정 (메모리 DB는 SQLAlchemy 기본 풀 사용)"""
+    if _is_sqlite_memory():
+        return {}
+    return {
+        "pool_size": settings.POOL_SIZE,
+        "max_overflow": settings.MAX_OVERFLOW,
+    }
+
+
 class SessionManager:
     """세션 관리자 - Context Manager 패턴"""
 
     def __init__(self):
         self.engine = None
+        self.replica_engine = None
         self._init_engine()
+        self._init_replica_engine()
 
     def _init_engine(self):
         """엔진 초기화 - DB 타입에 따라 최적화된 설정 적용"""
@@ -46,23 +98,20 @@ class SessionManager:
             self._init_default_engine()
 
     def _init_sqlite_engine(self):
-        """SQLite 엔진 초기화"""
+        """SQLite 엔진 초기화 - 성능 프로필(PRAGMA) 적용, 파일 DB는 연결 풀 크기 설정"""
         connect_args = {"check_same_thread": False}
 
         self.engine = create_engine(
             settings.DATABASE_URL,
             echo=settings.DEBUG,
             connect_args=connect_args,
+            **_sqlite_pool_kwargs(),
         )
 
-        # SQLite 외래 키 제약 조건 활성화 (각 연결마다)
-        @event.listens_for(self.engine, "connect")
-        def set_sqlite_pragma(dbapi_conn, connection_record):
-            cursor = dbapi_conn.cursor()
-            cursor.execute("PRAGMA foreign_keys=ON")
-            cursor.close()
+        # SQLite PRAGMA 적용 (외래 키, WAL 등 - 각 연결마다)
+        event.listen(self.engine, "connect", set_sqlite_pragmas)
 
-        logger.info("✅ SQLite engine initialized")
+        logger.info("✅ SQLite engine initialized (%s)", ", ".join(_sqlite_pragmas()))
 
     def _init_postgresql_engine(self):
         """PostgreSQL 엔진 초기화 - 프로덕션 최적화 설정"""
@@ -91,13 +140,42 @@ class SessionManager:
 
         logger.info("✅ Database engine initialized: %s", settings.DATABASE_URL.split("://")[0])
 
+    def _init_replica_engine(self):
+        """읽기 replica 엔진 초기화 (DATABASE_REPLICA_URL 설정 시에만)"""
+        if not settings.DATABASE_REPLICA_URL:
+            return
+
+        self.replica_engine = create_engine(
+            settings.DATABASE_REPLICA_URL,
+            echo=settings.DEBUG,
+            pool_size=settings.POOL_SIZE,
+            max_overflow=settings.MAX_OVERFLOW,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+
+        logger.info("✅ Read replica engine initialized: %s",
+                    settings.DATABASE_REPLICA_URL.split("://")[0])
+
     @contextmanager
-    def get_session(self):
+    def get_session(self, read_only: bool = False, use_replica: bool = False):
         """
         Context Manager를 통한 세션 관리
         - with 블록 종료 시 자동 close
+
+        :param read_only: PostgreSQL이면 트랜잭션을 READ ONLY로 시작
+        :param use_replica: replica 엔진이 있으면 replica 사용 (없으면 primary)
         """
-        with Session(self.engine) as session:
+        engine = self.engine
+        if use_replica and self.replica_engine is not None:
+            engine = self.replica_engine
+
+        with Session(engine) as session:
+            # 읽기 전용 세션 표시 (테스트에서 flush 감지용)
+            session.info["read_only"] = read_only
+            if read_only and engine.dialect.name == "postgresql":
+                # 트랜잭션의 첫 문장이어야 적용됨
+                session.connection().exec_driver_sql("SET TRANSACTION READ ONLY")
             yield session
 
     def init_db(self):
@@ -114,13 +192,20 @@ def init_db():
     _session_manager.init_db()
 
 
-def get_db() -> Generator[Session, None, None]:
+def read_your_writes_requested(request: Request) -> bool:
+    """요청이 read-your-writes(primary 조회)를 요구하는지 확인 (READ_YOUR_WRITES_HEADER)"""
+    value = request.headers.get(READ_YOUR_WRITES_HEADER, "")
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def read_only_session(use_replica: bool = True) -> Generator[Session, None, None]:
     """
-    읽기 전용 세션 (commit 없음)
-    - GET 요청 등 읽기 작업에 사용
-    - FastAPI가 자동으로 세션 close 처리
+    읽기 전용 세션 Generator (commit 없음)
+    - PostgreSQL은 SET TRANSACTION READ ONLY로 시작
+    - use_replica=True이고 DATABASE_REPLICA_URL이 설정되어 있으면 replica 사용
+    - 종료 시 항상 rollback (변경 사항이 남아 있으면 경고)
     """
-    with _session_manager.get_session() as session:
+    with _session_manager.get_session(read_only=True, use_replica=use_replica) as session:
         try:
             yield session
         except Exception:
@@ -138,6 +223,21 @@ def get_db() -> Generator[Session, None, None]:
             session.rollback()
 
 
+def get_db(request: Request) -> Generator[Session, None, None]:
+    """
+    읽기 전용 세션 (commit 없음)
+    - GET 요청 등 읽기 작업에 사용
+    - FastAPI가 자동으로 세션 close 처리
+    - GET/HEAD/OPTIONS 요청은 replica에서 조회 (replica 미설정 시 primary)
+    - 쓰기 요청의 검증 조회와 READ_YOUR_WRITES_HEADER가 있는 요청은 primary에서 조회
+    """
+    use_replica = (
+        request.method in _REPLICA_METHODS
+        and not read_your_writes_requested(request)
+    )
+    yield from read_only_session(use_replica=use_replica)
+
+
 def get_db_transactional() -> Generator[Session, None, None]:
     """
     트랜잭션 자동 관리 세션
@@ -191,12 +291,15 @@ def _create_async_engine():
     async_url = _get_async_database_url()
 
     if _is_sqlite():
-        # SQLite: connect_args 필요, pool 설정 불필요
-        return create_async_engine(
+        # SQLite: 동기 엔진과 같은 성능 프로필(PRAGMA)과 연결 풀 크기 적용
+        engine = create_async_engine(
             async_url,
             echo=settings.DEBUG,
             connect_args={"check_same_thread": False},
+            **_sqlite_pool_kwargs(),
         )
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        return engine
     elif _is_postgresql():
         # PostgreSQL: 프로덕션 최적화 설정
         return create_async_engine(
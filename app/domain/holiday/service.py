@@ -12,6 +12,7 @@ import json
 import logging
 from typing import Awaitable, Callable, List, Optional
 
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import Session
 
@@ -442,6 +443,14 @@ class HolidayReadService:
 
         return holidays
 
+    @staticmethod
+    def _get_holidays_from_primary(start_year: int, end_year: int) -> List[HolidayItem]:
+        """primary DB에서 공휴일 조회 (요청 세션이 replica일 수 있으므로 별도 세션 사용)"""
+        from app.db.session import _session_manager
+
+        with _session_manager.get_session(read_only=True) as session:
+            return HolidayReadService(session).get_holidays(start_year, end_year)
+
     async def get_holidays_with_auto_sync(
             self,
             start_year: int,
@@ -460,8 +469,8 @@ class HolidayReadService:
         if end_year is None:
             end_year = start_year
 
-        # 1. 먼저 조회
-        holidays = self.get_holidays(start_year, end_year)
+        # 1. 먼저 조회 (동기 DB 조회는 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+        holidays = await run_in_threadpool(self.get_holidays, start_year, end_year)
 
         if not holidays:
             # 2. 데이터 없으면 비동기 세션으로 동기화 수행
@@ -475,6 +484,9 @@ class HolidayReadService:
                 )
                 # get_async_db의 context manager가 자동으로 commit 처리
 
-            holidays = self.get_holidays(start_year, end_year)
+            # 동기화 결과는 primary에 commit되므로 primary에서 재조회 (replica 복제 지연 회피)
+            holidays = await run_in_threadpool(
+                self._get_holidays_from_primary, start_year, end_year
+            )
 
         return holidays
@@ -19,7 +19,7 @@ from app.domain.schedule.model import Schedule
 from app.models.schedule import ScheduleException
 
 
-async def valid_schedule_id(
+def valid_schedule_id(
         schedule_id: UUID,
         session: Session = Depends(get_db),
         current_user: CurrentUser = Depends(get_current_user),
@@ -45,7 +45,7 @@ async def valid_schedule_id(
     return schedule
 
 
-async def valid_schedule_exception_id(
+def valid_schedule_exception_id(
         exception_id: UUID,
         session: Session = Depends(get_db),
 ) -> ScheduleException:
@@ -0,0 +1,156 @@
+"""
+Schedule Occurrence Service
+
+반복 일정 인스턴스 인덱스(schedule_occurrence)의 갱신을 담당합니다.
+
+인덱스는 선택 기능이며(settings.SCHEDULE_OCCURRENCE_INDEX_ENABLED),
+현재 기준 [과거 LOOKBACK_DAYS, 미래 HORIZON_DAYS] 기간의 인스턴스를 저장합니다.
+- 일정 생성/수정 시 해당 일정의 인덱스를 다시 계산
+- 인스턴스 삭제/복원 시 is_deleted 반영
+- 원본 삭제 시 DB 레벨 CASCADE로 자동 삭제
+- horizon 연장은 ScheduleOccurrenceHorizonTask가 주기적으로 처리
+
+기능이 꺼져 있는 동안의 쓰기는 해당 일정의 인덱스를 삭제합니다.
+다시 켜면 coverage가 없는 일정은 RRULE 확장으로 조회되고, horizon 연장이 다시 채웁니다.
+"""
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.crud import schedule as crud
+from app.domain.dateutil.service import DEFAULT_TIME_TOLERANCE_SECONDS
+from app.domain.schedule.model import Schedule
+from app.models.base import utc_now_naive
+from app.utils.recurrence import RecurrenceCalculator
+
+
+class ScheduleOccurrenceService:
+    """
+    반복 일정 인스턴스 인덱스 관리 서비스
+
+    - 일정 단위 인덱스 재계산 (refresh)
+    - 인스턴스 삭제 여부 반영 (mark_deleted)
+    - 기간이 끝나가는 일정의 horizon 연장 (extend_horizon)
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """인스턴스 인덱스 사용 여부"""
+        return settings.SCHEDULE_OCCURRENCE_INDEX_ENABLED
+
+    @staticmethod
+    def target_window(now: datetime | None = None) -> tuple[datetime, datetime]:
+        """
+        인덱스를 유지할 기간 계산
+
+        :param now: 기준 시각 (UTC naive, 없으면 현재)
+        :return: (시작, 종료) 튜플
+        """
+        now = now or utc_now_naive()
+        return (
+            now - timedelta(days=settings.SCHEDULE_OCCURRENCE_LOOKBACK_DAYS),
+            now + timedelta(days=settings.SCHEDULE_OCCURRENCE_HORIZON_DAYS),
+        )
+
+    def refresh(self, schedule: Schedule, now: datetime | None = None) -> None:
+        """
+        일정의 인덱스 인스턴스 재계산
+
+        반복 일정이 아니거나 인덱스가 꺼져 있으면 인덱스를 삭제합니다.
+        원본 start_time이 기간 시작 이후이면 시리즈 처음부터 저장합니다.
+        원본 행을 잠근 뒤 삭제된 예외를 읽으므로, 동시에 실행된 mark_deleted가 덮어써지지 않습니다.
+
+        :param schedule: 원본 일정
+        :param now: 기준 시각 (UTC naive, 없으면 현재)
+        """
+        if not self.is_enabled() or not schedule.recurrence_rule:
+            crud.delete_schedule_occurrences(self.session, schedule.id)
+            return
+
+        crud.lock_schedule_occurrences(self.session, schedule.id)
+
+        window_start, window_end = self.target_window(now)
+        covered_from = max(window_start, schedule.start_time)
+
+        instances = RecurrenceCalculator.expand_recurrence(
+            schedule.start_time,
+            schedule.end_time,
+            schedule.recurrence_rule,
+            schedule.recurrence_end,
+            covered_from,
+            window_end,
+        )
+
+        # 이미 삭제된 인스턴스 반영 (1분 이내 허용 오차)
+        tolerance = timedelta(seconds=DEFAULT_TIME_TOLERANCE_SECONDS)
+        deleted_dates = []
+        if instances:
+            deleted_dates = crud.get_deleted_schedule_exception_dates(
+                self.session,
+                schedule.id,
+                instances[0][0] - tolerance,
+                instances[-1][0] + tolerance,
+            )
+
+        rows = []
+        for instance_start, instance_end in instances:
+            index = bisect_left(deleted_dates, instance_start - tolerance)
+            is_deleted = (
+                index < len(deleted_dates)
+                and deleted_dates[index] <= instance_start + tolerance
+            )
+            rows.append((instance_start, instance_end, is_deleted))
+
+        crud.replace_schedule_occurrences(
+            self.session, schedule, rows, covered_from, window_end
+        )
+
+    def mark_deleted(self, parent_id: UUID, instance_start: datetime, is_deleted: bool) -> None:
+        """
+        인스턴스 삭제 여부를 인덱스에 반영
+
+        인덱스가 꺼져 있으면 해당 일정의 인덱스를 삭제합니다 (다시 켤 때 오래된 인덱스 사용 방지).
+
+        :param parent_id: 원본 일정 ID
+        :param instance_start: 인스턴스 시작 시간 (UTC naive)
+        :param is_deleted: 삭제 여부
+        """
+        if not self.is_enabled():
+            crud.delete_schedule_occurrences(self.session, parent_id)
+            return
+        crud.lock_schedule_occurrences(self.session, parent_id)
+        crud.set_schedule_occurrence_deleted(self.session, parent_id, instance_start, is_deleted)
+
+    def extend_horizon(self, now: datetime | None = None, batch_size: int = 100) -> int:
+        """
+        coverage가 없거나 끝나가는 반복 일정의 인덱스 재계산
+
+        남은 기간이 HORIZON_DAYS의 절반 아래로 떨어진 일정만 다시 계산하므로,
+        일정마다 약 HORIZON_DAYS / 2 주기로 한 번씩 갱신됩니다.
+        배치마다 flush하며, commit은 호출자가 처리합니다.
+
+        :param now: 기준 시각 (UTC naive, 없으면 현재)
+        :param batch_size: 한 번에 조회할 일정 수
+        :return: 재계산한 일정 수
+        """
+        if not self.is_enabled():
+            return 0
+
+        now = now or utc_now_naive()
+        threshold = now + timedelta(days=settings.SCHEDULE_OCCURRENCE_HORIZON_DAYS / 2)
+
+        refreshed = 0
+        while True:
+            schedules = crud.get_stale_occurrence_schedules(self.session, threshold, batch_size)
+            if not schedules:
+                break
+            for schedule in schedules:
+                self.refresh(schedule, now)
+            refreshed += len(schedules)
+        return refreshed
@@ -10,9 +10,11 @@ from uuid import UUID
 from sqlmodel import Session, select
 
 from app.crud import schedule as crud
-from app.domain.dateutil.service import ensure_utc_naive, is_datetime_within_tolerance
+from app.domain.dateutil.service import ensure_utc_naive
 from app.domain.schedule.model import Schedule
-from app.domain.schedule.recurring_service import RecurringScheduleService
+from app.domain.schedule.occurrence_service import ScheduleOccurrenceService
+from app.domain.schedule.recurring_service import RecurringScheduleService, ScheduleExceptionIndex
+from app.models.schedule import ScheduleException
 from app.models.tag import Tag, ScheduleTag
 from app.utils.recurrence import RecurrenceCalculator
 
@@ -22,7 +24,7 @@ class ScheduleQueryService:
     일정 조회 및 태그 필터링 서비스
 
     - 날짜 범위 조회 (반복 일정 확장 포함)
-    - 태그 기반 필터링 (AND/OR 방식)
+    - 태그 기반 필터링 (AND/OR 방식, SQL에서 원본 일정 기준으로 적용)
     """
 
     def __init__(self, session: Session, owner_id: str):
@@ -42,13 +44,7 @@ class ScheduleQueryService:
         :param group_ids: 필터링할 그룹 ID 리스트
         :return: 필터링된 일정 리스트
         """
-        all_schedules = crud.get_schedules(self.session, self.owner_id)
-
-        # 태그 필터링 적용
-        if tag_ids or group_ids:
-            return self.filter_schedules_by_tags(all_schedules, tag_ids, group_ids)
-
-        return all_schedules
+        return crud.get_schedules(self.session, self.owner_id, tag_ids, group_ids)
 
     def get_schedules_by_date_range(
             self,
@@ -66,6 +62,8 @@ class ScheduleQueryService:
         - 예외 인스턴스 처리 (삭제/수정된 인스턴스)
         - 태그 필터링: AND 방식 (모든 지정 태그 포함)
         - 그룹 필터링: 해당 그룹의 태그 중 하나라도 있으면 포함
+        - 태그/그룹 필터는 SQL에서 원본 일정에 적용하므로, 조건에 맞는 반복 일정만 확장
+          (가상 인스턴스는 원본의 태그를 상속)
 
         :param start_date: 시작 날짜
         :param end_date: 종료 날짜
@@ -79,7 +77,7 @@ class ScheduleQueryService:
 
         # 1. 일반 일정 조회 (반복 일정 제외)
         regular_schedules = crud.get_schedules_by_date_range(
-            self.session, start_date_utc, end_date_utc, self.owner_id
+            self.session, start_date_utc, end_date_utc, self.owner_id, tag_ids, group_ids
         )
         # 반복 일정이 아닌 것만 필터링
         regular_schedules = [
@@ -87,54 +85,89 @@ class ScheduleQueryService:
             if not s.recurrence_rule
         ]
 
-        # 2. 반복 일정 조회 (원본만)
-        recurring_schedules = crud.get_recurring_schedules(
-            self.session, start_date_utc, end_date_utc, self.owner_id
+        # 2. 반복 일정 인스턴스 수집 (원본, [(instance_start, instance_end), ...])
+        expanded = self._collect_recurring_instances(
+            start_date_utc, end_date_utc, tag_ids, group_ids
         )
 
-        # 3. 예외 인스턴스 조회 및 인덱싱
+        # 3. 예외 인스턴스 조회
         exceptions = crud.get_schedule_exceptions(
             self.session, start_date_utc, end_date_utc, self.owner_id
         )
 
-        # 예외를 한 번만 순회하여 dict와 parent별 그룹화 동시 생성
-        exception_dict = {}
-        exceptions_by_parent = {}
-        for exc in exceptions:
-            # 정확한 매칭용 딕셔너리
-            exception_dict[(exc.parent_id, exc.exception_date)] = exc
+        # 4. 반복 일정 인스턴스를 가상 인스턴스로 변환 (예외 적용)
+        virtual_instances = self._build_virtual_instances(expanded, exceptions)
 
-            # parent별 그룹화 (허용 오차 검색용)
-            if exc.parent_id not in exceptions_by_parent:
-                exceptions_by_parent[exc.parent_id] = []
-            exceptions_by_parent[exc.parent_id].append(exc)
+        # 5. 일반 일정 + 가상 인스턴스 합치기 후 시간순 정렬
+        all_schedules = list(regular_schedules) + virtual_instances
+        return sorted(all_schedules, key=lambda s: s.start_time)
 
-        # 4. 반복 일정을 가상 인스턴스로 확장
-        virtual_instances = []
-        for schedule in recurring_schedules:
-            if not schedule.recurrence_rule:
-                continue
+    def expand_schedules(
+            self,
+            schedules: list[Schedule],
+            start_date: datetime,
+            end_date: datetime,
+    ) -> list[Schedule]:
+        """
+        이미 조회된 일정 목록을 날짜 범위로 확장 (공유된 일정 등)
 
-            instances = RecurrenceCalculator.expand_recurrence(
-                schedule.start_time,
-                schedule.end_time,
-                schedule.recurrence_rule,
-                schedule.recurrence_end,
-                start_date_utc,
-                end_date_utc,
+        get_schedules_by_date_range와 같은 방식으로 반복 일정을 가상 인스턴스로 확장하고
+        예외를 적용합니다. 예외는 소유자가 아니라 원본 일정 ID로 조회합니다.
+        일반 일정은 호출 측에서 이미 날짜 범위로 조회되었다고 가정합니다.
+
+        :param schedules: 일반 일정과 반복 일정 원본 리스트
+        :param start_date: 조회 시작 날짜 (UTC naive)
+        :param end_date: 조회 종료 날짜 (UTC naive)
+        :return: 일반 일정 + 가상 인스턴스 (시간순)
+        """
+        regular_schedules = [s for s in schedules if not s.recurrence_rule]
+        recurring_schedules = [s for s in schedules if s.recurrence_rule]
+
+        expanded = [
+            (
+                schedule,
+                RecurrenceCalculator.expand_recurrence(
+                    schedule.start_time,
+                    schedule.end_time,
+                    schedule.recurrence_rule,
+                    schedule.recurrence_end,
+                    start_date,
+                    end_date,
+                ),
             )
+            for schedule in recurring_schedules
+        ]
+        exceptions = crud.get_schedule_exceptions_by_parents(
+            self.session, [s.id for s in recurring_schedules], start_date, end_date
+        )
+
+        all_schedules = regular_schedules + self._build_virtual_instances(expanded, exceptions)
+        return sorted(all_schedules, key=lambda s: s.start_time)
+
+    def _build_virtual_instances(
+            self,
+            expanded: list[tuple[Schedule, list[tuple[datetime, datetime]]]],
+            exceptions: list[ScheduleException],
+    ) -> list[Schedule]:
+        """
+        확장된 인스턴스에 예외를 적용하여 가상 인스턴스 생성
+
+        삭제된 인스턴스는 제외하고, 수정된 인스턴스는 예외 데이터를 사용합니다.
 
+        :param expanded: [(원본 일정, [(instance_start, instance_end), ...]), ...]
+        :param exceptions: 조회 범위의 예외 인스턴스
+        :return: 가상 인스턴스 리스트
+        """
+        # parent별로 exception_date 순 정렬 (인스턴스마다 허용 오차 범위를 bisect로 검색)
+        exception_index = ScheduleExceptionIndex(exceptions)
+
+        virtual_instances = []
+        for schedule, instances in expanded:
             # 예외 처리: 삭제/수정된 인스턴스 처리
             for instance_start, instance_end in instances:
 
-                exception = exception_dict.get((schedule.id, instance_start))
-
-                # 정확히 매칭되지 않으면 시간 허용 오차 검색 (해당 parent_id의 예외만)
-                if exception is None and schedule.id in exceptions_by_parent:
-                    for exc in exceptions_by_parent[schedule.id]:
-                        if is_datetime_within_tolerance(exc.exception_date, instance_start):
-                            exception = exc
-                            break
+                # 정확히 일치하거나 시간 허용 오차 내의 예외 (해당 parent_id의 예외만)
+                exception = exception_index.find(schedule.id, instance_start)
 
                 if exception and exception.is_deleted:
                     continue  # 삭제된 인스턴스는 제외
@@ -145,101 +178,64 @@ class ScheduleQueryService:
                 )
                 virtual_instances.append(virtual_schedule)
 
-        # 5. 일반 일정 + 가상 인스턴스 합치기
-        all_schedules = list(regular_schedules) + virtual_instances
-
-        # 6. 태그 필터링 적용
-        if tag_ids or group_ids:
-            all_schedules = self.filter_schedules_by_tags(
-                all_schedules, tag_ids, group_ids
-            )
-
-        # 7. 시간순 정렬
-        return sorted(all_schedules, key=lambda s: s.start_time)
+        return virtual_instances
 
-    def filter_schedules_by_tags(
+    def _collect_recurring_instances(
             self,
-            schedules: list[Schedule],
+            start_date: datetime,
+            end_date: datetime,
             tag_ids: Optional[List[UUID]] = None,
             group_ids: Optional[List[UUID]] = None,
-    ) -> list[Schedule]:
+    ) -> list[tuple[Schedule, list[tuple[datetime, datetime]]]]:
         """
-        일정을 태그로 필터링
+        조회 범위 내 반복 일정 인스턴스 수집
 
-        비즈니스 로직:
-        - tag_ids: AND 방식 (모든 지정 태그 포함해야 함)
-        - group_ids: 해당 그룹의 태그 중 하나라도 있으면 포함
-        - 둘 다 지정 시: 그룹 필터링 후 태그 필터링 적용
+        인스턴스 인덱스가 켜져 있으면 범위를 덮는 원본은 schedule_occurrence
+        범위 스캔 한 번으로 가져오고, 덮지 않는 원본만 RRULE로 확장합니다.
 
-        :param schedules: 필터링할 일정 리스트
-        :param tag_ids: 필터링할 태그 ID 리스트 (AND 방식)
-        :param group_ids: 필터링할 그룹 ID 리스트
-        :return: 필터링된 일정 리스트
+        :param start_date: 조회 시작 날짜 (UTC naive)
+        :param end_date: 조회 종료 날짜 (UTC naive)
+        :param tag_ids: 태그 필터 (AND 방식)
+        :param group_ids: 그룹 필터
+        :return: [(원본 일정, [(instance_start, instance_end), ...]), ...]
         """
-        if not schedules:
-            return schedules
+        expanded: list[tuple[Schedule, list[tuple[datetime, datetime]]]] = []
+
+        if ScheduleOccurrenceService.is_enabled():
+            indexed: dict[UUID, tuple[Schedule, list[tuple[datetime, datetime]]]] = {}
+            for occurrence, schedule in crud.get_schedule_occurrences(
+                    self.session, start_date, end_date, self.owner_id, tag_ids, group_ids
+            ):
+                if schedule.id not in indexed:
+                    indexed[schedule.id] = (schedule, [])
+                indexed[schedule.id][1].append(
+                    (occurrence.instance_start, occurrence.instance_end)
+                )
+            expanded.extend(indexed.values())
 
-        # 그룹 ID가 지정된 경우, 해당 그룹의 태그 ID 조회
-        group_tag_ids: set[UUID] = set()
-        if group_ids:
-            statement = select(Tag.id).where(Tag.group_id.in_(group_ids))
-            group_tag_ids = set(self.session.exec(statement).all())
+            recurring_schedules = crud.get_uncovered_recurring_schedules(
+                self.session, start_date, end_date, self.owner_id, tag_ids, group_ids
+            )
+        else:
+            recurring_schedules = crud.get_recurring_schedules(
+                self.session, start_date, end_date, self.owner_id, tag_ids, group_ids
+            )
 
-        # 일정별 태그 조회 (한 번에 조회하여 N+1 방지)
-        schedule_ids = [s.id for s in schedules]
-        statement = (
-            select(ScheduleTag.schedule_id, ScheduleTag.tag_id)
-            .where(ScheduleTag.schedule_id.in_(schedule_ids))
-        )
-        schedule_tag_rows = self.session.exec(statement).all()
-
-        # 일정별 태그 매핑
-        schedule_tag_map: dict[UUID, set[UUID]] = {}
-        for schedule_id, tag_id in schedule_tag_rows:
-            if schedule_id not in schedule_tag_map:
-                schedule_tag_map[schedule_id] = set()
-            schedule_tag_map[schedule_id].add(tag_id)
-
-        # 가상 인스턴스(parent_id가 있는)의 경우, 부모 일정의 태그를 상속
-        parent_ids = [s.parent_id for s in schedules if s.parent_id]
-        if parent_ids:
-            parent_statement = (
-                select(ScheduleTag.schedule_id, ScheduleTag.tag_id)
-                .where(ScheduleTag.schedule_id.in_(parent_ids))
+        for schedule in recurring_schedules:
+            if not schedule.recurrence_rule:
+                continue
+
+            instances = RecurrenceCalculator.expand_recurrence(
+                schedule.start_time,
+                schedule.end_time,
+                schedule.recurrence_rule,
+                schedule.recurrence_end,
+                start_date,
+                end_date,
             )
-            parent_tag_rows = self.session.exec(parent_statement).all()
-
-            # 부모 태그 매핑
-            parent_tag_map: dict[UUID, set[UUID]] = {}
-            for schedule_id, tag_id in parent_tag_rows:
-                if schedule_id not in parent_tag_map:
-                    parent_tag_map[schedule_id] = set()
-                parent_tag_map[schedule_id].add(tag_id)
-
-            # 가상 인스턴스에 부모 태그 상속
-            for schedule in schedules:
-                if schedule.parent_id and schedule.parent_id in parent_tag_map:
-                    if schedule.id not in schedule_tag_map:
-                        schedule_tag_map[schedule.id] = set()
-                    schedule_tag_map[schedule.id].update(parent_tag_map[schedule.parent_id])
-
-        filtered_schedules = []
-        for schedule in schedules:
-            schedule_tags = schedule_tag_map.get(schedule.id, set())
-
-            # 그룹 필터링: 해당 그룹의 태그 중 하나라도 있어야 함
-            if group_ids:
-                if not schedule_tags.intersection(group_tag_ids):
-                    continue
-
-            # 태그 필터링: 모든 지정 태그를 포함해야 함 (AND 방식)
-            if tag_ids:
-                if not set(tag_ids).issubset(schedule_tags):
-                    continue
-
-            filtered_schedules.append(schedule)
-
-        return filtered_schedules
+            expanded.append((schedule, instances))
+
+        return expanded
 
     def get_schedule_tags(self, schedule_id: UUID) -> list[Tag]:
         """
@@ -3,21 +3,79 @@ Recurring Schedule Service
 
 반복 일정 인스턴스의 생성, 수정, 삭제를 담당합니다.
 """
-from datetime import datetime
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Iterable
 from uuid import UUID, uuid4
 
 from sqlmodel import Session
 
 from app.crud import schedule as crud
-from app.domain.dateutil.service import ensure_utc_naive, is_datetime_within_tolerance
+from app.domain.dateutil.service import ensure_utc_naive, DEFAULT_TIME_TOLERANCE_SECONDS
 from app.domain.schedule.exceptions import (
     ScheduleNotFoundError,
     RecurringScheduleError,
 )
 from app.domain.schedule.model import Schedule
+from app.domain.schedule.occurrence_service import ScheduleOccurrenceService
 from app.domain.schedule.schema.dto import ScheduleUpdate
 from app.models.schedule import ScheduleException
-from app.utils.recurrence import RecurrenceCalculator
+from app.utils.recurrence import RecurrenceCalculator, rrule_cache
+
+
+class ScheduleExceptionIndex:
+    """
+    예외 인스턴스 검색 인덱스
+
+    예외를 parent_id별로 exception_date 순으로 정렬해 두고, 인스턴스마다
+    허용 오차(기본 60초) 범위를 bisect로 찾습니다.
+    인스턴스마다 예외 목록 전체를 훑지 않으므로 매칭 비용은 O(log n)입니다.
+    """
+
+    def __init__(
+            self,
+            exceptions: Iterable[ScheduleException],
+            tolerance_seconds: int = DEFAULT_TIME_TOLERANCE_SECONDS,
+    ):
+        self._tolerance = timedelta(seconds=tolerance_seconds)
+        self._exceptions: dict[UUID, list[ScheduleException]] = {}
+        for exc in exceptions:
+            if exc.parent_id not in self._exceptions:
+                self._exceptions[exc.parent_id] = []
+            self._exceptions[exc.parent_id].append(exc)
+
+        self._dates: dict[UUID, list[datetime]] = {}
+        for parent_id, parent_exceptions in self._exceptions.items():
+            parent_exceptions.sort(key=lambda exc: exc.exception_date)
+            self._dates[parent_id] = [exc.exception_date for exc in parent_exceptions]
+
+    def find(self, parent_id: UUID, instance_start: datetime) -> ScheduleException | None:
+        """
+        인스턴스 시작 시간과 허용 오차 내에 있는 예외 찾기
+
+        날짜가 아니라 시간까지 비교하므로 하루에 인스턴스가 여러 개여도 구분합니다.
+        허용 오차 안에 예외가 여러 개면 가장 가까운 예외를 반환합니다
+        (정확히 일치하는 예외가 항상 우선).
+
+        :param parent_id: 원본 일정 ID
+        :param instance_start: 인스턴스 시작 시간
+        :return: 예외 인스턴스 또는 None
+        """
+        dates = self._dates.get(parent_id)
+        if not dates:
+            return None
+
+        upper = instance_start + self._tolerance
+        index = bisect_left(dates, instance_start - self._tolerance)
+        nearest = None
+        nearest_diff = None
+        while index < len(dates) and dates[index] <= upper:
+            diff = abs(dates[index] - instance_start)
+            if nearest_diff is None or diff < nearest_diff:
+                nearest = self._exceptions[parent_id][index]
+                nearest_diff = diff
+            index += 1
+        return nearest
 
 
 class RecurringScheduleService:
@@ -32,6 +90,7 @@ class RecurringScheduleService:
     def __init__(self, session: Session, owner_id: str):
         self.session = session
         self.owner_id = owner_id
+        self._occurrences = ScheduleOccurrenceService(session)
 
     def create_virtual_instance(
             self,
@@ -68,6 +127,7 @@ class RecurringScheduleService:
                 recurrence_rule=None,  # 가상 인스턴스는 반복 규칙 없음
                 recurrence_end=None,
                 parent_id=schedule.id,
+                owner_id=schedule.owner_id,
             )
 
         # 예외가 없으면 원본 데이터 사용
@@ -81,34 +141,9 @@ class RecurringScheduleService:
             recurrence_rule=None,
             recurrence_end=None,
             parent_id=schedule.id,
+            owner_id=schedule.owner_id,
         )
 
-    def find_exception(
-            self,
-            exceptions: list[ScheduleException],
-            parent_id: UUID,
-            instance_start: datetime,
-    ) -> ScheduleException | None:
-        """
-        특정 인스턴스의 예외 찾기
-
-        Bug Fix: 시간까지 비교하여 정확한 인스턴스 매칭
-        - 날짜만 비교하면 하루에 여러 인스턴스가 있을 때 구분하지 못함
-        - 시간까지 비교하여 정확한 인스턴스와 매칭
-        - 약간의 허용 오차를 두어 시간 정밀도 문제 방지 (1분 이내)
-
-        :param exceptions: 예외 인스턴스 리스트
-        :param parent_id: 원본 일정 ID
-        :param instance_start: 인스턴스 시작 시간 (datetime)
-        :return: 예외 인스턴스 또는 None
-        """
-        for exc in exceptions:
-            if exc.parent_id == parent_id:
-                # 시간까지 비교 (1분 이내 허용 오차)
-                if is_datetime_within_tolerance(exc.exception_date, instance_start):
-                    return exc
-        return None
-
     def update_recurring_instance(
             self,
             parent_id: UUID,
@@ -156,6 +191,7 @@ class RecurringScheduleService:
             # 기존 예외 인스턴스 업데이트
             if existing_exception.is_deleted:
                 existing_exception.is_deleted = False
+                self._occurrences.mark_deleted(parent_id, existing_exception.exception_date, False)
 
             crud.update_schedule_exception(self.session, existing_exception, update_dict)
 
@@ -252,6 +288,7 @@ class RecurringScheduleService:
                 owner_id=self.owner_id,
                 is_deleted=True,
             )
+        self._occurrences.mark_deleted(parent_id, instance_start_utc, True)
 
         # recurrence_end가 있는 경우, 모든 인스턴스가 삭제되었는지 확인
         if parent_schedule.recurrence_end:
@@ -266,47 +303,59 @@ class RecurringScheduleService:
         recurrence_end가 있는 경우에만 사용 가능합니다.
         무한 반복 일정은 확인하지 않습니다.
 
+        전체 인스턴스를 리스트로 확장하지 않고 시간순으로 하나씩 생성하며,
+        해당 일정의 삭제된 예외 날짜(시간순)와 함께 훑다가 삭제되지 않은
+        인스턴스를 처음 만나면 바로 False를 반환합니다.
+        단순 DAILY/WEEKLY 규칙은 인스턴스 수를 산술로 계산하여, 삭제된 예외가
+        그보다 적으면 순회 없이 False를 반환합니다.
+
         :param schedule: 반복 일정
         :return: 모든 인스턴스가 삭제되었으면 True
         """
         if not schedule.recurrence_rule or not schedule.recurrence_end:
             return False
 
-        # 모든 인스턴스 확장
-        instances = RecurrenceCalculator.expand_recurrence(
-            schedule.start_time,
-            schedule.end_time,
-            schedule.recurrence_rule,
-            schedule.recurrence_end,
-            schedule.start_time,  # 시작부터
-            schedule.recurrence_end,  # 종료일까지
-        )
-
-        if not instances:
-            # 인스턴스가 없으면 삭제된 것으로 간주
-            return True
+        tolerance = timedelta(seconds=DEFAULT_TIME_TOLERANCE_SECONDS)
+        range_start = schedule.start_time - tolerance
+        range_end = schedule.recurrence_end + tolerance
 
-        # 모든 예외 인스턴스 조회 (parent_id로 필터링)
-        all_exceptions = crud.get_schedule_exceptions(
-            self.session,
-            schedule.start_time,
-            schedule.recurrence_end,
-            self.owner_id,
-        )
-        parent_exceptions = [
-            exc for exc in all_exceptions
-            if exc.parent_id == schedule.id
-        ]
-
-        # 각 인스턴스가 삭제되었는지 확인
-        for instance_start, instance_end in instances:
-            exception = self.find_exception(
-                parent_exceptions, schedule.id, instance_start
+        try:
+            rule = rrule_cache.get(
+                schedule.recurrence_rule, schedule.start_time, schedule.recurrence_end
+            )
+            occurrences = iter(rule)
+        except Exception:
+            # RRULE 파싱 실패 시 원본만 인스턴스로 간주
+            rule = None
+            occurrences = iter([schedule.start_time])
+
+        # 개수 비교: 인스턴스마다 서로 다른 삭제 예외가 필요하므로
+        # 삭제된 예외가 인스턴스 수보다 적으면 살아 있는 인스턴스가 있음
+        instance_count = RecurrenceCalculator.count_simple(rule, schedule.recurrence_end)
+        if instance_count:
+            deleted_count = crud.count_deleted_schedule_exceptions(
+                self.session, schedule.id, range_start, range_end
             )
+            if deleted_count < instance_count:
+                return False
+
+        # 삭제된 예외 날짜 (해당 일정만, 오름차순)
+        deleted_dates = iter(crud.get_deleted_schedule_exception_dates(
+            self.session, schedule.id, range_start, range_end
+        ))
+        deleted_date = next(deleted_dates, None)
+
+        for instance_start in occurrences:
+            if instance_start > schedule.recurrence_end:
+                break
+
+            # 허용 오차 범위보다 이른 삭제 날짜는 건너뜀 (양쪽 모두 시간순)
+            while deleted_date is not None and deleted_date < instance_start - tolerance:
+                deleted_date = next(deleted_dates, None)
 
-            # 예외가 없거나 삭제되지 않았으면 False
-            if not exception or not exception.is_deleted:
+            # 삭제되지 않은 인스턴스 발견
+            if deleted_date is None or deleted_date > instance_start + tolerance:
                 return False
 
-        # 모든 인스턴스가 삭제되었음
+        # 모든 인스턴스가 삭제되었음 (인스턴스가 없으면 삭제된 것으로 간주)
         return True
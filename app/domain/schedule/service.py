@@ -10,6 +10,7 @@ FastAPI Best Practices:
 내부 서비스:
 - RecurringScheduleService: 반복 일정 인스턴스 관리
 - ScheduleQueryService: 날짜 범위 조회 및 태그 필터링
+- ScheduleOccurrenceService: 반복 일정 인스턴스 인덱스 갱신 (선택 기능)
 """
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
@@ -23,6 +24,7 @@ from sqlmodel import Session
 from app.core.auth import CurrentUser
 from app.crud import schedule as crud
 from app.crud import visibility as visibility_crud
+from app.domain.dateutil.service import ensure_utc_naive
 from app.domain.schedule.exceptions import (
     ScheduleNotFoundError,
     InvalidRecurrenceRuleError,
@@ -30,6 +32,7 @@ from app.domain.schedule.exceptions import (
     ScheduleAlreadyLinkedToTodoError,
 )
 from app.domain.schedule.model import Schedule
+from app.domain.schedule.occurrence_service import ScheduleOccurrenceService
 from app.domain.schedule.query_service import ScheduleQueryService
 from app.domain.schedule.recurring_service import RecurringScheduleService
 from app.domain.schedule.schema.dto import ScheduleCreate, ScheduleUpdate
@@ -37,6 +40,9 @@ from app.domain.visibility.enums import VisibilityLevel, ResourceType
 from app.domain.visibility.service import VisibilityService
 from app.utils.recurrence import RecurrenceCalculator
 
+# 변경 시 반복 일정 인스턴스 인덱스를 다시 계산해야 하는 필드
+_RECURRENCE_FIELDS = frozenset({"start_time", "end_time", "recurrence_rule", "recurrence_end"})
+
 
 class ScheduleService:
     """
@@ -55,6 +61,7 @@ class ScheduleService:
         self.owner_id = current_user.sub
         self._recurring = RecurringScheduleService(session, self.owner_id)
         self._query = ScheduleQueryService(session, self.owner_id)
+        self._occurrences = ScheduleOccurrenceService(session)
 
     # ========================================
     # CRUD
@@ -79,7 +86,10 @@ class ScheduleService:
         """
         # 반복 일정 검증
         if data.recurrence_rule:
-            if not RecurrenceCalculator.is_valid_rrule(data.recurrence_rule):
+            # 실제 dtstart로 검증하여 파싱 결과를 이후 조회에서 캐시로 재사용
+            if not RecurrenceCalculator.is_valid_rrule(
+                    data.recurrence_rule, data.start_time, data.recurrence_end
+            ):
                 raise InvalidRecurrenceRuleError()
 
             if data.recurrence_end and data.recurrence_end < data.start_time:
@@ -87,6 +97,10 @@ class ScheduleService:
 
         schedule = crud.create_schedule(self.session, data, self.owner_id)
 
+        # 반복 일정 인스턴스 인덱스 갱신
+        if schedule.recurrence_rule:
+            self._occurrences.refresh(schedule)
+
         # 태그 설정
         if data.tag_ids:
             from app.domain.tag.service import TagService
@@ -158,7 +172,9 @@ class ScheduleService:
         if recurrence_rule:
             if 'recurrence_rule' in update_dict:
                 # 새로운 recurrence_rule이 제공된 경우 검증
-                if not RecurrenceCalculator.is_valid_rrule(recurrence_rule):
+                if not RecurrenceCalculator.is_valid_rrule(
+                        recurrence_rule, start_time_utc, recurrence_end_utc
+                ):
                     raise InvalidRecurrenceRuleError()
 
             # recurrence_end 검증 (업데이트되거나 기존 값이 있는 경우)
@@ -177,6 +193,10 @@ class ScheduleService:
             tag_service.set_schedule_tags(schedule.id, update_dict['tag_ids'] or [])
         updated_schedule = crud.update_schedule(self.session, schedule, data)
 
+        # 반복 규칙이나 시간이 바뀐 경우 인스턴스 인덱스 갱신
+        if _RECURRENCE_FIELDS.intersection(update_dict):
+            self._occurrences.refresh(updated_schedule)
+
         # 태그가 업데이트된 경우 relationship 갱신
         if tag_ids_updated:
             self.session.refresh(updated_schedule)
@@ -307,6 +327,77 @@ class ScheduleService:
             get_resource_id=lambda s: s.id,
         )
 
+    def get_shared_schedule_reads_by_date_range(
+            self,
+            start_date: datetime,
+            end_date: datetime,
+            tag_ids: Optional[List[UUID]] = None,
+            group_ids: Optional[List[UUID]] = None,
+    ) -> list["ScheduleRead"]:
+        """
+        날짜 범위로 공유된 일정을 ScheduleRead DTO로 조회 (타인 소유, 접근 권한 있는 것만, 반복 일정 포함)
+
+        get_shared_schedules와 같은 배치 권한 필터링을 사용하되, 날짜 범위는 SQL에서
+        적용하므로 비용이 공유된 일정 전체가 아니라 조회 범위에 비례합니다.
+        1. visibility 조인 + 날짜 범위 조회
+        2. 배치 권한 필터링
+        3. 반복 일정 확장 및 예외 적용 (get_schedules_by_date_range와 동일)
+
+        후보 조회 쿼리가 함께 읽은 접근권한 레벨을 원본 ID 기준으로 가상 인스턴스에 전달하므로,
+        인스턴스마다 접근권한을 다시 조회하지 않습니다.
+
+        :param start_date: 조회 시작 날짜
+        :param end_date: 조회 종료 날짜
+        :param tag_ids: 필터링할 태그 ID 리스트 (AND 방식)
+        :param group_ids: 필터링할 그룹 ID 리스트
+        :return: 공유된 일정 DTO 리스트 (시간순, is_shared=True)
+        """
+        schedules, levels = self._get_shared_schedules_with_levels(start_date, end_date, tag_ids, group_ids)
+        return [
+            self.to_read_dto(
+                schedule,
+                is_shared=True,
+                visibility_level=levels[schedule.parent_id or schedule.id],
+            )
+            for schedule in schedules
+        ]
+
+    def _get_shared_schedules_with_levels(
+            self,
+            start_date: datetime,
+            end_date: datetime,
+            tag_ids: Optional[List[UUID]],
+            group_ids: Optional[List[UUID]],
+    ) -> tuple[list[Schedule], dict[UUID, VisibilityLevel]]:
+        """공유된 일정 조회 + 원본 일정 ID별 접근권한 레벨"""
+        start_date_utc = ensure_utc_naive(start_date)
+        end_date_utc = ensure_utc_naive(end_date)
+
+        # 1. 후보 목록 조회 (visibility != PRIVATE, owner != me, 날짜 범위, 태그 필터)
+        rows = crud.get_shared_schedules_by_date_range(
+            self.session,
+            start_date_utc,
+            end_date_utc,
+            exclude_owner_id=self.owner_id,
+            tag_ids=tag_ids,
+            group_ids=group_ids,
+        )
+        if not rows:
+            return [], {}
+
+        # 2. 배치 권한 필터링
+        visibility_service = VisibilityService(self.session, self.current_user)
+        schedules = visibility_service.filter_accessible_resources(
+            resource_type=ResourceType.SCHEDULE,
+            visibilities=[visibility for _, visibility in rows],
+            resources=[schedule for schedule, _ in rows],
+            get_resource_id=lambda s: s.id,
+        )
+        levels = {schedule.id: visibility.level for schedule, visibility in rows}
+
+        # 3. 반복 일정 확장 및 예외 적용
+        return self._query.expand_schedules(schedules, start_date_utc, end_date_utc), levels
+
     # ========================================
     # 조회 및 태그 필터링 (→ ScheduleQueryService)
     # ========================================
@@ -461,12 +552,14 @@ class ScheduleService:
             self,
             schedule: Schedule,
             is_shared: bool = False,
+            visibility_level: Optional[VisibilityLevel] = None,
     ) -> "ScheduleRead":
         """
         Schedule을 ScheduleRead DTO로 변환하고 접근권한 정보를 채웁니다.
 
-        :param schedule: Schedule 모델
+        :param schedule: Schedule 모델 (가상 인스턴스는 원본 일정 기준으로 접근권한 조회)
         :param is_shared: 공유된 리소스인지 여부
+        :param visibility_level: 이미 조회한 접근권한 레벨 (None이면 조회)
         :return: ScheduleRead DTO (접근권한 정보 포함)
         """
         from app.domain.schedule.schema.dto import ScheduleRead
@@ -478,10 +571,9 @@ class ScheduleService:
         schedule_read.is_shared = is_shared
 
         # 접근권한 레벨 조회
-        visibility = visibility_crud.get_visibility_by_resource(
-            self.session, ResourceType.SCHEDULE, schedule.id
-        )
-        if visibility:
-            schedule_read.visibility_level = visibility.level
+        if visibility_level is None:
+            visibility_level = self.get_schedule_visibility(schedule.parent_id or schedule.id)
+        if visibility_level:
+            schedule_read.visibility_level = visibility_level
 
         return schedule_read
@@ -0,0 +1,94 @@
+"""
+Schedule 백그라운드 태스크
+
+반복 일정 인스턴스 인덱스(schedule_occurrence)의 horizon 연장 태스크
+lifespan 내부에서 실행될 async 태스크
+
+책임:
+- 스케줄링 (주기적 실행)
+- 상태 관리 (is_running)
+- Service 호출 (비즈니스 로직은 ScheduleOccurrenceService에 위임)
+"""
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.db.session import _session_manager
+from app.domain.schedule.occurrence_service import ScheduleOccurrenceService
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleOccurrenceHorizonTask:
+    """
+    반복 일정 인스턴스 인덱스 horizon 연장 태스크
+
+    시작 직후 한 번 실행하여 인덱스가 없는 기존 반복 일정을 채우고,
+    이후 주기마다 기간이 끝나가는 일정의 인덱스를 다시 계산한다.
+    """
+
+    def __init__(self, interval_seconds: int | None = None):
+        """
+        Args:
+            interval_seconds: 실행 주기(초). None이면 설정값을 사용한다.
+        """
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else settings.SCHEDULE_OCCURRENCE_REFRESH_INTERVAL_SECONDS
+        )
+        self.is_running = False
+
+    @property
+    def enabled(self) -> bool:
+        """인스턴스 인덱스가 켜져 있고 주기가 0보다 클 때만 활성화"""
+        return ScheduleOccurrenceService.is_enabled() and self.interval_seconds > 0
+
+    def _extend(self) -> int:
+        """동기 세션으로 horizon 연장 (스레드에서 실행)"""
+        with _session_manager.get_session() as session:
+            try:
+                refreshed = ScheduleOccurrenceService(session).extend_horizon()
+                session.commit()
+                return refreshed
+            except Exception:
+                session.rollback()
+                raise
+
+    async def run(self) -> None:
+        """
+        주기적 horizon 연장 (lifespan startup 후 실행)
+
+        - enabled가 False면 즉시 종료한다.
+        - 동기 DB 작업은 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+        - 실패는 경고만 남기고 다음 주기에 재시도한다.
+        - asyncio.CancelledError 시 정상 종료한다.
+        """
+        if not self.enabled:
+            logger.info("ℹ️  Schedule occurrence index disabled")
+            return
+
+        self.is_running = True
+        logger.info(
+            "✅ Schedule occurrence horizon task started (interval=%ds)",
+            self.interval_seconds,
+        )
+
+        try:
+            while self.is_running:
+                try:
+                    refreshed = await asyncio.to_thread(self._extend)
+                    if refreshed:
+                        logger.info("Schedule occurrence index refreshed: %d schedules", refreshed)
+                except Exception as e:
+                    logger.warning(
+                        "Schedule occurrence horizon refresh failed (will retry next interval): %s",
+                        str(e),
+                    )
+
+                await asyncio.sleep(self.interval_seconds)
+
+        except asyncio.CancelledError:
+            logger.info("Schedule occurrence horizon task cancelled (shutdown)")
+            self.is_running = False
+            raise
@@ -17,7 +17,7 @@ from app.domain.tag.exceptions import TagGroupNotFoundError, TagNotFoundError
 from app.domain.tag.model import TagGroup, Tag
 
 
-async def valid_tag_group_id(
+def valid_tag_group_id(
         group_id: UUID,
         session: Session = Depends(get_db),
 ) -> TagGroup:
@@ -41,7 +41,7 @@ async def valid_tag_group_id(
     return tag_group
 
 
-async def valid_tag_id(
+def valid_tag_id(
         tag_id: UUID,
         session: Session = Depends(get_db),
 ) -> Tag:
@@ -17,7 +17,7 @@ from app.domain.timer.exceptions import TimerNotFoundError
 from app.domain.timer.model import TimerSession
 
 
-async def valid_timer_id(
+def valid_timer_id(
         timer_id: UUID,
         session: Session = Depends(get_db),
 ) -> TimerSession:
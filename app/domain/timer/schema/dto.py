@@ -121,6 +121,8 @@ class TimerRead(CustomModel):
         """
         # schedule, todo, tags 관계를 제외하여 안전하게 변환 (의도치 않은 lazy load 방지)
         timer_data = timer.model_dump(exclude={"schedule", "todo", "tags"})
+        # RUNNING이면 현재 세그먼트까지 포함한 경과 시간 (모델은 변경하지 않음)
+        timer_data["elapsed_time"] = timer.current_elapsed_time()
         timer_read = cls.model_validate(timer_data)
 
         # schedule 필드 명시적으로 설정
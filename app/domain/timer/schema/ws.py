@@ -5,13 +5,16 @@ Timer 도메인 전용 WebSocket 메시지 구조 정의
 """
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional, Any
+from typing import Optional, Any, TYPE_CHECKING
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.domain.dateutil.service import convert_utc_naive_to_timezone, ensure_utc_naive
 
+if TYPE_CHECKING:
+    from app.domain.timer.model import TimerSession
+
 
 class TimerWSMessageType(str, Enum):
     """타이머 WebSocket 메시지 타입"""
@@ -88,6 +91,17 @@ class TimerData(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @classmethod
+    def from_model(cls, timer: "TimerSession") -> "TimerData":
+        """
+        TimerSession 모델에서 TimerData 생성
+
+        RUNNING이면 현재 세그먼트까지 포함한 경과 시간을 채운다 (모델은 변경하지 않음).
+        """
+        timer_data = cls.model_validate(timer)
+        timer_data.elapsed_time = timer.current_elapsed_time()
+        return timer_data
+
     def to_timezone(self, tz: timezone | str | None) -> "TimerData":
         """
         UTC naive datetime 필드를 지정된 타임존의 aware datetime으로 변환
@@ -129,7 +129,8 @@ class TimerService:
         타이머 조회 (본인 소유만)
         
         비즈니스 로직:
-        - 경과 시간을 실시간으로 계산 (status가 RUNNING인 경우)
+        - RUNNING 타이머의 실시간 경과 시간은 모델을 변경하지 않고 DTO 변환 시 계산
+          (TimerSession.current_elapsed_time, 읽기 전용 세션에서 UPDATE 방지)
         
         :param timer_id: 타이머 ID
         :return: 타이머
@@ -139,10 +140,6 @@ class TimerService:
         if not timer:
             raise TimerNotFoundError()
 
-        if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-            now = ensure_utc_naive(datetime.now(UTC))
-            self._add_running_segment_to_elapsed(timer, now)
-
         return timer
 
     def get_timer_with_access_check(self, timer_id: UUID) -> tuple[TimerSession, bool]:
@@ -162,10 +159,6 @@ class TimerService:
         if not timer:
             raise TimerNotFoundError()
 
-        if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-            now = ensure_utc_naive(datetime.now(UTC))
-            self._add_running_segment_to_elapsed(timer, now)
-
         # 본인 소유인 경우
         if timer.owner_id == self.owner_id:
             return timer, False
@@ -218,11 +211,6 @@ class TimerService:
             get_resource_id=lambda t: t.id,
         )
 
-        now = ensure_utc_naive(datetime.now(UTC))
-        for timer in accessible_timers:
-            if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-                self._add_running_segment_to_elapsed(timer, now)
-
         return accessible_timers
 
     def get_timers_by_schedule(self, schedule_id: UUID) -> list[TimerSession]:
@@ -234,11 +222,6 @@ class TimerService:
         """
         timers = crud.get_timers_by_schedule(self.session, schedule_id, self.owner_id)
 
-        now = ensure_utc_naive(datetime.now(UTC))
-        for timer in timers:
-            if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-                self._add_running_segment_to_elapsed(timer, now)
-
         return timers
 
     def get_active_timer(self, schedule_id: UUID) -> TimerSession | None:
@@ -250,10 +233,6 @@ class TimerService:
         """
         timer = crud.get_active_timer(self.session, schedule_id, self.owner_id)
 
-        if timer and timer.status == TimerStatus.RUNNING.value and timer.started_at:
-            now = ensure_utc_naive(datetime.now(UTC))
-            self._add_running_segment_to_elapsed(timer, now)
-
         return timer
 
     def get_timers_by_todo(self, todo_id: UUID) -> list[TimerSession]:
@@ -265,11 +244,6 @@ class TimerService:
         """
         timers = crud.get_timers_by_todo(self.session, todo_id, self.owner_id)
 
-        now = ensure_utc_naive(datetime.now(UTC))
-        for timer in timers:
-            if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-                self._add_running_segment_to_elapsed(timer, now)
-
         return timers
 
     def get_active_timer_by_todo(self, todo_id: UUID) -> TimerSession | None:
@@ -281,10 +255,6 @@ class TimerService:
         """
         timer = crud.get_active_timer_by_todo(self.session, todo_id, self.owner_id)
 
-        if timer and timer.status == TimerStatus.RUNNING.value and timer.started_at:
-            now = ensure_utc_naive(datetime.now(UTC))
-            self._add_running_segment_to_elapsed(timer, now)
-
         return timer
 
     def get_all_timers(
@@ -312,11 +282,6 @@ class TimerService:
             end_date=end_date,
         )
 
-        now = ensure_utc_naive(datetime.now(UTC))
-        for timer in timers:
-            if timer.status == TimerStatus.RUNNING.value and timer.started_at:
-                self._add_running_segment_to_elapsed(timer, now)
-
         return timers
 
     def get_user_active_timer(self) -> TimerSession | None:
@@ -329,10 +294,6 @@ class TimerService:
         """
         timer = crud.get_user_active_timer(self.session, self.owner_id)
 
-        if timer and timer.status == TimerStatus.RUNNING.value and timer.started_at:
-            now = ensure_utc_naive(datetime.now(UTC))
-            self._add_running_segment_to_elapsed(timer, now)
-
         return timer
 
     def pause_timer(self, timer_id: UUID) -> TimerSession:
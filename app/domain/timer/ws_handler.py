@@ -11,6 +11,7 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import WebSocket
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
 
 from app.core.auth import CurrentUser
@@ -23,6 +24,7 @@ from app.domain.timer.schema.ws import (
     TimerActionPayload,
     TimerData,
 )
+from app.domain.timer.model import TimerSession
 from app.domain.timer.service import TimerService
 from app.websocket.base import WSClientMessage, WSServerMessage, WSMessageType
 from app.websocket.manager import connection_manager
@@ -38,6 +40,8 @@ class TimerWSHandler:
     
     Note: pause_history는 TimerService에서 처리하므로 핸들러에서는 
     Service 메서드 호출만 수행합니다.
+    동기 DB 작업(Service 호출, DTO 변환)은 스레드풀에서 실행하여
+    다른 WebSocket 연결과 HTTP 요청이 이벤트 루프에서 대기하지 않도록 합니다.
     """
 
     def __init__(self, session: Session, current_user: CurrentUser, tz=None):
@@ -46,6 +50,28 @@ class TimerWSHandler:
         self.timer_service = TimerService(session, current_user)
         self.tz = tz  # 타임존 (timezone 객체, 문자열, 또는 None)
 
+    def _to_timer_data(self, timer) -> TimerData:
+        """TimerSession을 TimerData로 변환 (타임존 적용)"""
+        timer_data = TimerData.from_model(timer)
+        if self.tz:
+            timer_data = timer_data.to_timezone(self.tz)
+        return timer_data
+
+    async def _run_timer_action(self, action, *args) -> tuple[TimerSession, TimerData]:
+        """
+        타이머 Service 메서드를 스레드풀에서 실행하고 TimerData로 변환
+
+        :param action: TimerService 메서드
+        :param args: 메서드 인자
+        :return: (타이머, TimerData)
+        """
+
+        def run() -> tuple[TimerSession, TimerData]:
+            timer = action(*args)
+            return timer, self._to_timer_data(timer)
+
+        return await run_in_threadpool(run)
+
     async def dispatch(
             self,
             message: WSClientMessage,
@@ -98,13 +124,8 @@ class TimerWSHandler:
                 tag_ids=create_payload.tag_ids,
             )
 
-            # 타이머 생성 (TimerService에서 pause_history 처리 포함)
-            timer = self.timer_service.create_timer(timer_create)
-
-            # TimerData로 변환 및 타임존 적용
-            timer_data = TimerData.model_validate(timer)
-            if self.tz:
-                timer_data = timer_data.to_timezone(self.tz)
+            # 타이머 생성 (TimerService에서 pause_history 처리 포함), TimerData로 변환 및 타임존 적용
+            timer, timer_data = await self._run_timer_action(self.timer_service.create_timer, timer_create)
 
             # 응답 메시지 생성
             response = WSServerMessage(
@@ -147,13 +168,10 @@ class TimerWSHandler:
         try:
             action_payload = TimerActionPayload(**payload)
 
-            # TimerService에서 pause_history 처리 포함
-            timer = self.timer_service.pause_timer(action_payload.timer_id)
-
-            # TimerData로 변환 및 타임존 적용
-            timer_data = TimerData.model_validate(timer)
-            if self.tz:
-                timer_data = timer_data.to_timezone(self.tz)
+            # TimerService에서 pause_history 처리 포함, TimerData로 변환 및 타임존 적용
+            timer, timer_data = await self._run_timer_action(
+                self.timer_service.pause_timer, action_payload.timer_id
+            )
 
             # 응답 메시지 생성
             response = WSServerMessage(
@@ -196,13 +214,10 @@ class TimerWSHandler:
         try:
             action_payload = TimerActionPayload(**payload)
 
-            # TimerService에서 pause_history 처리 포함
-            timer = self.timer_service.resume_timer(action_payload.timer_id)
-
-            # TimerData로 변환 및 타임존 적용
-            timer_data = TimerData.model_validate(timer)
-            if self.tz:
-                timer_data = timer_data.to_timezone(self.tz)
+            # TimerService에서 pause_history 처리 포함, TimerData로 변환 및 타임존 적용
+            timer, timer_data = await self._run_timer_action(
+                self.timer_service.resume_timer, action_payload.timer_id
+            )
 
             # 응답 메시지 생성
             response = WSServerMessage(
@@ -245,13 +260,10 @@ class TimerWSHandler:
         try:
             action_payload = TimerActionPayload(**payload)
 
-            # TimerService에서 pause_history 처리 포함
-            timer = self.timer_service.stop_timer(action_payload.timer_id)
-
-            # TimerData로 변환 및 타임존 적용
-            timer_data = TimerData.model_validate(timer)
-            if self.tz:
-                timer_data = timer_data.to_timezone(self.tz)
+            # TimerService에서 pause_history 처리 포함, TimerData로 변환 및 타임존 적용
+            timer, timer_data = await self._run_timer_action(
+                self.timer_service.stop_timer, action_payload.timer_id
+            )
 
             # 응답 메시지 생성
             response = WSServerMessage(
@@ -296,49 +308,7 @@ class TimerWSHandler:
         try:
             timer_id = payload.get("timer_id")
             scope = payload.get("scope", "active")
-
-            if timer_id:
-                # 특정 타이머 조회 (단건)
-                timer = self.timer_service.get_timer(UUID(timer_id))
-                if timer:
-                    timer_data = TimerData.model_validate(timer)
-                    if self.tz:
-                        timer_data = timer_data.to_timezone(self.tz)
-                    return WSServerMessage(
-                        type=TimerWSMessageType.UPDATED.value,
-                        payload={"timer": timer_data.model_dump(mode="json"), "action": "sync"},
-                        from_user=self.current_user.sub,
-                    )
-                else:
-                    return WSServerMessage(
-                        type=TimerWSMessageType.UPDATED.value,
-                        payload={"timer": None, "action": "sync"},
-                        from_user=self.current_user.sub,
-                    )
-            else:
-                # 타이머 목록 조회
-                if scope == "active":
-                    timers = self.timer_service.get_all_timers(status=["RUNNING", "PAUSED"])
-                else:
-                    timers = self.timer_service.get_all_timers()
-
-                # 타임존 변환 적용
-                timer_list = []
-                for t in timers:
-                    timer_data = TimerData.model_validate(t)
-                    if self.tz:
-                        timer_data = timer_data.to_timezone(self.tz)
-                    timer_list.append(timer_data)
-
-                return WSServerMessage(
-                    type=TimerWSMessageType.SYNC_RESULT.value,
-                    payload={
-                        "timers": [t.model_dump(mode="json") for t in timer_list],
-                        "count": len(timer_list),
-                    },
-                    from_user=self.current_user.sub,
-                )
-
+            return await run_in_threadpool(self._build_sync_response, timer_id, scope)
         except Exception as e:
             logger.error(f"Timer sync failed: {e}")
             return WSServerMessage(
@@ -346,6 +316,44 @@ class TimerWSHandler:
                 payload={"code": "SYNC_FAILED", "message": str(e)},
             )
 
+    def _build_sync_response(self, timer_id: Optional[str], scope: str) -> WSServerMessage:
+        """
+        동기화 응답 생성 (동기, 스레드풀에서 실행)
+
+        :param timer_id: 조회할 타이머 ID (없으면 목록 조회)
+        :param scope: 목록 조회 범위 (active: 실행/일시정지 중인 타이머만)
+        :return: 응답 메시지
+        """
+        if timer_id:
+            # 특정 타이머 조회 (단건)
+            timer = self.timer_service.get_timer(UUID(timer_id))
+            return WSServerMessage(
+                type=TimerWSMessageType.UPDATED.value,
+                payload={
+                    "timer": self._to_timer_data(timer).model_dump(mode="json") if timer else None,
+                    "action": "sync",
+                },
+                from_user=self.current_user.sub,
+            )
+
+        # 타이머 목록 조회
+        if scope == "active":
+            timers = self.timer_service.get_all_timers(status=["RUNNING", "PAUSED"])
+        else:
+            timers = self.timer_service.get_all_timers()
+
+        # 타임존 변환 적용
+        timer_list = [self._to_timer_data(t) for t in timers]
+
+        return WSServerMessage(
+            type=TimerWSMessageType.SYNC_RESULT.value,
+            payload={
+                "timers": [t.model_dump(mode="json") for t in timer_list],
+                "count": len(timer_list),
+            },
+            from_user=self.current_user.sub,
+        )
+
     async def _notify_friends(
             self,
             action: TimerAction,
@@ -361,7 +369,8 @@ class TimerWSHandler:
         """
         try:
             # 친구 ID 목록 조회
-            friend_ids = friendship_crud.get_friend_ids(
+            friend_ids = await run_in_threadpool(
+                friendship_crud.get_friend_ids,
                 self.session,
                 self.current_user.sub,
             )
@@ -13,24 +13,34 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.v1 import api_router
-from app.core.auth import AuthMiddleware
+from app.core.auth import AuthMiddleware, oidc_client
 from app.core.config import settings
 from app.core.error_handlers import register_exception_handlers
 from app.core.logging import setup_logging
 from app.db.keepalive import DatabaseKeepAliveTask
 from app.db.session import init_db as init_db_sync, init_db_async  # 동기 및 비동기 방식
 from app.domain.holiday.tasks import HolidayBackgroundTask
+from app.domain.schedule.tasks import ScheduleOccurrenceHorizonTask
 from app.middleware.request_logger import RequestLoggerMiddleware
 from app.ratelimit.cloudflare import get_cloudflare_manager, get_trusted_proxy_manager
+from app.ratelimit.config import reload_rules
 from app.ratelimit.middleware import RateLimitMiddleware
+from app.ratelimit.storage.memory import get_storage
+from app.ratelimit.tasks import RateLimitCleanupTask
+from app.websocket.bus import create_event_bus
+from app.websocket.manager import connection_manager
 
 logger = logging.getLogger(__name__)
 
 # 전역 태스크 참조 (shutdown 시 정리)
 holiday_task = HolidayBackgroundTask()
 keepalive_task = DatabaseKeepAliveTask()
+occurrence_task = ScheduleOccurrenceHorizonTask()
+ratelimit_cleanup_task = RateLimitCleanupTask()
 _asyncio_task: asyncio.Task | None = None
 _keepalive_asyncio_task: asyncio.Task | None = None
+_occurrence_asyncio_task: asyncio.Task | None = None
+_ratelimit_cleanup_asyncio_task: asyncio.Task | None = None
 
 
 @asynccontextmanager
@@ -43,7 +53,7 @@ async def lifespan(app: FastAPI):
     
     이 패턴으로 startup/shutdown 로직 연결 가능
     """
-    global _asyncio_task, _keepalive_asyncio_task
+    global _asyncio_task, _keepalive_asyncio_task, _occurrence_asyncio_task, _ratelimit_cleanup_asyncio_task
 
     # ============ STARTUP ============
     logger.info("🌍 Starting FastAPI application")
@@ -54,7 +64,9 @@ async def lifespan(app: FastAPI):
 
         # 2. Rate Limit status check
         if settings.RATE_LIMIT_ENABLED:
-            logger.info("✅ Rate limiting is ENABLED")
+            # 엔드포인트 규칙을 미리 컴파일 (규칙 파일이 잘못되었으면 시작 실패)
+            rules = reload_rules()
+            logger.info(f"✅ Rate limiting is ENABLED ({len(rules.rules)} rules)")
         else:
             logger.warning("⚠️  Rate limiting is DISABLED")
 
@@ -73,6 +85,13 @@ async def lifespan(app: FastAPI):
             logger.warning("#                                                      #")
             logger.warning("########################################################")
             logger.warning("")
+        else:
+            # 3-1. JWKS 미리 조회 (첫 요청이 IdP 왕복을 기다리지 않도록, 실패해도 시작은 계속)
+            try:
+                await oidc_client.get_jwks()
+                logger.info("✅ OIDC JWKS preloaded")
+            except Exception as e:
+                logger.warning(f"⚠️  Failed to preload OIDC JWKS, will retry on first request: {e}")
 
         # 4. 동기 DB 초기화 (기존 코드 호환성)
         init_db_sync()
@@ -97,6 +116,26 @@ async def lifespan(app: FastAPI):
         else:
             logger.info("ℹ️  DB keep-alive disabled")
 
+        # 6-2. 반복 일정 인스턴스 인덱스 horizon 연장 태스크 (활성화된 경우에만)
+        if occurrence_task.enabled:
+            _occurrence_asyncio_task = asyncio.create_task(occurrence_task.run())
+            logger.info(
+                "✅ Schedule occurrence horizon task scheduled (interval=%ds)",
+                occurrence_task.interval_seconds,
+            )
+
+        # 6-3. 레이트 리밋 저장소 정리 태스크 (REST/WebSocket 공용 저장소의 만료 키 정리)
+        if ratelimit_cleanup_task.enabled:
+            _ratelimit_cleanup_asyncio_task = asyncio.create_task(ratelimit_cleanup_task.run())
+            logger.info(
+                "✅ Rate limit cleanup task scheduled (interval=%ds)",
+                ratelimit_cleanup_task.interval_seconds,
+            )
+
+        # 6-4. WebSocket 이벤트 버스 구독 (다른 워커의 send_to_user/broadcast_to_friends 수신)
+        await connection_manager.start_bus(create_event_bus())
+        logger.info(f"✅ WebSocket event bus started ({settings.WS_EVENT_BUS})")
+
         # 7. Cloudflare/Trusted Proxy 설정 초기화
         if settings.CF_ENABLED:
             cf_manager = get_cloudflare_manager()
@@ -143,6 +182,35 @@ async def lifespan(app: FastAPI):
             except asyncio.CancelledError:
                 logger.info("✅ DB keep-alive task stopped")
 
+        # 3. 반복 일정 인스턴스 인덱스 태스크 정상 종료
+        if _occurrence_asyncio_task:
+            occurrence_task.is_running = False
+            _occurrence_asyncio_task.cancel()
+
+            try:
+                await _occurrence_asyncio_task
+            except asyncio.CancelledError:
+                logger.info("✅ Schedule occurrence horizon task stopped")
+
+        # 4. 레이트 리밋 저장소 정리 태스크 정상 종료
+        if _ratelimit_cleanup_asyncio_task:
+            ratelimit_cleanup_task.is_running = False
+            _ratelimit_cleanup_asyncio_task.cancel()
+
+            try:
+                await _ratelimit_cleanup_asyncio_task
+            except asyncio.CancelledError:
+                logger.info("✅ Rate limit cleanup task stopped")
+
+        # 4-1. 레이트 리밋 저장소 연결 종료 (공유 저장소 사용 시)
+        get_storage().close()
+
+        # 4-2. WebSocket 이벤트 버스 구독 중단
+        await connection_manager.stop_bus()
+
+        # 5. OIDC HTTP 클라이언트(연결 풀) 종료
+        await oidc_client.aclose()
+
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}", exc_info=True)
 
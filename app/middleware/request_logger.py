@@ -2,16 +2,24 @@ import logging
 import time
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
-    """요청 로깅 미들웨어"""
+class RequestLoggerMiddleware:
+    """요청 로깅 미들웨어 (순수 ASGI, HTTP 요청만 기록)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         start_time = time.time()
+        request = Request(scope)
 
         # 요청 정보 로깅
         logger.info(
@@ -23,20 +31,26 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):
             }
         )
 
-        response = await call_next(request)
+        status_code = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # 응답 시간 계산
+        await self.app(scope, receive, send_wrapper)
+
+        # 응답 시간 계산 (본문 전송 완료까지)
         process_time = time.time() - start_time
 
         # 응답 정보 로깅
         logger.info(
-            f"Response: {request.method} {request.url.path} - {response.status_code}",
+            f"Response: {request.method} {request.url.path} - {status_code}",
             extra={
                 "method": request.method,
                 "path": request.url.path,
-                "status_code": response.status_code,
+                "status_code": status_code,
                 "process_time": process_time,
             }
         )
-
-        return response
@@ -3,7 +3,12 @@ import app.valid.schedule  # noqa: F401
 import app.valid.tag  # noqa: F401
 from app.models.friendship import Friendship, FriendshipStatus
 from app.models.meeting import Meeting, MeetingParticipant, MeetingTimeSlot
-from app.models.schedule import Schedule, ScheduleException
+from app.models.schedule import (
+    Schedule,
+    ScheduleException,
+    ScheduleOccurrence,
+    ScheduleOccurrenceCoverage,
+)
 from app.models.tag import TagGroup, Tag, ScheduleTag, ScheduleExceptionTag, TodoTag
 from app.models.timer import TimerSession
 from app.models.todo import Todo
@@ -19,6 +24,9 @@ from app.models.visibility import (
 __all__ = [
     "Schedule",
     "ScheduleException",
+    # 반복 일정 인스턴스 인덱스 (선택 기능)
+    "ScheduleOccurrence",
+    "ScheduleOccurrenceCoverage",
     "TimerSession",
     "TagGroup",
     "Tag",
@@ -72,6 +72,7 @@ class Friendship(UUIDBase, TimestampMixin, table=True):
         # 친구 조회 성능 최적화
         Index("ix_friendship_status", "status"),
         Index("ix_friendship_addressee_status", "addressee_id", "status"),
+        Index("ix_friendship_requester_status", "requester_id", "status"),
     )
 
     def compute_pair_ids(self) -> None:
@@ -2,8 +2,8 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING, List
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, Enum as SQLEnum
-from sqlmodel import Field, Relationship
+from sqlalchemy import Column, ForeignKey, Index, Enum as SQLEnum, text
+from sqlmodel import Field, Relationship, SQLModel
 
 from app.domain.schedule.enums import ScheduleState
 from app.models.base import UUIDBase, TimestampMixin
@@ -18,6 +18,18 @@ if TYPE_CHECKING:
 
 
 class Schedule(UUIDBase, TimestampMixin, table=True):
+    __table_args__ = (
+        # 날짜 범위 조회 (get_schedules_by_date_range)
+        Index("ix_schedule_owner_range", "owner_id", "start_time", "end_time"),
+        # 반복 일정(원본)만 담는 부분 인덱스 (get_recurring_schedules)
+        Index(
+            "ix_schedule_owner_recurring",
+            "owner_id", "start_time",
+            sqlite_where=text("recurrence_rule IS NOT NULL"),
+            postgresql_where=text("recurrence_rule IS NOT NULL"),
+        ),
+    )
+
     # 소유자 (OIDC sub claim)
     owner_id: str = Field(index=True)
 
@@ -70,6 +82,18 @@ class Schedule(UUIDBase, TimestampMixin, table=True):
 
 class ScheduleException(UUIDBase, TimestampMixin, table=True):
     """반복 일정의 예외 인스턴스 (특정 날짜만 수정/삭제)"""
+    __table_args__ = (
+        # 인스턴스별 예외 조회 (get_schedule_exception_by_date)
+        Index("ix_scheduleexception_owner_parent_date", "owner_id", "parent_id", "exception_date"),
+        # 삭제된 인스턴스만 담는 부분 인덱스 (전체 인스턴스 삭제 여부 확인)
+        Index(
+            "ix_scheduleexception_parent_deleted",
+            "parent_id", "exception_date",
+            sqlite_where=text("is_deleted IS 1"),
+            postgresql_where=text("is_deleted IS true"),
+        ),
+    )
+
     # 소유자 (OIDC sub claim)
     owner_id: str = Field(index=True)
 
@@ -92,3 +116,57 @@ class ScheduleException(UUIDBase, TimestampMixin, table=True):
         link_model=ScheduleExceptionTag,
         sa_relationship_kwargs={"lazy": "selectin"}  # N+1 방지
     )
+
+
+class ScheduleOccurrence(SQLModel, table=True):
+    """
+    반복 일정 인스턴스 인덱스 (선택 기능)
+
+    반복 일정(원본)의 RRULE 확장 결과를 기간(horizon) 단위로 미리 저장해,
+    날짜 범위 조회를 인덱스 범위 스캔 한 번으로 처리합니다.
+    - instance_start/instance_end: RRULE이 생성한 원래 인스턴스 시간
+    - is_deleted: 삭제된 인스턴스 (ScheduleException.is_deleted 반영)
+    - 수정된 인스턴스(제목/시간 변경)는 조회 시 ScheduleException으로 덮어씀
+    """
+    __tablename__ = "schedule_occurrence"
+    __table_args__ = (
+        Index(
+            "ix_schedule_occurrence_owner_range",
+            "owner_id", "instance_start", "instance_end",
+        ),
+    )
+
+    parent_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("schedule.id", ondelete="CASCADE"),
+            nullable=False,
+            primary_key=True,
+        )
+    )
+    instance_start: datetime = Field(primary_key=True)
+    instance_end: datetime
+    # 소유자 (OIDC sub claim) - 범위 조회용 비정규화
+    owner_id: str
+    is_deleted: bool = False
+
+
+class ScheduleOccurrenceCoverage(SQLModel, table=True):
+    """
+    반복 일정별 인스턴스 인덱스 적용 범위
+
+    [covered_from, covered_until]과 겹치는 모든 인스턴스가 schedule_occurrence에
+    저장되어 있음을 나타냅니다. covered_from이 원본 start_time 이하이면
+    시리즈 처음부터 저장된 것입니다. 범위를 벗어난 조회는 RRULE 확장으로 처리합니다.
+    """
+    __tablename__ = "schedule_occurrence_coverage"
+
+    parent_id: UUID = Field(
+        sa_column=Column(
+            ForeignKey("schedule.id", ondelete="CASCADE"),
+            nullable=False,
+            primary_key=True,
+        )
+    )
+    owner_id: str = Field(index=True)
+    covered_from: datetime
+    covered_until: datetime = Field(index=True)
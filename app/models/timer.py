@@ -1,8 +1,8 @@
-from datetime import datetime
+from datetime import datetime, UTC
 from typing import Optional, TYPE_CHECKING, List, Any
 from uuid import UUID
 
-from sqlalchemy import Column, ForeignKey, JSON
+from sqlalchemy import Column, ForeignKey, Index, JSON
 from sqlmodel import Field, Relationship
 
 from app.core.constants import TimerStatus
@@ -17,6 +17,11 @@ if TYPE_CHECKING:
 
 class TimerSession(UUIDBase, TimestampMixin, table=True):
     """타이머 세션 모델"""
+    __table_args__ = (
+        # 상태/시작 시간 필터 조회 (get_all_timers, get_user_active_timer)
+        Index("ix_timersession_owner_status_started", "owner_id", "status", "started_at"),
+    )
+
     # 소유자 (OIDC sub claim)
     owner_id: str = Field(index=True)
 
@@ -75,3 +80,17 @@ class TimerSession(UUIDBase, TimestampMixin, table=True):
         link_model=TimerTag,
         sa_relationship_kwargs={"lazy": "selectin"}  # N+1 방지
     )
+
+    def current_elapsed_time(self, now: Optional[datetime] = None) -> int:
+        """
+        현재까지의 경과 시간 (초)
+
+        RUNNING이면 저장된 elapsed_time에 현재 세그먼트(started_at ~ now)를 더한 값.
+        모델은 변경하지 않으므로 읽기 전용 세션에서도 flush(UPDATE)가 발생하지 않는다.
+
+        :param now: 기준 시각 (UTC naive, None이면 현재 시각)
+        """
+        if self.status != TimerStatus.RUNNING.value or not self.started_at:
+            return self.elapsed_time
+        now = now or datetime.now(UTC).replace(tzinfo=None)
+        return self.elapsed_time + max(0, int((now - self.started_at).total_seconds()))
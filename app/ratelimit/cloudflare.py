@@ -7,12 +7,13 @@ Cloudflare IP 목록을 fetch하고 캐시하며, 요청이 Cloudflare에서 왔
 import asyncio
 import logging
 import time
-from ipaddress import IPv4Address, IPv4Network, IPv6Address, IPv6Network, ip_address, ip_network
+from ipaddress import IPv4Network, IPv6Network, ip_network
 
 import httpx
 
 from app.core import config as app_config
 from app.ratelimit.exceptions import ProxyEnforcementError
+from app.ratelimit.ipset import IPRangeSet
 
 logger = logging.getLogger(__name__)
 
@@ -30,11 +31,11 @@ class CloudflareIPManager:
     
     Cloudflare 공식 URL에서 IP 목록을 fetch하고 캐시합니다.
     TTL 기반으로 캐시를 갱신하며, fetch 실패 시 이전 캐시를 사용합니다.
+    대역은 IPRangeSet으로 컴파일하고, 갱신 시 새 집합으로 통째로 교체합니다.
     """
 
     def __init__(self):
-        self._ipv4_networks: list[IPv4Network] = []
-        self._ipv6_networks: list[IPv6Network] = []
+        self._ip_set = IPRangeSet([])
         self._last_fetch_time: float = 0
         self._fetch_lock = asyncio.Lock()
         self._initialized = False
@@ -125,8 +126,7 @@ class CloudflareIPManager:
 
                     # 최소 하나의 네트워크라도 있으면 성공
                     if ipv4_networks or ipv6_networks:
-                        self._ipv4_networks = ipv4_networks
-                        self._ipv6_networks = ipv6_networks
+                        self._ip_set = IPRangeSet([*ipv4_networks, *ipv6_networks])
                         self._last_fetch_time = time.time()
                         self._initialized = True
                         logger.info(
@@ -154,28 +154,21 @@ class CloudflareIPManager:
             return False
 
         try:
-            ip = ip_address(ip_str)
+            return self._ip_set.contains(ip_str)
         except ValueError:
             logger.warning(f"Invalid IP address: {ip_str}")
             return False
 
-        if isinstance(ip, IPv4Address):
-            return any(ip in network for network in self._ipv4_networks)
-        elif isinstance(ip, IPv6Address):
-            return any(ip in network for network in self._ipv6_networks)
-
-        return False
-
 
 class TrustedProxyManager:
     """
     Trusted Proxy IP 관리자
     
-    TRUSTED_PROXY_IPS 환경변수에 설정된 IP/CIDR 목록을 관리합니다.
+    TRUSTED_PROXY_IPS 환경변수에 설정된 IP/CIDR 목록을 IPRangeSet으로 컴파일해 관리합니다.
     """
 
     def __init__(self):
-        self._networks: list[IPv4Network | IPv6Network] = []
+        self._ip_set = IPRangeSet([])
         self._initialized = False
 
     def initialize(self) -> None:
@@ -189,7 +182,7 @@ class TrustedProxyManager:
             except ValueError:
                 logger.warning(f"Invalid trusted proxy IP/CIDR: {ip_or_cidr}")
 
-        self._networks = networks
+        self._ip_set = IPRangeSet(networks)
         self._initialized = True
 
         if networks:
@@ -205,16 +198,14 @@ class TrustedProxyManager:
         if not self._initialized:
             self.initialize()
 
-        if not self._networks:
+        if not self._ip_set:
             return False
 
         try:
-            ip = ip_address(ip_str)
+            return self._ip_set.contains(ip_str)
         except ValueError:
             return False
 
-        return any(ip in network for network in self._networks)
-
 
 # 싱글톤 인스턴스
 _cf_manager: CloudflareIPManager | None = None
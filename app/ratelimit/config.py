@@ -4,9 +4,18 @@ Rate Limit 규칙 설정
 엔드포인트별 레이트 리밋 규칙 정의 및 매칭 로직
 """
 import fnmatch
-from typing import List, Optional
+import functools
+import json
+import logging
+import os
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter
+
+from app.core import config as app_config
+
+logger = logging.getLogger(__name__)
 
 
 class RateLimitRule(BaseModel):
@@ -22,8 +31,17 @@ class RateLimitRule(BaseModel):
     """
     methods: Optional[List[str]] = None  # None = 모든 메서드, ["POST", "PUT"] = 특정 메서드만
     path_pattern: str  # fnmatch 패턴: "/v1/todos/*", "/v1/todos"
-    window_seconds: int  # 윈도우 크기 (초)
-    max_requests: int  # 윈도우 내 최대 요청 수
+    window_seconds: int = Field(gt=0)  # 윈도우 크기 (초)
+    max_requests: int = Field(ge=0)  # 윈도우 내 최대 요청 수 (0이면 항상 거부)
+
+    _methods: Optional[FrozenSet[str]] = PrivateAttr(default=None)
+    _regex: re.Pattern = PrivateAttr()
+
+    def model_post_init(self, __context) -> None:
+        # 매칭에 쓰는 메서드 집합과 경로 정규식은 생성 시 한 번만 만든다
+        if self.methods is not None:
+            self._methods = frozenset(m.upper() for m in self.methods)
+        self._regex = re.compile(fnmatch.translate(self.path_pattern))
 
     def matches(self, method: str, path: str) -> bool:
         """
@@ -34,12 +52,11 @@ class RateLimitRule(BaseModel):
         :return: 매칭 여부
         """
         # 메서드 체크
-        if self.methods is not None:
-            if method.upper() not in [m.upper() for m in self.methods]:
-                return False
+        if self._methods is not None and method.upper() not in self._methods:
+            return False
 
-        # 경로 패턴 매칭 (fnmatch 사용)
-        return fnmatch.fnmatch(path, self.path_pattern)
+        # 경로 패턴 매칭 (fnmatch 패턴을 정규식으로 미리 변환)
+        return self._regex.match(path) is not None
 
 
 # ============================================================
@@ -150,12 +167,133 @@ RATE_LIMIT_RULES: List[RateLimitRule] = [
 ]
 
 
+class CompiledRules:
+    """
+    규칙 목록을 메서드별 정규식 하나로 컴파일한 매처
+    
+    - 메서드마다 그 메서드에 적용되는 규칙의 경로 정규식을 원래 순서대로 이어 붙인
+      alternation(`(?P<r0>...)|(?P<r1>...)|...`) 하나로 컴파일
+      (정규식은 앞쪽 대안부터 시도하므로 "첫 번째 매칭 규칙" 순서가 그대로 유지됨)
+    - 어떤 규칙에도 명시되지 않은 메서드는 methods=None 규칙만 모은 정규식 사용
+    - (메서드, 경로) → 규칙 결과를 LRU 캐시에 저장 (매칭 실패(None)도 캐싱)
+    """
+
+    def __init__(self, rules: List[RateLimitRule], cache_size: int):
+        self.rules: Tuple[RateLimitRule, ...] = tuple(rules)
+        # functools.lru_cache: C 구현이라 스레드 안전하고 정규식 매칭보다 조회 비용이 작음
+        self._cached_match = functools.lru_cache(maxsize=max(1, cache_size))(self._match)
+
+        methods = {m.upper() for rule in self.rules for m in (rule.methods or ())}
+        self._by_method: Dict[str, Optional[re.Pattern]] = {
+            method: self._compile(
+                i for i, rule in enumerate(self.rules)
+                if rule.methods is None or method in rule._methods
+            )
+            for method in methods
+        }
+        self._any_method = self._compile(
+            i for i, rule in enumerate(self.rules) if rule.methods is None
+        )
+
+    def _compile(self, indexes) -> Optional[re.Pattern]:
+        alternatives = [
+            f"(?P<r{i}>{fnmatch.translate(self.rules[i].path_pattern)})"
+            for i in indexes
+        ]
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    def _match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        pattern = self._by_method.get(method.upper(), self._any_method)
+        found = pattern.match(path) if pattern is not None else None
+        return self.rules[int(found.lastgroup[1:])] if found else None
+
+    def match(self, method: str, path: str) -> Optional[RateLimitRule]:
+        """첫 번째로 매칭되는 규칙 (없으면 None)"""
+        return self._cached_match(method, path)
+
+    def stats(self) -> dict[str, int]:
+        """캐시 적중/미스 통계"""
+        info = self._cached_match.cache_info()
+        return {
+            "rules": len(self.rules),
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+
+
+def load_rules_file(path: str) -> List[RateLimitRule]:
+    """
+    JSON 파일에서 규칙 목록 읽기
+    
+    형식: [{"methods": ["POST"], "path_pattern": "/v1/todos", "window_seconds": 60, "max_requests": 30}, ...]
+    
+    :raises OSError: 파일을 읽을 수 없을 때
+    :raises ValueError: JSON 또는 규칙 형식이 잘못되었을 때 (pydantic ValidationError 포함)
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return TypeAdapter(List[RateLimitRule]).validate_python(data)
+
+
+# 현재 적용 중인 규칙 (reload_rules로 통째로 교체)
+_compiled: Optional[CompiledRules] = None
+_rules_file_mtime: Optional[float] = None
+
+
+def reload_rules(rules: Optional[List[RateLimitRule]] = None) -> CompiledRules:
+    """
+    규칙을 다시 컴파일하여 교체 (매칭 캐시도 새로 시작)
+    
+    :param rules: 적용할 규칙. None이면 RATE_LIMIT_RULES_FILE(설정 시) 또는 RATE_LIMIT_RULES
+    :return: 새로 적용된 매처
+    :raises OSError, ValueError: 규칙 파일을 읽을 수 없거나 형식이 잘못되었을 때 (기존 규칙 유지)
+    """
+    global _compiled, _rules_file_mtime
+
+    settings = app_config.settings
+    mtime = None
+    if rules is None:
+        if settings.RATE_LIMIT_RULES_FILE:
+            mtime = os.path.getmtime(settings.RATE_LIMIT_RULES_FILE)
+            rules = load_rules_file(settings.RATE_LIMIT_RULES_FILE)
+        else:
+            rules = RATE_LIMIT_RULES
+
+    _compiled = CompiledRules(rules, settings.RATE_LIMIT_RULE_CACHE_SIZE)
+    _rules_file_mtime = mtime
+    return _compiled
+
+
+def refresh_rules() -> bool:
+    """
+    RATE_LIMIT_RULES_FILE이 바뀌었으면 다시 읽어 적용 (RateLimitCleanupTask가 주기마다 호출)
+    
+    :return: 규칙을 다시 읽었으면 True
+    :raises OSError, ValueError: 바뀐 파일이 잘못되었을 때 (기존 규칙 유지, 다음 주기에 재시도)
+    """
+    path = app_config.settings.RATE_LIMIT_RULES_FILE
+    if not path or os.path.getmtime(path) == _rules_file_mtime:
+        return False
+    compiled = reload_rules()
+    logger.info("Rate limit rules reloaded from %s (%d rules)", path, len(compiled.rules))
+    return True
+
+
+def get_compiled_rules() -> CompiledRules:
+    """현재 적용 중인 매처 (처음 호출 시 컴파일)"""
+    if _compiled is None:
+        return reload_rules()
+    return _compiled
+
+
 def get_rule_for_request(method: str, path: str) -> Optional[RateLimitRule]:
     """
     요청에 맞는 규칙 찾기 (메서드 + 경로 매칭)
     
     매칭 우선순위:
-    1. RATE_LIMIT_RULES 리스트 순서대로 순회
+    1. 규칙 리스트 순서대로 (RATE_LIMIT_RULES_FILE 설정 시 파일의 순서)
     2. 첫 번째 매칭되는 규칙 반환
     3. 매칭되는 규칙이 없으면 None 반환 (레이트 리밋 미적용)
     
@@ -163,10 +301,7 @@ def get_rule_for_request(method: str, path: str) -> Optional[RateLimitRule]:
     :param path: 요청 경로
     :return: 매칭된 규칙 또는 None
     """
-    for rule in RATE_LIMIT_RULES:
-        if rule.matches(method, path):
-            return rule
-    return None
+    return get_compiled_rules().match(method, path)
 
 
 def build_rate_limit_key(user_id: str, method: str, rule: RateLimitRule) -> str:
@@ -0,0 +1,68 @@
+"""
+IP 대역 집합
+
+Cloudflare/Trusted Proxy IP 대역을 정렬된 구간 목록으로 컴파일하여,
+요청마다 모든 대역을 순회하지 않고 이진 탐색(O(log n))으로 포함 여부를 판단한다.
+"""
+import functools
+from bisect import bisect_right
+from ipaddress import IPv4Network, IPv6Network, ip_address
+from typing import Iterable
+
+# 최근 판정한 클라이언트 IP 문자열 → 결과 캐시 크기 (ip_address 파싱까지 생략)
+VERDICT_CACHE_SIZE = 4096
+
+
+class IPRangeSet:
+    """
+    불변 IP 대역 집합
+
+    - IPv4/IPv6별로 대역을 [시작, 끝] 정수 구간으로 바꾸고, 겹치거나 맞닿은 구간은 합쳐 정렬
+    - 조회: 시작 값 목록에서 bisect로 후보 구간 하나를 찾아 끝 값과 비교
+    - IPv4 주소는 IPv4 대역에서만, IPv6 주소는 IPv6 대역에서만 찾음 (ip in network와 동일)
+    - 최근 판정 결과를 LRU로 캐싱 (대역이 바뀌면 새 집합을 만들어 통째로 교체하므로 캐시도 함께 교체)
+    """
+
+    def __init__(self, networks: Iterable[IPv4Network | IPv6Network]):
+        networks = list(networks)
+        self._count = len(networks)
+        self._starts: dict[int, list[int]] = {}
+        self._ends: dict[int, list[int]] = {}
+        for version in (4, 6):
+            merged = self._merge(
+                (int(n.network_address), int(n.broadcast_address))
+                for n in networks if n.version == version
+            )
+            self._starts[version] = [start for start, _ in merged]
+            self._ends[version] = [end for _, end in merged]
+        self._cached_contains = functools.lru_cache(maxsize=VERDICT_CACHE_SIZE)(self._contains)
+
+    @staticmethod
+    def _merge(intervals: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        merged: list[tuple[int, int]] = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1] + 1:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _contains(self, ip_str: str) -> bool:
+        ip = ip_address(ip_str)
+        value = int(ip)
+        starts = self._starts[ip.version]
+        i = bisect_right(starts, value) - 1
+        return i >= 0 and value <= self._ends[ip.version][i]
+
+    def contains(self, ip_str: str) -> bool:
+        """
+        IP 주소 문자열이 대역 중 하나에 속하는지 확인
+
+        :raises ValueError: 올바른 IP 주소가 아닐 때 (캐싱하지 않음)
+        """
+        return self._cached_contains(ip_str)
+
+    def __len__(self) -> int:
+        """컴파일 전 대역 수"""
+        return self._count
@@ -1,13 +1,14 @@
 """
 Rate Limit Middleware
 
-FastAPI 미들웨어로 모든 /v1/* 요청에 레이트 리밋 적용
+순수 ASGI 미들웨어로 모든 /v1/* 요청에 레이트 리밋 적용
 """
 import logging
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core import config as app_config
 from app.ratelimit.cloudflare import get_real_client_ip
@@ -17,9 +18,9 @@ from app.ratelimit.limiter import get_limiter
 logger = logging.getLogger(__name__)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
-    레이트 리밋 미들웨어
+    레이트 리밋 미들웨어 (순수 ASGI)
     
     처리 흐름:
     1. 요청 경로가 /v1/*인지 확인
@@ -27,29 +28,34 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     3. 사용자 식별 (Authorization 헤더 -> sub 또는 Client IP)
     4. 레이트 리밋 체크
     5. 초과 시 429 응답, 허용 시 X-RateLimit-* 헤더 추가
+
+    HTTP 요청만 처리하고 WebSocket/lifespan은 그대로 통과시킨다.
     """
 
-    async def dispatch(
-            self,
-            request: Request,
-            call_next: RequestResponseEndpoint,
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # 레이트 리밋 비활성화 시 바로 통과
-        if not app_config.settings.RATE_LIMIT_ENABLED:
-            return await call_next(request)
+        if scope["type"] != "http" or not app_config.settings.RATE_LIMIT_ENABLED:
+            await self.app(scope, receive, send)
+            return
 
+        request = Request(scope)
         path = request.url.path
         method = request.method
 
         # /v1/* 경로만 레이트 리밋 적용
         if not path.startswith("/v1"):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # 규칙 찾기
         rule = get_rule_for_request(method, path)
         if not rule:
             # 매칭되는 규칙 없으면 레이트 리밋 미적용
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # 사용자 식별
         user_id = await self._get_user_id(request)
@@ -64,7 +70,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 f"Rate limit exceeded: user={user_id}, path={path}, "
                 f"count={result.current_count}/{result.max_requests}"
             )
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 content={
                     "detail": "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.",
@@ -77,16 +83,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "X-RateLimit-Reset": str(result.reset_after),
                 },
             )
+            await response(scope, receive, send)
+            return
+
+        # 응답 시작 메시지에 레이트 리밋 헤더 추가 (본문은 그대로 스트리밍)
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(result.max_requests)
+                headers["X-RateLimit-Remaining"] = str(result.remaining)
+                headers["X-RateLimit-Reset"] = str(result.reset_after)
+            await send(message)
 
         # 요청 처리
-        response = await call_next(request)
-
-        # 응답에 레이트 리밋 헤더 추가
-        response.headers["X-RateLimit-Limit"] = str(result.max_requests)
-        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
-        response.headers["X-RateLimit-Reset"] = str(result.reset_after)
-
-        return response
+        await self.app(scope, receive, send_with_headers)
 
     async def _get_user_id(self, request: Request) -> str:
         """
@@ -1,5 +1,7 @@
 # Rate Limit Storage 패키지
 from app.ratelimit.storage.base import RateLimitStorage
 from app.ratelimit.storage.memory import InMemoryStorage
+from app.ratelimit.storage.sliding_window import SlidingWindowCounterStorage
+from app.ratelimit.storage.sqlite import SqliteStorage
 
-__all__ = ["RateLimitStorage", "InMemoryStorage"]
+__all__ = ["RateLimitStorage", "InMemoryStorage", "SlidingWindowCounterStorage", "SqliteStorage"]
@@ -26,7 +26,7 @@ class RateLimitStorage(ABC):
     레이트 리밋 저장소 추상 클래스
     
     슬라이딩 윈도우 알고리즘을 위한 저장소 인터페이스
-    구현체: InMemoryStorage, (향후) RedisStorage
+    구현체: InMemoryStorage, SlidingWindowCounterStorage, SqliteStorage
     """
 
     @abstractmethod
@@ -78,3 +78,20 @@ class RateLimitStorage(ABC):
         :return: 정리된 엔트리 수
         """
         pass
+
+    @abstractmethod
+    async def stats(self) -> dict[str, int]:
+        """
+        저장소 상태 지표 (gauge)
+        
+        :return: {"keys": 키 수, "bytes": 추정 메모리 사용량, "evictions": 상한 초과로 제거된 키 수,
+                  "max_keys": 최대 키 수}
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        저장소 리소스 정리 (연결, 스레드 등)
+        
+        인메모리 저장소는 정리할 것이 없음
+        """
@@ -0,0 +1,61 @@
+"""
+키 수 상한이 있는 LRU 맵
+
+인메모리 Rate Limit 저장소의 키별 상태를 보관한다. 상한을 넘으면 가장 오래 사용하지 않은
+키부터 제거하여, IP를 바꿔가며 요청하는 클라이언트가 프로세스 메모리를 무한히 늘리지 못하게 한다.
+"""
+from collections import OrderedDict
+from typing import Generic, Iterator, TypeVar
+
+V = TypeVar("V")
+
+# cleanup_expired가 이벤트 루프에 양보하기 전까지 한 번에 검사하는 키 수
+CLEANUP_BATCH_SIZE = 1000
+
+
+class LRUKeyMap(Generic[V]):
+    """
+    키 수 상한이 있는 LRU 맵
+
+    - get/put 시 해당 키를 가장 최근 사용으로 이동 (peek은 순서 유지)
+    - max_keys를 넘으면 가장 오래된 키 제거 (evictions 증가)
+    - max_keys가 0 이하면 상한 없음
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self.evictions = 0
+        self._data: OrderedDict[str, V] = OrderedDict()
+
+    def get(self, key: str) -> V | None:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def peek(self, key: str) -> V | None:
+        """LRU 순서를 바꾸지 않고 조회 (cleanup용)"""
+        return self._data.get(key)
+
+    def put(self, key: str, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.max_keys > 0:
+            while len(self._data) > self.max_keys:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: str) -> V | None:
+        return self._data.pop(key, None)
+
+    def keys(self) -> Iterator[str]:
+        return iter(list(self._data))
+
+    def items(self) -> Iterator[tuple[str, V]]:
+        return iter(list(self._data.items()))
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
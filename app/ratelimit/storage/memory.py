@@ -5,10 +5,14 @@
 슬라이딩 윈도우 알고리즘 구현
 """
 import asyncio
+import sys
 import time
-from typing import Dict, List
 
+from app.core import config as app_config
 from app.ratelimit.storage.base import RateLimitResult, RateLimitStorage
+from app.ratelimit.storage.lru import CLEANUP_BATCH_SIZE, LRUKeyMap
+from app.ratelimit.storage.sliding_window import SlidingWindowCounterStorage
+from app.ratelimit.storage.sqlite import SqliteStorage
 
 
 class InMemoryStorage(RateLimitStorage):
@@ -16,20 +20,26 @@ class InMemoryStorage(RateLimitStorage):
     인메모리 슬라이딩 윈도우 저장소
     
     특징:
-    - dict 기반으로 키별 타임스탬프 리스트 저장
-    - asyncio.Lock으로 동시성 제어
-    - 주기적 cleanup으로 메모리 관리 필요
+    - 키별 [window_seconds, 타임스탬프 리스트]를 LRU 맵에 저장
+    - 키 수가 max_keys를 넘으면 가장 오래 사용하지 않은 키 제거
+    - 락 없이 동작: 각 메서드의 상태 변경 구간에 await가 없어 이벤트 루프에서 원자적으로 실행됨
+    - cleanup은 CLEANUP_BATCH_SIZE개 키마다 이벤트 루프에 양보
+    - 주기적 cleanup(RateLimitCleanupTask)으로 만료된 키 정리
     
     제한:
     - 단일 프로세스/인스턴스에서만 유효
     - 서버 재시작 시 데이터 손실
-    - 멀티 인스턴스 환경에서는 Redis 사용 권장
+    - 멀티 워커 환경에서는 SqliteStorage(RATE_LIMIT_BACKEND=sqlite) 사용
     """
 
-    def __init__(self):
-        # key -> [timestamp, timestamp, ...] (정렬된 타임스탬프 리스트)
-        self._requests: Dict[str, List[float]] = {}
-        self._lock = asyncio.Lock()
+    def __init__(self, max_keys: int | None = None):
+        """
+        :param max_keys: 최대 키 수 (None이면 RATE_LIMIT_MAX_KEYS, 0 이하면 상한 없음)
+        """
+        if max_keys is None:
+            max_keys = app_config.settings.RATE_LIMIT_MAX_KEYS
+        # key -> [window_seconds, [timestamp, timestamp, ...]] (정렬된 타임스탬프 리스트)
+        self._requests: LRUKeyMap[list] = LRUKeyMap(max_keys)
 
     async def record_request(
             self,
@@ -48,128 +58,159 @@ class InMemoryStorage(RateLimitStorage):
         now = time.time()
         window_start = now - window_seconds
 
-        async with self._lock:
-            # 키가 없으면 빈 리스트로 초기화
-            if key not in self._requests:
-                self._requests[key] = []
-
-            # 윈도우 밖의 오래된 요청 제거
-            self._requests[key] = [
-                ts for ts in self._requests[key]
-                if ts > window_start
-            ]
-
-            current_count = len(self._requests[key])
-
-            # 한도 초과 체크 (새 요청 추가 전에 체크)
-            if current_count >= max_requests:
-                # 가장 오래된 요청이 만료되는 시간 계산
-                if self._requests[key]:
-                    oldest = min(self._requests[key])
-                    reset_after = int(oldest + window_seconds - now) + 1
-                else:
-                    reset_after = window_seconds
-
-                return RateLimitResult(
-                    allowed=False,
-                    current_count=current_count,
-                    max_requests=max_requests,
-                    reset_after=max(1, reset_after),
-                )
-
-            # 새 요청 기록
-            self._requests[key].append(now)
-            current_count += 1
-
-            # 윈도우 리셋 시간 계산
-            if self._requests[key]:
-                oldest = min(self._requests[key])
+        # 키가 없으면 빈 리스트로 초기화 (cleanup은 키에 기록된 윈도우 기준)
+        entry = self._requests.get(key)
+        if entry is None:
+            entry = [window_seconds, []]
+            self._requests.put(key, entry)
+        entry[0] = window_seconds
+
+        # 윈도우 밖의 오래된 요청 제거
+        timestamps = entry[1] = [
+            ts for ts in entry[1]
+            if ts > window_start
+        ]
+
+        current_count = len(timestamps)
+
+        # 한도 초과 체크 (새 요청 추가 전에 체크)
+        if current_count >= max_requests:
+            # 가장 오래된 요청이 만료되는 시간 계산
+            if timestamps:
+                oldest = min(timestamps)
                 reset_after = int(oldest + window_seconds - now) + 1
             else:
                 reset_after = window_seconds
 
             return RateLimitResult(
-                allowed=True,
+                allowed=False,
                 current_count=current_count,
                 max_requests=max_requests,
                 reset_after=max(1, reset_after),
             )
 
+        # 새 요청 기록
+        timestamps.append(now)
+        current_count += 1
+
+        # 윈도우 리셋 시간 계산
+        oldest = min(timestamps)
+        reset_after = int(oldest + window_seconds - now) + 1
+
+        return RateLimitResult(
+            allowed=True,
+            current_count=current_count,
+            max_requests=max_requests,
+            reset_after=max(1, reset_after),
+        )
+
     async def get_current_count(self, key: str, window_seconds: int) -> int:
         """현재 윈도우 내 요청 수 조회"""
         now = time.time()
         window_start = now - window_seconds
 
-        async with self._lock:
-            if key not in self._requests:
-                return 0
+        entry = self._requests.get(key)
+        if entry is None:
+            return 0
 
-            # 윈도우 내 요청만 카운트
-            return len([
-                ts for ts in self._requests[key]
-                if ts > window_start
-            ])
+        # 윈도우 내 요청만 카운트
+        return len([
+            ts for ts in entry[1]
+            if ts > window_start
+        ])
 
     async def reset(self, key: str) -> None:
         """특정 키 초기화"""
-        async with self._lock:
-            if key in self._requests:
-                del self._requests[key]
+        self._requests.pop(key)
 
     async def cleanup_expired(self) -> int:
         """
         만료된 엔트리 정리
         
-        기본 윈도우(5분)보다 오래된 모든 타임스탬프 제거
+        키마다 기록된 규칙 윈도우보다 오래된 타임스탬프 제거
         빈 키는 삭제
+        
+        키가 많아도 요청 처리를 막지 않도록 CLEANUP_BATCH_SIZE개마다 이벤트 루프에 양보한다.
+        양보하는 동안 다른 코루틴이 키를 바꿀 수 있으므로 엔트리가 그대로일 때만 정리한다.
         """
         now = time.time()
-        # 5분보다 오래된 것은 어떤 규칙에서도 사용하지 않음
-        max_window = 300
-        window_start = now - max_window
         cleaned = 0
 
-        async with self._lock:
-            keys_to_delete = []
-
-            for key, timestamps in self._requests.items():
-                original_len = len(timestamps)
-                self._requests[key] = [
-                    ts for ts in timestamps
-                    if ts > window_start
-                ]
-                cleaned += original_len - len(self._requests[key])
-
-                # 빈 리스트는 삭제 대상
-                if not self._requests[key]:
-                    keys_to_delete.append(key)
+        for i, (key, entry) in enumerate(self._requests.items(), start=1):
+            if i % CLEANUP_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+            # 목록은 시작 시점 스냅샷: 양보 중 삭제되거나 다시 생성된 키는 건너뜀
+            if self._requests.peek(key) is not entry:
+                continue
+
+            window_start = now - entry[0]
+            original_len = len(entry[1])
+            entry[1] = [
+                ts for ts in entry[1]
+                if ts > window_start
+            ]
+            cleaned += original_len - len(entry[1])
 
-            for key in keys_to_delete:
-                del self._requests[key]
+            # 빈 리스트는 삭제
+            if not entry[1]:
+                self._requests.pop(key)
                 cleaned += 1
 
         return cleaned
 
+    async def stats(self) -> dict[str, int]:
+        """
+        키 수, 추정 메모리 사용량(바이트), LRU 제거 횟수
+
+        bytes는 모든 키를 순회하므로 cleanup과 같이 CLEANUP_BATCH_SIZE개마다 이벤트 루프에 양보
+        """
+        float_size = sys.getsizeof(0.0)
+        size = 0
+        for i, (key, entry) in enumerate(self._requests.items(), start=1):
+            if i % CLEANUP_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+            size += (
+                    sys.getsizeof(key) + sys.getsizeof(entry)
+                    + sys.getsizeof(entry[1]) + len(entry[1]) * float_size
+            )
+        return {
+            "keys": len(self._requests),
+            "bytes": size,
+            "evictions": self._requests.evictions,
+            "max_keys": self._requests.max_keys,
+        }
+
 
 # 싱글톤 인스턴스 (앱 전역에서 공유)
-_storage_instance: InMemoryStorage | None = None
+_storage_instance: RateLimitStorage | None = None
 
 
-def get_storage() -> InMemoryStorage:
+def get_storage() -> RateLimitStorage:
     """
     저장소 싱글톤 인스턴스 반환
     
-    향후 Redis 등 다른 저장소로 교체 시 이 함수만 수정
+    RATE_LIMIT_BACKEND=sqlite: SqliteStorage (같은 호스트의 워커끼리 공유)
+    RATE_LIMIT_BACKEND=memory: RATE_LIMIT_ALGORITHM 설정으로 구현체 선택
+    - sliding_log: InMemoryStorage
+    - sliding_window_counter: SlidingWindowCounterStorage
     """
     global _storage_instance
     if _storage_instance is None:
-        _storage_instance = InMemoryStorage()
+        settings = app_config.settings
+        if settings.RATE_LIMIT_BACKEND == "sqlite":
+            _storage_instance = SqliteStorage()
+        elif settings.RATE_LIMIT_ALGORITHM == "sliding_window_counter":
+            _storage_instance = SlidingWindowCounterStorage()
+        else:
+            _storage_instance = InMemoryStorage()
     return _storage_instance
 
 
 def reset_storage() -> None:
     """
-    저장소 인스턴스 초기화 (테스트용)
+    저장소 인스턴스 종료 및 초기화 (테스트, 애플리케이션 종료 시)
     """
     global _storage_instance
+    if _storage_instance is not None:
+        _storage_instance.close()
     _storage_instance = None
@@ -0,0 +1,204 @@
+"""
+슬라이딩 윈도우 카운터 Rate Limit Storage
+
+키마다 타임스탬프 목록 대신 카운터 두 개만 저장하는 인메모리 저장소.
+요청 수와 관계없이 키당 상태 크기와 요청당 연산량이 일정하다.
+"""
+import asyncio
+import math
+import sys
+import time
+from typing import List, Optional
+
+from app.core import config as app_config
+from app.ratelimit.storage.base import RateLimitResult, RateLimitStorage
+from app.ratelimit.storage.lru import CLEANUP_BATCH_SIZE, LRUKeyMap
+
+
+class SlidingWindowCounterStorage(RateLimitStorage):
+    """
+    인메모리 슬라이딩 윈도우 카운터 저장소
+
+    시간을 window_seconds 크기의 고정 구간으로 나누고 현재/직전 구간의 요청 수만 저장한다.
+    슬라이딩 윈도우 안의 요청 수는 직전 구간 수를 겹치는 비율만큼 가중해 추정한다:
+
+        estimate = previous * (1 - elapsed / window) + current
+
+    - 키당 상태: [window_seconds, 현재 구간 시작 시각, 현재 구간 수, 직전 구간 수]
+    - 직전 구간 요청이 균등하게 분포했다고 가정하는 근사치
+      (InMemoryStorage의 정확한 슬라이딩 로그와 달리 구간 경계 근처에서 약간 차이 날 수 있음)
+    - 거부된 요청은 기록하지 않음 (InMemoryStorage와 동일)
+    - 키 수가 max_keys를 넘으면 가장 오래 사용하지 않은 키 제거 (InMemoryStorage와 동일)
+    - 락 없이 동작하고 cleanup은 배치마다 이벤트 루프에 양보 (InMemoryStorage와 동일)
+
+    제한:
+    - 단일 프로세스/인스턴스에서만 유효
+    - 서버 재시작 시 데이터 손실
+    """
+
+    def __init__(self, max_keys: int | None = None):
+        """
+        :param max_keys: 최대 키 수 (None이면 RATE_LIMIT_MAX_KEYS, 0 이하면 상한 없음)
+        """
+        if max_keys is None:
+            max_keys = app_config.settings.RATE_LIMIT_MAX_KEYS
+        # key -> [window_seconds, bucket_start, current, previous]
+        self._counters: LRUKeyMap[List[float]] = LRUKeyMap(max_keys)
+
+    def _rotate(self, key: str, window_seconds: int, now: float) -> List[float]:
+        """현재 시각이 속한 구간으로 카운터를 옮긴 상태 반환 (없으면 생성)"""
+        state = self._counters.get(key)
+        rotated = self._advance(state, window_seconds, now)
+        if rotated is not state:
+            self._counters.put(key, rotated)
+        return rotated
+
+    @staticmethod
+    def _advance(state: Optional[List[float]], window_seconds: int, now: float) -> List[float]:
+        """
+        상태를 현재 시각이 속한 구간으로 이동 (제자리 변경)
+
+        상태가 없거나 윈도우가 바뀌었으면 새 상태를 만들어 반환한다.
+        윈도우가 0 이하면 요청을 세지 않으므로 매번 빈 상태를 반환한다 (InMemoryStorage와 동일).
+        (SqliteStorage도 같은 계산을 사용)
+        """
+        if window_seconds <= 0:
+            return [window_seconds, now, 0, 0]
+
+        bucket_start = now - now % window_seconds
+        if state is None or state[0] != window_seconds:
+            return [window_seconds, bucket_start, 0, 0]
+
+        elapsed_buckets = (bucket_start - state[1]) / window_seconds
+        if elapsed_buckets >= 2:
+            # 두 구간 이상 지남: 직전 구간도 비어 있음
+            state[1], state[2], state[3] = bucket_start, 0, 0
+        elif elapsed_buckets >= 1:
+            state[1], state[2], state[3] = bucket_start, 0, state[2]
+        return state
+
+    @staticmethod
+    def _estimate(state: List[float], now: float) -> float:
+        window_seconds, bucket_start, current, previous = state
+        if window_seconds <= 0:
+            return current
+        weight = 1 - (now - bucket_start) / window_seconds
+        return previous * weight + current
+
+    @staticmethod
+    def _retry_after(state: List[float], now: float, max_requests: int) -> float:
+        """추정 요청 수가 max_requests 아래로 내려가 다음 요청이 허용될 때까지 남은 초"""
+        window_seconds, bucket_start, current, previous = state
+        elapsed = now - bucket_start
+        if current < max_requests:
+            # 현재 구간 안에서 직전 구간 가중치가 줄어들기를 기다림
+            return window_seconds * (1 - (max_requests - current) / previous) - elapsed
+        # 다음 구간으로 넘어간 뒤 현재 구간 수(→ 직전 구간)의 가중치가 줄어들기를 기다림
+        return (window_seconds - elapsed) + window_seconds * (1 - max_requests / current)
+
+    async def record_request(
+            self,
+            key: str,
+            window_seconds: int,
+            max_requests: int,
+    ) -> RateLimitResult:
+        """
+        요청 기록 및 레이트 리밋 체크
+
+        1. 현재 시각이 속한 구간으로 카운터 이동
+        2. 추정 요청 수가 max_requests 이상이면 거부 (기록하지 않음)
+        3. 허용 시 현재 구간 수 증가
+        """
+        now = time.time()
+        return self._check(self._rotate(key, window_seconds, now), now, max_requests)
+
+    @classmethod
+    def _check(cls, state: List[float], now: float, max_requests: int) -> RateLimitResult:
+        """구간 이동이 끝난 상태로 허용 여부 판단, 허용 시 현재 구간 수 증가 (제자리 변경)"""
+        window_seconds = state[0]
+        if max_requests <= 0:
+            # 한도 0: 항상 거부하고 윈도우 길이 뒤로 안내 (InMemoryStorage와 동일)
+            return RateLimitResult(
+                allowed=False,
+                current_count=0,
+                max_requests=max_requests,
+                reset_after=max(1, int(window_seconds)),
+            )
+
+        estimate = cls._estimate(state, now)
+
+        if estimate >= max_requests:
+            # 경계 시각에는 추정치가 아직 max_requests와 같으므로 1초 뒤로 안내
+            reset_after = int(cls._retry_after(state, now, max_requests)) + 1
+            return RateLimitResult(
+                allowed=False,
+                current_count=min(math.floor(estimate), max_requests),
+                max_requests=max_requests,
+                reset_after=max(1, reset_after),
+            )
+
+        state[2] += 1
+        # 현재 구간이 끝나면 카운트가 직전 구간으로 넘어가 가중치가 줄어들기 시작
+        reset_after = window_seconds - (now - state[1])
+        return RateLimitResult(
+            allowed=True,
+            current_count=math.floor(estimate) + 1,
+            max_requests=max_requests,
+            reset_after=max(1, math.ceil(reset_after)),
+        )
+
+    async def get_current_count(self, key: str, window_seconds: int) -> int:
+        """현재 윈도우 내 (추정) 요청 수 조회"""
+        now = time.time()
+
+        if key not in self._counters:
+            return 0
+        return math.floor(self._estimate(self._rotate(key, window_seconds, now), now))
+
+    async def reset(self, key: str) -> None:
+        """특정 키 초기화"""
+        self._counters.pop(key)
+
+    async def cleanup_expired(self) -> int:
+        """
+        만료된 엔트리 정리
+
+        현재/직전 구간이 모두 지난 키(키마다 자기 window_seconds 기준)를 삭제
+        CLEANUP_BATCH_SIZE개마다 이벤트 루프에 양보하며, 키마다 현재 상태로 판단
+        """
+        now = time.time()
+        cleaned = 0
+
+        for i, key in enumerate(self._counters.keys(), start=1):
+            if i % CLEANUP_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+                now = time.time()
+            # 목록은 시작 시점 스냅샷: 현재 상태로 판단 (양보 중 삭제된 키는 건너뜀)
+            state = self._counters.peek(key)
+            if state is None:
+                continue
+
+            window_seconds, bucket_start, _, _ = state
+            if now >= bucket_start + 2 * window_seconds:
+                self._counters.pop(key)
+                cleaned += 1
+
+        return cleaned
+
+    async def stats(self) -> dict[str, int]:
+        """
+        키 수, 추정 메모리 사용량(바이트), LRU 제거 횟수
+
+        bytes는 모든 키를 순회하므로 cleanup과 같이 CLEANUP_BATCH_SIZE개마다 이벤트 루프에 양보
+        """
+        size = 0
+        for i, (key, state) in enumerate(self._counters.items(), start=1):
+            if i % CLEANUP_BATCH_SIZE == 0:
+                await asyncio.sleep(0)
+            size += sys.getsizeof(key) + sys.getsizeof(state) + sum(sys.getsizeof(v) for v in state)
+        return {
+            "keys": len(self._counters),
+            "bytes": size,
+            "evictions": self._counters.evictions,
+            "max_keys": self._counters.max_keys,
+        }
@@ -0,0 +1,196 @@
+"""
+SQLite 공유 Rate Limit Storage
+
+같은 호스트의 여러 워커 프로세스(uvicorn --workers N)가 하나의 SQLite 파일로
+레이트 리밋 상태를 공유하는 저장소. 프로세스마다 InMemoryStorage를 두면 한도가
+워커 수만큼 늘어나고 상태도 중복되는 문제를 막는다.
+"""
+import asyncio
+import math
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from app.core import config as app_config
+from app.ratelimit.storage.base import RateLimitResult, RateLimitStorage
+from app.ratelimit.storage.lru import CLEANUP_BATCH_SIZE
+from app.ratelimit.storage.sliding_window import SlidingWindowCounterStorage
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS rate_limit (
+        key TEXT PRIMARY KEY,
+        window_seconds INTEGER NOT NULL,
+        bucket_start REAL NOT NULL,
+        current INTEGER NOT NULL,
+        previous INTEGER NOT NULL,
+        expires_at REAL NOT NULL
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_rate_limit_expires_at ON rate_limit (expires_at)",
+)
+
+_SELECT = "SELECT window_seconds, bucket_start, current, previous FROM rate_limit WHERE key = ?"
+_UPSERT = """
+    INSERT INTO rate_limit (key, window_seconds, bucket_start, current, previous, expires_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (key) DO UPDATE SET
+        window_seconds = excluded.window_seconds,
+        bucket_start = excluded.bucket_start,
+        current = excluded.current,
+        previous = excluded.previous,
+        expires_at = excluded.expires_at
+"""
+_DELETE_EXPIRED = """
+    DELETE FROM rate_limit WHERE key IN (
+        SELECT key FROM rate_limit WHERE expires_at <= ? LIMIT ?
+    )
+"""
+
+
+class SqliteStorage(RateLimitStorage):
+    """
+    SQLite 공유 슬라이딩 윈도우 카운터 저장소
+
+    SlidingWindowCounterStorage와 같은 계산(키당 현재/직전 구간 카운터)을 SQLite 행 하나에 저장한다.
+    (요청마다 행을 쌓는 슬라이딩 로그는 공유 저장소에 맞지 않아 RATE_LIMIT_ALGORITHM과 무관하게 카운터 사용)
+
+    - 읽기-계산-쓰기를 BEGIN IMMEDIATE 트랜잭션 하나로 실행 → 워커 간에도 원자적
+    - 연결은 전용 스레드 하나가 소유하고, 요청마다 트랜잭션 전체를 한 번에 넘겨 이벤트 루프를 막지 않음
+    - WAL + synchronous=NORMAL: 커밋마다 fsync를 생략해도 OS 장애/전원 차단 시 파일은 손상되지 않음
+      (최근 카운트만 유실될 수 있음, SQLITE_SYNCHRONOUS 기본값과 동일)
+    - 만료 행은 cleanup_expired가 CLEANUP_BATCH_SIZE개씩 삭제 (키 수 상한/LRU 제거 없음)
+
+    제한:
+    - 같은 호스트(같은 파일시스템)의 프로세스 간에만 공유 (네트워크 파일시스템 비권장)
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        :param path: SQLite 파일 경로 (None이면 RATE_LIMIT_SQLITE_PATH)
+        """
+        self.path = path or app_config.settings.RATE_LIMIT_SQLITE_PATH
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ratelimit-sqlite")
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """전용 스레드에서만 호출 (처음 사용할 때 연결 및 스키마 생성)"""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=app_config.settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # 트랜잭션은 직접 BEGIN/COMMIT
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _transaction(self, key: str, window_seconds: int, now: float, apply):
+        """키 상태를 잠그고 읽어 apply(state)를 적용한 뒤 저장 (apply의 반환값 반환)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(_SELECT, (key,)).fetchone()
+            state = SlidingWindowCounterStorage._advance(
+                list(row) if row else None, window_seconds, now,
+            )
+            result = apply(state)
+            conn.execute(_UPSERT, (key, *state, state[1] + 2 * state[0]))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return result
+
+    def _record(self, key: str, window_seconds: int, max_requests: int) -> RateLimitResult:
+        now = time.time()
+        return self._transaction(
+            key, window_seconds, now,
+            lambda state: SlidingWindowCounterStorage._check(state, now, max_requests),
+        )
+
+    async def record_request(
+            self,
+            key: str,
+            window_seconds: int,
+            max_requests: int,
+    ) -> RateLimitResult:
+        """
+        요청 기록 및 레이트 리밋 체크 (SlidingWindowCounterStorage와 같은 규칙, 워커 간 공유)
+        """
+        return await self._run(self._record, key, window_seconds, max_requests)
+
+    def _count(self, key: str, window_seconds: int) -> int:
+        now = time.time()
+        row = self._connect().execute(_SELECT, (key,)).fetchone()
+        if row is None:
+            return 0
+        state: List[float] = SlidingWindowCounterStorage._advance(list(row), window_seconds, now)
+        return math.floor(SlidingWindowCounterStorage._estimate(state, now))
+
+    async def get_current_count(self, key: str, window_seconds: int) -> int:
+        """현재 윈도우 내 (추정) 요청 수 조회 (읽기만 함)"""
+        return await self._run(self._count, key, window_seconds)
+
+    def _delete(self, key: str) -> None:
+        self._connect().execute("DELETE FROM rate_limit WHERE key = ?", (key,))
+
+    async def reset(self, key: str) -> None:
+        """특정 키 초기화"""
+        await self._run(self._delete, key)
+
+    def _delete_expired_batch(self, now: float) -> int:
+        return self._connect().execute(_DELETE_EXPIRED, (now, CLEANUP_BATCH_SIZE)).rowcount
+
+    async def cleanup_expired(self) -> int:
+        """
+        만료된 엔트리 정리
+
+        현재/직전 구간이 모두 지난 행(expires_at 인덱스)을 CLEANUP_BATCH_SIZE개씩 삭제한다.
+        배치마다 쓰기 잠금을 놓으므로 다른 워커의 요청이 정리 전체를 기다리지 않는다.
+        """
+        now = time.time()
+        cleaned = 0
+        while True:
+            deleted = await self._run(self._delete_expired_batch, now)
+            cleaned += deleted
+            if deleted < CLEANUP_BATCH_SIZE:
+                return cleaned
+
+    def _stats(self) -> dict[str, int]:
+        if self._conn is None and not os.path.exists(self.path):
+            # 아직 사용 전: 조회하려고 파일을 만들지 않음
+            return {"keys": 0, "bytes": 0, "evictions": 0, "max_keys": 0}
+        conn = self._connect()
+        keys = conn.execute("SELECT COUNT(*) FROM rate_limit").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "keys": keys,
+            "bytes": page_count * page_size,
+            "evictions": 0,
+            "max_keys": 0,
+        }
+
+    async def stats(self) -> dict[str, int]:
+        """키 수, 파일 크기(바이트) - 정리 주기마다 호출되므로 전용 스레드에서 조회"""
+        return await self._run(self._stats)
+
+    def close(self) -> None:
+        """연결과 전용 스레드 종료 (이후에는 사용할 수 없음)"""
+        def _close():
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        self._executor.submit(_close).result()
+        self._executor.shutdown()
@@ -0,0 +1,108 @@
+"""
+Rate Limit 백그라운드 태스크
+
+REST/WebSocket 레이트 리밋이 공유하는 저장소에서 만료된 키를 주기적으로 정리한다.
+정리하지 않으면 ratelimit:ip:<addr>:..., ws:message:<sub> 같은 키가 요청이 끝난 뒤에도 남는다.
+
+책임:
+- 스케줄링 (주기적 cleanup_expired)
+- 상태 관리 (is_running)
+- 저장소 지표(키 수, 추정 메모리) 로깅
+- RATE_LIMIT_RULES_FILE이 바뀌었으면 엔드포인트 규칙 다시 읽기 (hot reload)
+"""
+import asyncio
+import logging
+
+from app.core.config import settings
+from app.ratelimit.config import refresh_rules
+from app.ratelimit.storage.memory import get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitCleanupTask:
+    """
+    레이트 리밋 저장소 정리 태스크
+
+    주기마다 get_storage()의 cleanup_expired()를 실행한다.
+    (저장소는 매번 새로 조회 - 테스트에서 reset_storage()로 교체될 수 있음)
+    """
+
+    def __init__(self, interval_seconds: int | None = None):
+        """
+        Args:
+            interval_seconds: 정리 주기(초). None이면 설정값을 사용한다.
+                              0 이하이면 비활성화된다.
+        """
+        self.interval_seconds = (
+            interval_seconds
+            if interval_seconds is not None
+            else settings.RATE_LIMIT_CLEANUP_INTERVAL_SECONDS
+        )
+        self.is_running = False
+
+    @property
+    def enabled(self) -> bool:
+        """주기가 0보다 클 때만 활성화"""
+        return self.interval_seconds > 0
+
+    async def sweep(self) -> int:
+        """
+        만료된 엔트리를 한 번 정리하고 정리된 수 반환
+
+        규칙 파일이 바뀌었으면 먼저 다시 읽는다. 잘못된 파일은 경고만 남기고 기존 규칙을 유지한다.
+        """
+        try:
+            refresh_rules()
+        except (OSError, ValueError) as e:
+            logger.warning("Rate limit rules reload failed (keeping current rules): %s", str(e))
+
+        storage = get_storage()
+        cleaned = await storage.cleanup_expired()
+        stats = await storage.stats()
+        logger.debug(
+            "Rate limit storage swept: cleaned=%d keys=%d bytes=%d evictions=%d",
+            cleaned, stats["keys"], stats["bytes"], stats["evictions"],
+        )
+        return cleaned
+
+    async def run(self) -> None:
+        """
+        주기적 정리 실행 (lifespan startup 후 실행)
+
+        - enabled가 False면 즉시 종료한다.
+        - 정리 실패는 경고만 남기고 다음 주기에 재시도한다.
+        - asyncio.CancelledError 시 정상 종료한다.
+        """
+        if not self.enabled:
+            logger.info(
+                "ℹ️  Rate limit cleanup disabled (RATE_LIMIT_CLEANUP_INTERVAL_SECONDS=%d)",
+                self.interval_seconds,
+            )
+            return
+
+        self.is_running = True
+        logger.info(
+            "✅ Rate limit cleanup task started (interval=%ds)",
+            self.interval_seconds,
+        )
+
+        try:
+            while self.is_running:
+                await asyncio.sleep(self.interval_seconds)
+
+                if not self.is_running:
+                    break
+
+                try:
+                    await self.sweep()
+                except Exception as e:
+                    logger.warning(
+                        "Rate limit cleanup failed (will retry next interval): %s",
+                        str(e),
+                    )
+
+        except asyncio.CancelledError:
+            logger.info("Rate limit cleanup task cancelled (shutdown)")
+            self.is_running = False
+            raise
@@ -4,13 +4,109 @@
 RRULE 기반으로 반복 일정의 가상 인스턴스를 생성합니다.
 """
 import re
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 from typing import List, Optional
 
-from dateutil.rrule import rrulestr
+from cachetools import LRUCache
+from dateutil.rrule import (
+    rrule,
+    rrulestr,
+    YEARLY,
+    MONTHLY,
+    WEEKLY,
+    DAILY,
+    HOURLY,
+    MINUTELY,
+    SECONDLY,
+)
 
+from app.core.config import settings
 from app.domain.dateutil.service import format_datetime_for_rrule
 
+# 고정 길이 주기 (timedelta로 정확히 건너뛸 수 있는 FREQ)
+_FIXED_PERIODS = {
+    WEEKLY: timedelta(weeks=1),
+    DAILY: timedelta(days=1),
+    HOURLY: timedelta(hours=1),
+    MINUTELY: timedelta(minutes=1),
+    SECONDLY: timedelta(seconds=1),
+}
+
+# RRULE 검증에 사용하는 임시 dtstart
+_VALIDATION_DTSTART = datetime(2024, 1, 1, 10, 0, 0)
+
+
+class RRuleCache:
+    """
+    파싱된 RRULE 객체 캐시 (프로세스 전역, LRU)
+
+    같은 반복 규칙이 요청마다 rrulestr로 다시 파싱되는 것을 막습니다.
+    키는 (recurrence_rule, dtstart, recurrence_end)이며, dateutil의 rrule 객체는
+    순회할 때마다 새 제너레이터를 만들기 때문에 여러 요청에서 공유해도 안전합니다.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache: LRUCache = LRUCache(maxsize=max(1, maxsize))
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+            self,
+            recurrence_rule: str,
+            dtstart: datetime,
+            recurrence_end: Optional[datetime] = None,
+    ):
+        """
+        파싱된 규칙 조회 (없으면 파싱 후 저장)
+
+        :param recurrence_rule: RRULE 형식의 반복 규칙
+        :param dtstart: 반복 시작 시간
+        :param recurrence_end: 반복 종료일 (RRULE에 UNTIL이 없으면 추가됨)
+        :return: rrule 또는 rruleset
+        :raises ValueError: RRULE 파싱 실패 시 (실패 결과는 캐싱하지 않음)
+        """
+        key = (recurrence_rule, dtstart, recurrence_end)
+        with self._lock:
+            rule = self._cache.get(key)
+            if rule is not None:
+                self.hits += 1
+                return rule
+            self.misses += 1
+
+        rrule_str = recurrence_rule
+        if recurrence_end:
+            # RRULE에 UNTIL이 없으면 추가
+            if "UNTIL" not in rrule_str.upper():
+                rrule_str = f"{rrule_str};UNTIL={format_datetime_for_rrule(recurrence_end)}"
+        rule = rrulestr(rrule_str, dtstart=dtstart)
+
+        with self._lock:
+            self._cache[key] = rule
+        return rule
+
+    def stats(self) -> dict[str, int]:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "maxsize": int(self._cache.maxsize),
+            }
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# 싱글톤 RRULE 캐시 인스턴스
+rrule_cache = RRuleCache(maxsize=settings.RRULE_CACHE_SIZE)
+
 
 class RecurrenceCalculator:
     """반복 일정 계산 유틸리티"""
@@ -26,7 +122,11 @@ class RecurrenceCalculator:
     ) -> List[tuple[datetime, datetime]]:
         """
         반복 일정을 가상 인스턴스로 확장
-        
+
+        원본 시작 시간부터 순회하지 않고, 조회 범위 직전의 주기로 dtstart를
+        건너뛴 뒤(seek) 조회 범위 안의 인스턴스만 생성합니다.
+        따라서 비용은 일정의 나이가 아니라 조회 범위의 크기에 비례합니다.
+
         :param start_time: 원본 일정 시작 시간
         :param end_time: 원본 일정 종료 시간
         :param recurrence_rule: RRULE 형식의 반복 규칙 (예: "FREQ=WEEKLY;BYDAY=MO")
@@ -44,47 +144,274 @@ class RecurrenceCalculator:
         # 일정의 지속 시간 계산
         duration = end_time - start_time
 
-        # RRULE 파싱 및 계산
-        # until 파라미터가 있으면 추가
-        rrule_str = recurrence_rule
-        if recurrence_end:
-            # RRULE에 UNTIL이 없으면 추가
-            if "UNTIL" not in rrule_str.upper():
-                rrule_str = f"{rrule_str};UNTIL={format_datetime_for_rrule(recurrence_end)}"
-
+        # RRULE 파싱 (캐시 사용)
         try:
-            rrule_obj = rrulestr(
-                rrule_str,
-                dtstart=start_time,
-            )
+            rrule_obj = rrule_cache.get(recurrence_rule, start_time, recurrence_end)
         except Exception:
             # RRULE 파싱 실패 시 원본만 반환
             if start_time <= query_end and end_time >= query_start:
                 return [(start_time, end_time)]
             return []
 
+        # 종료 시간이 query_start 이후인 인스턴스 = 시작 시간이 (query_start - duration) 이후
+        seek_from = query_start - duration
+
+        # 단순 DAILY/WEEKLY 규칙은 산술로 바로 계산, 나머지는 dateutil로 순회
+        instance_starts = RecurrenceCalculator.expand_simple(rrule_obj, seek_from, query_end)
+        if instance_starts is None:
+            rrule_obj = RecurrenceCalculator.seek(rrule_obj, seek_from)
+            instance_starts = rrule_obj.between(seek_from, query_end, inc=True)
+
         # 쿼리 범위 내의 인스턴스만 생성
-        instances = []
-        for instance_start in rrule_obj:
-            # 조회 범위를 벗어나면 중단
-            if instance_start > query_end:
-                break
+        return [
+            (instance_start, instance_start + duration)
+            for instance_start in instance_starts
+        ]
 
-            # 조회 범위 이전이면 스킵
-            instance_end = instance_start + duration
-            if instance_end < query_start:
-                continue
+    @staticmethod
+    def expand_simple(rule, seek_from: datetime, query_end: datetime) -> Optional[List[datetime]]:
+        """
+        단순 DAILY/WEEKLY 규칙의 인스턴스 시작 시각을 산술로 계산
+
+        대부분의 반복 일정은 FREQ=DAILY, FREQ=WEEKLY;BYDAY=..., INTERVAL=n 형태입니다.
+        이런 규칙은 n번째 인스턴스를 dtstart로부터 바로 계산할 수 있으므로
+        dateutil의 인스턴스별 제너레이터를 거치지 않고 조회 범위 안의 값만 만듭니다.
+        결과는 rule.between(seek_from, query_end, inc=True)와 동일합니다.
 
-            instances.append((instance_start, instance_end))
+        단순 규칙이 아니면 None을 반환하며, 호출 측은 dateutil로 처리해야 합니다.
 
-        return instances
+        :param rule: rrulestr()로 파싱된 규칙
+        :param seek_from: 조회 시작 시각 (포함)
+        :param query_end: 조회 종료 시각 (포함)
+        :return: 인스턴스 시작 시각 리스트 (또는 None)
+        """
+        if not RecurrenceCalculator._is_simple(rule):
+            return None
+
+        dtstart = rule._dtstart
+        count = rule._count
+        lower = max(seek_from, dtstart)
+        upper = query_end if rule._until is None else min(query_end, rule._until)
+        if upper < lower:
+            return []
+
+        if rule._freq == DAILY:
+            # n번째 인스턴스 = dtstart + n * INTERVAL일
+            step = timedelta(days=rule._interval)
+            first = -((dtstart - lower) // step)
+            last = (upper - dtstart) // step
+            if count is not None:
+                last = min(last, count - 1)
+            return [dtstart + step * n for n in range(first, last + 1)]
+
+        # WEEKLY: WKST 기준 주의 시작일로부터 요일 오프셋
+        first_week_start, first_week_offsets, offsets = RecurrenceCalculator._weekly_offsets(rule)
+        period = timedelta(weeks=rule._interval)
+
+        instance_starts = []
+        week = max(0, (lower - first_week_start) // period)
+        while True:
+            week_start = first_week_start + period * week
+            if week_start > upper:
+                return instance_starts
+            week_offsets = first_week_offsets if week == 0 else offsets
+            for position, offset in enumerate(week_offsets):
+                if count is not None:
+                    # 첫 주는 dtstart 이후 요일만 포함되므로 인스턴스 순번을 따로 계산
+                    index = position if week == 0 else (
+                        len(first_week_offsets) + (week - 1) * len(offsets) + position
+                    )
+                    if index >= count:
+                        return instance_starts
+                instance_start = week_start + timedelta(days=offset)
+                if instance_start > upper:
+                    return instance_starts
+                if instance_start >= lower:
+                    instance_starts.append(instance_start)
+            week += 1
 
     @staticmethod
-    def is_valid_rrule(rrule_str: str) -> bool:
+    def count_simple(rule, until: datetime) -> Optional[int]:
+        """
+        단순 DAILY/WEEKLY 규칙에서 until까지의 인스턴스 개수를 산술로 계산
+
+        인스턴스를 생성하지 않고 COUNT/UNTIL과 until 중 먼저 닿는 경계까지의
+        개수를 구합니다. 결과는 len(list(rule.between(dtstart, until, inc=True)))와 동일합니다.
+
+        :param rule: rrulestr()로 파싱된 규칙
+        :param until: 이 시각까지(포함)의 인스턴스만 셈
+        :return: 인스턴스 개수 (단순 규칙이 아니면 None)
+        """
+        if not RecurrenceCalculator._is_simple(rule):
+            return None
+
+        dtstart = rule._dtstart
+        upper = until if rule._until is None else min(until, rule._until)
+        if upper < dtstart:
+            return 0
+
+        if rule._freq == DAILY:
+            total = (upper - dtstart) // timedelta(days=rule._interval) + 1
+        else:
+            first_week_start, first_week_offsets, offsets = RecurrenceCalculator._weekly_offsets(rule)
+            period = timedelta(weeks=rule._interval)
+            last_week = (upper - first_week_start) // period
+            last_week_start = first_week_start + period * last_week
+            last_week_count = sum(
+                1 for offset in (first_week_offsets if last_week == 0 else offsets)
+                if last_week_start + timedelta(days=offset) <= upper
+            )
+            if last_week == 0:
+                total = last_week_count
+            else:
+                total = len(first_week_offsets) + (last_week - 1) * len(offsets) + last_week_count
+
+        if rule._count is not None:
+            total = min(total, rule._count)
+        return total
+
+    @staticmethod
+    def _weekly_offsets(rule: rrule) -> tuple[datetime, list[int], list[int]]:
+        """
+        WEEKLY 규칙의 첫 주 시작 시각과 요일 오프셋 계산
+
+        :return: (첫 주 시작 시각, 첫 주 오프셋(dtstart 이후 요일만), 매주 오프셋)
+        """
+        dtstart = rule._dtstart
+        offsets = sorted({(weekday - rule._wkst) % 7 for weekday in rule._byweekday})
+        start_offset = (dtstart.weekday() - rule._wkst) % 7
+        first_week_offsets = [offset for offset in offsets if offset >= start_offset]
+        return dtstart - timedelta(days=start_offset), first_week_offsets, offsets
+
+    @staticmethod
+    def _is_simple(rule) -> bool:
+        """
+        산술 계산이 가능한 단순 규칙인지 확인
+
+        - FREQ=DAILY (BYDAY 없음) 또는 FREQ=WEEKLY (BYDAY는 요일만)
+        - INTERVAL/COUNT/UNTIL/WKST 허용
+        - 하루 한 번, dtstart와 같은 시각 (BYHOUR/BYMINUTE/BYSECOND로 시각을 바꾸지 않음)
+        - 그 외 BYxxx 없음
+        """
+        if not isinstance(rule, rrule):
+            return False
+        if rule._freq == DAILY:
+            if rule._byweekday is not None:
+                return False
+        elif rule._freq == WEEKLY:
+            if not rule._byweekday:
+                return False
+        else:
+            return False
+        if (
+                rule._bynweekday or rule._bymonth or rule._bymonthday or rule._bynmonthday
+                or rule._byyearday or rule._byweekno or rule._byeaster or rule._bysetpos
+        ):
+            return False
+        timeset = rule._timeset
+        return len(timeset) == 1 and timeset[0] == rule._dtstart.time()
+
+    @staticmethod
+    def seek(rule, seek_from: datetime):
+        """
+        반복 규칙의 dtstart를 seek_from 직전 주기로 건너뛴 규칙 반환
+
+        dateutil은 항상 dtstart부터 순회하므로(between()도 동일),
+        오래된 반복 일정일수록 조회 범위 이전의 인스턴스를 버리는 비용이 커집니다.
+        FREQ/INTERVAL 주기의 정수 배만큼 dtstart를 옮기면 seek_from 이후의
+        인스턴스는 원래 규칙과 동일하게 유지됩니다.
+
+        다음 경우에는 안전하게 건너뛸 수 없으므로 원래 규칙을 그대로 반환합니다.
+        - rruleset (EXDATE/RDATE 포함)
+        - COUNT가 있는 규칙 (건너뛴 인스턴스 수를 알아야 함)
+        - BYWEEKNO/BYYEARDAY/BYEASTER (연도 경계를 넘는 집합)
+
+        :param rule: rrulestr()로 파싱된 규칙
+        :param seek_from: 이 시각 이후의 인스턴스만 필요함
+        :return: dtstart가 이동된 규칙 (또는 원래 규칙)
+        """
+        if not isinstance(rule, rrule):
+            return rule
+        if rule._count is not None:
+            return rule
+        if rule._byweekno or rule._byyearday or rule._byeaster:
+            return rule
+
+        dtstart = rule._dtstart
+        if seek_from <= dtstart:
+            return rule
+
+        freq = rule._freq
+        interval = rule._interval
+
+        if freq in _FIXED_PERIODS:
+            # 같은 요일/시각을 유지하므로 dtstart에서 파생된 BYxxx 값이 그대로 유지됨
+            step = _FIXED_PERIODS[freq] * interval
+            periods = (seek_from - dtstart) // step
+            if periods <= 0:
+                return rule
+            return rule.replace(dtstart=dtstart + step * periods)
+
+        if freq == MONTHLY:
+            elapsed = (seek_from.year - dtstart.year) * 12 + (seek_from.month - dtstart.month)
+            periods = elapsed // interval
+            if periods <= 0:
+                return rule
+            month_index = dtstart.month - 1 + periods * interval
+            new_dtstart = datetime(
+                dtstart.year + month_index // 12, month_index % 12 + 1, 1, tzinfo=dtstart.tzinfo,
+            )
+        elif freq == YEARLY:
+            periods = (seek_from.year - dtstart.year) // interval
+            if periods <= 0:
+                return rule
+            new_dtstart = datetime(dtstart.year + periods * interval, 1, 1, tzinfo=dtstart.tzinfo)
+        else:
+            return rule
+
+        # 주기의 첫 시각(1일 00:00)으로 옮기므로 dtstart에서 파생되던 값은 명시적으로 고정
+        return rule.replace(dtstart=new_dtstart, **RecurrenceCalculator._derived_byxxx(rule))
+
+    @staticmethod
+    def _derived_byxxx(rule: rrule) -> dict:
+        """
+        dtstart에서 암묵적으로 파생된 BYxxx 값 추출
+
+        RRULE에 명시되지 않은 BYMONTH/BYMONTHDAY/BYDAY/BYHOUR/BYMINUTE/BYSECOND는
+        dateutil이 dtstart로부터 채웁니다. dtstart를 옮길 때 이 값들이 바뀌지 않도록
+        원래 규칙에서 계산된 값을 그대로 넘깁니다.
+        """
+        original = rule._original_rule
+        derived = {}
+        if 'bymonth' in original and original['bymonth'] is None:
+            derived['bymonth'] = rule._bymonth
+        if 'bymonthday' in original and original['bymonthday'] is None:
+            derived['bymonthday'] = rule._bymonthday + rule._bynmonthday
+        if 'byweekday' in original and original['byweekday'] is None:
+            derived['byweekday'] = rule._byweekday
+        if 'byhour' not in original and rule._byhour:
+            derived['byhour'] = tuple(rule._byhour)
+        if 'byminute' not in original and rule._byminute:
+            derived['byminute'] = tuple(rule._byminute)
+        if 'bysecond' not in original and rule._bysecond:
+            derived['bysecond'] = tuple(rule._bysecond)
+        return derived
+
+    @staticmethod
+    def is_valid_rrule(
+            rrule_str: str,
+            dtstart: Optional[datetime] = None,
+            recurrence_end: Optional[datetime] = None,
+    ) -> bool:
         """
         RRULE 문자열이 유효한지 검증
-        
+
+        실제 일정의 dtstart/recurrence_end를 넘기면 검증에 사용한 파싱 결과가
+        캐시에 남아 이후 조회 시 그대로 재사용됩니다.
+
         :param rrule_str: RRULE 형식의 문자열
+        :param dtstart: 반복 시작 시간 (없으면 임시 datetime 사용)
+        :param recurrence_end: 반복 종료일
         :return: 유효하면 True, 아니면 False
         """
         if not rrule_str:
@@ -98,9 +425,7 @@ class RecurrenceCalculator:
                 return False
 
         try:
-            # 임시 datetime으로 파싱 테스트
-            test_start = datetime(2024, 1, 1, 10, 0, 0)
-            rrulestr(rrule_str, dtstart=test_start)
+            rrule_cache.get(rrule_str, dtstart or _VALIDATION_DTSTART, recurrence_end)
             return True
         except Exception:
             return False
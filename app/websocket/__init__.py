@@ -3,6 +3,7 @@ WebSocket 모듈
 
 WebSocket 인프라 레이어 (공용)
 - ConnectionManager: 연결 관리
+- 이벤트 버스: bus/ (워커 간 브로드캐스트 전달)
 - 인증: auth.py
 - 공용 스키마: base.py
 """
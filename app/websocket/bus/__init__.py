@@ -0,0 +1,27 @@
+# WebSocket 이벤트 버스 패키지 (워커 간 브로드캐스트 전달)
+from app.core import config as app_config
+from app.websocket.bus.base import BusEvent, EventBus, EventHandler
+from app.websocket.bus.memory import InProcessBus
+from app.websocket.bus.postgres import PostgresBus
+from app.websocket.bus.sqlite import SqliteBus
+
+
+def create_event_bus() -> EventBus:
+    """WS_EVENT_BUS 설정에 맞는 이벤트 버스 생성"""
+    backend = app_config.settings.WS_EVENT_BUS
+    if backend == "sqlite":
+        return SqliteBus()
+    if backend == "postgres":
+        return PostgresBus()
+    return InProcessBus()
+
+
+__all__ = [
+    "BusEvent",
+    "EventBus",
+    "EventHandler",
+    "InProcessBus",
+    "PostgresBus",
+    "SqliteBus",
+    "create_event_bus",
+]
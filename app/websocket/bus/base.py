@@ -0,0 +1,70 @@
+"""
+WebSocket 이벤트 버스 인터페이스
+
+워커 프로세스마다 ConnectionManager가 자기 프로세스의 연결만 알고 있으므로,
+한 워커에서 발생한 이벤트를 다른 워커의 연결에도 전달하기 위한 pub/sub 추상화.
+"""
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+
+@dataclass(frozen=True, slots=True)
+class BusEvent:
+    """
+    워커 간에 전달되는 이벤트
+
+    :param id: 이벤트 고유 ID (중복 수신 제거용, "<worker_id>:<seq>")
+    :param origin: 발행한 워커 ID (발행 워커는 이미 로컬 전달을 마쳤으므로 무시)
+    :param user_ids: 수신 대상 사용자 ID 목록
+    :param text: 전송할 JSON 텍스트 (WSServerMessage.to_json() 결과)
+    """
+    id: str
+    origin: str
+    user_ids: tuple[str, ...]
+    text: str
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"id": self.id, "origin": self.origin, "user_ids": self.user_ids, "text": self.text},
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> "BusEvent":
+        raw = json.loads(data)
+        return cls(id=raw["id"], origin=raw["origin"], user_ids=tuple(raw["user_ids"]), text=raw["text"])
+
+
+EventHandler = Callable[[BusEvent], Awaitable[None]]
+
+
+class EventBus(ABC):
+    """
+    이벤트 버스 추상 클래스
+
+    - start: 워커 ID와 수신 핸들러를 등록하고 구독 시작
+    - publish: 이벤트 발행 (네트워크/디스크를 기다리지 않음, 실패는 로그로 남김)
+    - 핸들러는 다른 워커가 발행한 이벤트를 발행 순서대로 받음 (자기 이벤트는 버스 구현에 따라 올 수 있음)
+    - 전달 보장: at-most-once (구독 전/연결 끊김 중 이벤트는 유실될 수 있음)
+    """
+
+    @abstractmethod
+    async def start(self, worker_id: str, handler: EventHandler) -> None:
+        """구독 시작"""
+        pass
+
+    @abstractmethod
+    async def publish(self, event: BusEvent) -> None:
+        """이벤트 발행"""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """구독 중단 및 연결 종료"""
+        pass
+
+    def stats(self) -> dict[str, int]:
+        """발행/수신 이벤트 수 등 통계"""
+        return {}
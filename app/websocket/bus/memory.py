@@ -0,0 +1,34 @@
+"""
+프로세스 내 이벤트 버스 (기본값)
+
+단일 워커 배포용. 같은 버스에 구독한 ConnectionManager끼리만 이벤트를 주고받는다.
+"""
+from app.websocket.bus.base import BusEvent, EventBus, EventHandler
+
+
+class InProcessBus(EventBus):
+    """
+    프로세스 내 이벤트 버스
+
+    - 발행 즉시 같은 버스를 구독한 다른 워커(ConnectionManager)의 핸들러를 호출
+    - 워커가 하나면 전달할 곳이 없으므로 기존(프로세스 메모리 전용)과 동작이 같음
+    """
+
+    def __init__(self):
+        self._handlers: dict[str, EventHandler] = {}
+        self.published = 0
+
+    async def start(self, worker_id: str, handler: EventHandler) -> None:
+        self._handlers[worker_id] = handler
+
+    async def publish(self, event: BusEvent) -> None:
+        self.published += 1
+        for worker_id, handler in list(self._handlers.items()):
+            if worker_id != event.origin:
+                await handler(event)
+
+    async def close(self) -> None:
+        self._handlers.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"published": self.published, "subscribers": len(self._handlers)}
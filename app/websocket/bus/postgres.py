@@ -0,0 +1,170 @@
+"""
+PostgreSQL LISTEN/NOTIFY 이벤트 버스
+
+여러 호스트/워커가 같은 PostgreSQL 채널을 구독해 이벤트를 주고받는다.
+별도 브로커 없이 이미 사용하는 데이터베이스(asyncpg)로 워커 간 전달을 처리한다.
+"""
+import asyncio
+import logging
+import re
+from typing import Optional
+
+import asyncpg
+
+from app.core import config as app_config
+from app.websocket.bus.base import BusEvent, EventBus, EventHandler
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payload 최대 크기 (PostgreSQL 기본 8000바이트 미만)
+NOTIFY_MAX_BYTES = 7999
+# 연결이 끊겼을 때 재연결 간격 (초)
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+def _asyncpg_dsn(url: str) -> str:
+    """SQLAlchemy URL(postgresql+asyncpg://...)을 asyncpg DSN(postgresql://...)으로 변환"""
+    return re.sub(r"^postgresql\+\w+://", "postgresql://", url)
+
+
+class PostgresBus(EventBus):
+    """
+    PostgreSQL LISTEN/NOTIFY 이벤트 버스
+
+    - 구독 연결 하나(LISTEN)와 발행 연결 하나(pg_notify)를 워커마다 유지
+    - 발행은 큐에 넣고 발행 태스크가 순서대로 NOTIFY (핸들러는 데이터베이스 왕복을 기다리지 않음)
+    - 수신한 알림도 큐를 거쳐 도착 순서대로 핸들러에 전달
+    - 연결이 끊기면 RECONNECT_DELAY_SECONDS 간격으로 재연결 (끊긴 동안의 알림은 유실)
+    - 발행 실패 시 재연결 후 한 번 재시도 (서버가 이미 처리했다면 중복 → 수신 측 이벤트 ID로 제거)
+
+    제한:
+    - NOTIFY payload는 8000바이트 미만이어야 하므로 더 큰 이벤트는 다른 워커로 전달하지 않음 (oversized)
+    """
+
+    def __init__(self, dsn: str | None = None, channel: str | None = None):
+        """
+        :param dsn: PostgreSQL URL (None이면 WS_EVENT_BUS_POSTGRES_URL, 없으면 DATABASE_URL)
+        :param channel: LISTEN/NOTIFY 채널 이름 (None이면 WS_EVENT_BUS_CHANNEL)
+        """
+        settings = app_config.settings
+        self.dsn = _asyncpg_dsn(dsn or settings.WS_EVENT_BUS_POSTGRES_URL or settings.DATABASE_URL)
+        self.channel = channel or settings.WS_EVENT_BUS_CHANNEL
+        self._handler: Optional[EventHandler] = None
+        self._listen_conn: Optional[asyncpg.Connection] = None
+        self._publish_conn: Optional[asyncpg.Connection] = None
+        self._inbox: asyncio.Queue[str] = asyncio.Queue()
+        self._outbox: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._closing = False
+        self.published = 0
+        self.received = 0
+        self.oversized = 0
+        self.errors = 0
+
+    async def _listen(self) -> None:
+        conn = await asyncpg.connect(self.dsn)
+        await conn.add_listener(self.channel, self._on_notify)
+        conn.add_termination_listener(self._on_listen_lost)
+        self._listen_conn = conn
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self._inbox.put_nowait(payload)
+
+    def _on_listen_lost(self, connection) -> None:
+        if self._closing or self._reconnect_task is not None:
+            return
+        logger.warning("WebSocket event bus LISTEN connection lost, reconnecting")
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_listener())
+
+    async def _reconnect_listener(self) -> None:
+        try:
+            while not self._closing:
+                try:
+                    await self._listen()
+                    logger.info("WebSocket event bus LISTEN connection restored")
+                    return
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Failed to reconnect WebSocket event bus: {e}")
+                    await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+        finally:
+            self._reconnect_task = None
+
+    async def start(self, worker_id: str, handler: EventHandler) -> None:
+        self._handler = handler
+        await self._listen()
+        self._publish_conn = await asyncpg.connect(self.dsn)
+        self._tasks = [
+            asyncio.create_task(self._dispatch(), name="ws-bus-postgres-dispatch"),
+            asyncio.create_task(self._publisher(), name="ws-bus-postgres-publish"),
+        ]
+
+    async def publish(self, event: BusEvent) -> None:
+        payload = event.to_json()
+        if len(payload.encode()) > NOTIFY_MAX_BYTES:
+            self.oversized += 1
+            logger.warning(f"WebSocket event too large for NOTIFY, not sent to other workers: id={event.id}")
+            return
+        self.published += 1
+        self._outbox.put_nowait(payload)
+
+    async def _notify(self, payload: str) -> None:
+        if self._publish_conn is None or self._publish_conn.is_closed():
+            self._publish_conn = await asyncpg.connect(self.dsn)
+        await self._publish_conn.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+
+    async def _publisher(self) -> None:
+        while True:
+            payload = await self._outbox.get()
+            try:
+                await self._notify(payload)
+            except Exception as e:
+                logger.warning(f"Failed to publish WebSocket event, retrying: {e}")
+                await self._close_publish_conn()
+                try:
+                    await self._notify(payload)
+                except Exception as e:
+                    self.errors += 1
+                    logger.warning(f"Failed to publish WebSocket event: {e}")
+                    await self._close_publish_conn()
+                    await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def _dispatch(self) -> None:
+        while True:
+            payload = await self._inbox.get()
+            self.received += 1
+            try:
+                await self._handler(BusEvent.from_json(payload))
+            except Exception as e:
+                logger.warning(f"Failed to deliver WebSocket event: {e}")
+
+    async def _close_publish_conn(self) -> None:
+        conn, self._publish_conn = self._publish_conn, None
+        if conn is not None and not conn.is_closed():
+            try:
+                await conn.close()
+            except Exception:
+                conn.terminate()
+
+    async def close(self) -> None:
+        self._closing = True
+        for task in [*self._tasks, self._reconnect_task]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._listen_conn is not None and not self._listen_conn.is_closed():
+            await self._listen_conn.remove_listener(self.channel, self._on_notify)
+            await self._listen_conn.close()
+        self._listen_conn = None
+        await self._close_publish_conn()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "published": self.published,
+            "received": self.received,
+            "oversized": self.oversized,
+            "errors": self.errors,
+        }
@@ -0,0 +1,171 @@
+"""
+SQLite 공유 이벤트 버스
+
+같은 호스트의 워커 프로세스(uvicorn --workers N)가 SQLite 파일 하나를 이벤트 로그로 공유한다.
+발행은 행 추가, 구독은 마지막으로 읽은 ID 이후 행을 짧은 주기로 폴링한다.
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from app.core import config as app_config
+from app.websocket.bus.base import BusEvent, EventBus, EventHandler
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 행 보관 시간 (초) - 이보다 오래 뒤처진 워커는 이벤트를 놓침
+EVENT_RETENTION_SECONDS = 60
+# 폴링 한 번에 읽는 최대 행 수 (다 읽으면 쉬지 않고 다시 읽음)
+FETCH_BATCH_SIZE = 1000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS ws_event (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        created_at REAL NOT NULL,
+        origin TEXT NOT NULL,
+        payload TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_ws_event_created_at ON ws_event (created_at)",
+)
+
+_INSERT = "INSERT INTO ws_event (created_at, origin, payload) VALUES (?, ?, ?)"
+_FETCH = "SELECT id, origin, payload FROM ws_event WHERE id > ? ORDER BY id LIMIT ?"
+_DELETE_EXPIRED = "DELETE FROM ws_event WHERE created_at < ?"
+
+
+class SqliteBus(EventBus):
+    """
+    SQLite 폴링 이벤트 버스
+
+    - AUTOINCREMENT ID는 커밋 순서대로 커지므로, "마지막 ID 이후" 조회로 빠짐없이 발행 순서대로 읽음
+    - 연결은 전용 스레드 하나가 소유 (발행은 스레드에 넘기고 기다리지 않음, 같은 스레드라 발행 순서 유지)
+    - 자기 워커가 발행한 행은 건너뜀
+    - 오래된 행은 폴링하는 워커들이 1초에 한 번 EVENT_RETENTION_SECONDS 기준으로 삭제
+
+    제한:
+    - 지연 시간은 폴링 주기(WS_EVENT_BUS_SQLITE_POLL_MS)만큼 늘어남
+    - 같은 호스트(같은 파일시스템)의 프로세스 간에만 공유
+    """
+
+    def __init__(self, path: str | None = None, poll_interval: float | None = None):
+        """
+        :param path: SQLite 파일 경로 (None이면 WS_EVENT_BUS_SQLITE_PATH)
+        :param poll_interval: 폴링 주기 (초, None이면 WS_EVENT_BUS_SQLITE_POLL_MS)
+        """
+        settings = app_config.settings
+        self.path = path or settings.WS_EVENT_BUS_SQLITE_PATH
+        self.poll_interval = (
+            poll_interval if poll_interval is not None else settings.WS_EVENT_BUS_SQLITE_POLL_MS / 1000
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ws-bus-sqlite")
+        self._conn: Optional[sqlite3.Connection] = None
+        self._worker_id = ""
+        self._handler: Optional[EventHandler] = None
+        self._task: Optional[asyncio.Task] = None
+        self._last_id = 0
+        self._last_cleanup = 0.0
+        self.published = 0
+        self.received = 0
+        self.errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """전용 스레드에서만 호출"""
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=app_config.settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,  # 문장마다 자동 커밋
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서 전원 장애 시에도 파일 손상 없음
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _max_id(self) -> int:
+        return self._connect().execute("SELECT COALESCE(MAX(id), 0) FROM ws_event").fetchone()[0]
+
+    async def start(self, worker_id: str, handler: EventHandler) -> None:
+        self._worker_id = worker_id
+        self._handler = handler
+        # 구독 시작 이후에 발행된 이벤트만 전달
+        self._last_id = await self._run(self._max_id)
+        self._task = asyncio.create_task(self._poll(), name="ws-bus-sqlite")
+
+    def _insert(self, origin: str, payload: str) -> None:
+        self._connect().execute(_INSERT, (time.time(), origin, payload))
+
+    def _on_published(self, future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            self.errors += 1
+            logger.warning(f"Failed to publish WebSocket event: {error}")
+
+    async def publish(self, event: BusEvent) -> None:
+        self.published += 1
+        self._executor.submit(self._insert, event.origin, event.to_json()).add_done_callback(self._on_published)
+
+    def _fetch(self, after_id: int) -> list[tuple[int, str, str]]:
+        conn = self._connect()
+        now = time.time()
+        if now - self._last_cleanup >= 1:
+            conn.execute(_DELETE_EXPIRED, (now - EVENT_RETENTION_SECONDS,))
+            self._last_cleanup = now
+        return conn.execute(_FETCH, (after_id, FETCH_BATCH_SIZE)).fetchall()
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                rows = await self._run(self._fetch, self._last_id)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"Failed to read WebSocket events: {e}")
+                rows = []
+
+            for row_id, origin, payload in rows:
+                self._last_id = row_id
+                if origin == self._worker_id:
+                    continue
+                self.received += 1
+                try:
+                    await self._handler(BusEvent.from_json(payload))
+                except Exception as e:
+                    logger.warning(f"Failed to deliver WebSocket event: {e}")
+
+            if len(rows) < FETCH_BATCH_SIZE:
+                await asyncio.sleep(self.poll_interval)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        def _close():
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        await self._run(_close)
+        self._executor.shutdown()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "published": self.published,
+            "received": self.received,
+            "errors": self.errors,
+            "last_id": self._last_id,
+        }
@@ -4,15 +4,24 @@ WebSocket 연결 관리자
 사용자별 연결 관리 및 브로드캐스트 기능 제공
 """
 import asyncio
+import itertools
 import logging
-from typing import Optional
+import uuid
+from collections import OrderedDict
+from typing import Iterable, Optional
 
 from fastapi import WebSocket
 
+from app.core import config as app_config
 from app.websocket.base import WSServerMessage
+from app.websocket.bus import BusEvent, EventBus
+from app.websocket.sender import ConnectionSender
 
 logger = logging.getLogger(__name__)
 
+# 중복 수신 제거를 위해 기억하는 최근 이벤트 ID 수
+SEEN_EVENTS_SIZE = 4096
+
 
 class ConnectionManager:
     """
@@ -22,6 +31,13 @@ class ConnectionManager:
     - 사용자별 다중 연결 관리 (멀티 플랫폼 지원)
     - 사용자 전체 연결 브로드캐스트
     - 친구 그룹 브로드캐스트
+
+    전송은 연결별 송신 큐(ConnectionSender)에 넣기만 하고, 연결마다 writer 태스크가 실제로 보낸다.
+    (WS_SEND_QUEUE_SIZE, WS_SEND_OVERFLOW_POLICY)
+
+    연결은 이 프로세스(워커)에만 있으므로, 이벤트 버스가 연결되어 있으면 send_to_user/broadcast_to_friends는
+    로컬 연결에 바로 전달한 뒤 이벤트를 한 번 발행하고, 다른 워커는 버스에서 받아 자기 연결에 전달한다.
+    (WS_EVENT_BUS)
     """
 
     def __init__(self):
@@ -30,8 +46,29 @@ class ConnectionManager:
         self._connections: dict[str, list[WebSocket]] = {}
         # 연결 -> 사용자 ID 역매핑 (빠른 조회용)
         self._user_by_connection: dict[WebSocket, str] = {}
+        # 연결 -> 송신 큐
+        self._senders: dict[WebSocket, ConnectionSender] = {}
         # 비동기 락 (동시성 제어)
         self._lock = asyncio.Lock()
+        # 워커 간 이벤트 버스 (start_bus 전에는 로컬 전달만)
+        self.worker_id = uuid.uuid4().hex
+        self._bus: Optional[EventBus] = None
+        self._event_seq = itertools.count()
+        # 최근 수신한 이벤트 ID (중복 수신 제거)
+        self._seen_events: OrderedDict[str, None] = OrderedDict()
+        self.duplicate_events = 0
+
+    async def start_bus(self, bus: EventBus) -> None:
+        """이벤트 버스 구독 시작 (이미 연결된 버스가 있으면 먼저 종료)"""
+        await self.stop_bus()
+        await bus.start(self.worker_id, self._on_bus_event)
+        self._bus = bus
+
+    async def stop_bus(self) -> None:
+        """이벤트 버스 구독 중단"""
+        bus, self._bus = self._bus, None
+        if bus is not None:
+            await bus.close()
 
     async def connect(self, websocket: WebSocket, user_id: str) -> None:
         """
@@ -46,6 +83,13 @@ class ConnectionManager:
 
             self._connections[user_id].append(websocket)
             self._user_by_connection[websocket] = user_id
+            settings = app_config.settings
+            self._senders[websocket] = ConnectionSender(
+                websocket,
+                user_id,
+                maxsize=settings.WS_SEND_QUEUE_SIZE,
+                policy=settings.WS_SEND_OVERFLOW_POLICY,
+            )
 
             logger.info(
                 f"WebSocket connected: user={user_id}, "
@@ -61,6 +105,9 @@ class ConnectionManager:
         """
         async with self._lock:
             user_id = self._user_by_connection.pop(websocket, None)
+            sender = self._senders.pop(websocket, None)
+            if sender is not None:
+                sender.close()
 
             if user_id and user_id in self._connections:
                 try:
@@ -76,51 +123,114 @@ class ConnectionManager:
 
             return user_id
 
+    @staticmethod
+    def _encode(message: WSServerMessage | str) -> str:
+        """메시지를 전송할 JSON 텍스트로 변환 (이미 인코딩된 문자열은 그대로)"""
+        return message if isinstance(message, str) else message.to_json()
+
+    def _enqueue(
+            self,
+            targets: list[WebSocket],
+            text: str,
+    ) -> int:
+        """연결 목록의 송신 큐에 같은 텍스트를 넣고, 넣은 연결 수 반환 (네트워크를 기다리지 않음)"""
+        enqueued = 0
+        for ws in targets:
+            sender = self._senders.get(ws)
+            if sender is not None and sender.enqueue(text):
+                enqueued += 1
+        return enqueued
+
+    async def _deliver_local(
+            self,
+            user_ids: Iterable[str],
+            text: str,
+            exclude_websocket: Optional[WebSocket] = None,
+    ) -> int:
+        """이 워커에 있는 사용자들의 연결을 한 번에 모아 송신 큐에 넣고, 넣은 연결 수 반환"""
+        async with self._lock:
+            targets = [
+                ws
+                for user_id in user_ids
+                for ws in self._connections.get(user_id, [])
+                if ws is not exclude_websocket
+            ]
+
+        if not targets:
+            return 0
+        return self._enqueue(targets, text)
+
+    async def _publish(self, user_ids: list[str], text: str) -> None:
+        """다른 워커로 이벤트 발행 (버스가 없으면 생략, 실패해도 로컬 전달에는 영향 없음)"""
+        if self._bus is None or not user_ids:
+            return
+        event = BusEvent(
+            id=f"{self.worker_id}:{next(self._event_seq)}",
+            origin=self.worker_id,
+            user_ids=tuple(user_ids),
+            text=text,
+        )
+        try:
+            await self._bus.publish(event)
+        except Exception as e:
+            logger.warning(f"Failed to publish WebSocket event: {e}")
+
+    async def _on_bus_event(self, event: BusEvent) -> None:
+        """다른 워커가 발행한 이벤트를 이 워커의 연결에 전달 (자기 이벤트, 이미 받은 이벤트는 무시)"""
+        if event.origin == self.worker_id:
+            return
+        if event.id in self._seen_events:
+            self.duplicate_events += 1
+            return
+        self._seen_events[event.id] = None
+        if len(self._seen_events) > SEEN_EVENTS_SIZE:
+            self._seen_events.popitem(last=False)
+
+        await self._deliver_local(event.user_ids, event.text)
+
     async def send_to_user(
             self,
             user_id: str,
-            message: WSServerMessage,
+            message: WSServerMessage | str,
             exclude_websocket: Optional[WebSocket] = None,
     ) -> int:
         """
         특정 사용자의 모든 연결에 메시지 전송
 
+        메시지는 한 번만 JSON으로 인코딩하여 모든 연결의 송신 큐에 같은 텍스트를 넣는다.
+        다른 워커에 있는 연결에는 이벤트 버스로 전달된다.
+
         :param user_id: 대상 사용자 ID
-        :param message: 전송할 메시지
-        :param exclude_websocket: 제외할 연결 (발신자 본인 제외용)
-        :return: 전송 성공한 연결 수
+        :param message: 전송할 메시지 (또는 to_json()으로 미리 인코딩한 문자열)
+        :param exclude_websocket: 제외할 연결 (발신자 본인 제외용, 이 워커의 연결)
+        :return: 이 워커에서 송신 큐에 넣은 연결 수
         """
-        async with self._lock:
-            connections = self._connections.get(user_id, []).copy()
-
-        sent_count = 0
-        for ws in connections:
-            if ws == exclude_websocket:
-                continue
-
-            try:
-                await ws.send_text(message.to_json())
-                sent_count += 1
-            except Exception as e:
-                logger.warning(f"Failed to send to user {user_id}: {e}")
-                # 실패한 연결은 disconnect에서 정리됨
-
-        return sent_count
+        text = self._encode(message)
+        sent = await self._deliver_local([user_id], text, exclude_websocket)
+        await self._publish([user_id], text)
+        return sent
 
     async def send_to_websocket(
             self,
             websocket: WebSocket,
-            message: WSServerMessage,
+            message: WSServerMessage | str,
     ) -> bool:
         """
         특정 WebSocket 연결에 메시지 전송
 
+        등록된 연결이면 송신 큐에 넣어 브로드캐스트와 순서를 맞추고,
+        등록 전(connect 이전) 연결이면 바로 전송한다.
+
         :param websocket: 대상 WebSocket
-        :param message: 전송할 메시지
-        :return: 전송 성공 여부
+        :param message: 전송할 메시지 (또는 미리 인코딩한 문자열)
+        :return: 전송(또는 송신 큐 추가) 성공 여부
         """
+        sender = self._senders.get(websocket)
+        if sender is not None:
+            return sender.enqueue(self._encode(message))
+
         try:
-            await websocket.send_text(message.to_json())
+            await websocket.send_text(self._encode(message))
             return True
         except Exception as e:
             logger.warning(f"Failed to send message: {e}")
@@ -129,21 +239,28 @@ class ConnectionManager:
     async def broadcast_to_friends(
             self,
             friend_ids: list[str],
-            message: WSServerMessage,
+            message: WSServerMessage | str,
     ) -> int:
         """
         친구들에게 메시지 브로드캐스트
 
+        온라인 친구들의 연결을 한 번에 모은 뒤, 메시지를 한 번만 인코딩하여 모든 연결의 송신 큐에 넣는다.
+        느린 친구의 연결이 다른 친구나 호출한 핸들러를 기다리게 하지 않는다.
+        다른 워커에 있는 친구의 연결에는 이벤트 버스로 한 번 발행해 전달된다.
+
         :param friend_ids: 친구 ID 목록
-        :param message: 전송할 메시지
-        :return: 전송 성공한 총 연결 수
+        :param message: 전송할 메시지 (또는 미리 인코딩한 문자열)
+        :return: 이 워커에서 송신 큐에 넣은 총 연결 수
         """
-        total_sent = 0
-        for friend_id in friend_ids:
-            sent = await self.send_to_user(friend_id, message)
-            total_sent += sent
-
-        return total_sent
+        text = self._encode(message)
+        sent = await self._deliver_local(friend_ids, text)
+        await self._publish(list(friend_ids), text)
+        return sent
+
+    async def flush(self) -> None:
+        """모든 연결의 송신 큐가 비워질 때까지 대기 (테스트, 종료 전 전송 보장용)"""
+        for sender in list(self._senders.values()):
+            await sender.join()
 
     def get_user_connection_count(self, user_id: str) -> int:
         """사용자의 현재 연결 수 반환"""
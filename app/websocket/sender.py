@@ -0,0 +1,105 @@
+"""
+WebSocket 연결별 송신 큐
+
+연결마다 크기가 제한된 송신 큐와 전용 writer 태스크를 둔다. 브로드캐스트는 큐에 넣기만 하므로
+느린 클라이언트 하나가 다른 수신자나 브로드캐스트를 일으킨 핸들러를 기다리게 하지 않는다.
+"""
+import asyncio
+import logging
+from typing import Literal
+
+from fastapi import WebSocket
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = Literal["drop_oldest", "disconnect"]
+
+# 송신 큐가 넘쳐 연결을 끊을 때의 close code (1013 Try Again Later: 재연결 후 동기화 유도)
+OVERFLOW_CLOSE_CODE = 1013
+
+
+class ConnectionSender:
+    """
+    연결 하나의 송신 큐 + writer 태스크
+
+    - enqueue: 네트워크를 기다리지 않고 큐에 넣음 (이벤트 루프에서 원자적)
+    - writer 태스크가 큐 순서대로 send_text 실행 → 연결별 전송 순서 유지
+    - 큐가 가득 차면 정책에 따라 처리:
+      - drop_oldest: 가장 오래된 메시지를 버리고 새 메시지를 넣음 (dropped 증가)
+      - disconnect: 송신을 멈추고 연결을 close code 1013으로 종료
+    - 전송 실패(연결 끊김) 시 송신을 멈춤 (등록 해제는 엔드포인트의 disconnect에서)
+    """
+
+    def __init__(self, websocket: WebSocket, user_id: str, maxsize: int, policy: OverflowPolicy):
+        self.websocket = websocket
+        self.user_id = user_id
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max(1, maxsize))
+        self._close_task: asyncio.Task | None = None
+        self._task = asyncio.create_task(self._run(), name=f"ws-sender:{user_id}")
+
+    def enqueue(self, text: str) -> bool:
+        """
+        메시지를 송신 큐에 넣음
+
+        :return: 큐에 넣었으면 True (송신이 멈췄거나 넘쳐서 연결을 끊으면 False)
+        """
+        if self.closed:
+            return False
+
+        try:
+            self._queue.put_nowait(text)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.policy == "drop_oldest":
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._queue.put_nowait(text)
+            self.dropped += 1
+            if self.dropped == 1:
+                logger.warning(f"WebSocket send queue full, dropping oldest messages: user={self.user_id}")
+            return True
+
+        logger.warning(f"WebSocket send queue full, disconnecting slow consumer: user={self.user_id}")
+        self.close()
+        self._close_task = asyncio.create_task(self._close_websocket())
+        return False
+
+    async def _close_websocket(self) -> None:
+        try:
+            await self.websocket.close(code=OVERFLOW_CLOSE_CODE, reason="Send queue overflow")
+        except Exception as e:
+            logger.debug(f"Failed to close slow WebSocket: user={self.user_id}, error={e}")
+
+    async def _run(self) -> None:
+        while True:
+            text = await self._queue.get()
+            try:
+                await self.websocket.send_text(text)
+            except Exception as e:
+                logger.warning(f"Failed to send to user {self.user_id}: {e}")
+                # 실패한 연결은 disconnect에서 정리됨
+                self.closed = True
+                self._discard_pending()
+                return
+            finally:
+                self._queue.task_done()
+
+    def _discard_pending(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    def close(self) -> None:
+        """송신 중단 (남은 메시지 폐기, writer 태스크 취소)"""
+        self.closed = True
+        self._task.cancel()
+        self._discard_pending()
+
+    async def join(self) -> None:
+        """큐에 들어간 메시지가 모두 처리될 때까지 대기"""
+        await self._queue.join()
@@ -0,0 +1,3 @@
+# Benchmarks package
+#
+# 실행 예: python -m benchmarks.recurrence_expansion
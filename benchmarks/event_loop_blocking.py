@@ -0,0 +1,129 @@
+"""
+이벤트 루프 블로킹 벤치마크
+
+느린 쿼리(SLOW_QUERY_SECONDS만큼 지연되는 태그 그룹 조회)가 실행되는 동안
+관련 없는 빠른 요청(타이머 목록 조회)을 일정 간격으로 보내 지연 시간을 측정합니다.
+지연 시간은 예정 전송 시각 기준이므로 루프가 막혀 전송 자체가 늦어진 시간도 포함합니다.
+
+- blocking: 기존 방식 (async def 엔드포인트에서 동기 세션 사용)
+- offloaded: 현재 방식 (def 엔드포인트, FastAPI 스레드풀에서 실행)
+
+실행: python -m benchmarks.event_loop_blocking
+"""
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ["OIDC_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+from app.core.auth import CurrentUser  # noqa: E402
+from app.crud import tag as tag_crud  # noqa: E402
+from app.db.session import _session_manager  # noqa: E402
+from app.domain.tag.service import TagService  # noqa: E402
+from app.domain.timer.service import TimerService  # noqa: E402
+from app.main import app  # noqa: E402
+
+SLOW_QUERY_SECONDS = 0.2
+SLOW_REQUESTS = 4
+FAST_REQUESTS = 50
+FAST_INTERVAL_SECONDS = 0.01
+
+
+def _create_blocking_app(engine) -> FastAPI:
+    """기존 방식 재현: async def 엔드포인트에서 동기 세션으로 조회"""
+    blocking_app = FastAPI()
+    user = CurrentUser.mock()
+
+    @blocking_app.get("/v1/tags/groups")
+    async def read_tag_groups():
+        with Session(engine) as session:
+            return [g.id for g in TagService(session, user).get_all_tag_groups()]
+
+    @blocking_app.get("/v1/timers")
+    async def list_timers():
+        with Session(engine) as session:
+            return [t.id for t in TimerService(session, user).get_all_timers()]
+
+    return blocking_app
+
+
+async def _paced_get(client: httpx.AsyncClient, path: str, send_at: float) -> float:
+    """send_at에 요청을 보내고, 예정 시각 기준 지연 시간 반환 (루프가 막혀 늦게 보낸 시간 포함)"""
+    delay = send_at - time.perf_counter()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    response = await client.get(path)
+    response.raise_for_status()
+    return time.perf_counter() - send_at
+
+
+async def _run(target_app) -> list[float]:
+    """느린 요청을 보낸 뒤, FAST_INTERVAL 간격으로 빠른 요청을 보내 지연 시간 수집"""
+    transport = httpx.ASGITransport(app=target_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 워밍업 (프로필 생성, 커넥션 풀 준비)
+        (await client.get("/v1/timers")).raise_for_status()
+
+        started = time.perf_counter()
+        slow = [asyncio.create_task(client.get("/v1/tags/groups")) for _ in range(SLOW_REQUESTS)]
+        fast = await asyncio.gather(*(
+            _paced_get(client, "/v1/timers", started + i * FAST_INTERVAL_SECONDS)
+            for i in range(FAST_REQUESTS)
+        ))
+        for response in await asyncio.gather(*slow):
+            response.raise_for_status()
+    return list(fast)
+
+
+def _summary(latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p50 = statistics.median(ordered) * 1000
+    p99 = ordered[int(len(ordered) * 0.99) - 1] * 1000
+    return f"p50 {p50:8.1f} ms   p99 {p99:8.1f} ms   max {ordered[-1] * 1000:8.1f} ms"
+
+
+def main() -> None:
+    original = tag_crud.get_all_tag_groups
+
+    def slow_get_all_tag_groups(*args, **kwargs):
+        time.sleep(SLOW_QUERY_SECONDS)  # 느린 쿼리 재현 (DB 드라이버 대기와 동일하게 스레드를 점유)
+        return original(*args, **kwargs)
+
+    tag_crud.get_all_tag_groups = slow_get_all_tag_groups
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        # 요청마다 프로필 동기화(쓰기)가 일어나므로 WAL로 읽기/쓰기 동시성 확보
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+        SQLModel.metadata.create_all(engine)
+        original_engine = _session_manager.engine
+        _session_manager.engine = engine
+        try:
+            blocking = asyncio.run(_run(_create_blocking_app(engine)))
+            offloaded = asyncio.run(_run(app))
+        finally:
+            _session_manager.engine = original_engine
+            tag_crud.get_all_tag_groups = original
+            engine.dispose()
+
+    print(
+        f"{SLOW_REQUESTS} slow requests ({SLOW_QUERY_SECONDS * 1000:.0f} ms each) + "
+        f"{FAST_REQUESTS} fast requests every {FAST_INTERVAL_SECONDS * 1000:.0f} ms"
+    )
+    print(f"{'blocking':<10} {_summary(blocking)}")
+    print(f"{'offloaded':<10} {_summary(offloaded)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+미들웨어 스택 처리량 벤치마크
+
+가벼운 엔드포인트 하나(/v1/ping)를 앱과 같은 미들웨어 스택
+(CORS, RequestLogger, RateLimit, Auth) 뒤에 두고 초당 처리 요청 수를 측정합니다.
+레이트 리밋은 활성화하되 한도에 걸리지 않도록 큰 규칙을 사용합니다.
+
+- baseline: 기존 방식 (BaseHTTPMiddleware 기반 RequestLogger/RateLimit/Auth)
+- asgi: 현재 방식 (순수 ASGI 미들웨어)
+
+실행: python -m benchmarks.middleware_stack
+"""
+import asyncio
+import logging
+import os
+import time
+
+os.environ["OIDC_ENABLED"] = "false"
+os.environ["RATE_LIMIT_ENABLED"] = "true"
+os.environ["DEBUG"] = "false"
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+
+from app.core.auth import AuthMiddleware, CurrentUser  # noqa: E402
+from app.middleware.request_logger import RequestLoggerMiddleware  # noqa: E402
+from app.ratelimit import middleware as ratelimit_middleware  # noqa: E402
+from app.ratelimit.config import RateLimitRule  # noqa: E402
+from app.ratelimit.limiter import get_limiter  # noqa: E402
+from app.ratelimit.middleware import RateLimitMiddleware  # noqa: E402
+from app.ratelimit.storage.memory import reset_storage  # noqa: E402
+
+REQUESTS = 5000
+CONCURRENCY = 50
+BENCH_RULE = RateLimitRule(path_pattern="/v1/*", window_seconds=60, max_requests=10 ** 9)
+
+logger = logging.getLogger("app.middleware.request_logger")
+
+
+class _BaselineLogger(BaseHTTPMiddleware):
+    """기존 RequestLoggerMiddleware 재현"""
+
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logger.info(f"Request: {request.method} {request.url.path}")
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.info(
+            f"Response: {request.method} {request.url.path} - {response.status_code}",
+            extra={"process_time": process_time},
+        )
+        return response
+
+
+class _BaselineRateLimit(BaseHTTPMiddleware):
+    """기존 RateLimitMiddleware 재현 (통과 경로)"""
+
+    async def dispatch(self, request: Request, call_next):
+        rule = ratelimit_middleware.get_rule_for_request(request.method, request.url.path)
+        result = await get_limiter().check_and_record(request.state.current_user.sub, request.method, rule)
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(result.max_requests)
+        response.headers["X-RateLimit-Remaining"] = str(result.remaining)
+        response.headers["X-RateLimit-Reset"] = str(result.reset_after)
+        return response
+
+
+class _BaselineAuth(BaseHTTPMiddleware):
+    """기존 AuthMiddleware 재현 (OIDC 비활성화 경로)"""
+
+    async def dispatch(self, request: Request, call_next):
+        request.state.current_user = CurrentUser.mock()
+        return await call_next(request)
+
+
+def _create_app(logger_cls, rate_limit_cls, auth_cls) -> FastAPI:
+    bench_app = FastAPI()
+
+    @bench_app.get("/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    bench_app.add_middleware(CORSMiddleware, allow_origins=["*"])
+    bench_app.add_middleware(logger_cls)
+    bench_app.add_middleware(rate_limit_cls)
+    bench_app.add_middleware(auth_cls)
+    return bench_app
+
+
+async def _run(target_app) -> float:
+    """REQUESTS개의 요청을 CONCURRENCY개씩 동시에 보내고 초당 요청 수 반환"""
+    reset_storage()
+    transport = httpx.ASGITransport(app=target_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        (await client.get("/v1/ping")).raise_for_status()  # 워밍업
+
+        async def worker(count: int) -> None:
+            for _ in range(count):
+                response = await client.get("/v1/ping")
+                response.raise_for_status()
+                assert "X-RateLimit-Limit" in response.headers
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(REQUESTS // CONCURRENCY) for _ in range(CONCURRENCY)))
+        return REQUESTS / (time.perf_counter() - started)
+
+
+def main() -> None:
+    original_rule_lookup = ratelimit_middleware.get_rule_for_request
+    ratelimit_middleware.get_rule_for_request = lambda method, path: BENCH_RULE
+    try:
+        baseline = asyncio.run(_run(_create_app(_BaselineLogger, _BaselineRateLimit, _BaselineAuth)))
+        current = asyncio.run(_run(_create_app(RequestLoggerMiddleware, RateLimitMiddleware, AuthMiddleware)))
+    finally:
+        ratelimit_middleware.get_rule_for_request = original_rule_lookup
+
+    print(f"{REQUESTS} requests, concurrency {CONCURRENCY}, CORS + logger + rate limit + auth")
+    print(f"{'baseline':<9} {baseline:8.0f} req/s")
+    print(f"{'asgi':<9} {current:8.0f} req/s   ({current / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
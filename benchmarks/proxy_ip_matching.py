@@ -0,0 +1,86 @@
+"""
+프록시 IP 대역 매칭 벤치마크
+
+요청마다 실행되는 "이 IP가 Cloudflare/Trusted Proxy 대역인가" 판정 시간을 방식별로 측정합니다.
+
+- linear: ip_address 파싱 후 any(ip in network ...) (이전 구현)
+- ip_range_set: 정렬된 구간 이진 탐색 (캐시 미사용)
+- ip_range_set+cache: IPRangeSet.contains (최근 판정 LRU, 현재 구현)
+
+대역 수: Cloudflare 공식 목록 규모(IPv4 15 + IPv6 7)와 큰 사내 프록시 목록(1000개)
+
+실행: python -m benchmarks.proxy_ip_matching
+"""
+import random
+import time
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+
+from app.ratelimit.ipset import IPRangeSet
+
+LOOKUPS = 100_000
+DISTINCT_CLIENTS = 2000  # 반복되는 클라이언트/프록시 주소 수
+
+CLOUDFLARE = [
+    "173.245.48.0/20", "103.21.244.0/22", "103.22.200.0/22", "103.31.4.0/22", "141.101.64.0/18",
+    "108.162.192.0/18", "190.93.240.0/20", "188.114.96.0/20", "197.234.240.0/22", "198.41.128.0/17",
+    "162.158.0.0/15", "104.16.0.0/13", "104.24.0.0/14", "172.64.0.0/13", "131.0.72.0/22",
+    "2400:cb00::/32", "2606:4700::/32", "2803:f800::/32", "2405:b500::/32", "2405:8100::/32",
+    "2a06:98c0::/29", "2c0f:f248::/32",
+]
+
+
+def _large_list(rng: random.Random) -> list[str]:
+    return [
+        f"{rng.randrange(1, 224)}.{rng.randrange(256)}.{rng.randrange(256)}.0/{rng.randrange(16, 29)}"
+        for _ in range(1000)
+    ]
+
+
+def _clients(rng: random.Random, networks) -> list[str]:
+    """대역 안/밖이 섞인 IPv4/IPv6 주소를 반복 사용"""
+    pool = []
+    for i in range(DISTINCT_CLIENTS):
+        if i % 4 == 0:
+            network = rng.choice(networks)
+            pool.append(str(network.network_address + rng.randrange(network.num_addresses)))
+        elif i % 4 == 1:
+            pool.append(str(IPv6Address(0x2001 << 112 | rng.getrandbits(112))))
+        else:
+            pool.append(str(IPv4Address(rng.getrandbits(32))))
+    return [rng.choice(pool) for _ in range(LOOKUPS)]
+
+
+def _measure(lookup, clients) -> float:
+    """판정당 평균 시간 (마이크로초)"""
+    started = time.perf_counter()
+    for client in clients:
+        lookup(client)
+    return (time.perf_counter() - started) / len(clients) * 1_000_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    for name, cidrs in (("cloudflare", CLOUDFLARE), ("large", _large_list(rng))):
+        networks = [ip_network(c, strict=False) for c in cidrs]
+        clients = _clients(rng, networks)
+        ip_set = IPRangeSet(networks)
+
+        def linear(ip_str):
+            ip = ip_address(ip_str)
+            return any(ip in network for network in networks)
+
+        for client in clients[:DISTINCT_CLIENTS]:  # 동일 결과 확인
+            assert ip_set.contains(client) is linear(client)
+        ip_set = IPRangeSet(networks)
+
+        print(f"{name}: {len(networks)} networks, {LOOKUPS} lookups")
+        for label, lookup in (
+                ("linear", linear),
+                ("ip_range_set", ip_set._contains),  # 캐시를 거치지 않는 내부 판정
+                ("ip_range_set+cache", ip_set.contains),
+        ):
+            print(f"  {label:<19} {_measure(lookup, clients):7.2f} us/lookup")
+
+
+if __name__ == "__main__":
+    main()
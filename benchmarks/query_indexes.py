@@ -0,0 +1,210 @@
+"""
+복합/부분 인덱스 벤치마크
+
+생성한 데이터셋(SQLite 파일 DB)에서 주요 CRUD 조회의 실행 계획과 소요 시간을
+복합 인덱스(Alembic d6f8b0c2e4a1) 적용 전후로 비교합니다.
+조회는 app.crud 함수를 그대로 호출하고, 실행된 SQL로 EXPLAIN QUERY PLAN을 출력합니다.
+
+실행: python -m benchmarks.query_indexes
+"""
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import event, insert
+from sqlmodel import Session, SQLModel, create_engine
+
+import app.models  # noqa: F401 - 모든 테이블을 메타데이터에 등록
+from app.core.constants import TimerStatus
+from app.crud import friendship as friendship_crud
+from app.crud import schedule as schedule_crud
+from app.crud import timer as timer_crud
+from app.domain.schedule.enums import ScheduleState
+from app.models.friendship import Friendship, FriendshipStatus
+from app.models.schedule import Schedule, ScheduleException
+from app.models.timer import TimerSession
+
+NEW_INDEXES = {
+    "ix_schedule_owner_range",
+    "ix_schedule_owner_recurring",
+    "ix_scheduleexception_owner_parent_date",
+    "ix_scheduleexception_parent_deleted",
+    "ix_timersession_owner_status_started",
+    "ix_friendship_requester_status",
+}
+
+OWNERS = 100
+SCHEDULES_PER_OWNER = 400
+RECURRING_RATIO = 0.25
+EXCEPTIONS_PER_RECURRING = 8
+TIMERS_PER_OWNER = 400
+# 조회 대상 사용자(user-0)는 기록이 많은 사용자로 가정 (다른 사용자 대비 배수)
+HEAVY_OWNER_FACTOR = 50
+FRIENDSHIPS = 20_000
+BASE = datetime(2024, 1, 1)
+REPEAT = 200
+
+
+def _populate(session: Session, rng: random.Random) -> tuple[str, uuid.UUID, datetime]:
+    """데이터셋 생성 후 (조회 대상 owner_id, 반복 일정 ID, 그 일정의 예외 날짜) 반환"""
+    schedules, exceptions, timers = [], [], []
+    for o in range(OWNERS):
+        owner_id = f"user-{o}"
+        factor = HEAVY_OWNER_FACTOR if o == 0 else 1
+        for _ in range(SCHEDULES_PER_OWNER * factor):
+            schedule_id = uuid.uuid4()
+            start_time = BASE + timedelta(minutes=rng.randrange(0, 730 * 24 * 60))
+            recurring = rng.random() < RECURRING_RATIO
+            schedules.append({
+                "id": schedule_id,
+                "owner_id": owner_id,
+                "title": "bench",
+                "start_time": start_time,
+                "end_time": start_time + timedelta(hours=1),
+                "recurrence_rule": "FREQ=DAILY" if recurring else None,
+                "state": ScheduleState.PLANNED,
+                "created_at": BASE,
+                "updated_at": BASE,
+            })
+            if recurring:
+                for day in rng.sample(range(1, 365), EXCEPTIONS_PER_RECURRING):
+                    exceptions.append({
+                        "id": uuid.uuid4(),
+                        "owner_id": owner_id,
+                        "parent_id": schedule_id,
+                        "exception_date": start_time + timedelta(days=day),
+                        "is_deleted": rng.random() < 0.5,
+                        "created_at": BASE,
+                        "updated_at": BASE,
+                    })
+        for _ in range(TIMERS_PER_OWNER * factor):
+            started_at = BASE + timedelta(minutes=rng.randrange(0, 730 * 24 * 60))
+            timers.append({
+                "id": uuid.uuid4(),
+                "owner_id": owner_id,
+                "allocated_duration": 1500,
+                "status": rng.choice([TimerStatus.COMPLETED] * 8 + [TimerStatus.CANCELLED] * 2),
+                "started_at": started_at,
+                "pause_history": [],
+                "created_at": started_at,
+                "updated_at": started_at,
+            })
+
+    friendships = []
+    pairs = set()
+    while len(friendships) < FRIENDSHIPS:
+        requester_id = f"user-{rng.randrange(OWNERS * 50)}"
+        addressee_id = f"user-{rng.randrange(OWNERS * 50)}"
+        pair = tuple(sorted((requester_id, addressee_id)))
+        if requester_id == addressee_id or pair in pairs:
+            continue
+        pairs.add(pair)
+        friendships.append({
+            "id": uuid.uuid4(),
+            "requester_id": requester_id,
+            "addressee_id": addressee_id,
+            "pair_user_id_1": pair[0],
+            "pair_user_id_2": pair[1],
+            "status": rng.choice([FriendshipStatus.PENDING, FriendshipStatus.ACCEPTED]),
+            "created_at": BASE,
+            "updated_at": BASE,
+        })
+
+    session.execute(insert(Schedule), schedules)
+    session.execute(insert(ScheduleException), exceptions)
+    session.execute(insert(TimerSession), timers)
+    session.execute(insert(Friendship), friendships)
+    session.commit()
+    return "user-0", exceptions[0]["parent_id"], exceptions[0]["exception_date"]
+
+
+def _cases(owner_id: str, parent_id: uuid.UUID, exception_date: datetime):
+    range_start = datetime(2024, 6, 3)
+    range_end = datetime(2024, 6, 9, 23, 59, 59)
+    return [
+        ("schedules by date range", lambda s: schedule_crud.get_schedules_by_date_range(
+            s, range_start, range_end, owner_id)),
+        ("recurring schedules", lambda s: schedule_crud.get_recurring_schedules(
+            s, range_start, range_end, owner_id)),
+        ("exception by date", lambda s: schedule_crud.get_schedule_exception_by_date(
+            s, parent_id, exception_date, owner_id)),
+        ("deleted exception dates", lambda s: schedule_crud.get_deleted_schedule_exception_dates(
+            s, parent_id, BASE, BASE + timedelta(days=730))),
+        ("timers by status/range", lambda s: timer_crud.get_all_timers(
+            s, owner_id, status=[TimerStatus.COMPLETED.value],
+            start_date=range_start, end_date=range_end)),
+        ("active timer", lambda s: timer_crud.get_user_active_timer(s, owner_id)),
+        ("pending requests sent", lambda s: friendship_crud.get_pending_requests_sent(s, owner_id)),
+    ]
+
+
+def _measure(engine, func) -> tuple[float, list[str]]:
+    """평균 소요 시간(us)과 마지막 SELECT의 실행 계획 반환"""
+    executed = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    with Session(engine) as session:
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            func(session)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        statement, parameters = executed[0]
+        with engine.connect() as conn:
+            plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            func(session)
+            session.expunge_all()
+        elapsed = (time.perf_counter() - started) / REPEAT * 1_000_000
+    return elapsed, plan
+
+
+def _run(engine, cases) -> dict[str, tuple[float, list[str]]]:
+    return {name: _measure(engine, func) for name, func in cases}
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        SQLModel.metadata.create_all(engine)
+        indexes = [
+            index
+            for table in SQLModel.metadata.sorted_tables
+            for index in table.indexes
+            if index.name in NEW_INDEXES
+        ]
+
+        with Session(engine) as session:
+            cases = _cases(*_populate(session, random.Random(20241016)))
+
+        for index in indexes:
+            index.drop(engine)
+        before = _run(engine, cases)
+
+        for index in indexes:
+            index.create(engine)
+        after = _run(engine, cases)
+
+    print(f"{'query':<26} {'before (us)':>12} {'after (us)':>11} {'speedup':>8}")
+    for name, _ in cases:
+        before_us, _ = before[name]
+        after_us, _ = after[name]
+        print(f"{name:<26} {before_us:>12.1f} {after_us:>11.1f} {before_us / after_us:>7.1f}x")
+
+    print()
+    for name, _ in cases:
+        print(f"[{name}]")
+        print("  before: " + " | ".join(before[name][1]))
+        print("  after:  " + " | ".join(after[name][1]))
+
+
+if __name__ == "__main__":
+    main()
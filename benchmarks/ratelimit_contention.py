@@ -0,0 +1,104 @@
+"""
+Rate Limit 저장소 경합 벤치마크
+
+만료된 키 100,000개를 정리하는 cleanup_expired가 도는 동안, 동시에 요청을 기록하는
+코루틴 수천 개의 처리량과 요청 지연(p50/p99/max)을 측정합니다.
+
+- locked: 전역 asyncio.Lock 아래에서 요청을 기록하고, 정리는 락을 잡은 채 한 번에 수행 (이전 구현)
+- lock_free: 락 없이 기록하고, 정리는 CLEANUP_BATCH_SIZE개마다 이벤트 루프에 양보 (현재 구현)
+
+실행: python -m benchmarks.ratelimit_contention
+"""
+import asyncio
+import statistics
+import time
+from unittest.mock import patch
+
+from app.ratelimit.storage import InMemoryStorage, SlidingWindowCounterStorage
+
+EXPIRED_KEYS = 100_000
+WORKERS = 2000
+REQUESTS_PER_WORKER = 20
+WINDOW_SECONDS = 60
+MAX_REQUESTS = 1000
+
+
+class _Locked:
+    """이전 구현 재현: 모든 연산을 하나의 락으로 직렬화하고 정리 중 양보하지 않음"""
+
+    def __init__(self, storage):
+        self._storage = storage
+        self._lock = asyncio.Lock()
+
+    async def record_request(self, key, window_seconds, max_requests):
+        async with self._lock:
+            return await self._storage.record_request(key, window_seconds, max_requests)
+
+    async def cleanup_expired(self) -> int:
+        async with self._lock:
+            # 배치 크기를 키 수보다 크게 두어 한 번도 양보하지 않게 함
+            with patch(f"{type(self._storage).__module__}.CLEANUP_BATCH_SIZE", EXPIRED_KEYS + 1):
+                return await self._storage.cleanup_expired()
+
+
+async def _expire(storage) -> None:
+    """EXPIRED_KEYS개 키를 윈도우 1초로 기록한 뒤 만료시킴"""
+    for k in range(EXPIRED_KEYS):
+        await storage.record_request(f"ratelimit:ip:10.{k >> 16}.{(k >> 8) & 255}.{k & 255}", 1, 10)
+    await asyncio.sleep(2.1)
+
+
+async def _run(factory, locked: bool) -> tuple[float, list[float], int]:
+    """(초당 요청 수, 요청 지연 목록(ms), 정리된 수)"""
+    storage = factory(max_keys=0)
+    await _expire(storage)
+    target = _Locked(storage) if locked else storage
+    latencies: list[float] = []
+    start = asyncio.Event()
+
+    async def worker(n: int) -> None:
+        await start.wait()
+        for _ in range(REQUESTS_PER_WORKER):
+            began = time.perf_counter()
+            await target.record_request(f"ws:message:user-{n}", WINDOW_SECONDS, MAX_REQUESTS)
+            latencies.append((time.perf_counter() - began) * 1000)
+            await asyncio.sleep(0)  # 실제 요청처럼 다른 작업 사이에 기록
+
+    async def cleanup() -> int:
+        await start.wait()
+        return await target.cleanup_expired()
+
+    tasks = [asyncio.create_task(worker(n)) for n in range(WORKERS)]
+    cleanup_task = asyncio.create_task(cleanup())
+    await asyncio.sleep(0)
+
+    began = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - began
+    cleaned = await cleanup_task
+    return WORKERS * REQUESTS_PER_WORKER / elapsed, latencies, cleaned
+
+
+def main() -> None:
+    print(
+        f"{WORKERS} coroutines x {REQUESTS_PER_WORKER} requests "
+        f"during cleanup of {EXPIRED_KEYS} expired keys"
+    )
+    for name, factory in (
+            ("sliding_log", InMemoryStorage),
+            ("sliding_window_counter", SlidingWindowCounterStorage),
+    ):
+        for mode, locked in (("locked", True), ("lock_free", False)):
+            throughput, latencies, cleaned = asyncio.run(_run(factory, locked))
+            latencies.sort()
+            p99 = latencies[int(len(latencies) * 0.99) - 1]
+            print(
+                f"{name:<23} {mode:<10} {throughput:9.0f} req/s   "
+                f"p50 {statistics.median(latencies):6.3f} ms   p99 {p99:6.3f} ms   "
+                f"max {latencies[-1]:6.3f} ms   cleaned {cleaned}"
+            )
+
+
+if __name__ == "__main__":
+    main()
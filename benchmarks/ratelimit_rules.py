@@ -0,0 +1,77 @@
+"""
+Rate Limit 규칙 매칭 벤치마크
+
+/v1 요청마다 실행되는 (메서드, 경로) → 규칙 조회 시간을 방식별로 측정합니다.
+요청 경로는 ID가 섞인 실제 트래픽처럼 일부만 반복되도록 만듭니다.
+
+- linear_fnmatch: 규칙을 순서대로 순회하며 fnmatch.fnmatch (이전 구현)
+- compiled: 메서드별로 컴파일한 정규식 하나로 매칭 (캐시 미사용)
+- compiled+cache: 컴파일 매처 + (메서드, 경로) LRU 캐시 (현재 구현)
+
+실행: python -m benchmarks.ratelimit_rules
+"""
+import fnmatch
+import random
+import time
+
+from app.ratelimit.config import RATE_LIMIT_RULES, CompiledRules
+
+LOOKUPS = 200_000
+DISTINCT_IDS = 2000  # 캐시 크기(기본 4096)를 넘는 (메서드, 경로) 조합이 생기도록
+
+_PATHS = [
+    "/v1/todos", "/v1/todos/{id}", "/v1/todos/{id}/complete", "/v1/schedules",
+    "/v1/schedules/{id}", "/v1/timers/{id}/pause", "/v1/tags", "/v1/tags/groups/{id}",
+    "/v1/graphql", "/v1/friends/requests", "/v1/friends/requests/{id}/accept", "/v1/users/me",
+]
+_METHODS = ["GET", "GET", "GET", "POST", "PATCH", "DELETE"]
+
+
+def _linear_fnmatch(method: str, path: str):
+    for rule in RATE_LIMIT_RULES:
+        if rule.methods is not None:
+            if method.upper() not in [m.upper() for m in rule.methods]:
+                continue
+        if fnmatch.fnmatch(path, rule.path_pattern):
+            return rule
+    return None
+
+
+def _requests() -> list[tuple[str, str]]:
+    rng = random.Random(0)
+    return [
+        (rng.choice(_METHODS), rng.choice(_PATHS).format(id=rng.randrange(DISTINCT_IDS)))
+        for _ in range(LOOKUPS)
+    ]
+
+
+def _measure(lookup, requests) -> float:
+    """조회당 평균 시간 (마이크로초)"""
+    started = time.perf_counter()
+    for method, path in requests:
+        lookup(method, path)
+    return (time.perf_counter() - started) / len(requests) * 1_000_000
+
+
+def main() -> None:
+    requests = _requests()
+    print(f"{LOOKUPS} lookups, {len(RATE_LIMIT_RULES)} rules, {len(set(requests))} distinct (method, path)")
+
+    cached = CompiledRules(RATE_LIMIT_RULES, cache_size=4096)
+    for method, path in requests:  # 동일 결과 확인
+        assert cached.match(method, path) is _linear_fnmatch(method, path)
+    cached = CompiledRules(RATE_LIMIT_RULES, cache_size=4096)
+
+    for name, lookup in (
+            ("linear_fnmatch", _linear_fnmatch),
+            ("compiled", cached._match),  # 캐시를 거치지 않는 내부 매칭
+            ("compiled+cache", cached.match),
+    ):
+        print(f"{name:<15} {_measure(lookup, requests):6.2f} us/lookup")
+
+    stats = cached.stats()
+    print(f"cache hit rate {stats['hits'] / (stats['hits'] + stats['misses']):.1%}")
+
+
+if __name__ == "__main__":
+    main()
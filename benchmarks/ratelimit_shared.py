@@ -0,0 +1,78 @@
+"""
+Rate Limit 공유 저장소 벤치마크
+
+워커 프로세스 여러 개(uvicorn --workers N 대역)가 같은 키에 요청할 때
+저장소별 처리량과 실제로 허용된 요청 수를 측정합니다.
+
+- memory: 프로세스마다 SlidingWindowCounterStorage (한도가 워커 수만큼 늘어남)
+- sqlite: 모든 프로세스가 SqliteStorage 파일 하나를 공유
+
+실행: python -m benchmarks.ratelimit_shared
+"""
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.ratelimit.storage import SlidingWindowCounterStorage, SqliteStorage
+
+WORKERS = 4
+REQUESTS_PER_WORKER = 5000
+CONCURRENCY = 50  # 워커당 동시 요청 코루틴 수
+KEYS = 100  # 사용자 수
+MAX_REQUESTS = 100  # 키당 60초 한도
+
+
+def _worker(backend: str, path: str) -> tuple[int, float]:
+    """(허용된 요청 수, 경과 초)"""
+    async def run():
+        storage = SqliteStorage(path) if backend == "sqlite" else SlidingWindowCounterStorage()
+        allowed = 0
+
+        async def client(n: int):
+            nonlocal allowed
+            for i in range(REQUESTS_PER_WORKER // CONCURRENCY):
+                key = f"ratelimit:user-{(n * 31 + i) % KEYS}:ALL:/v1/*"
+                result = await storage.record_request(key, 60, MAX_REQUESTS)
+                allowed += result.allowed
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client(n) for n in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - started
+        storage.close()
+        return allowed, elapsed
+
+    return asyncio.run(run())
+
+
+def _run(backend: str, workers: int) -> tuple[float, int]:
+    """(전체 초당 요청 수, 허용된 요청 수)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "ratelimit.db")
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            results = list(pool.map(_worker, [backend] * workers, [path] * workers))
+    allowed = sum(a for a, _ in results)
+    elapsed = max(e for _, e in results)
+    return workers * REQUESTS_PER_WORKER / elapsed, allowed
+
+
+def main() -> None:
+    total = WORKERS * REQUESTS_PER_WORKER
+    print(
+        f"{total} requests over {KEYS} keys, limit {MAX_REQUESTS}/60s per key "
+        f"(at most {min(total, KEYS * MAX_REQUESTS)} should be allowed)"
+    )
+    for backend in ("memory", "sqlite"):
+        for workers in (1, WORKERS):
+            throughput, allowed = _run(backend, workers)
+            print(
+                f"{backend:<7} {workers} worker(s)  {throughput:9.0f} req/s   "
+                f"allowed {allowed} / {workers * REQUESTS_PER_WORKER}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Rate Limit 저장소 벤치마크
+
+WebSocket 메시지 한도(120건/60초)와 같은 규칙으로, 키마다 한도 가까이 요청이 쌓인 상태에서
+요청 기록 처리 시간과 키당 메모리 사용량을 저장소 구현별로 측정합니다.
+
+- sliding_log: InMemoryStorage (키마다 타임스탬프 목록)
+- sliding_window_counter: SlidingWindowCounterStorage (키마다 카운터 두 개)
+
+실행: python -m benchmarks.ratelimit_storage
+"""
+import asyncio
+import time
+import tracemalloc
+
+from app.ratelimit.storage import InMemoryStorage, SlidingWindowCounterStorage
+
+KEYS = 1000
+WINDOW_SECONDS = 60
+MAX_REQUESTS = 120
+REQUESTS_PER_KEY = 100  # 한도 가까이 채운 상태
+
+
+async def _fill(storage) -> float:
+    """키마다 REQUESTS_PER_KEY건 기록하고 요청당 평균 처리 시간(마이크로초) 반환"""
+    started = time.perf_counter()
+    for _ in range(REQUESTS_PER_KEY):
+        for k in range(KEYS):
+            await storage.record_request(f"ws:message:user-{k}", WINDOW_SECONDS, MAX_REQUESTS)
+    return (time.perf_counter() - started) / (KEYS * REQUESTS_PER_KEY) * 1_000_000
+
+
+async def _run(factory) -> tuple[float, float]:
+    """(요청당 처리 시간, 키당 메모리) - 메모리 추적 오버헤드가 시간에 섞이지 않도록 따로 실행"""
+    per_request_us = await _fill(factory())
+
+    tracemalloc.start()
+    storage = factory()
+    await _fill(storage)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return per_request_us, current / KEYS
+
+
+def main() -> None:
+    print(
+        f"{KEYS} keys x {REQUESTS_PER_KEY} requests, "
+        f"limit {MAX_REQUESTS}/{WINDOW_SECONDS}s"
+    )
+    for name, factory in (
+            ("sliding_log", InMemoryStorage),
+            ("sliding_window_counter", SlidingWindowCounterStorage),
+    ):
+        per_request_us, bytes_per_key = asyncio.run(_run(factory))
+        print(f"{name:<23} {per_request_us:7.2f} us/request   {bytes_per_key:8.0f} bytes/key")
+
+
+if __name__ == "__main__":
+    main()
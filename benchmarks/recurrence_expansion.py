@@ -0,0 +1,76 @@
+"""
+반복 일정 확장 벤치마크
+
+일정의 나이(원본 start_time으로부터 조회 범위까지의 거리)가 늘어나도
+한 주 조회 비용이 일정하게 유지되는지 측정합니다.
+단순 DAILY/WEEKLY 규칙은 산술 계산 경로(fast path)와 dateutil 경로(seek)를 함께 비교합니다.
+
+실행: python -m benchmarks.recurrence_expansion
+"""
+import time
+from datetime import datetime, timedelta
+
+from dateutil.rrule import rrulestr
+
+from app.utils.recurrence import RecurrenceCalculator
+
+QUERY_START = datetime(2026, 3, 2)
+QUERY_END = datetime(2026, 3, 8, 23, 59, 59)
+AGES_IN_YEARS = [0, 1, 3, 10, 30]
+RULES = [
+    "FREQ=DAILY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=MONTHLY;BYDAY=1MO",
+]
+REPEAT = 200
+
+
+def _expand_from_dtstart(start_time, end_time, rule):
+    """기존 방식: dtstart부터 순회하며 조회 범위 이전 인스턴스를 버림"""
+    duration = end_time - start_time
+    instances = []
+    for instance_start in rrulestr(rule, dtstart=start_time):
+        if instance_start > QUERY_END:
+            break
+        if instance_start + duration < QUERY_START:
+            continue
+        instances.append((instance_start, instance_start + duration))
+    return instances
+
+
+def _expand_with_dateutil(start_time, end_time, parsed_rule):
+    """산술 계산 경로 없이 seek 후 dateutil로 순회 (파싱된 규칙 재사용)"""
+    duration = end_time - start_time
+    seek_from = QUERY_START - duration
+    rule_obj = RecurrenceCalculator.seek(parsed_rule, seek_from)
+    return [(s, s + duration) for s in rule_obj.between(seek_from, QUERY_END, inc=True)]
+
+
+def _measure(func) -> float:
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - started) / REPEAT * 1_000_000
+
+
+def main() -> None:
+    print(
+        f"{'rule':<30} {'age':>5} {'from dtstart (us)':>18} "
+        f"{'seek (us)':>10} {'current (us)':>13}"
+    )
+    for rule in RULES:
+        for years in AGES_IN_YEARS:
+            start_time = QUERY_START - timedelta(days=365 * years) + timedelta(hours=9)
+            end_time = start_time + timedelta(minutes=30)
+
+            baseline = _measure(lambda: _expand_from_dtstart(start_time, end_time, rule))
+            parsed_rule = rrulestr(rule, dtstart=start_time)
+            seek = _measure(lambda: _expand_with_dateutil(start_time, end_time, parsed_rule))
+            current = _measure(lambda: RecurrenceCalculator.expand_recurrence(
+                start_time, end_time, rule, None, QUERY_START, QUERY_END,
+            ))
+            print(f"{rule:<30} {years:>4}y {baseline:>18.1f} {seek:>10.1f} {current:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+SQLite 쓰기 경합 벤치마크
+
+여러 스레드가 동시에 타이머를 갱신(조회 후 수정, 일시정지/재개와 같은 패턴)하고,
+다른 스레드들이 타이머 목록을 조회하는 동안 처리량, 지연 시간, 실패 횟수를 측정합니다.
+
+- baseline: 기존 방식 (rollback journal, PRAGMA foreign_keys만 적용)
+- profile: 현재 방식 (SessionManager의 SQLite 성능 프로필: WAL, synchronous=NORMAL,
+  busy_timeout, cache_size, mmap_size, temp_store, 연결 풀 크기)
+
+rollback journal 모드에서는 읽기 트랜잭션이 쓰기를 막고, 조회 후 수정하는 트랜잭션끼리
+잠금 승격에서 충돌하면 대기 없이 "database is locked"로 실패합니다.
+
+실행: python -m benchmarks.sqlite_write_contention
+"""
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import timedelta
+
+os.environ["DEBUG"] = "false"  # SQL 로그(echo) 출력이 측정에 섞이지 않도록
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlmodel import Session, SQLModel, create_engine  # noqa: E402
+
+import app.models  # noqa: F401, E402 - 모든 테이블을 메타데이터에 등록
+from app.core.config import settings  # noqa: E402
+from app.core.constants import TimerStatus  # noqa: E402
+from app.crud import timer as timer_crud  # noqa: E402
+from app.db.session import SessionManager  # noqa: E402
+from app.models.base import utc_now_naive  # noqa: E402
+from app.models.timer import TimerSession  # noqa: E402
+
+OWNERS = 20
+TIMERS_PER_OWNER = 50
+WRITERS = 8
+READERS = 8
+DURATION_SECONDS = 3.0
+
+
+def _create_baseline_engine(url: str):
+    """기존 방식 재현: 외래 키 PRAGMA만 적용한 SQLite 엔진"""
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    return engine
+
+
+def _create_profile_engine(url: str):
+    """현재 방식: SessionManager가 만드는 SQLite 엔진"""
+    original_url = settings.DATABASE_URL
+    settings.DATABASE_URL = url
+    try:
+        return SessionManager().engine
+    finally:
+        settings.DATABASE_URL = original_url
+
+
+def _populate(engine) -> list[tuple[str, list]]:
+    """타이머 데이터 생성 후 [(owner_id, [timer_id, ...]), ...] 반환"""
+    SQLModel.metadata.create_all(engine)
+    now = utc_now_naive()
+    owners = []
+    with Session(engine) as session:
+        for o in range(OWNERS):
+            owner_id = f"user-{o}"
+            timers = [
+                TimerSession(
+                    owner_id=owner_id,
+                    allocated_duration=1800,
+                    status=TimerStatus.RUNNING,
+                    started_at=now - timedelta(minutes=i),
+                )
+                for i in range(TIMERS_PER_OWNER)
+            ]
+            session.add_all(timers)
+            session.flush()
+            owners.append((owner_id, [t.id for t in timers]))
+        session.commit()
+    return owners
+
+
+def _worker(engine, owners, index: int, write: bool, deadline: float, result: dict) -> None:
+    """deadline까지 쓰기(조회 후 수정) 또는 읽기(목록 조회)를 반복"""
+    latencies, errors = [], 0
+    i = index
+    while time.perf_counter() < deadline:
+        owner_id, timer_ids = owners[i % len(owners)]
+        started = time.perf_counter()
+        try:
+            with Session(engine) as session:
+                if write:
+                    timer = timer_crud.get_timer(session, timer_ids[i % len(timer_ids)], owner_id)
+                    timer_crud.update_timer(session, timer, {"elapsed_time": timer.elapsed_time + 1})
+                    session.commit()
+                else:
+                    timer_crud.get_all_timers(session, owner_id)
+        except OperationalError:
+            errors += 1
+        else:
+            latencies.append(time.perf_counter() - started)
+        i += 1
+    result.setdefault("write" if write else "read", []).append((latencies, errors))
+
+
+def _run(engine) -> dict:
+    owners = _populate(engine)
+    result: dict = {}
+    deadline = time.perf_counter() + DURATION_SECONDS
+    threads = [
+        threading.Thread(target=_worker, args=(engine, owners, n, n < WRITERS, deadline, result))
+        for n in range(WRITERS + READERS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return result
+
+
+def _summary(entries: list[tuple[list[float], int]]) -> str:
+    latencies = sorted(lat for lats, _ in entries for lat in lats)
+    errors = sum(err for _, err in entries)
+    if not latencies:
+        return f"{'ok':>3} {0:7d}   locked {errors:6d}"
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000
+    return (
+        f"ok {len(latencies):7d} ({len(latencies) / DURATION_SECONDS:8.0f}/s)   "
+        f"locked {errors:6d}   p50 {p50:7.2f} ms   p99 {p99:8.2f} ms"
+    )
+
+
+def main() -> None:
+    print(
+        f"{WRITERS} writer + {READERS} reader threads, {DURATION_SECONDS:.0f}s, "
+        f"{OWNERS * TIMERS_PER_OWNER} timers"
+    )
+    for name, factory in (("baseline", _create_baseline_engine), ("profile", _create_profile_engine)):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = factory(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            try:
+                result = _run(engine)
+            finally:
+                engine.dispose()
+        print(f"{name:<9} write  {_summary(result['write'])}")
+        print(f"{'':<9} read   {_summary(result['read'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+WebSocket 이벤트 버스 워커 간 전달 벤치마크
+
+워커 프로세스 여러 개(uvicorn --workers N 대역)가 SQLite 이벤트 버스를 공유할 때,
+한 워커의 broadcast_to_friends가 다른 워커의 연결에 도착하기까지의 지연과 누락/중복을 측정합니다.
+워커마다 사용자 1명(기기 2대)이 접속해 있고, 모든 워커가 모든 사용자에게 브로드캐스트합니다.
+
+- 폴링 주기(WS_EVENT_BUS_SQLITE_POLL_MS)별 p50/p95/p99 지연
+- 워커마다 같은 이벤트를 한 번 더 발행해 중복 제거 확인
+
+실행: python -m benchmarks.websocket_bus
+"""
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from app.websocket.bus import BusEvent, SqliteBus
+from app.websocket.manager import ConnectionManager
+
+WORKERS = 4
+BROADCASTS_PER_WORKER = 200
+BROADCAST_INTERVAL_SECONDS = 0.002
+POLL_INTERVALS_MS = (2, 10, 50)
+DEVICES = 2
+
+
+class _Socket:
+    def __init__(self):
+        self.received: list[tuple[float, str]] = []
+
+    async def send_text(self, text: str) -> None:
+        self.received.append((time.time(), text))
+
+
+def _worker(path: str, index: int, poll_ms: int, barrier) -> dict:
+    async def run():
+        logging.disable(logging.INFO)  # connect 로그 생략
+        manager = ConnectionManager()
+        bus = SqliteBus(path, poll_interval=poll_ms / 1000)
+        await manager.start_bus(bus)
+        sockets = [_Socket() for _ in range(DEVICES)]
+        for ws in sockets:
+            await manager.connect(ws, f"user-{index}")
+        await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+
+        users = [f"user-{i}" for i in range(WORKERS)]
+        for seq in range(BROADCASTS_PER_WORKER):
+            await manager.broadcast_to_friends(users, json.dumps({"from": index, "seq": seq, "at": time.time()}))
+            await asyncio.sleep(BROADCAST_INTERVAL_SECONDS)
+        retry = BusEvent(
+            id=f"{manager.worker_id}:retry", origin=manager.worker_id, user_ids=tuple(users),
+            text=json.dumps({"from": index, "seq": "retry", "at": time.time()}),
+        )
+        await bus.publish(retry)
+        await bus.publish(retry)
+
+        expected = WORKERS * BROADCASTS_PER_WORKER + WORKERS - 1
+        deadline = time.monotonic() + 30
+        while any(len(ws.received) < expected for ws in sockets) and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.2)  # 늦은 중복 확인
+        await manager.stop_bus()
+
+        latencies, received, unique = [], 0, set()
+        for device, ws in enumerate(sockets):
+            for received_at, text in ws.received:
+                message = json.loads(text)
+                received += 1
+                unique.add((device, message["from"], message["seq"]))
+                if message["from"] != index:
+                    latencies.append(received_at - message["at"])
+        return {
+            "expected": expected * DEVICES,
+            "received": received,
+            "unique": len(unique),
+            "suppressed": manager.duplicate_events,
+            "latencies": latencies,
+        }
+
+    return asyncio.run(run())
+
+
+def _run(poll_ms: int) -> list[dict]:
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp, context.Manager() as sync:
+        path = os.path.join(tmp, "ws_events.db")
+        barrier = sync.Barrier(WORKERS)
+        with ProcessPoolExecutor(max_workers=WORKERS, mp_context=context) as pool:
+            return list(pool.map(
+                _worker, [path] * WORKERS, range(WORKERS), [poll_ms] * WORKERS, [barrier] * WORKERS,
+            ))
+
+
+def _percentile(values: list[float], q: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * q))] * 1000
+
+
+def main() -> None:
+    print(
+        f"{WORKERS} workers x {DEVICES} devices, {BROADCASTS_PER_WORKER} broadcasts per worker "
+        f"every {BROADCAST_INTERVAL_SECONDS * 1000:.0f} ms (sqlite bus)"
+    )
+    for poll_ms in POLL_INTERVALS_MS:
+        results = _run(poll_ms)
+        latencies = sorted(latency for r in results for latency in r["latencies"])
+        expected = sum(r["expected"] for r in results)
+        received = sum(r["received"] for r in results)
+        unique = sum(r["unique"] for r in results)
+        suppressed = sum(r["suppressed"] for r in results)
+        print(
+            f"poll {poll_ms:>3} ms  p50 {_percentile(latencies, 0.5):6.1f} ms  "
+            f"p95 {_percentile(latencies, 0.95):6.1f} ms  p99 {_percentile(latencies, 0.99):6.1f} ms  "
+            f"delivered {received}/{expected} (unique {unique}, duplicates suppressed {suppressed})"
+        )
+
+
+if __name__ == "__main__":
+    main()
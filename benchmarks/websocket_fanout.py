@@ -0,0 +1,134 @@
+"""
+WebSocket 브로드캐스트 fan-out 벤치마크
+
+친구 50명 x 기기 3대(연결 150개)에게 타이머 친구 활동 알림 하나를 보내는 비용을 측정합니다.
+연결은 실제 Starlette WebSocket 객체이고, ASGI send는 아무 일도 하지 않습니다 (네트워크 비용 제외).
+
+- per_recipient: 연결마다 message.to_json() 후 직접 전송 (송신 큐 이전 구현)
+- encode_once: ConnectionManager.broadcast_to_friends (한 번 인코딩 후 연결별 송신 큐, 현재 구현)
+  - 브로드캐스트마다 큐에 넣은 메시지가 모두 전송될 때까지(flush) 포함해 측정
+
+느린 클라이언트: 연결 하나의 send가 SLOW_SEND_SECONDS 걸릴 때,
+브로드캐스트를 호출한 핸들러가 돌아오기까지의 시간을 비교합니다.
+
+실행: python -m benchmarks.websocket_fanout
+"""
+import asyncio
+import logging
+import time
+import uuid
+
+from starlette.websockets import WebSocket, WebSocketState
+
+from app.websocket.base import WSServerMessage
+from app.websocket.manager import ConnectionManager
+
+FRIENDS = 50
+DEVICES_PER_FRIEND = 3
+BROADCASTS = 2000
+SLOW_BROADCASTS = 20
+SLOW_SEND_SECONDS = 0.01
+
+
+async def _receive():
+    return {"type": "websocket.disconnect"}
+
+
+async def _send(message):
+    pass
+
+
+async def _slow_send(message):
+    await asyncio.sleep(SLOW_SEND_SECONDS)
+
+
+def _websocket(send=_send) -> WebSocket:
+    ws = WebSocket({"type": "websocket", "path": "/v1/ws/timers", "headers": []}, _receive, send)
+    ws.client_state = WebSocketState.CONNECTED
+    ws.application_state = WebSocketState.CONNECTED
+    return ws
+
+
+def _message() -> WSServerMessage:
+    return WSServerMessage(
+        type="timer.friend_activity",
+        payload={
+            "friend_id": str(uuid.uuid4()),
+            "display_name": "Hipster Timer User",
+            "action": "start",
+            "timer_id": str(uuid.uuid4()),
+            "timer_title": "Deep work: write the quarterly report",
+        },
+        from_user=str(uuid.uuid4()),
+    )
+
+
+async def _per_recipient(manager: ConnectionManager, friend_ids: list[str], message: WSServerMessage) -> int:
+    """이전 구현: 친구마다 락을 잡고 연결마다 다시 인코딩"""
+    sent = 0
+    for friend_id in friend_ids:
+        async with manager._lock:
+            connections = manager._connections.get(friend_id, []).copy()
+        for ws in connections:
+            await ws.send_text(message.to_json())
+            sent += 1
+    return sent
+
+
+async def _queued(manager: ConnectionManager, friend_ids: list[str], message: WSServerMessage) -> int:
+    """현재 구현: 큐에 넣고 writer 태스크가 모두 보낼 때까지 대기"""
+    sent = await manager.broadcast_to_friends(friend_ids, message)
+    await manager.flush()
+    return sent
+
+
+async def _manager(friend_ids: list[str], slow: bool = False) -> ConnectionManager:
+    manager = ConnectionManager()
+    for friend_id in friend_ids:
+        for _ in range(DEVICES_PER_FRIEND):
+            await manager.connect(_websocket(), friend_id)
+    if slow:
+        await manager.connect(_websocket(_slow_send), friend_ids[0])
+    return manager
+
+
+async def _run() -> None:
+    friend_ids = [f"friend-{i}" for i in range(FRIENDS)]
+    manager = await _manager(friend_ids)
+    message = _message()
+
+    print(
+        f"{FRIENDS} friends x {DEVICES_PER_FRIEND} devices, "
+        f"{len(message.to_json())}-byte payload, {BROADCASTS} broadcasts"
+    )
+    for name, broadcast in (
+            ("per_recipient", lambda: _per_recipient(manager, friend_ids, message)),
+            ("encode_once", lambda: _queued(manager, friend_ids, message)),
+    ):
+        started = time.perf_counter()
+        for _ in range(BROADCASTS):
+            assert await broadcast() == FRIENDS * DEVICES_PER_FRIEND
+        per_broadcast_us = (time.perf_counter() - started) / BROADCASTS * 1_000_000
+        print(f"{name:<14} {per_broadcast_us:8.1f} us/broadcast")
+
+    manager = await _manager(friend_ids, slow=True)
+    print(f"1 slow client ({SLOW_SEND_SECONDS * 1000:.0f} ms/send), {SLOW_BROADCASTS} broadcasts")
+    for name, broadcast in (
+            ("per_recipient", lambda: _per_recipient(manager, friend_ids, message)),
+            ("encode_once", lambda: manager.broadcast_to_friends(friend_ids, message)),
+    ):
+        started = time.perf_counter()
+        for _ in range(SLOW_BROADCASTS):
+            await broadcast()
+        per_broadcast_ms = (time.perf_counter() - started) / SLOW_BROADCASTS * 1000
+        await manager.flush()
+        print(f"{name:<14} {per_broadcast_ms:8.2f} ms/broadcast (handler wait)")
+
+
+def main() -> None:
+    logging.disable(logging.INFO)  # connect 로그 생략
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,30 @@ def _get_async_url(url: str) -> str:
     return url
 
 
+@pytest.fixture(autouse=True)
+def forbid_read_only_flush(request):
+    """
+    읽기 전용 세션(get_db, read_only_session)에서 변경 사항을 flush하면 테스트 실패
+
+    PostgreSQL은 READ ONLY 트랜잭션에서 UPDATE/INSERT를 거부(500)하지만 SQLite는 통과하므로,
+    SQLite 테스트에서도 GET 경로가 ORM 객체를 변경하는 것을 잡아낸다.
+    """
+    if request.node.get_closest_marker("allow_read_only_flush"):
+        yield
+        return
+
+    def guard(session, flush_context, instances):
+        if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+            changed = [type(obj).__name__ for obj in [*session.new, *session.dirty, *session.deleted]]
+            raise AssertionError(f"Flush from read-only session: {changed}")
+
+    event.listen(Session, "before_flush", guard)
+    try:
+        yield
+    finally:
+        event.remove(Session, "before_flush", guard)
+
+
 @pytest.fixture
 def test_user() -> CurrentUser:
     """테스트용 사용자 (OIDC 비활성화 시 반환되는 mock 사용자와 동일)"""
@@ -420,6 +444,10 @@ def e2e_client():
     reset_storage()
     reset_ws_limiter()  # WebSocket 리미터도 초기화
 
+    # 프로필 동기화 캐시 초기화 (이전 테스트 DB에 동기화한 기록 제거)
+    from app.core.auth import profile_sync_cache
+    profile_sync_cache.clear()
+
     test_engine = _create_test_engine()
 
     # SessionManager의 엔진을 테스트용으로 임시 교체 (init_db 전에 교체)
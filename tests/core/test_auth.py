@@ -669,3 +669,323 @@ class TestAuthenticationRequiredError:
 
         assert error.detail == "Custom auth error"
         assert error.status_code == 401
+
+
+# ============================================================================
+# 검증된 토큰 캐시 테스트
+# ============================================================================
+
+class TestVerifiedTokenCache:
+    """VerifiedTokenCache 단위 테스트"""
+
+    def test_get_after_set(self):
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=10, ttl_seconds=60)
+        cache.set("token-a", {"sub": "a", "exp": time.time() + 3600})
+
+        assert cache.get("token-a")["sub"] == "a"
+        assert cache.get("token-b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_returns_copy(self):
+        """반환된 클레임을 수정해도 캐시에 영향 없음"""
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=10, ttl_seconds=60)
+        cache.set("token-a", {"sub": "a"})
+        cache.get("token-a")["sub"] = "tampered"
+
+        assert cache.get("token-a")["sub"] == "a"
+
+    def test_expires_at_token_exp(self):
+        """exp가 TTL보다 이르면 exp에서 만료"""
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=10, ttl_seconds=3600)
+        cache.set("token-a", {"sub": "a", "exp": time.time() - 1})
+
+        assert cache.get("token-a") is None
+        assert cache.stats()["size"] == 0
+
+    def test_expires_at_ttl(self):
+        """exp가 TTL보다 늦으면 TTL에서 만료"""
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=10, ttl_seconds=60)
+        cache.set("token-a", {"sub": "a", "exp": time.time() + 3600})
+
+        with patch("app.core.auth.token_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("token-a") is None
+
+    def test_bounded_size(self):
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=2, ttl_seconds=60)
+        for i in range(5):
+            cache.set(f"token-{i}", {"sub": str(i)})
+
+        assert cache.stats()["size"] == 2
+        assert cache.get("token-0") is None
+        assert cache.get("token-4") is not None
+
+    @pytest.mark.parametrize("maxsize,ttl", [(0, 60), (10, 0)])
+    def test_disabled(self, maxsize, ttl):
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=maxsize, ttl_seconds=ttl)
+        cache.set("token-a", {"sub": "a"})
+
+        assert cache.get("token-a") is None
+
+    def test_invalidate(self):
+        from app.core.auth import VerifiedTokenCache
+
+        cache = VerifiedTokenCache(maxsize=10, ttl_seconds=60)
+        cache.set("token-a", {"sub": "a"})
+        cache.invalidate()
+
+        assert cache.get("token-a") is None
+        assert cache.stats()["invalidations"] == 1
+
+
+class TestVerifyTokenCache:
+    """OIDCClient.verify_token의 검증 결과 캐싱"""
+
+    @staticmethod
+    def _client(mock_settings):
+        from app.core.auth import OIDCClient
+
+        mock_settings.OIDC_ISSUER_URL = "https://issuer.example.com"
+        mock_settings.OIDC_DISCOVERY_URL = None
+        mock_settings.OIDC_JWKS_CACHE_TTL_SECONDS = 3600
+        mock_settings.OIDC_AUDIENCE = "test-client-id"
+        return OIDCClient()
+
+    @pytest.mark.asyncio
+    async def test_second_verify_skips_signature_check(self):
+        token = create_test_token(iss="https://issuer.example.com", aud="test-client-id")
+
+        with patch("app.core.auth.client.settings") as mock_settings:
+            client = self._client(mock_settings)
+            jwks = KeySet.import_key_set(TEST_JWKS)
+            with patch.object(client, "get_jwks", new_callable=AsyncMock, return_value=jwks), \
+                    patch("app.core.auth.client.jwt.decode", wraps=jwt.decode) as mock_decode:
+                first = await client.verify_token(token)
+                second = await client.verify_token(token)
+
+        assert first == second
+        assert mock_decode.call_count == 1
+        assert client.token_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_not_cached(self):
+        token = create_test_token(iss="https://wrong-issuer.example.com", aud="test-client-id")
+
+        with patch("app.core.auth.client.settings") as mock_settings:
+            client = self._client(mock_settings)
+            jwks = KeySet.import_key_set(TEST_JWKS)
+            with patch.object(client, "get_jwks", new_callable=AsyncMock, return_value=jwks):
+                for _ in range(2):
+                    with pytest.raises(HTTPException):
+                        await client.verify_token(token)
+
+        assert client.token_cache.stats()["size"] == 0
+
+
+# ============================================================================
+# JWKS/discovery 갱신 테스트 (로컬 stub IdP)
+# ============================================================================
+
+STUB_ISSUER = "https://issuer.example.com"
+
+
+class StubIdP:
+    """
+    테스트용 로컬 OIDC Provider (discovery + JWKS)
+
+    httpx.ASGITransport로 OIDCClient에 주입한다.
+    - hits: 엔드포인트별 요청 수
+    - gate: 설정하면 JWKS 응답을 gate가 열릴 때까지 지연
+    - fail: True면 JWKS 요청에 500 응답
+    """
+
+    def __init__(self, jwks: dict):
+        from starlette.applications import Starlette
+        from starlette.responses import JSONResponse
+        from starlette.routing import Route
+
+        self.jwks = jwks
+        self.hits = {"metadata": 0, "jwks": 0}
+        self.gate = None
+        self.fail = False
+
+        async def metadata(request):
+            self.hits["metadata"] += 1
+            return JSONResponse({"issuer": STUB_ISSUER, "jwks_uri": f"{STUB_ISSUER}/jwks"})
+
+        async def jwks_endpoint(request):
+            self.hits["jwks"] += 1
+            if self.gate is not None:
+                await self.gate.wait()
+            if self.fail:
+                return JSONResponse({"error": "unavailable"}, status_code=500)
+            return JSONResponse(self.jwks)
+
+        app = Starlette(routes=[
+            Route("/.well-known/openid-configuration", metadata),
+            Route("/jwks", jwks_endpoint),
+        ])
+        self.transport = httpx.ASGITransport(app=app)
+
+
+@pytest.fixture
+def stub_idp():
+    """stub IdP와 그 IdP를 바라보는 OIDCClient (idp.client)"""
+    from app.core.auth import OIDCClient
+
+    idp = StubIdP(TEST_JWKS)
+    with patch("app.core.auth.client.settings") as mock_settings:
+        mock_settings.OIDC_ISSUER_URL = STUB_ISSUER
+        mock_settings.OIDC_DISCOVERY_URL = None
+        mock_settings.OIDC_JWKS_CACHE_TTL_SECONDS = 3600
+        mock_settings.OIDC_AUDIENCE = "test-client-id"
+        idp.client = OIDCClient(transport=idp.transport)
+        yield idp
+
+
+def _age_jwks(client, seconds: float) -> None:
+    """캐시된 JWKS를 seconds만큼 오래된 것으로 만듦"""
+    client._jwks.fetched_at -= seconds
+
+
+def _signed_token(private_key, kid: str) -> str:
+    now = int(time.time())
+    claims = {"sub": "rotated-user", "iss": STUB_ISSUER, "aud": "test-client-id", "iat": now, "exp": now + 3600}
+    return jwt.encode({"alg": "RS256", "kid": kid}, claims, private_key, algorithms=["RS256"])
+
+
+class TestOIDCRefresh:
+    """pooled HTTP 클라이언트, single-flight, stale-while-revalidate, unknown kid"""
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_reused(self, stub_idp):
+        client = stub_idp.client
+
+        await client.get_jwks()
+        http_client = client._http_client
+        _age_jwks(client, 3600)
+        await client.get_jwks()
+
+        assert client._http_client is http_client
+        assert stub_idp.hits["jwks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_single_flight(self, stub_idp):
+        """캐시가 비어 있을 때 동시 요청은 한 번의 조회를 함께 기다림"""
+        import asyncio
+
+        stub_idp.gate = asyncio.Event()
+        waiters = [asyncio.create_task(stub_idp.client.get_jwks()) for _ in range(20)]
+        await asyncio.sleep(0.05)
+        stub_idp.gate.set()
+        results = await asyncio.gather(*waiters)
+
+        assert stub_idp.hits == {"metadata": 1, "jwks": 1}
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_serves_cached_value(self, stub_idp):
+        """TTL 만료 전 갱신 구간: IdP를 기다리지 않고 캐시 값 반환, 백그라운드 갱신"""
+        import asyncio
+
+        client = stub_idp.client
+        first = await client.get_jwks()
+        _age_jwks(client, 3600 * 0.9)
+
+        stub_idp.gate = asyncio.Event()  # IdP 응답 지연
+        assert await asyncio.wait_for(client.get_jwks(), timeout=0.5) is first
+        assert await asyncio.wait_for(client.get_jwks(), timeout=0.5) is first
+
+        stub_idp.gate.set()
+        refreshed = await client._jwks.refresh_task
+
+        assert refreshed is not first
+        assert await client.get_jwks() is refreshed
+        assert stub_idp.hits["jwks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_refresh_failure_keeps_last_value(self, stub_idp):
+        client = stub_idp.client
+        first = await client.get_jwks()
+        _age_jwks(client, 3600)
+        stub_idp.fail = True
+
+        assert await client.get_jwks() is first
+
+    @pytest.mark.asyncio
+    async def test_first_fetch_failure_raises_503(self, stub_idp):
+        stub_idp.fail = True
+
+        with pytest.raises(HTTPException) as exc_info:
+            await stub_idp.client.verify_token(create_test_token(iss=STUB_ISSUER))
+
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetches_jwks_once(self, stub_idp):
+        """모르는 kid는 JWKS를 즉시 재조회, 재조회 간격 안의 다른 모르는 kid는 재조회하지 않음"""
+        client = stub_idp.client
+        await client.get_jwks()
+
+        rotated_key = RSAKey.generate_key(2048, parameters={"kid": "rotated-key-id", "use": "sig"})
+        stub_idp.jwks = {"keys": TEST_JWKS["keys"] + [rotated_key.as_dict(private=False)]}
+
+        claims = await client.verify_token(_signed_token(rotated_key, "rotated-key-id"))
+        assert claims["sub"] == "rotated-user"
+        assert stub_idp.hits["jwks"] == 2
+
+        with pytest.raises(HTTPException) as exc_info:
+            await client.verify_token(_signed_token(rotated_key, "unknown-key-id"))
+        assert exc_info.value.status_code == 401
+        assert stub_idp.hits["jwks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_kid_refetch_failure_returns_401(self, stub_idp):
+        """모르는 kid 재조회 중 IdP 장애: 503이 아니라 캐시된 JWKS로 검증 실패 401"""
+        client = stub_idp.client
+        await client.get_jwks()
+        stub_idp.fail = True
+
+        rotated_key = RSAKey.generate_key(2048, parameters={"kid": "rotated-key-id", "use": "sig"})
+        with pytest.raises(HTTPException) as exc_info:
+            await client.verify_token(_signed_token(rotated_key, "rotated-key-id"))
+
+        assert exc_info.value.status_code == 401
+        assert stub_idp.hits["jwks"] == 2
+
+    @pytest.mark.asyncio
+    async def test_jwks_rotation_invalidates_token_cache(self, stub_idp):
+        """JWKS가 바뀌면 캐시된 토큰은 새 키로 다시 검증"""
+        client = stub_idp.client
+        token = create_test_token(iss=STUB_ISSUER, aud="test-client-id")
+
+        await client.verify_token(token)
+        assert client.token_cache.stats()["size"] == 1
+
+        # 같은 JWKS 재조회는 무효화하지 않음
+        _age_jwks(client, 3600)
+        await client.get_jwks()
+        assert client.token_cache.stats()["size"] == 1
+
+        # 같은 kid의 키 교체: 캐시 무효화 후 이전 키로 서명된 토큰은 거부
+        _, _, stub_idp.jwks = generate_rsa_keypair()
+        _age_jwks(client, 3600)
+        await client.get_jwks()
+        assert client.token_cache.stats()["invalidations"] == 1
+
+        with pytest.raises(HTTPException) as exc_info:
+            await client.verify_token(token)
+        assert exc_info.value.status_code == 401
@@ -0,0 +1,140 @@
+"""
+순수 ASGI 미들웨어 테스트
+
+AuthMiddleware, RateLimitMiddleware, RequestLoggerMiddleware가 작은 Starlette 앱 앞에서
+request.state, X-RateLimit-* 헤더, 429 응답, 로그를 기존과 같이 처리하는지,
+스트리밍 응답과 WebSocket/lifespan scope를 건드리지 않는지 검증한다.
+"""
+import logging
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core.auth import AuthMiddleware, CurrentUser
+from app.middleware.request_logger import RequestLoggerMiddleware
+from app.ratelimit.config import RateLimitRule
+from app.ratelimit.middleware import RateLimitMiddleware
+from app.ratelimit.storage.base import RateLimitResult
+
+
+async def _whoami(request):
+    user = request.state.current_user
+    return JSONResponse({"sub": user.sub if user else None})
+
+
+async def _stream(request):
+    async def chunks():
+        for i in range(3):
+            yield f"chunk-{i}\n".encode()
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+def _app(*middleware) -> Starlette:
+    app = Starlette(routes=[
+        Route("/v1/whoami", _whoami),
+        Route("/v1/stream", _stream),
+    ])
+    for cls in middleware:
+        app.add_middleware(cls)
+    return app
+
+
+async def _get(app, path: str, **kwargs) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, **kwargs)
+
+
+def _result(allowed: bool) -> RateLimitResult:
+    return RateLimitResult(
+        allowed=allowed,
+        current_count=1 if allowed else 11,
+        max_requests=10,
+        reset_after=42,
+    )
+
+
+class TestAuthMiddleware:
+    @pytest.mark.asyncio
+    async def test_sets_current_user(self):
+        claims = {"sub": "asgi-user", "iss": "https://issuer.example.com"}
+        with patch("app.core.auth.middleware.settings") as mock_settings, \
+                patch("app.core.auth.middleware.oidc_client") as mock_client:
+            mock_settings.OIDC_ENABLED = True
+            mock_client.verify_token = AsyncMock(return_value=claims)
+            response = await _get(_app(AuthMiddleware), "/v1/whoami", headers={"Authorization": "Bearer t"})
+
+        assert response.json() == {"sub": "asgi-user"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_leaves_user_unset(self):
+        with patch("app.core.auth.middleware.settings") as mock_settings, \
+                patch("app.core.auth.middleware.oidc_client") as mock_client:
+            mock_settings.OIDC_ENABLED = True
+            mock_client.verify_token = AsyncMock(side_effect=Exception("bad token"))
+            response = await _get(_app(AuthMiddleware), "/v1/whoami", headers={"Authorization": "Bearer t"})
+
+        assert response.json() == {"sub": None}
+
+    @pytest.mark.asyncio
+    async def test_non_http_scope_passes_through(self):
+        inner = AsyncMock()
+        scope = {"type": "websocket", "path": "/ws"}
+
+        await AuthMiddleware(inner)(scope, None, None)
+
+        inner.assert_awaited_once_with(scope, None, None)
+        assert "state" not in scope
+
+
+class TestRateLimitMiddleware:
+    @pytest.fixture
+    def limiter(self):
+        rule = RateLimitRule(path_pattern="/v1/*", methods=["GET"], window_seconds=60, max_requests=10)
+        limiter = AsyncMock()
+        with patch("app.ratelimit.middleware.app_config.settings") as mock_settings, \
+                patch("app.ratelimit.middleware.get_rule_for_request", return_value=rule), \
+                patch("app.ratelimit.middleware.get_limiter", return_value=limiter):
+            mock_settings.RATE_LIMIT_ENABLED = True
+            mock_settings.ORIGIN_VERIFY_HEADER = None
+            yield limiter
+
+    @pytest.mark.asyncio
+    async def test_streaming_response_gets_headers(self, limiter):
+        limiter.check_and_record.return_value = _result(allowed=True)
+
+        response = await _get(_app(RateLimitMiddleware, AuthMiddleware), "/v1/stream")
+
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+        assert response.headers["X-RateLimit-Limit"] == "10"
+        assert response.headers["X-RateLimit-Remaining"] == "9"
+        assert response.headers["X-RateLimit-Reset"] == "42"
+        # AuthMiddleware가 먼저 실행되어 사용자 sub로 식별
+        assert limiter.check_and_record.await_args.args[0] == CurrentUser.mock().sub
+
+    @pytest.mark.asyncio
+    async def test_exceeded_returns_429(self, limiter):
+        limiter.check_and_record.return_value = _result(allowed=False)
+
+        response = await _get(_app(RateLimitMiddleware, AuthMiddleware), "/v1/whoami")
+
+        assert response.status_code == 429
+        assert response.json()["retry_after"] == 42
+        assert response.headers["Retry-After"] == "42"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+
+
+class TestRequestLoggerMiddleware:
+    @pytest.mark.asyncio
+    async def test_logs_request_and_response(self, caplog):
+        with caplog.at_level(logging.INFO, logger="app.middleware.request_logger"):
+            await _get(_app(RequestLoggerMiddleware), "/v1/stream")
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages == ["Request: GET /v1/stream", "Response: GET /v1/stream - 200"]
+        assert caplog.records[1].process_time >= 0
@@ -0,0 +1,108 @@
+"""
+프로필 동기화 fingerprint 캐시 테스트
+
+fingerprint가 같으면 get_current_user_synced가 DB에 접근하지 않는지,
+클레임이 바뀌거나 항목이 만료되면 다시 동기화하는지, 실패한 동기화는 기록하지 않는지 검증한다.
+"""
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.core.auth import CurrentUser, ProfileSyncCache, get_current_user_synced
+from app.core.auth.profile_sync_cache import profile_fingerprint
+from app.db.session import _session_manager
+from app.domain.user.model import UserProfile
+
+
+def _user(sub: str = "sync-user", **kwargs) -> CurrentUser:
+    kwargs.setdefault("name", "Sync User")
+    return CurrentUser(sub=sub, raw_claims={"iss": "https://issuer.example.com"}, **kwargs)
+
+
+@pytest.fixture
+def sync_env(monkeypatch):
+    """메모리 DB 엔진과 비어 있는 캐시로 교체 (engine, cache)"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    cache = ProfileSyncCache(maxsize=100, ttl_seconds=3600)
+    monkeypatch.setattr(_session_manager, "engine", engine)
+    monkeypatch.setattr("app.core.auth.dependencies.profile_sync_cache", cache)
+    yield engine, cache
+    engine.dispose()
+
+
+class TestProfileFingerprint:
+    def test_same_claims_same_fingerprint(self):
+        assert profile_fingerprint(_user()) == profile_fingerprint(_user())
+
+    @pytest.mark.parametrize("changes", [
+        {"name": "Renamed"},
+        {"picture": "https://example.com/a.png"},
+        {"email": "sync@example.com"},
+        {"email": "sync@example.com", "email_verified": True},
+    ])
+    def test_profile_claim_change(self, changes):
+        assert profile_fingerprint(_user(**changes)) != profile_fingerprint(_user())
+
+    def test_unrelated_claim_ignored(self):
+        user = _user()
+        user.raw_claims["scope"] = "openid profile"
+        assert profile_fingerprint(user) == profile_fingerprint(_user())
+
+
+class TestProfileSyncCache:
+    def test_expired_entry_not_synced(self):
+        cache = ProfileSyncCache(maxsize=10, ttl_seconds=60)
+        cache.mark_synced("u1", "fp")
+
+        with patch("app.core.auth.profile_sync_cache.time.monotonic", return_value=1e12):
+            assert cache.is_synced("u1", "fp") is False
+
+    def test_disabled_cache_always_syncs(self):
+        cache = ProfileSyncCache(maxsize=0, ttl_seconds=60)
+        cache.mark_synced("u1", "fp")
+
+        assert cache.is_synced("u1", "fp") is False
+        assert cache.stats()["synced"] == 1
+
+
+class TestGetCurrentUserSynced:
+    def test_unchanged_claims_skip_db(self, sync_env):
+        engine, cache = sync_env
+        get_current_user_synced(_user())
+
+        with patch.object(_session_manager, "get_session", side_effect=AssertionError("DB touched")):
+            for _ in range(3):
+                get_current_user_synced(_user())
+
+        assert cache.stats()["skipped"] == 3
+        assert cache.stats()["synced"] == 1
+
+    def test_changed_claims_resync(self, sync_env):
+        engine, cache = sync_env
+        get_current_user_synced(_user())
+        get_current_user_synced(_user(name="Renamed"))
+
+        with Session(engine) as session:
+            assert session.get(UserProfile, "sync-user").display_name == "Renamed"
+        assert cache.stats()["synced"] == 2
+
+    def test_failed_sync_not_recorded(self, sync_env):
+        """동기화가 실패하면 요청은 진행하고 다음 요청에서 재시도"""
+        engine, cache = sync_env
+        with patch(
+                "app.domain.user.service.UserProfileService.sync_from_current_user",
+                side_effect=RuntimeError("db down"),
+        ):
+            assert get_current_user_synced(_user()).sub == "sync-user"
+
+        assert cache.stats()["synced"] == 0
+        get_current_user_synced(_user())
+        with Session(engine) as session:
+            assert session.get(UserProfile, "sync-user") is not None
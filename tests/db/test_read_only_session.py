@@ -0,0 +1,132 @@
+"""
+읽기 전용 세션(get_db) 테스트
+
+replica 라우팅(GET만 replica, 쓰기 요청/read-your-writes 헤더는 primary),
+replica 미설정 시 primary fallback, commit 없이 종료되는지 검증한다.
+"""
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+from starlette.requests import Request
+
+from app.db.session import (
+    READ_YOUR_WRITES_HEADER,
+    _session_manager,
+    get_db,
+    read_only_session,
+)
+from app.models.tag import TagGroup
+
+
+def _memory_engine():
+    return create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+
+def _request(method: str = "GET", headers: dict[str, str] | None = None) -> Request:
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": method, "path": "/", "headers": raw_headers})
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    """primary/replica 엔진을 테스트용 메모리 DB로 교체 (primary, replica)"""
+    primary, replica = _memory_engine(), _memory_engine()
+    monkeypatch.setattr(_session_manager, "engine", primary)
+    monkeypatch.setattr(_session_manager, "replica_engine", replica)
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def _session_engine(request: Request):
+    gen = get_db(request)
+    session = next(gen)
+    engine = session.get_bind()
+    gen.close()
+    return engine
+
+
+class TestReplicaRouting:
+    """요청별 primary/replica 선택"""
+
+    def test_get_uses_replica(self, engines):
+        _, replica = engines
+        assert _session_engine(_request("GET")) is replica
+
+    @pytest.mark.parametrize("method", ["POST", "PUT", "PATCH", "DELETE"])
+    def test_write_request_uses_primary(self, engines, method):
+        """쓰기 요청의 검증 조회(valid_*_id)는 방금 쓴 데이터를 볼 수 있도록 primary"""
+        primary, _ = engines
+        assert _session_engine(_request(method)) is primary
+
+    @pytest.mark.parametrize("value", ["1", "true", "YES"])
+    def test_read_your_writes_header_uses_primary(self, engines, value):
+        primary, _ = engines
+        request = _request("GET", {READ_YOUR_WRITES_HEADER: value})
+        assert _session_engine(request) is primary
+
+    def test_header_false_keeps_replica(self, engines):
+        _, replica = engines
+        request = _request("GET", {READ_YOUR_WRITES_HEADER: "0"})
+        assert _session_engine(request) is replica
+
+    def test_no_replica_falls_back_to_primary(self, engines, monkeypatch):
+        primary, _ = engines
+        monkeypatch.setattr(_session_manager, "replica_engine", None)
+        assert _session_engine(_request("GET")) is primary
+
+
+@pytest.mark.allow_read_only_flush
+def test_read_only_session_never_commits(engines):
+    """세션에 남은 변경 사항은 commit되지 않고 rollback"""
+    primary, _ = engines
+    SQLModel.metadata.create_all(primary)
+
+    gen = read_only_session(use_replica=False)
+    session = next(gen)
+    session.add(TagGroup(name="leak", color="#000000", owner_id="test-user-id"))
+    session.flush()
+    gen.close()
+
+    with Session(primary) as check:
+        assert check.exec(select(TagGroup)).all() == []
+
+
+def test_running_timer_read_does_not_flush(engines, test_user):
+    """RUNNING 타이머 조회/DTO 변환이 읽기 전용 세션에서 UPDATE를 만들지 않음 (forbid_read_only_flush 가드)"""
+    from datetime import UTC, datetime, timedelta
+
+    from app.core.constants import TimerStatus
+    from app.domain.timer.service import TimerService
+    from app.models.timer import TimerSession
+
+    primary, _ = engines
+    SQLModel.metadata.create_all(primary)
+    started_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(seconds=30)
+    with Session(primary) as setup:
+        timer = TimerSession(
+            owner_id=test_user.sub,
+            allocated_duration=3600,
+            elapsed_time=60,
+            status=TimerStatus.RUNNING.value,
+            started_at=started_at,
+        )
+        setup.add(timer)
+        setup.commit()
+        timer_id = timer.id
+
+    gen = read_only_session(use_replica=False)
+    session = next(gen)
+    service = TimerService(session, test_user)
+    dtos = [service.to_read_dto(service.get_timer(timer_id))]
+    dtos += [service.to_read_dto(t) for t in service.get_all_timers()]
+    active = service.get_user_active_timer()
+    assert active.elapsed_time == 60
+    assert not session.dirty
+    gen.close()
+
+    assert all(dto.elapsed_time >= 90 for dto in dtos)
@@ -0,0 +1,111 @@
+"""
+SQLite 성능 프로필 테스트
+
+설정값이 PRAGMA 목록으로 변환되는지, 연결마다 실제로 적용되는지,
+파일/메모리 DB에 따라 연결 풀 크기 설정이 달라지는지 검증한다.
+"""
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import create_engine
+
+from app.core.config import settings
+from app.db.session import (
+    _is_sqlite_memory,
+    _sqlite_pool_kwargs,
+    _sqlite_pragmas,
+    set_sqlite_pragmas,
+)
+
+
+def _read_pragma(conn, name: str):
+    return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+class TestSqlitePragmas:
+    """설정 -> PRAGMA 목록 변환"""
+
+    def test_default_profile(self):
+        pragmas = _sqlite_pragmas()
+
+        assert "foreign_keys=ON" in pragmas
+        assert f"journal_mode={settings.SQLITE_JOURNAL_MODE}" in pragmas
+        assert f"synchronous={settings.SQLITE_SYNCHRONOUS}" in pragmas
+        assert f"busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}" in pragmas
+        assert f"cache_size=-{settings.SQLITE_CACHE_SIZE_KIB}" in pragmas
+
+    def test_non_positive_cache_size_uses_sqlite_default(self, monkeypatch):
+        monkeypatch.setattr(settings, "SQLITE_CACHE_SIZE_KIB", 0)
+
+        assert not any(p.startswith("cache_size") for p in _sqlite_pragmas())
+
+
+class TestApplyPragmas:
+    """연결 이벤트에서 PRAGMA 적용"""
+
+    def test_file_db_connection(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+        event.listen(engine, "connect", set_sqlite_pragmas)
+        try:
+            with engine.connect() as conn:
+                assert _read_pragma(conn, "journal_mode") == "wal"
+                assert _read_pragma(conn, "synchronous") == 1  # NORMAL
+                assert _read_pragma(conn, "foreign_keys") == 1
+                assert _read_pragma(conn, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+                assert _read_pragma(conn, "temp_store") == 2  # MEMORY
+                assert _read_pragma(conn, "cache_size") == -settings.SQLITE_CACHE_SIZE_KIB
+        finally:
+            engine.dispose()
+
+    def test_custom_profile(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "SQLITE_JOURNAL_MODE", "DELETE")
+        monkeypatch.setattr(settings, "SQLITE_SYNCHRONOUS", "FULL")
+        monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 1234)
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'custom.db'}")
+        event.listen(engine, "connect", set_sqlite_pragmas)
+        try:
+            with engine.connect() as conn:
+                assert _read_pragma(conn, "journal_mode") == "delete"
+                assert _read_pragma(conn, "synchronous") == 2  # FULL
+                assert _read_pragma(conn, "busy_timeout") == 1234
+        finally:
+            engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_async_engine_connection(self, tmp_path):
+        """aiosqlite 엔진도 sync_engine 이벤트로 같은 프로필 적용"""
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql("PRAGMA journal_mode")
+                assert result.scalar() == "wal"
+                result = await conn.exec_driver_sql("PRAGMA busy_timeout")
+                assert result.scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+        finally:
+            await engine.dispose()
+
+
+class TestPoolKwargs:
+    """파일/메모리 DB별 연결 풀 설정"""
+
+    @pytest.mark.parametrize("url", [
+        "sqlite://",
+        "sqlite:///:memory:",
+        "sqlite:///file:test?mode=memory&cache=shared&uri=true",
+    ])
+    def test_memory_db_uses_default_pool(self, monkeypatch, url):
+        monkeypatch.setattr(settings, "DATABASE_URL", url)
+
+        assert _is_sqlite_memory() is True
+        assert _sqlite_pool_kwargs() == {}
+
+    def test_file_db_sized_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "DATABASE_URL", "sqlite:///./schedule.db")
+
+        assert _is_sqlite_memory() is False
+        assert _sqlite_pool_kwargs() == {
+            "pool_size": settings.POOL_SIZE,
+            "max_overflow": settings.MAX_OVERFLOW,
+        }
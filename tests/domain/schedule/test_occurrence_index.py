@@ -0,0 +1,275 @@
+"""
+반복 일정 인스턴스 인덱스(schedule_occurrence) 테스트
+
+인덱스를 켠 상태의 날짜 범위 조회 결과가 RRULE 확장 결과와 같은지,
+일정/예외 쓰기 시 인덱스가 갱신되는지 확인합니다.
+"""
+import asyncio
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlmodel import select
+
+from app.core.config import settings
+from app.crud import schedule as crud
+from app.domain.schedule.occurrence_service import ScheduleOccurrenceService
+from app.domain.schedule.schema.dto import ScheduleCreate, ScheduleUpdate
+from app.domain.schedule.service import ScheduleService
+from app.domain.schedule.tasks import ScheduleOccurrenceHorizonTask
+from app.models.schedule import ScheduleOccurrence, ScheduleOccurrenceCoverage
+
+NOW = datetime(2024, 1, 15)
+
+
+@pytest.fixture
+def occurrence_index(monkeypatch):
+    """인스턴스 인덱스 활성화 (2024-01-15 기준, 과거 60일 / 미래 120일)"""
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", True)
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_LOOKBACK_DAYS", 60)
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_HORIZON_DAYS", 120)
+    monkeypatch.setattr("app.domain.schedule.occurrence_service.utc_now_naive", lambda: NOW)
+
+
+def _create_daily(service, title="일일 회의", **kwargs):
+    return service.create_schedule(ScheduleCreate(
+        title=title,
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        end_time=datetime(2024, 1, 1, 11, 0, 0, tzinfo=UTC),
+        recurrence_rule="FREQ=DAILY",
+        **kwargs,
+    ))
+
+
+def _occurrences(session, parent_id):
+    statement = (
+        select(ScheduleOccurrence)
+        .where(ScheduleOccurrence.parent_id == parent_id)
+        .order_by(ScheduleOccurrence.instance_start)
+    )
+    return list(session.exec(statement).all())
+
+
+def _summary(schedules):
+    return [(s.parent_id, s.title, s.start_time, s.end_time) for s in schedules]
+
+
+def test_create_recurring_schedule_materializes_occurrences(test_session, test_user, occurrence_index):
+    """반복 일정 생성 시 [시작, 현재 + horizon] 인스턴스 저장"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+
+    rows = _occurrences(test_session, schedule.id)
+    assert rows[0].instance_start == datetime(2024, 1, 1, 10, 0, 0)
+    assert rows[-1].instance_start <= NOW + timedelta(days=120)
+    assert len(rows) == (NOW + timedelta(days=120) - datetime(2024, 1, 1)).days
+    assert all(row.owner_id == test_user.sub for row in rows)
+
+    coverage = test_session.get(ScheduleOccurrenceCoverage, schedule.id)
+    assert coverage.covered_from == schedule.start_time
+    assert coverage.covered_until == NOW + timedelta(days=120)
+
+
+def test_date_range_query_uses_index_and_matches_expansion(
+        test_session, test_user, occurrence_index, monkeypatch
+):
+    """인덱스 조회 결과가 RRULE 확장 결과와 동일"""
+    service = ScheduleService(test_session, test_user)
+    daily = _create_daily(service)
+    weekly = service.create_schedule(ScheduleCreate(
+        title="주간 회의",
+        start_time=datetime(2024, 1, 1, 9, 0, 0, tzinfo=UTC),
+        end_time=datetime(2024, 1, 1, 9, 30, 0, tzinfo=UTC),
+        recurrence_rule="FREQ=WEEKLY;BYDAY=MO,TH",
+        recurrence_end=datetime(2024, 2, 29, tzinfo=UTC),
+    ))
+    service.update_recurring_instance(
+        daily.id, datetime(2024, 1, 10, 10, 0, 0, tzinfo=UTC), ScheduleUpdate(title="특별 회의"),
+    )
+    service.delete_recurring_instance(weekly.id, datetime(2024, 1, 11, 9, 0, 0, tzinfo=UTC))
+
+    start_date = datetime(2024, 1, 8, tzinfo=UTC)
+    end_date = datetime(2024, 1, 21, 23, 59, 59, tzinfo=UTC)
+
+    # 범위를 덮는 원본은 RRULE 확장 대상이 아님
+    assert crud.get_uncovered_recurring_schedules(
+        test_session, start_date.replace(tzinfo=None), end_date.replace(tzinfo=None), test_user.sub,
+    ) == []
+    indexed = service.get_schedules_by_date_range(start_date, end_date)
+
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", False)
+    expanded = service.get_schedules_by_date_range(start_date, end_date)
+
+    assert _summary(indexed) == _summary(expanded)
+    assert len([s for s in indexed if s.parent_id == daily.id]) == 14
+    assert len([s for s in indexed if s.parent_id == weekly.id]) == 3
+    assert any(s.title == "특별 회의" for s in indexed)
+
+
+def test_date_range_query_with_tag_filter_uses_index(
+        test_session, test_user, sample_tag_group, occurrence_index
+):
+    """인덱스 조회에도 태그 필터가 원본 기준으로 적용"""
+    from app.domain.tag.schema.dto import TagCreate
+    from app.domain.tag.service import TagService
+
+    tag = TagService(test_session, test_user).create_tag(
+        TagCreate(name="업무", color="#FF0000", group_id=sample_tag_group.id)
+    )
+    service = ScheduleService(test_session, test_user)
+    tagged = _create_daily(service, tag_ids=[tag.id])
+    _create_daily(service, title="태그 없음")
+
+    start_date = datetime(2024, 1, 8, tzinfo=UTC)
+    end_date = datetime(2024, 1, 14, 23, 59, 59, tzinfo=UTC)
+
+    by_tag = service.get_schedules_by_date_range(start_date, end_date, tag_ids=[tag.id])
+    by_group = service.get_schedules_by_date_range(start_date, end_date, group_ids=[sample_tag_group.id])
+
+    assert [s.parent_id for s in by_tag] == [tagged.id] * 7
+    assert _summary(by_group) == _summary(by_tag)
+
+
+def test_delete_recurring_instance_marks_occurrence_deleted(test_session, test_user, occurrence_index):
+    """인스턴스 삭제/복원이 인덱스의 is_deleted에 반영"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+    instance_start = datetime(2024, 1, 5, 10, 0, 0, tzinfo=UTC)
+
+    service.delete_recurring_instance(schedule.id, instance_start)
+    deleted = [row for row in _occurrences(test_session, schedule.id) if row.is_deleted]
+    assert [row.instance_start for row in deleted] == [datetime(2024, 1, 5, 10, 0, 0)]
+
+    schedules = service.get_schedules_by_date_range(
+        datetime(2024, 1, 5, tzinfo=UTC), datetime(2024, 1, 5, 23, 59, 59, tzinfo=UTC),
+    )
+    assert [s for s in schedules if s.parent_id == schedule.id] == []
+
+    # 삭제된 인스턴스를 수정하면 복원됨
+    service.update_recurring_instance(schedule.id, instance_start, ScheduleUpdate(title="복원"))
+    assert not any(row.is_deleted for row in _occurrences(test_session, schedule.id))
+
+
+def test_update_schedule_refreshes_occurrences(test_session, test_user, occurrence_index):
+    """반복 규칙 변경 시 인덱스 재계산, 일반 일정으로 바뀌면 삭제"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+
+    service.update_schedule(schedule.id, ScheduleUpdate(recurrence_rule="FREQ=WEEKLY"))
+    rows = _occurrences(test_session, schedule.id)
+    assert all(row.instance_start.weekday() == 0 for row in rows)
+
+    service.update_schedule(schedule.id, ScheduleUpdate(recurrence_rule=None))
+    assert _occurrences(test_session, schedule.id) == []
+    assert test_session.get(ScheduleOccurrenceCoverage, schedule.id) is None
+
+
+def test_query_beyond_horizon_falls_back_to_expansion(test_session, test_user, occurrence_index):
+    """인덱스 기간을 벗어난 조회는 RRULE 확장으로 처리"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+
+    start_date = datetime(2025, 3, 1, tzinfo=UTC)
+    end_date = datetime(2025, 3, 7, 23, 59, 59, tzinfo=UTC)
+    uncovered = crud.get_uncovered_recurring_schedules(
+        test_session, start_date.replace(tzinfo=None), end_date.replace(tzinfo=None), test_user.sub,
+    )
+    assert [s.id for s in uncovered] == [schedule.id]
+
+    schedules = service.get_schedules_by_date_range(start_date, end_date)
+    assert len([s for s in schedules if s.parent_id == schedule.id]) == 7
+
+
+def test_extend_horizon_backfills_and_extends(test_session, test_user, occurrence_index, monkeypatch):
+    """인덱스 없이 만들어진 일정을 채우고, 기간이 끝나가면 연장"""
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", False)
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+    assert _occurrences(test_session, schedule.id) == []
+
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", True)
+    occurrences = ScheduleOccurrenceService(test_session)
+    assert occurrences.extend_horizon(now=NOW) == 1
+    assert occurrences.extend_horizon(now=NOW) == 0  # 이미 최신
+
+    # 남은 기간이 horizon의 절반 아래로 떨어지면 연장
+    later = NOW + timedelta(days=61)
+    assert occurrences.extend_horizon(now=later) == 1
+    coverage = test_session.get(ScheduleOccurrenceCoverage, schedule.id)
+    assert coverage.covered_until == later + timedelta(days=120)
+    assert coverage.covered_from == later - timedelta(days=60)
+
+
+def test_writes_while_disabled_drop_stale_index(test_session, test_user, occurrence_index, monkeypatch):
+    """인덱스가 꺼진 동안 바뀐 일정은 인덱스를 버려, 다시 켜도 오래된 인스턴스를 쓰지 않음"""
+    service = ScheduleService(test_session, test_user)
+    edited = _create_daily(service, title="규칙 변경")
+    deleted = _create_daily(service, title="인스턴스 삭제")
+    untouched = _create_daily(service, title="변경 없음")
+
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", False)
+    service.update_schedule(edited.id, ScheduleUpdate(recurrence_rule="FREQ=WEEKLY"))
+    service.delete_recurring_instance(deleted.id, datetime(2024, 1, 16, 10, 0, 0, tzinfo=UTC))
+
+    assert _occurrences(test_session, edited.id) == []
+    assert test_session.get(ScheduleOccurrenceCoverage, edited.id) is None
+    assert test_session.get(ScheduleOccurrenceCoverage, deleted.id) is None
+    assert test_session.get(ScheduleOccurrenceCoverage, untouched.id) is not None
+
+    monkeypatch.setattr(settings, "SCHEDULE_OCCURRENCE_INDEX_ENABLED", True)
+    start_date = datetime(2024, 1, 15, tzinfo=UTC)
+    end_date = datetime(2024, 1, 21, 23, 59, 59, tzinfo=UTC)
+    indexed = service.get_schedules_by_date_range(start_date, end_date)
+    assert len([s for s in indexed if s.parent_id == edited.id]) == 1
+    assert [s.start_time.day for s in indexed if s.parent_id == deleted.id] == [15, 17, 18, 19, 20, 21]
+
+    # horizon 연장이 버려진 인덱스를 다시 채움
+    assert ScheduleOccurrenceService(test_session).extend_horizon(now=NOW) == 2
+    assert sorted(_summary(service.get_schedules_by_date_range(start_date, end_date))) == sorted(_summary(indexed))
+
+
+def test_refresh_locks_parent_before_reading_exceptions(test_session, test_user, occurrence_index, monkeypatch):
+    """재계산은 원본 행을 잠근 뒤 삭제된 예외를 읽음 (동시 mark_deleted와 직렬화)"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+    calls = []
+    for name in ("lock_schedule_occurrences", "get_deleted_schedule_exception_dates",
+                 "set_schedule_occurrence_deleted"):
+        original = getattr(crud, name)
+        monkeypatch.setattr(
+            crud, name,
+            lambda *args, _name=name, _original=original: calls.append(_name) or _original(*args),
+        )
+
+    occurrences = ScheduleOccurrenceService(test_session)
+    occurrences.refresh(schedule, NOW)
+    occurrences.mark_deleted(schedule.id, datetime(2024, 1, 16, 10, 0, 0), True)
+
+    assert calls == [
+        "lock_schedule_occurrences",
+        "get_deleted_schedule_exception_dates",
+        "lock_schedule_occurrences",
+        "set_schedule_occurrence_deleted",
+    ]
+
+
+def test_delete_schedule_cascades_occurrences(test_session, test_user, occurrence_index):
+    """원본 삭제 시 인덱스도 CASCADE로 삭제"""
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_daily(service)
+
+    service.delete_schedule(schedule.id)
+    test_session.flush()
+    test_session.expire_all()
+
+    assert _occurrences(test_session, schedule.id) == []
+
+
+@pytest.mark.asyncio
+async def test_horizon_task_disabled_returns_immediately():
+    """인덱스가 꺼져 있으면 태스크는 즉시 종료"""
+    task = ScheduleOccurrenceHorizonTask(interval_seconds=10)
+
+    await asyncio.wait_for(task.run(), timeout=1.0)
+
+    assert task.enabled is False
+    assert task.is_running is False
@@ -3,7 +3,7 @@
 
 RRULE 기반 반복 일정의 생성, 조회, 수정, 삭제를 테스트합니다.
 """
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from uuid import uuid4
 
 import pytest
@@ -14,6 +14,7 @@ from app.domain.schedule.exceptions import (
     RecurringScheduleError,
     ScheduleNotFoundError,
 )
+from app.domain.schedule.recurring_service import ScheduleExceptionIndex
 from app.domain.schedule.schema.dto import ScheduleCreate, ScheduleUpdate
 from app.domain.schedule.service import ScheduleService
 from app.models.schedule import ScheduleException
@@ -1039,3 +1040,160 @@ def test_invalid_rrule_invalid_freq(test_session, test_user):
     service = ScheduleService(test_session, test_user)
     with pytest.raises(InvalidRecurrenceRuleError):
         service.create_schedule(schedule_data)
+
+
+# ==================== 예외 인스턴스 인덱스 테스트 ====================
+
+def _exception(parent_id, exception_date, **kwargs):
+    return ScheduleException(
+        parent_id=parent_id, exception_date=exception_date, owner_id="owner", **kwargs
+    )
+
+
+def test_exception_index_matches_within_tolerance():
+    """허용 오차(60초) 내 예외만 매칭, 다른 parent의 예외는 무시"""
+    parent_id = uuid4()
+    other_parent_id = uuid4()
+    instance_start = datetime(2024, 1, 1, 10, 0, 0)
+    index = ScheduleExceptionIndex([
+        _exception(other_parent_id, instance_start),
+        _exception(parent_id, instance_start + timedelta(seconds=60), title="edge"),
+    ])
+
+    assert index.find(parent_id, instance_start).title == "edge"
+    assert index.find(parent_id, instance_start - timedelta(seconds=1)) is None
+    assert index.find(uuid4(), instance_start) is None
+
+
+def test_exception_index_prefers_nearest_exception():
+    """허용 오차 내 예외가 여러 개면 가장 가까운 예외 (정확히 일치하면 그 예외)"""
+    parent_id = uuid4()
+    instance_start = datetime(2024, 1, 1, 10, 0, 0)
+    index = ScheduleExceptionIndex([
+        _exception(parent_id, instance_start + timedelta(seconds=30), title="late"),
+        _exception(parent_id, instance_start, title="exact"),
+        _exception(parent_id, instance_start - timedelta(seconds=50), title="early"),
+    ])
+
+    assert index.find(parent_id, instance_start).title == "exact"
+    assert index.find(parent_id, instance_start + timedelta(seconds=25)).title == "late"
+    assert index.find(parent_id, instance_start - timedelta(seconds=45)).title == "early"
+
+
+def test_heavily_edited_daily_series(test_session, test_user):
+    """예외가 많은 매일 반복 일정도 인스턴스별로 올바른 예외와 매칭"""
+    schedule_data = ScheduleCreate(
+        title="매일 회의",
+        start_time=datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        end_time=datetime(2024, 1, 1, 11, 0, 0, tzinfo=UTC),
+        recurrence_rule="FREQ=DAILY",
+    )
+    service = ScheduleService(test_session, test_user)
+    parent_schedule = service.create_schedule(schedule_data)
+
+    # 홀수 날짜는 삭제, 짝수 날짜는 제목 수정
+    for day in range(1, 61):
+        instance_start = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC) + timedelta(days=day - 1)
+        if day % 2:
+            service.delete_recurring_instance(parent_schedule.id, instance_start)
+        else:
+            service.update_recurring_instance(
+                parent_schedule.id, instance_start, ScheduleUpdate(title=f"수정 {day}")
+            )
+
+    schedules = service.get_schedules_by_date_range(
+        datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 3, 10, 23, 59, 59, tzinfo=UTC)
+    )
+    titles = [s.title for s in schedules if s.parent_id == parent_schedule.id]
+
+    assert titles == [f"수정 {day}" for day in range(2, 61, 2)] + ["매일 회의"] * 10
+
+
+# ==================== 전체 인스턴스 삭제 판정 테스트 ====================
+
+def _create_recurring(service, rule, start_time, recurrence_end):
+    return service.create_schedule(ScheduleCreate(
+        title="반복 일정",
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        recurrence_rule=rule,
+        recurrence_end=recurrence_end,
+    ))
+
+
+def test_all_instances_deleted_ignores_other_schedules(test_session, test_user):
+    """같은 시간의 다른 일정 예외는 삭제 판정에 쓰이지 않음"""
+    from app.crud import schedule as crud
+
+    service = ScheduleService(test_session, test_user)
+    start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+    recurrence_end = datetime(2024, 1, 3, 23, 59, 59, tzinfo=UTC)
+    schedule = _create_recurring(service, "FREQ=DAILY", start_time, recurrence_end)
+    other = _create_recurring(service, "FREQ=DAILY", start_time, recurrence_end)
+
+    for day in range(3):
+        crud.create_schedule_exception(
+            test_session,
+            parent_id=other.id,
+            exception_date=datetime(2024, 1, 1 + day, 10, 0, 0),
+            owner_id=test_user.sub,
+            is_deleted=True,
+        )
+
+    assert service._recurring._are_all_instances_deleted(other) is True
+    assert service._recurring._are_all_instances_deleted(schedule) is False
+
+
+def test_all_instances_deleted_streams_non_simple_rule(test_session, test_user):
+    """단순 규칙이 아니면 인스턴스를 순회하며 삭제 여부 판정"""
+    from app.crud import schedule as crud
+
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_recurring(
+        service,
+        "FREQ=DAILY;BYHOUR=9,18",
+        datetime(2024, 1, 1, 9, 0, 0, tzinfo=UTC),
+        datetime(2024, 1, 2, 23, 59, 59, tzinfo=UTC),
+    )
+
+    instance_starts = [
+        datetime(2024, 1, 1, 9, 0, 0),
+        datetime(2024, 1, 1, 18, 0, 0),
+        datetime(2024, 1, 2, 9, 0, 0),
+        datetime(2024, 1, 2, 18, 0, 30),  # 허용 오차 내
+    ]
+    for instance_start in instance_starts[:-1]:
+        crud.create_schedule_exception(
+            test_session, parent_id=schedule.id, exception_date=instance_start,
+            owner_id=test_user.sub, is_deleted=True,
+        )
+    assert service._recurring._are_all_instances_deleted(schedule) is False
+
+    crud.create_schedule_exception(
+        test_session, parent_id=schedule.id, exception_date=instance_starts[-1],
+        owner_id=test_user.sub, is_deleted=True,
+    )
+    assert service._recurring._are_all_instances_deleted(schedule) is True
+
+
+def test_all_instances_deleted_count_shortcut(test_session, test_user, monkeypatch):
+    """단순 규칙은 삭제 예외가 인스턴스 수보다 적으면 예외 날짜를 조회하지 않음"""
+    from app.crud import schedule as crud
+    from app.models.schedule import Schedule
+
+    service = ScheduleService(test_session, test_user)
+    schedule = _create_recurring(
+        service,
+        "FREQ=DAILY",
+        datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC),
+        datetime(2034, 1, 1, 23, 59, 59, tzinfo=UTC),
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("count shortcut should skip loading exception dates")
+
+    monkeypatch.setattr(crud, "get_deleted_schedule_exception_dates", fail)
+
+    service.delete_recurring_instance(schedule.id, datetime(2030, 6, 1, 10, 0, 0, tzinfo=UTC))
+
+    assert test_session.get(Schedule, schedule.id) is not None
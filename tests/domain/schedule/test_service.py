@@ -523,3 +523,99 @@ def test_create_todo_from_schedule_not_found(test_session, test_user, sample_tag
 
     with pytest.raises(ScheduleNotFoundError):
         service.create_todo_from_schedule(uuid4(), sample_tag_group.id)
+
+
+def _create_tags(test_session, test_user, group_id, names):
+    from app.domain.tag.schema.dto import TagCreate
+    from app.domain.tag.service import TagService
+
+    tag_service = TagService(test_session, test_user)
+    return [
+        tag_service.create_tag(TagCreate(name=name, color="#FF0000", group_id=group_id))
+        for name in names
+    ]
+
+
+def test_date_range_tag_filter_applies_to_recurring_parents(test_session, test_user, sample_tag_group):
+    """태그(AND)/그룹 필터가 일반 일정과 반복 일정 원본에 적용되고 인스턴스는 원본 태그를 상속"""
+    from app.domain.tag.schema.dto import TagGroupCreate
+    from app.domain.tag.service import TagService
+
+    work, urgent = _create_tags(test_session, test_user, sample_tag_group.id, ["업무", "긴급"])
+    other_group = TagService(test_session, test_user).create_tag_group(
+        TagGroupCreate(name="개인", color="#00FF00")
+    )
+    (hobby,) = _create_tags(test_session, test_user, other_group.id, ["취미"])
+
+    service = ScheduleService(test_session, test_user)
+    start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+    both = service.create_schedule(ScheduleCreate(
+        title="매일 긴급 업무", start_time=start_time, end_time=start_time + timedelta(hours=1),
+        recurrence_rule="FREQ=DAILY", tag_ids=[work.id, urgent.id],
+    ))
+    service.create_schedule(ScheduleCreate(
+        title="업무", start_time=start_time, end_time=start_time + timedelta(hours=1),
+        tag_ids=[work.id],
+    ))
+    service.create_schedule(ScheduleCreate(
+        title="매주 취미", start_time=start_time, end_time=start_time + timedelta(hours=1),
+        recurrence_rule="FREQ=WEEKLY", tag_ids=[hobby.id],
+    ))
+
+    start_date = datetime(2024, 1, 1, tzinfo=UTC)
+    end_date = datetime(2024, 1, 7, 23, 59, 59, tzinfo=UTC)
+
+    # AND 방식 (중복 태그 ID는 한 번만 셈)
+    schedules = service.get_schedules_by_date_range(
+        start_date, end_date, tag_ids=[work.id, urgent.id, work.id]
+    )
+    assert len(schedules) == 7
+    assert {s.parent_id for s in schedules} == {both.id}
+
+    schedules = service.get_schedules_by_date_range(start_date, end_date, tag_ids=[work.id])
+    assert sorted({s.title for s in schedules}) == ["매일 긴급 업무", "업무"]
+
+    # 그룹 필터 + 태그 필터
+    schedules = service.get_schedules_by_date_range(
+        start_date, end_date, tag_ids=[work.id], group_ids=[other_group.id]
+    )
+    assert schedules == []
+
+    schedules = service.get_schedules_by_date_range(start_date, end_date, group_ids=[other_group.id])
+    assert [s.title for s in schedules] == ["매주 취미"]
+
+    all_schedules = service.get_all_schedules_with_tag_filter(tag_ids=[urgent.id])
+    assert [s.id for s in all_schedules] == [both.id]
+
+
+def test_date_range_tag_filter_skips_expanding_other_parents(
+        test_session, test_user, sample_tag_group, monkeypatch
+):
+    """태그 조건에 맞지 않는 반복 일정은 확장하지 않음"""
+    from app.domain.schedule import query_service
+
+    (tag,) = _create_tags(test_session, test_user, sample_tag_group.id, ["업무"])
+    service = ScheduleService(test_session, test_user)
+    start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=UTC)
+    for index in range(5):
+        service.create_schedule(ScheduleCreate(
+            title=f"반복 {index}", start_time=start_time, end_time=start_time + timedelta(hours=1),
+            recurrence_rule="FREQ=DAILY", tag_ids=[tag.id] if index == 0 else None,
+        ))
+
+    expanded_rules = []
+    expand_recurrence = query_service.RecurrenceCalculator.expand_recurrence
+
+    def record(start, end, rule, recurrence_end, query_start, query_end):
+        expanded_rules.append(rule)
+        return expand_recurrence(start, end, rule, recurrence_end, query_start, query_end)
+
+    monkeypatch.setattr(query_service.RecurrenceCalculator, "expand_recurrence", record)
+
+    schedules = service.get_schedules_by_date_range(
+        datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 3, 23, 59, 59, tzinfo=UTC),
+        tag_ids=[tag.id],
+    )
+
+    assert len(expanded_rules) == 1
+    assert [s.title for s in schedules] == ["반복 0"] * 3
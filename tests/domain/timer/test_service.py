@@ -1767,13 +1767,11 @@ class TestElapsedTimeAccumulation:
             mock_dt.now = lambda tz=None: base_time + timedelta(seconds=70)
             service.resume_timer(timer.id)
 
-        # 20초 후 조회 → 누적 60 + 현재 세그먼트 20 = 80
-        with patch("app.domain.timer.service.datetime") as mock_dt:
-            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
-            mock_dt.now = lambda tz=None: base_time + timedelta(seconds=90)
-
-            retrieved = service.get_timer(timer.id)
-            assert retrieved.elapsed_time == 80
+        # 20초 후 조회 → 누적 60 + 현재 세그먼트 20 = 80 (모델은 변경하지 않고 계산)
+        retrieved = service.get_timer(timer.id)
+        assert retrieved.current_elapsed_time(base_time + timedelta(seconds=90)) == 80
+        assert retrieved.elapsed_time == 60
+        assert retrieved not in test_session.dirty
 
     def test_pause_history_elapsed_matches_elapsed_time(self, test_session, test_user):
         """pause_history의 elapsed 값이 해당 시점의 elapsed_time과 일치해야 함"""
@@ -34,6 +34,8 @@ TIMESTAMP_TABLE_NAMES = {
 TIMESTAMPLESS_TABLE_NAMES = {
     "meeting_time_slot",
     "schedule_exception_tag",
+    "schedule_occurrence",
+    "schedule_occurrence_coverage",
     "schedule_tag",
     "timer_tag",
     "todo_tag",
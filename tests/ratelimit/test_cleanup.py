@@ -0,0 +1,185 @@
+"""
+Rate Limit 저장소 상한/정리 테스트
+
+LRU 키 상한, 규칙 윈도우 기준 만료 정리, 지표(stats),
+RateLimitCleanupTask의 주기적 정리와 정상 종료를 검증한다.
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.config import settings
+from app.ratelimit.storage import InMemoryStorage, SlidingWindowCounterStorage
+from app.ratelimit.storage.memory import get_storage, reset_storage
+from app.ratelimit.tasks import RateLimitCleanupTask
+
+pytestmark = pytest.mark.ratelimit
+
+STORAGES = [InMemoryStorage, SlidingWindowCounterStorage]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_max_keys_evicts_least_recently_used(storage_cls):
+    storage = storage_cls(max_keys=3)
+    for key in ("a", "b", "c"):
+        await storage.record_request(key, window_seconds=60, max_requests=10)
+    await storage.record_request("a", window_seconds=60, max_requests=10)  # a를 최근 사용으로
+
+    await storage.record_request("d", window_seconds=60, max_requests=10)
+
+    assert await storage.get_current_count("b", 60) == 0  # 가장 오래된 b 제거
+    assert await storage.get_current_count("a", 60) == 2
+    stats = await storage.stats()
+    assert stats["keys"] == 3
+    assert stats["evictions"] == 1
+    assert stats["max_keys"] == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_ip_spraying_bounded(storage_cls):
+    storage = storage_cls(max_keys=100)
+    for i in range(1000):
+        await storage.record_request(f"ratelimit:ip:10.0.{i // 256}.{i % 256}:GET:/v1/*", 60, 60)
+
+    assert (await storage.stats())["keys"] == 100
+    assert (await storage.stats())["evictions"] == 900
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_stats_bytes_grow_with_keys(storage_cls):
+    storage = storage_cls(max_keys=0)
+    assert (await storage.stats())["bytes"] == 0
+
+    for i in range(10):
+        await storage.record_request(f"key-{i}", window_seconds=60, max_requests=10)
+
+    assert (await storage.stats())["keys"] == 10
+    assert (await storage.stats())["bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_sliding_log_cleanup_uses_rule_window():
+    """300초 고정값이 아니라 키에 기록된 규칙 윈도우로 만료 판단"""
+    storage = InMemoryStorage(max_keys=0)
+    await storage.record_request("short", window_seconds=1, max_requests=10)
+    await storage.record_request("long", window_seconds=600, max_requests=10)
+
+    with patch("app.ratelimit.storage.memory.time.time", return_value=time.time() + 5):
+        cleaned = await storage.cleanup_expired()
+
+    assert cleaned == 2  # short의 타임스탬프 1개 + 빈 키 1개
+    assert (await storage.stats())["keys"] == 1
+    assert await storage.get_current_count("long", 600) == 1
+
+
+class TestRateLimitCleanupTask:
+    def test_default_interval_from_settings(self):
+        assert RateLimitCleanupTask().interval_seconds == settings.RATE_LIMIT_CLEANUP_INTERVAL_SECONDS
+
+    def test_non_positive_interval_disabled(self):
+        assert RateLimitCleanupTask(interval_seconds=0).enabled is False
+
+    @pytest.mark.asyncio
+    async def test_run_sweeps_periodically(self):
+        reset_storage()
+        storage = get_storage()
+        await storage.record_request("expired", window_seconds=1, max_requests=10)
+        task = RateLimitCleanupTask(interval_seconds=0.01)
+
+        future = time.time() + 5
+        with patch("app.ratelimit.storage.memory.time.time", return_value=future), \
+                patch("app.ratelimit.storage.sliding_window.time.time", return_value=future):
+            runner = asyncio.create_task(task.run())
+            await asyncio.sleep(0.05)
+            runner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await runner
+
+        assert (await storage.stats())["keys"] == 0
+        assert task.is_running is False
+        reset_storage()
+
+    @pytest.mark.asyncio
+    async def test_sweep_failure_keeps_running(self):
+        task = RateLimitCleanupTask(interval_seconds=0.01)
+        with patch.object(RateLimitCleanupTask, "sweep", side_effect=RuntimeError("boom")) as sweep:
+            runner = asyncio.create_task(task.run())
+            await asyncio.sleep(0.05)
+            runner.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await runner
+
+        assert sweep.call_count >= 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_cleanup_yields_between_batches(storage_cls):
+    """정리 중에도 다른 요청이 처리됨 (락 없이 배치마다 이벤트 루프에 양보)"""
+    storage = storage_cls(max_keys=0)
+    for i in range(50):
+        await storage.record_request(f"expired-{i}", window_seconds=1, max_requests=10)
+    module = storage_cls.__module__
+    served = []
+
+    async def request():
+        result = await storage.record_request("live", window_seconds=60, max_requests=10)
+        served.append(result.allowed)
+
+    with patch(f"{module}.CLEANUP_BATCH_SIZE", 10), \
+            patch(f"{module}.time.time", return_value=time.time() + 5):
+        cleanup = asyncio.create_task(storage.cleanup_expired())
+        await asyncio.sleep(0)  # cleanup 시작 (첫 배치 후 양보)
+        await request()
+        assert not cleanup.done()
+        await cleanup
+
+    assert served == [True]
+    assert (await storage.stats())["keys"] == 1
+    assert await storage.get_current_count("live", 60) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_stats_yields_between_batches(storage_cls):
+    """stats의 bytes 계산도 배치마다 이벤트 루프에 양보"""
+    storage = storage_cls(max_keys=0)
+    for i in range(50):
+        await storage.record_request(f"key-{i}", window_seconds=60, max_requests=10)
+
+    with patch(f"{storage_cls.__module__}.CLEANUP_BATCH_SIZE", 10):
+        stats = asyncio.create_task(storage.stats())
+        await asyncio.sleep(0)  # stats 시작 (첫 배치 후 양보)
+        await storage.record_request("live", window_seconds=60, max_requests=10)
+        assert not stats.done()
+        await stats
+
+    assert (await storage.stats())["keys"] == 51
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", STORAGES)
+async def test_cleanup_keeps_key_recreated_while_yielding(storage_cls):
+    """양보 중 reset 후 다시 기록된 키는 만료 판단 대상이 아님"""
+    storage = storage_cls(max_keys=0)
+    for i in range(20):
+        await storage.record_request(f"key-{i}", window_seconds=1, max_requests=10)
+    module = storage_cls.__module__
+    future = time.time() + 5
+
+    with patch(f"{module}.CLEANUP_BATCH_SIZE", 10), \
+            patch(f"{module}.time.time", return_value=future):
+        cleanup = asyncio.create_task(storage.cleanup_expired())
+        await asyncio.sleep(0)
+        await storage.reset("key-15")
+        await storage.record_request("key-15", window_seconds=60, max_requests=10)
+        await cleanup
+
+    assert (await storage.stats())["keys"] == 1
+    with patch(f"{module}.time.time", return_value=future):
+        assert await storage.get_current_count("key-15", 60) == 1
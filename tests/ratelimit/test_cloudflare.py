@@ -114,6 +114,32 @@ class TestCloudflareIPManager:
         # Cloudflare IP 범위 외
         assert manager.is_cloudflare_ip("2001:4860:4860::8888") is False
 
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_ranges(self, mock_cf_response):
+        """TTL 만료 후 갱신되면 새 대역으로 교체 (이전 판정 캐시도 함께 교체)"""
+        manager = CloudflareIPManager()
+
+        with patch("app.ratelimit.cloudflare.httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_client.return_value.__aenter__.return_value = mock_instance
+            mock_instance.get = AsyncMock(side_effect=mock_cf_response)
+            await manager.initialize()
+            assert manager.is_cloudflare_ip("173.245.48.1") is True
+
+            def updated_response(url):
+                response = AsyncMock(spec=httpx.Response)
+                response.status_code = 200
+                response.text = "198.41.128.0/17" if "ips-v4" in url else "2a06:98c0::/29"
+                return response
+
+            mock_instance.get = AsyncMock(side_effect=updated_response)
+            manager._last_fetch_time = 0  # 캐시 만료
+            assert await manager._fetch_ips() is True
+
+        assert manager.is_cloudflare_ip("173.245.48.1") is False
+        assert manager.is_cloudflare_ip("198.41.200.1") is True
+        assert manager.is_cloudflare_ip("2a06:98c0::1") is True
+
     def test_is_cloudflare_ip_not_initialized(self):
         """초기화 안된 상태에서는 항상 False"""
         manager = CloudflareIPManager()
@@ -1,12 +1,20 @@
 """
 Rate Limit Config 테스트
 """
+import json
+import os
+
 import pytest
 
 from app.ratelimit.config import (
+    RATE_LIMIT_RULES,
+    CompiledRules,
     RateLimitRule,
+    get_compiled_rules,
     get_rule_for_request,
     build_rate_limit_key,
+    refresh_rules,
+    reload_rules,
 )
 
 pytestmark = pytest.mark.ratelimit
@@ -116,6 +124,118 @@ class TestGetRuleForRequest:
         assert "/v1/graphql" in rule.path_pattern or "*" in rule.path_pattern
 
 
+def _linear_lookup(rules, method, path):
+    """컴파일 전 방식: 규칙을 순서대로 순회하며 첫 매칭 반환"""
+    for rule in rules:
+        if rule.matches(method, path):
+            return rule
+    return None
+
+
+class TestCompiledRules:
+    """메서드별 컴파일 매처 + 매칭 캐시"""
+
+    METHODS = ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "post"]
+    PATHS = [
+        "/v1/todos", "/v1/todos/", "/v1/todos/abc", "/v1/todos/abc/complete",
+        "/v1/schedules", "/v1/schedules/1", "/v1/timers", "/v1/timers/x/pause",
+        "/v1/tags", "/v1/tags/groups", "/v1/tags/groups/1", "/v1/graphql",
+        "/v1/friends/requests", "/v1/friends/requests/abc/accept",
+        "/v1", "/v1/", "/health", "/v2/todos", "/v1/todos\n",
+    ]
+
+    def test_same_result_as_linear_scan(self):
+        compiled = CompiledRules(RATE_LIMIT_RULES, cache_size=16)
+
+        for method in self.METHODS:
+            for path in self.PATHS:
+                assert compiled.match(method, path) is _linear_lookup(RATE_LIMIT_RULES, method, path), (method, path)
+
+    def test_rule_order_preserved_for_overlapping_patterns(self):
+        broad = RateLimitRule(path_pattern="/v1/*", window_seconds=60, max_requests=1)
+        specific = RateLimitRule(methods=["GET"], path_pattern="/v1/todos", window_seconds=60, max_requests=2)
+        compiled = CompiledRules([broad, specific], cache_size=16)
+
+        assert compiled.match("GET", "/v1/todos") is broad
+
+    def test_empty_methods_never_match(self):
+        rule = RateLimitRule(methods=[], path_pattern="/v1/*", window_seconds=60, max_requests=1)
+        compiled = CompiledRules([rule], cache_size=16)
+
+        assert compiled.match("GET", "/v1/todos") is None
+
+    def test_results_are_memoized(self):
+        compiled = CompiledRules(RATE_LIMIT_RULES, cache_size=2)
+
+        compiled.match("GET", "/v1/todos")
+        compiled.match("GET", "/v1/todos")
+        compiled.match("GET", "/health")
+        compiled.match("GET", "/health")  # None 결과도 캐싱
+        compiled.match("GET", "/v1/tags")
+
+        stats = compiled.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["size"] == 2  # 상한 유지
+
+
+@pytest.fixture
+def rules_file(tmp_path, monkeypatch):
+    from app.core import config as app_config
+
+    path = tmp_path / "rules.json"
+
+    def write(rules, mtime=None):
+        path.write_text(json.dumps(rules), encoding="utf-8")
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    write([{"path_pattern": "/v1/*", "window_seconds": 60, "max_requests": 5}], mtime=1000)
+    monkeypatch.setattr(app_config.settings, "RATE_LIMIT_RULES_FILE", str(path))
+    yield write
+    monkeypatch.setattr(app_config.settings, "RATE_LIMIT_RULES_FILE", None)
+    reload_rules()
+
+
+class TestReloadRules:
+    """규칙 파일 hot reload"""
+
+    def test_reload_from_file(self, rules_file):
+        reload_rules()
+
+        assert get_rule_for_request("POST", "/v1/todos").max_requests == 5
+
+    def test_refresh_only_when_file_changes(self, rules_file):
+        reload_rules()
+        assert refresh_rules() is False
+
+        rules_file([
+            {"methods": ["POST"], "path_pattern": "/v1/todos", "window_seconds": 60, "max_requests": 1},
+            {"path_pattern": "/v1/*", "window_seconds": 60, "max_requests": 5},
+        ], mtime=2000)
+
+        assert refresh_rules() is True
+        assert get_rule_for_request("POST", "/v1/todos").max_requests == 1
+        assert get_rule_for_request("GET", "/v1/todos").max_requests == 5
+        assert get_compiled_rules().stats()["rules"] == 2
+
+    @pytest.mark.parametrize("rule", [
+        {"path_pattern": "/v1/*"},  # window_seconds/max_requests 누락
+        {"path_pattern": "/v1/*", "window_seconds": 0, "max_requests": 5},
+        {"path_pattern": "/v1/*", "window_seconds": 60, "max_requests": -1},
+    ])
+    def test_invalid_file_keeps_current_rules(self, rules_file, rule):
+        reload_rules()
+        current = get_compiled_rules()
+        rules_file([rule], mtime=2000)
+
+        with pytest.raises(ValueError):
+            refresh_rules()
+
+        assert get_compiled_rules() is current
+        assert get_rule_for_request("GET", "/v1/todos").max_requests == 5
+
+
 class TestBuildRateLimitKey:
     """build_rate_limit_key 테스트"""
 
@@ -0,0 +1,78 @@
+"""
+IP 대역 집합(IPRangeSet) 테스트
+
+구간 병합, 경계값, IPv4/IPv6 분리, 잘못된 주소, 선형 탐색(ip in network)과의 결과 일치를 검증한다.
+"""
+import random
+from ipaddress import IPv4Address, IPv6Address, ip_address, ip_network
+
+import pytest
+
+from app.ratelimit.ipset import IPRangeSet
+
+pytestmark = pytest.mark.ratelimit
+
+
+def _networks(*cidrs):
+    return [ip_network(c, strict=False) for c in cidrs]
+
+
+def test_boundaries():
+    ip_set = IPRangeSet(_networks("10.0.0.0/24", "192.168.1.7"))
+
+    assert ip_set.contains("10.0.0.0") is True
+    assert ip_set.contains("10.0.0.255") is True
+    assert ip_set.contains("10.0.1.0") is False
+    assert ip_set.contains("9.255.255.255") is False
+    assert ip_set.contains("192.168.1.7") is True
+    assert ip_set.contains("192.168.1.8") is False
+    assert len(ip_set) == 2
+
+
+def test_overlapping_and_adjacent_ranges_merged():
+    ip_set = IPRangeSet(_networks("10.0.0.0/8", "10.1.0.0/16", "11.0.0.0/8", "13.0.0.0/8"))
+
+    assert ip_set._starts[4] == [int(IPv4Address("10.0.0.0")), int(IPv4Address("13.0.0.0"))]
+    assert ip_set.contains("11.255.255.255") is True
+    assert ip_set.contains("12.0.0.0") is False
+
+
+def test_versions_are_separate():
+    ip_set = IPRangeSet(_networks("0.0.0.0/0"))
+
+    assert ip_set.contains("8.8.8.8") is True
+    assert ip_set.contains("::1") is False
+    assert ip_set.contains("::ffff:8.8.8.8") is False  # IPv4-mapped IPv6는 IPv4 대역에 속하지 않음
+
+
+def test_invalid_address_raises():
+    ip_set = IPRangeSet(_networks("10.0.0.0/8"))
+
+    with pytest.raises(ValueError):
+        ip_set.contains("invalid-ip")
+    with pytest.raises(ValueError):
+        ip_set.contains("")
+
+
+def test_empty_set():
+    ip_set = IPRangeSet([])
+
+    assert not ip_set
+    assert ip_set.contains("10.0.0.1") is False
+
+
+def test_same_result_as_linear_scan():
+    rng = random.Random(0)
+    networks = _networks(
+        *(f"{rng.randrange(256)}.{rng.randrange(256)}.0.0/{rng.randrange(8, 25)}" for _ in range(200)),
+        *(f"{rng.randrange(0x2000, 0x2fff):x}:{rng.randrange(0xffff):x}::/{rng.randrange(16, 49)}" for _ in range(50)),
+    )
+    ip_set = IPRangeSet(networks)
+    addresses = [str(IPv4Address(rng.getrandbits(32))) for _ in range(2000)]
+    # 대역 안쪽 주소도 충분히 섞음
+    addresses += [str(n.network_address + rng.randrange(n.num_addresses)) for n in networks]
+    addresses += [str(IPv6Address((0x2000 + rng.randrange(0x1000)) << 112 | rng.getrandbits(112))) for _ in range(500)]
+
+    for address in addresses:
+        ip = ip_address(address)
+        assert ip_set.contains(address) is any(ip in n for n in networks), address
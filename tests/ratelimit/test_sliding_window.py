@@ -0,0 +1,145 @@
+"""
+슬라이딩 윈도우 카운터 저장소 테스트
+
+시간을 고정해(time.time 패치) 구간 이동, 직전 구간 가중치, reset_after 계산,
+키당 상태 크기, 설정에 따른 저장소 선택을 검증한다.
+"""
+from unittest.mock import patch
+
+import pytest
+
+from app.ratelimit.storage import InMemoryStorage, SlidingWindowCounterStorage
+from app.ratelimit.storage.memory import get_storage, reset_storage
+
+pytestmark = pytest.mark.ratelimit
+
+KEY = "test:user1"
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = _Clock(1200.0)  # 60초 구간의 시작
+    with patch("app.ratelimit.storage.sliding_window.time.time", clock):
+        yield clock
+
+
+@pytest.fixture
+def storage():
+    return SlidingWindowCounterStorage()
+
+
+async def _record(storage, count: int, max_requests: int = 10):
+    results = []
+    for _ in range(count):
+        results.append(await storage.record_request(KEY, window_seconds=60, max_requests=max_requests))
+    return results
+
+
+@pytest.mark.asyncio
+async def test_limit_within_one_bucket(storage, clock):
+    results = await _record(storage, 11)
+
+    assert [r.allowed for r in results] == [True] * 10 + [False]
+    assert [r.current_count for r in results[:3]] == [1, 2, 3]
+    assert results[0].remaining == 9
+    assert results[0].reset_after == 60  # 현재 구간 종료까지
+    assert results[-1].current_count == 10
+    assert results[-1].remaining == 0
+
+
+@pytest.mark.asyncio
+async def test_previous_bucket_weighted(storage, clock):
+    """다음 구간 절반 지점: 직전 구간 10건이 5건으로 계산되어 5건만 추가 허용"""
+    await _record(storage, 10)
+    clock.now += 60 + 30
+
+    results = await _record(storage, 6)
+
+    assert [r.allowed for r in results] == [True] * 5 + [False]
+    assert results[0].current_count == 6
+    # 직전 구간 가중치가 0.5보다 조금만 줄어도 다시 허용
+    assert results[-1].reset_after == 1
+    assert await storage.get_current_count(KEY, 60) == 10
+
+
+@pytest.mark.asyncio
+async def test_denied_retry_after_is_accurate(storage, clock):
+    """거부 시 알려준 reset_after가 지나면 다시 허용"""
+    await _record(storage, 10)
+    denied = (await _record(storage, 1))[0]
+    assert denied.allowed is False
+
+    clock.now += denied.reset_after - 1
+    assert (await _record(storage, 1))[0].allowed is False
+    clock.now += 1
+    assert (await _record(storage, 1))[0].allowed is True
+
+
+@pytest.mark.asyncio
+async def test_idle_two_buckets_resets(storage, clock):
+    await _record(storage, 10)
+    clock.now += 120
+
+    result = (await _record(storage, 1))[0]
+
+    assert result.allowed is True
+    assert result.current_count == 1
+
+
+@pytest.mark.asyncio
+async def test_state_size_independent_of_limit(storage, clock):
+    await _record(storage, 1000, max_requests=5000)
+
+    assert len(storage._counters.get(KEY)) == 4
+
+
+@pytest.mark.asyncio
+async def test_cleanup_uses_key_window(storage, clock):
+    await storage.record_request("short", window_seconds=1, max_requests=10)
+    await storage.record_request("long", window_seconds=600, max_requests=10)
+    clock.now += 5
+
+    assert await storage.cleanup_expired() == 1
+    assert await storage.get_current_count("long", 600) == 1
+    assert await storage.get_current_count("short", 1) == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_limit_always_denies(storage, clock):
+    results = [await storage.record_request(KEY, window_seconds=60, max_requests=0) for _ in range(2)]
+
+    assert [r.allowed for r in results] == [False, False]
+    assert [r.reset_after for r in results] == [60, 60]
+    assert results[0].current_count == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_window_counts_nothing(storage, clock):
+    results = [await storage.record_request(KEY, window_seconds=0, max_requests=1) for _ in range(3)]
+
+    assert [r.allowed for r in results] == [True] * 3
+    assert await storage.get_current_count(KEY, 0) == 0
+    assert await storage.cleanup_expired() == 1
+
+
+@pytest.mark.parametrize("algorithm, expected", [
+    ("sliding_log", InMemoryStorage),
+    ("sliding_window_counter", SlidingWindowCounterStorage),
+])
+def test_get_storage_selects_algorithm(monkeypatch, algorithm, expected):
+    from app.core import config as app_config
+
+    monkeypatch.setattr(app_config.settings, "RATE_LIMIT_ALGORITHM", algorithm)
+    reset_storage()
+    try:
+        assert isinstance(get_storage(), expected)
+    finally:
+        reset_storage()
@@ -0,0 +1,173 @@
+"""
+SQLite 공유 저장소 테스트
+
+같은 파일을 여는 저장소 인스턴스 여러 개(워커 프로세스 대역)가 한도를 공유하는지,
+SlidingWindowCounterStorage와 같은 결과를 내는지, 만료 행 정리와 저장소 선택을 검증한다.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.ratelimit.storage import SlidingWindowCounterStorage, SqliteStorage
+from app.ratelimit.storage.memory import get_storage, reset_storage
+
+pytestmark = pytest.mark.ratelimit
+
+KEY = "ratelimit:user1:POST:/v1/todos"
+
+
+class _Clock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "ratelimit.db")
+
+
+@pytest.fixture
+def storage(db_path):
+    storage = SqliteStorage(db_path)
+    yield storage
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_limit_shared_between_instances(db_path):
+    """같은 파일을 쓰는 두 워커가 한도 하나를 나눠 씀"""
+    worker_a, worker_b = SqliteStorage(db_path), SqliteStorage(db_path)
+    try:
+        for _ in range(5):
+            assert (await worker_a.record_request(KEY, 60, 10)).allowed
+            assert (await worker_b.record_request(KEY, 60, 10)).allowed
+
+        denied = await worker_a.record_request(KEY, 60, 10)
+
+        assert denied.allowed is False
+        assert denied.remaining == 0
+        assert await worker_b.get_current_count(KEY, 60) == 10
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_same_results_as_in_memory_counter(storage):
+    clock = _Clock(1200.0)
+    memory = SlidingWindowCounterStorage()
+    with patch("app.ratelimit.storage.sliding_window.time.time", clock), \
+            patch("app.ratelimit.storage.sqlite.time.time", clock):
+        for step in range(40):
+            clock.now += 7.5 if step % 4 else 0.5
+            expected = await memory.record_request(KEY, 60, 5)
+            assert await storage.record_request(KEY, 60, 5) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window_seconds, max_requests", [(60, 0), (0, 1)])
+async def test_zero_limit_or_window_matches_in_memory_counter(storage, window_seconds, max_requests):
+    memory = SlidingWindowCounterStorage()
+    for _ in range(3):
+        expected = await memory.record_request(KEY, window_seconds, max_requests)
+        assert await storage.record_request(KEY, window_seconds, max_requests) == expected
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_atomic(storage):
+    results = await asyncio.gather(*(storage.record_request(KEY, 60, 10) for _ in range(30)))
+
+    assert sum(r.allowed for r in results) == 10
+
+
+@pytest.mark.asyncio
+async def test_reset(storage):
+    await storage.record_request(KEY, 60, 10)
+    await storage.reset(KEY)
+
+    assert await storage.get_current_count(KEY, 60) == 0
+    assert (await storage.stats())["keys"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cleanup_deletes_expired_rows_in_batches(storage):
+    clock = _Clock(1200.0)
+    with patch("app.ratelimit.storage.sqlite.time.time", clock), \
+            patch("app.ratelimit.storage.sqlite.CLEANUP_BATCH_SIZE", 10):
+        for i in range(25):
+            await storage.record_request(f"short-{i}", 1, 10)
+        await storage.record_request("long", 600, 10)
+        clock.now += 5
+
+        assert await storage.cleanup_expired() == 25
+        assert await storage.get_current_count("long", 600) == 1
+
+    stats = await storage.stats()
+    assert stats["keys"] == 1
+    assert stats["bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_stats_before_first_use(storage):
+    assert (await storage.stats()) == {"keys": 0, "bytes": 0, "evictions": 0, "max_keys": 0}
+
+
+@pytest.mark.asyncio
+async def test_stats_runs_on_storage_thread(storage):
+    """stats도 전용 스레드의 연결로 조회 (이벤트 루프에서 연결/COUNT를 실행하지 않음)"""
+    await storage.record_request(KEY, 60, 10)
+    with patch("app.ratelimit.storage.sqlite.sqlite3.connect") as connect:
+        assert (await storage.stats())["keys"] == 1
+    connect.assert_not_called()
+
+
+def test_close_shuts_down_storage_thread(db_path):
+    storage = SqliteStorage(db_path)
+    asyncio.run(storage.record_request(KEY, 60, 10))
+
+    storage.close()
+
+    assert storage._conn is None
+    with pytest.raises(RuntimeError):
+        storage._executor.submit(lambda: None)
+
+
+def _record_many(path: str, count: int) -> int:
+    """별도 프로세스에서 요청을 기록하고 허용된 수 반환"""
+    async def run():
+        storage = SqliteStorage(path)
+        try:
+            results = [await storage.record_request(KEY, 60, 50) for _ in range(count)]
+        finally:
+            storage.close()
+        return sum(r.allowed for r in results)
+
+    return asyncio.run(run())
+
+
+def test_limit_shared_between_processes(db_path):
+    """워커 프로세스 여러 개가 동시에 요청해도 한도 전체에서 정확히 max_requests만 허용"""
+    with ProcessPoolExecutor(max_workers=3, mp_context=multiprocessing.get_context("spawn")) as pool:
+        allowed = list(pool.map(_record_many, [db_path] * 3, [40] * 3))
+
+    assert sum(allowed) == 50
+
+
+def test_get_storage_selects_sqlite_backend(monkeypatch, db_path):
+    from app.core import config as app_config
+
+    monkeypatch.setattr(app_config.settings, "RATE_LIMIT_BACKEND", "sqlite")
+    monkeypatch.setattr(app_config.settings, "RATE_LIMIT_SQLITE_PATH", db_path)
+    reset_storage()
+    try:
+        storage = get_storage()
+        assert isinstance(storage, SqliteStorage)
+        assert storage.path == db_path
+    finally:
+        reset_storage()
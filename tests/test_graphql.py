@@ -1169,3 +1169,51 @@ def test_graphql_calendar_query_todo_excluded_by_date_range(e2e_client):
     event_ids = [e["id"] for e in events]
     # deadline이 있는 Todo는 Schedule로 변환되므로, Schedule ID로 확인해야 함
     assert schedule_id_from_todo not in event_ids, "날짜 범위 밖의 Todo의 Schedule은 포함되지 않아야 합니다"
+
+
+CALENDAR_QUERY = """
+query { calendar(startDate: "2024-01-01", endDate: "2024-01-07") { days { date } } }
+"""
+
+
+@pytest.fixture
+def session_opens(monkeypatch):
+    """GraphQL 세션이 열린 위치 기록 (이벤트 루프에서 열렸으면 True)"""
+    import asyncio
+    from app.api.v1 import graphql as graphql_router
+
+    opens = []
+    original = graphql_router.read_only_session
+
+    def recording(*args, **kwargs):
+        try:
+            asyncio.get_running_loop()
+            opens.append(True)
+        except RuntimeError:
+            opens.append(False)
+        yield from original(*args, **kwargs)
+
+    monkeypatch.setattr(graphql_router, "read_only_session", recording)
+    return opens
+
+
+@pytest.mark.e2e
+def test_graphql_session_opened_in_threadpool(e2e_client, session_opens):
+    """세션은 get_context(이벤트 루프)가 아니라 resolver의 스레드풀에서 열림"""
+    response = e2e_client.post("/v1/graphql", json={"query": CALENDAR_QUERY})
+
+    assert response.status_code == 200
+    assert "errors" not in response.json()
+    assert session_opens == [False]
+
+
+@pytest.mark.e2e
+def test_graphql_unauthenticated_request_opens_no_session(e2e_client, session_opens, monkeypatch):
+    """인증 실패 요청은 세션을 열지 않음"""
+    from app.api.v1 import graphql as graphql_router
+
+    monkeypatch.setattr(graphql_router.settings, "OIDC_ENABLED", True)
+    response = e2e_client.post("/v1/graphql", json={"query": CALENDAR_QUERY})
+
+    assert response.json()["errors"]
+    assert session_opens == []
@@ -0,0 +1,95 @@
+"""
+이벤트 루프 블로킹 방지 테스트
+
+동기 DB 세션(get_db, get_db_transactional)을 사용하는 엔드포인트/의존성은
+`def`로 선언되어 FastAPI 스레드풀에서 실행되어야 합니다.
+`async def`에서 동기 세션을 사용하면 SQL 왕복마다 이벤트 루프 전체(다른 요청,
+WebSocket 연결 포함)가 멈춥니다.
+"""
+import asyncio
+import inspect
+import time
+from typing import List
+
+import httpx
+import pytest
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from app.db.session import get_db, get_db_transactional
+from app.main import app
+
+SYNC_SESSION_DEPENDENCIES = {get_db, get_db_transactional}
+
+# 동기 조회를 run_in_threadpool로 명시적으로 오프로드하는 async 엔드포인트
+OFFLOADED_ENDPOINTS = {"get_holidays"}
+
+
+def find_blocking_dependants(dependant: Dependant) -> List[str]:
+    """
+    동기 세션 의존성을 직접 사용하는 async 함수 이름 목록 반환 (재귀)
+    """
+    violations = []
+    is_async = inspect.iscoroutinefunction(dependant.call)
+    for sub in dependant.dependencies:
+        if sub.call in SYNC_SESSION_DEPENDENCIES:
+            if is_async:
+                violations.append(dependant.call.__name__)
+        else:
+            violations.extend(find_blocking_dependants(sub))
+    return violations
+
+
+class TestNoBlockingDbRoutes:
+    """동기 세션을 사용하는 async 라우트가 없는지 검증"""
+
+    def test_async_routes_do_not_use_sync_session(self):
+        violations = set()
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            if route.endpoint.__name__ in OFFLOADED_ENDPOINTS:
+                continue
+            for name in find_blocking_dependants(route.dependant):
+                violations.add(f"{route.path} -> {name}")
+
+        assert not violations, (
+            "async 함수에서 동기 DB 세션을 사용하면 이벤트 루프가 블로킹됩니다. "
+            f"def로 선언하거나 run_in_threadpool을 사용하세요: {sorted(violations)}"
+        )
+
+
+@pytest.mark.asyncio
+async def test_slow_query_does_not_stall_event_loop(e2e_client, monkeypatch):
+    """느린 쿼리가 실행되는 동안에도 이벤트 루프는 다른 작업을 처리"""
+    from app.crud import tag as tag_crud
+
+    original = tag_crud.get_all_tag_groups
+
+    def slow_get_all_tag_groups(*args, **kwargs):
+        time.sleep(0.5)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tag_crud, "get_all_tag_groups", slow_get_all_tag_groups)
+
+    max_gap = 0.0
+
+    async def ticker(stop: asyncio.Event):
+        nonlocal max_gap
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.01)
+            now = time.perf_counter()
+            max_gap = max(max_gap, now - last)
+            last = now
+
+    stop = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        tick_task = asyncio.create_task(ticker(stop))
+        response = await client.get("/v1/tags/groups")
+        stop.set()
+        await tick_task
+
+    assert response.status_code == 200
+    assert max_gap < 0.25
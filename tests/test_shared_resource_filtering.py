@@ -118,14 +118,12 @@ class TestSharedScheduleTagFiltering:
     ):
         """
         공유된 Schedule 조회 시 tag_ids 필터가 적용되어야 함
-        
-        현재 이슈: 공유된 Schedule에 tag_ids, group_ids 필터가 적용되지 않음
         """
         from app.domain.tag.service import TagService
         from app.domain.schedule.service import ScheduleService
         from app.domain.tag.schema.dto import TagGroupCreate, TagCreate
         from app.domain.schedule.schema.dto import ScheduleCreate
-        from datetime import datetime, timezone
+        from datetime import datetime, timedelta, timezone
 
         # 1. second_user가 태그 그룹과 태그 생성
         user2_tag_service = TagService(test_session, second_user)
@@ -175,15 +173,178 @@ class TestSharedScheduleTagFiltering:
         # 필터 적용 전: 2개 모두 조회되어야 함
         assert len(shared_schedules) == 2
 
-        # 이슈 검증: API 레벨에서 tag_ids 필터링이 필요함
-        # 현재 app/api/v1/schedules.py에서 공유된 Schedule에 대해
-        # tag_ids, group_ids 필터가 적용되지 않음
-        #
-        # 필요한 수정:
-        # if tag_ids:
-        #     schedule_tag_ids = {tag.id for tag in schedule.tags}
-        #     if not all(tid in schedule_tag_ids for tid in tag_ids):
-        #         continue
+        # 날짜 범위 조회는 tag_ids 필터를 SQL에서 적용
+        filtered_schedules = user1_schedule_service.get_shared_schedule_reads_by_date_range(
+            start_date=now - timedelta(days=1),
+            end_date=now + timedelta(days=1),
+            tag_ids=[tag_a.id],
+        )
+
+        assert [s.id for s in filtered_schedules] == [schedule_with_tag_a.id]
+
+
+class TestSharedScheduleDateRange:
+    """공유된 Schedule의 날짜 범위 조회 테스트"""
+
+    def _share(self, session, owner, schedule_id, level=VisibilityLevel.FRIENDS):
+        VisibilityService(session, owner).set_visibility(
+            resource_type=ResourceType.SCHEDULE,
+            resource_id=schedule_id,
+            level=level,
+        )
+
+    def test_shared_recurring_schedule_expanded_with_exceptions(
+            self, test_session, test_user, second_user, friendship
+    ):
+        """공유된 반복 일정은 범위 내 가상 인스턴스로 확장되고 예외가 반영됨"""
+        from app.domain.schedule.service import ScheduleService
+        from app.domain.schedule.schema.dto import ScheduleCreate, ScheduleUpdate
+        from datetime import datetime, timezone
+
+        owner_service = ScheduleService(test_session, second_user)
+        daily = owner_service.create_schedule(
+            ScheduleCreate(
+                title="일일 회의",
+                start_time=datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc),
+                recurrence_rule="FREQ=DAILY",
+            )
+        )
+        owner_service.update_recurring_instance(
+            daily.id, datetime(2024, 1, 9, 10, 0, tzinfo=timezone.utc), ScheduleUpdate(title="특별 회의"),
+        )
+        owner_service.delete_recurring_instance(daily.id, datetime(2024, 1, 10, 10, 0, tzinfo=timezone.utc))
+        self._share(test_session, second_user, daily.id)
+
+        schedules = ScheduleService(test_session, test_user).get_shared_schedule_reads_by_date_range(
+            start_date=datetime(2024, 1, 8, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 11, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        assert [s.start_time.day for s in schedules] == [8, 9, 11]
+        assert [s.title for s in schedules] == ["일일 회의", "특별 회의", "일일 회의"]
+        assert all(s.parent_id == daily.id for s in schedules)
+        assert all(s.owner_id == second_user.sub for s in schedules)
+
+    def test_shared_schedule_reads_carry_parent_visibility(
+            self, test_session, test_user, second_user, friendship, monkeypatch
+    ):
+        """공유된 반복 일정의 가상 인스턴스 DTO에 원본의 접근권한 레벨이 인스턴스별 조회 없이 채워짐"""
+        from app.crud import visibility as visibility_crud
+        from app.domain.schedule.service import ScheduleService
+        from app.domain.schedule.schema.dto import ScheduleCreate
+        from datetime import datetime, timezone
+
+        owner_service = ScheduleService(test_session, second_user)
+        daily = owner_service.create_schedule(
+            ScheduleCreate(
+                title="일일 회의",
+                start_time=datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc),
+                recurrence_rule="FREQ=DAILY",
+            )
+        )
+        single = owner_service.create_schedule(
+            ScheduleCreate(
+                title="전체 공개",
+                start_time=datetime(2024, 1, 9, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 9, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        self._share(test_session, second_user, daily.id)
+        self._share(test_session, second_user, single.id, level=VisibilityLevel.PUBLIC)
+
+        lookups = []
+        original = visibility_crud.get_visibility_by_resource
+        monkeypatch.setattr(
+            visibility_crud, "get_visibility_by_resource",
+            lambda *args: lookups.append(args) or original(*args),
+        )
+        reads = ScheduleService(test_session, test_user).get_shared_schedule_reads_by_date_range(
+            start_date=datetime(2024, 1, 8, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 10, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        assert lookups == []
+        assert [(r.title, r.visibility_level) for r in reads] == [
+            ("일일 회의", VisibilityLevel.FRIENDS),
+            ("전체 공개", VisibilityLevel.PUBLIC),
+            ("일일 회의", VisibilityLevel.FRIENDS),
+            ("일일 회의", VisibilityLevel.FRIENDS),
+        ]
+        assert all(r.is_shared for r in reads)
+
+    def test_shared_schedules_outside_range_or_private_excluded(
+            self, test_session, test_user, second_user, friendship
+    ):
+        """범위 밖, 비공개, 종료된 반복 일정은 제외"""
+        from app.domain.schedule.service import ScheduleService
+        from app.domain.schedule.schema.dto import ScheduleCreate
+        from datetime import datetime, timezone
+
+        owner_service = ScheduleService(test_session, second_user)
+        in_range = owner_service.create_schedule(
+            ScheduleCreate(
+                title="범위 내",
+                start_time=datetime(2024, 1, 8, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 8, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        out_of_range = owner_service.create_schedule(
+            ScheduleCreate(
+                title="범위 밖",
+                start_time=datetime(2024, 2, 1, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 2, 1, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        ended = owner_service.create_schedule(
+            ScheduleCreate(
+                title="종료된 반복",
+                start_time=datetime(2023, 12, 1, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2023, 12, 1, 10, 0, tzinfo=timezone.utc),
+                recurrence_rule="FREQ=DAILY",
+                recurrence_end=datetime(2023, 12, 31, tzinfo=timezone.utc),
+            )
+        )
+        private = owner_service.create_schedule(
+            ScheduleCreate(
+                title="비공개",
+                start_time=datetime(2024, 1, 9, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 9, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        for schedule in (in_range, out_of_range, ended):
+            self._share(test_session, second_user, schedule.id)
+        self._share(test_session, second_user, private.id, level=VisibilityLevel.PRIVATE)
+
+        schedules = ScheduleService(test_session, test_user).get_shared_schedule_reads_by_date_range(
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 31, 23, 59, 59, tzinfo=timezone.utc),
+        )
+
+        assert [s.id for s in schedules] == [in_range.id]
+
+    def test_shared_schedules_require_friendship(self, test_session, test_user, second_user):
+        """친구가 아니면 FRIENDS 레벨 일정은 조회되지 않음"""
+        from app.domain.schedule.service import ScheduleService
+        from app.domain.schedule.schema.dto import ScheduleCreate
+        from datetime import datetime, timezone
+
+        schedule = ScheduleService(test_session, second_user).create_schedule(
+            ScheduleCreate(
+                title="친구 공개",
+                start_time=datetime(2024, 1, 8, 9, 0, tzinfo=timezone.utc),
+                end_time=datetime(2024, 1, 8, 10, 0, tzinfo=timezone.utc),
+            )
+        )
+        self._share(test_session, second_user, schedule.id)
+
+        schedules = ScheduleService(test_session, test_user).get_shared_schedule_reads_by_date_range(
+            start_date=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            end_date=datetime(2024, 1, 31, tzinfo=timezone.utc),
+        )
+
+        assert schedules == []
 
 
 class TestSharedTimerTypeFiltering:
@@ -0,0 +1,272 @@
+"""
+RecurrenceCalculator Tests
+"""
+import random
+from datetime import datetime, timedelta, timezone, UTC
+
+import pytest
+from dateutil.rrule import rrulestr
+
+from app.domain.dateutil.service import format_datetime_for_rrule
+from app.utils.recurrence import RecurrenceCalculator, RRuleCache, rrule_cache
+
+
+def _expand_naive(start_time, end_time, recurrence_rule, recurrence_end, query_start, query_end):
+    """dtstart부터 순회하는 기존 방식 (비교 기준)"""
+    duration = end_time - start_time
+    rrule_str = recurrence_rule
+    if recurrence_end and "UNTIL" not in rrule_str.upper():
+        rrule_str = f"{rrule_str};UNTIL={format_datetime_for_rrule(recurrence_end)}"
+    instances = []
+    for instance_start in rrulestr(rrule_str, dtstart=start_time):
+        if instance_start > query_end:
+            break
+        if instance_start + duration < query_start:
+            continue
+        instances.append((instance_start, instance_start + duration))
+    return instances
+
+
+RULES = [
+    "FREQ=DAILY",
+    "FREQ=DAILY;INTERVAL=3",
+    "FREQ=DAILY;BYHOUR=9,18",
+    "FREQ=WEEKLY",
+    "FREQ=WEEKLY;BYDAY=MO,WE,FR",
+    "FREQ=WEEKLY;INTERVAL=2;BYDAY=TU,TH",
+    "FREQ=WEEKLY;INTERVAL=3;BYDAY=SU;WKST=SU",
+    "FREQ=MONTHLY",
+    "FREQ=MONTHLY;INTERVAL=2",
+    "FREQ=MONTHLY;BYMONTHDAY=31",
+    "FREQ=MONTHLY;BYMONTHDAY=-1",
+    "FREQ=MONTHLY;BYDAY=2TU",
+    "FREQ=MONTHLY;BYDAY=MO,FR;BYSETPOS=-1",
+    "FREQ=MONTHLY;INTERVAL=5;BYDAY=-1FR",
+    "FREQ=YEARLY",
+    "FREQ=YEARLY;INTERVAL=2",
+    "FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=29",
+    "FREQ=YEARLY;BYMONTH=3,9;BYDAY=1MO",
+    "FREQ=HOURLY;INTERVAL=7",
+    "FREQ=HOURLY;INTERVAL=5;BYHOUR=0,5,10,15,20",
+    "FREQ=MINUTELY;INTERVAL=45;BYHOUR=9,10",
+    "FREQ=DAILY;COUNT=500",
+    "FREQ=YEARLY;BYWEEKNO=1;BYDAY=MO",
+]
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_expand_recurrence_matches_full_iteration(rule):
+    """건너뛰기(seek) 결과가 dtstart부터 순회한 결과와 동일"""
+    rng = random.Random(rule)
+    for _ in range(40):
+        start_time = datetime(2020, 1, 1) + timedelta(
+            days=rng.randrange(0, 900), hours=rng.randrange(24), minutes=rng.randrange(60),
+        )
+        end_time = start_time + timedelta(minutes=rng.choice([30, 90, 60 * 26, 60 * 24 * 9]))
+        recurrence_end = rng.choice([None, start_time + timedelta(days=rng.randrange(1, 2000))])
+        query_start = start_time + timedelta(days=rng.randrange(-30, 2000), hours=rng.randrange(24))
+        query_end = query_start + timedelta(days=rng.choice([1, 7, 31, 92]))
+
+        args = (start_time, end_time, rule, recurrence_end, query_start, query_end)
+        assert RecurrenceCalculator.expand_recurrence(*args) == _expand_naive(*args), args
+
+
+def test_expand_recurrence_cost_independent_of_schedule_age():
+    """오래된 반복 일정이어도 조회 범위 이전 인스턴스를 순회하지 않음"""
+    query_start = datetime(2026, 3, 2)
+    query_end = datetime(2026, 3, 8, 23, 59, 59)
+    start_time = datetime(1990, 1, 1, 9, 0, 0)
+
+    rule = rrulestr("FREQ=DAILY", dtstart=start_time)
+    sought = RecurrenceCalculator.seek(rule, query_start)
+
+    assert sought._dtstart <= query_start
+    assert query_start - sought._dtstart < timedelta(days=1)
+
+    instances = RecurrenceCalculator.expand_recurrence(
+        start_time, start_time + timedelta(minutes=15), "FREQ=DAILY", None, query_start, query_end,
+    )
+    assert len(instances) == 7
+    assert instances[0][0] == datetime(2026, 3, 2, 9, 0, 0)
+
+
+def test_seek_keeps_rule_with_count():
+    """COUNT가 있는 규칙은 건너뛰지 않음 (건너뛴 인스턴스 수를 알 수 없음)"""
+    rule = rrulestr("FREQ=DAILY;COUNT=10", dtstart=datetime(2024, 1, 1))
+    assert RecurrenceCalculator.seek(rule, datetime(2025, 1, 1)) is rule
+
+
+def test_seek_before_dtstart_returns_same_rule():
+    """조회 시작이 dtstart 이전이면 원래 규칙 그대로 사용"""
+    rule = rrulestr("FREQ=WEEKLY", dtstart=datetime(2024, 1, 1))
+    assert RecurrenceCalculator.seek(rule, datetime(2023, 1, 1)) is rule
+
+
+@pytest.mark.parametrize("rule", ["FREQ=MONTHLY;BYDAY=2TU", "FREQ=YEARLY;BYMONTH=3,9;BYDAY=1MO"])
+def test_seek_keeps_timezone_of_aware_dtstart(rule):
+    """MONTHLY/YEARLY 건너뛰기도 aware dtstart의 타임존 유지 (naive/aware 비교 오류 없음)"""
+    tz = timezone(timedelta(hours=9))
+    dtstart = datetime(2020, 5, 12, 9, 30, tzinfo=tz)
+    seek_from = datetime(2026, 4, 1, tzinfo=UTC)
+    parsed = rrulestr(rule, dtstart=dtstart)
+
+    sought = RecurrenceCalculator.seek(parsed, seek_from)
+
+    assert sought is not parsed
+    assert sought._dtstart.tzinfo is tz
+    query_end = seek_from + timedelta(days=400)
+    assert sought.between(seek_from, query_end, inc=True) == parsed.between(seek_from, query_end, inc=True)
+
+
+# ============================================================
+# Simple rule fast path Tests
+# ============================================================
+
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+def _random_simple_rule(rng: random.Random) -> str:
+    """단순 규칙(DAILY/WEEKLY + INTERVAL/BYDAY/WKST/COUNT/UNTIL) 임의 생성"""
+    parts = [f"FREQ={rng.choice(['DAILY', 'WEEKLY'])}"]
+    if rng.random() < 0.6:
+        parts.append(f"INTERVAL={rng.randrange(1, 6)}")
+    if parts[0] == "FREQ=WEEKLY" and rng.random() < 0.8:
+        parts.append("BYDAY=" + ",".join(rng.sample(WEEKDAYS, rng.randrange(1, 8))))
+    if rng.random() < 0.4:
+        parts.append(f"WKST={rng.choice(WEEKDAYS)}")
+    bound = rng.random()
+    if bound < 0.3:
+        parts.append(f"COUNT={rng.randrange(1, 400)}")
+    elif bound < 0.6:
+        until = datetime(2020, 1, 1) + timedelta(days=rng.randrange(0, 1500), hours=rng.randrange(24))
+        parts.append(f"UNTIL={format_datetime_for_rrule(until)}")
+    return ";".join(parts)
+
+
+def test_expand_simple_matches_dateutil():
+    """단순 규칙의 산술 계산 결과가 dateutil 순회 결과와 동일 (임의 규칙/범위)"""
+    rng = random.Random(20240101)
+    for _ in range(1500):
+        rule_str = _random_simple_rule(rng)
+        dtstart = datetime(2020, 1, 1) + timedelta(
+            days=rng.randrange(0, 900), hours=rng.randrange(24),
+            minutes=rng.randrange(60), seconds=rng.randrange(60),
+        )
+        rule = rrulestr(rule_str, dtstart=dtstart)
+        seek_from = dtstart + timedelta(days=rng.randrange(-60, 1500), minutes=rng.randrange(-720, 720))
+        query_end = seek_from + timedelta(days=rng.choice([0, 1, 7, 31, 92]), minutes=rng.randrange(720))
+
+        expected = rule.between(seek_from, query_end, inc=True)
+        assert RecurrenceCalculator.expand_simple(rule, seek_from, query_end) == expected, (
+            rule_str, dtstart, seek_from, query_end,
+        )
+
+
+def test_count_simple_matches_dateutil():
+    """단순 규칙의 인스턴스 개수 계산이 dateutil 순회 결과와 동일 (임의 규칙/경계)"""
+    rng = random.Random(20240102)
+    for _ in range(1000):
+        rule_str = _random_simple_rule(rng)
+        dtstart = datetime(2020, 1, 1) + timedelta(
+            days=rng.randrange(0, 900), hours=rng.randrange(24), minutes=rng.randrange(60),
+        )
+        rule = rrulestr(rule_str, dtstart=dtstart)
+        until = dtstart + timedelta(days=rng.randrange(-3, 900), minutes=rng.randrange(-720, 720))
+
+        expected = len(rule.between(dtstart, until, inc=True))
+        assert RecurrenceCalculator.count_simple(rule, until) == expected, (rule_str, dtstart, until)
+
+
+@pytest.mark.parametrize("rule_str", [
+    "FREQ=DAILY;BYDAY=MO,TU",
+    "FREQ=DAILY;BYHOUR=9,18",
+    "FREQ=DAILY;BYHOUR=7",
+    "FREQ=WEEKLY;BYMONTHDAY=5",
+    "FREQ=WEEKLY;BYMONTH=3",
+    "FREQ=WEEKLY;BYDAY=MO,FR;BYSETPOS=1",
+    "FREQ=MONTHLY",
+    "FREQ=HOURLY",
+])
+def test_expand_simple_falls_back_for_other_rules(rule_str):
+    """단순 규칙이 아니면 None (dateutil로 처리)"""
+    rule = rrulestr(rule_str, dtstart=datetime(2024, 1, 1, 10, 0, 0))
+    assert RecurrenceCalculator.expand_simple(rule, datetime(2024, 2, 1), datetime(2024, 3, 1)) is None
+
+
+def test_expand_simple_does_not_iterate_rule():
+    """단순 규칙은 dateutil 제너레이터를 거치지 않음"""
+    rule = rrulestr("FREQ=WEEKLY;BYDAY=MO,WE,FR", dtstart=datetime(1990, 1, 1, 9, 0, 0))
+    rule._iter = None  # 순회하면 TypeError
+
+    instances = RecurrenceCalculator.expand_simple(
+        rule, datetime(2026, 3, 2), datetime(2026, 3, 8, 23, 59, 59),
+    )
+    assert instances == [
+        datetime(2026, 3, 2, 9, 0, 0),
+        datetime(2026, 3, 4, 9, 0, 0),
+        datetime(2026, 3, 6, 9, 0, 0),
+    ]
+
+
+# ============================================================
+# RRuleCache Tests
+# ============================================================
+
+def test_rrule_cache_hit_and_miss():
+    """같은 (rule, dtstart, recurrence_end)는 한 번만 파싱"""
+    cache = RRuleCache(maxsize=8)
+    dtstart = datetime(2024, 1, 1, 9, 0, 0)
+
+    first = cache.get("FREQ=DAILY", dtstart)
+    second = cache.get("FREQ=DAILY", dtstart)
+    other = cache.get("FREQ=DAILY", dtstart, datetime(2024, 2, 1))
+
+    assert first is second
+    assert other is not first
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 2, "maxsize": 8}
+
+
+def test_rrule_cache_evicts_least_recently_used():
+    """최대 크기를 넘으면 가장 오래 사용되지 않은 규칙부터 제거"""
+    cache = RRuleCache(maxsize=2)
+    dtstart = datetime(2024, 1, 1)
+
+    daily = cache.get("FREQ=DAILY", dtstart)
+    cache.get("FREQ=WEEKLY", dtstart)
+    cache.get("FREQ=DAILY", dtstart)  # DAILY를 최근 사용으로 갱신
+    cache.get("FREQ=MONTHLY", dtstart)  # WEEKLY 제거
+
+    assert cache.get("FREQ=DAILY", dtstart) is daily
+    assert cache.stats()["size"] == 2
+    cache.get("FREQ=WEEKLY", dtstart)
+    assert cache.stats()["misses"] == 4
+
+
+def test_rrule_cache_applies_recurrence_end_as_until():
+    """recurrence_end가 UNTIL로 반영됨"""
+    cache = RRuleCache(maxsize=8)
+    rule = cache.get("FREQ=DAILY", datetime(2024, 1, 1), datetime(2024, 1, 3, 23, 59, 59))
+    assert list(rule) == [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)]
+
+
+def test_rrule_cache_does_not_store_parse_failures():
+    """파싱 실패는 예외로 전달되고 캐시에 저장되지 않음"""
+    cache = RRuleCache(maxsize=8)
+    with pytest.raises(ValueError):
+        cache.get("INVALID_RRULE", datetime(2024, 1, 1))
+    assert cache.stats()["size"] == 0
+
+
+def test_is_valid_rrule_warms_cache_for_expansion():
+    """실제 dtstart로 검증하면 이후 확장에서 파싱 결과를 재사용"""
+    rrule_cache.clear()
+    start_time = datetime(2024, 1, 1, 9, 0, 0)
+
+    assert RecurrenceCalculator.is_valid_rrule("FREQ=WEEKLY;BYDAY=MO", start_time)
+    RecurrenceCalculator.expand_recurrence(
+        start_time, start_time + timedelta(hours=1), "FREQ=WEEKLY;BYDAY=MO", None,
+        datetime(2024, 3, 1), datetime(2024, 3, 31),
+    )
+
+    assert rrule_cache.stats()["hits"] == 1
+    assert rrule_cache.stats()["misses"] == 1
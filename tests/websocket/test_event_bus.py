@@ -0,0 +1,305 @@
+"""
+WebSocket 이벤트 버스 테스트
+
+워커(ConnectionManager)마다 자기 연결만 가지고 있을 때, send_to_user/broadcast_to_friends가
+버스로 한 번 발행되어 다른 워커의 연결에도 정확히 한 번 전달되는지 검증한다.
+멀티 프로세스 테스트는 SQLite 버스로 실제 워커 프로세스 간 중복 제거와 전달 지연을 측정한다.
+"""
+import asyncio
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import pytest_asyncio
+
+from app.websocket.bus import BusEvent, InProcessBus, PostgresBus, SqliteBus, create_event_bus
+from app.websocket.bus import postgres as postgres_bus
+from app.websocket.manager import ConnectionManager
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.sent: list[str] = []
+        self.received_at: list[float] = []
+
+    async def send_text(self, text: str) -> None:
+        self.received_at.append(time.time())
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        pass
+
+
+async def _connect(manager: ConnectionManager, user_id: str, devices: int = 1) -> list[_FakeWebSocket]:
+    sockets = [_FakeWebSocket() for _ in range(devices)]
+    for ws in sockets:
+        await manager.connect(ws, user_id)
+    return sockets
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met before timeout")
+        await asyncio.sleep(0.005)
+
+
+@pytest_asyncio.fixture
+async def workers():
+    """같은 InProcessBus를 구독한 워커 두 개"""
+    bus = InProcessBus()
+    worker_a, worker_b = ConnectionManager(), ConnectionManager()
+    await worker_a.start_bus(bus)
+    await worker_b.start_bus(bus)
+    yield worker_a, worker_b
+    await worker_a.stop_bus()
+    await worker_b.stop_bus()
+
+
+@pytest.mark.asyncio
+async def test_send_to_user_reaches_other_worker(workers):
+    worker_a, worker_b = workers
+    phone = await _connect(worker_a, "me")
+    laptop = await _connect(worker_b, "me")
+
+    sent = await worker_a.send_to_user("me", '{"type":"timer.paused"}')
+    await worker_a.flush()
+    await worker_b.flush()
+
+    assert sent == 1  # 이 워커의 연결 수
+    assert phone[0].sent == ['{"type":"timer.paused"}']
+    assert laptop[0].sent == ['{"type":"timer.paused"}']
+
+
+@pytest.mark.asyncio
+async def test_exclude_websocket_applies_only_to_sender(workers):
+    worker_a, worker_b = workers
+    sender = await _connect(worker_a, "me")
+    other_device = await _connect(worker_b, "me")
+
+    await worker_a.send_to_user("me", "{}", exclude_websocket=sender[0])
+    await worker_b.flush()
+
+    assert sender[0].sent == []
+    assert other_device[0].sent == ["{}"]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_friends_on_every_worker_once(workers):
+    worker_a, worker_b = workers
+    local_friend = await _connect(worker_a, "friend-1", devices=2)
+    remote_friend = await _connect(worker_b, "friend-2", devices=3)
+
+    await worker_a.broadcast_to_friends(["friend-1", "friend-2", "offline"], "{}")
+    await worker_a.flush()
+    await worker_b.flush()
+
+    assert [ws.sent for ws in local_friend] == [["{}"]] * 2
+    assert [ws.sent for ws in remote_friend] == [["{}"]] * 3
+
+
+@pytest.mark.asyncio
+async def test_duplicate_events_are_suppressed():
+    bus = InProcessBus()
+    publisher, receiver = ConnectionManager(), ConnectionManager()
+    await receiver.start_bus(bus)
+    sockets = await _connect(receiver, "me")
+    event = BusEvent(id=f"{publisher.worker_id}:0", origin=publisher.worker_id, user_ids=("me",), text="{}")
+
+    await bus.publish(event)
+    await bus.publish(event)
+    await receiver.flush()
+
+    assert sockets[0].sent == ["{}"]
+    assert receiver.duplicate_events == 1
+
+
+@pytest.mark.asyncio
+async def test_own_events_are_ignored():
+    """발행 워커는 로컬에 이미 전달했으므로 버스에서 돌아온 자기 이벤트는 무시"""
+    bus = InProcessBus()
+    manager = ConnectionManager()
+    await manager.start_bus(bus)
+    sockets = await _connect(manager, "me")
+
+    await manager.send_to_user("me", "{}")
+    await manager._on_bus_event(
+        BusEvent(id=f"{manager.worker_id}:0", origin=manager.worker_id, user_ids=("me",), text="{}")
+    )
+    await manager.flush()
+
+    assert sockets[0].sent == ["{}"]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bus_delivers_in_order(tmp_path):
+    path = str(tmp_path / "ws_events.db")
+    worker_a, worker_b = ConnectionManager(), ConnectionManager()
+    await worker_a.start_bus(SqliteBus(path, poll_interval=0.005))
+    await worker_b.start_bus(SqliteBus(path, poll_interval=0.005))
+    try:
+        sockets = await _connect(worker_b, "me")
+        texts = [json.dumps({"seq": i}) for i in range(50)]
+        for text in texts:
+            await worker_a.send_to_user("me", text)
+
+        await _wait_for(lambda: len(sockets[0].sent) == len(texts))
+        assert sockets[0].sent == texts
+    finally:
+        await worker_a.stop_bus()
+        await worker_b.stop_bus()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_bus_close_shuts_down_thread(tmp_path):
+    bus = SqliteBus(str(tmp_path / "ws_events.db"), poll_interval=0.005)
+    manager = ConnectionManager()
+    await manager.start_bus(bus)
+
+    await manager.stop_bus()
+
+    assert bus._conn is None
+    with pytest.raises(RuntimeError):
+        bus._executor.submit(lambda: None)
+
+
+class _FakePostgres:
+    """LISTEN/NOTIFY만 흉내 내는 서버 (같은 채널 리스너 모두에게 전달)"""
+
+    def __init__(self):
+        self.listeners: dict[str, list] = {}
+
+    async def connect(self, dsn):
+        return _FakePgConnection(self)
+
+
+class _FakePgConnection:
+    def __init__(self, server: _FakePostgres):
+        self.server = server
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.server.listeners.setdefault(channel, []).append(callback)
+
+    async def remove_listener(self, channel, callback):
+        self.server.listeners[channel].remove(callback)
+
+    def add_termination_listener(self, callback):
+        pass
+
+    async def execute(self, query, channel, payload):
+        assert "pg_notify" in query
+        for callback in self.server.listeners.get(channel, []):
+            callback(self, 1, channel, payload)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_postgres_bus_uses_listen_notify(monkeypatch):
+    server = _FakePostgres()
+    monkeypatch.setattr(postgres_bus.asyncpg, "connect", server.connect)
+    worker_a, worker_b = ConnectionManager(), ConnectionManager()
+    bus_a = PostgresBus("postgresql+asyncpg://localhost/app", channel="ws_test")
+    await worker_a.start_bus(bus_a)
+    await worker_b.start_bus(PostgresBus("postgresql://localhost/app", channel="ws_test"))
+    try:
+        sockets = await _connect(worker_b, "friend")
+        await worker_a.broadcast_to_friends(["friend"], "{}")
+        await worker_a.broadcast_to_friends(["friend"], "x" * postgres_bus.NOTIFY_MAX_BYTES)
+
+        await _wait_for(lambda: sockets[0].sent == ["{}"])
+        assert bus_a.dsn == "postgresql://localhost/app"
+        assert bus_a.stats()["oversized"] == 1
+    finally:
+        await worker_a.stop_bus()
+        await worker_b.stop_bus()
+    assert server.listeners["ws_test"] == []
+
+
+@pytest.mark.parametrize(
+    "backend, expected",
+    [("memory", InProcessBus), ("sqlite", SqliteBus), ("postgres", PostgresBus)],
+)
+def test_create_event_bus_selects_backend(monkeypatch, backend, expected):
+    from app.core import config as app_config
+
+    monkeypatch.setattr(app_config.settings, "WS_EVENT_BUS", backend)
+
+    assert isinstance(create_event_bus(), expected)
+
+
+def _bus_worker(path: str, index: int, workers: int, barrier, count: int) -> dict:
+    """워커 프로세스: 자기 사용자 연결 2개를 두고 모든 사용자에게 count번 브로드캐스트"""
+    async def run():
+        manager = ConnectionManager()
+        bus = SqliteBus(path, poll_interval=0.005)
+        await manager.start_bus(bus)
+        sockets = await _connect(manager, f"user-{index}", devices=2)
+        await asyncio.get_running_loop().run_in_executor(None, barrier.wait)  # 모든 워커 구독 완료
+
+        users = [f"user-{i}" for i in range(workers)]
+        for seq in range(count):
+            await manager.broadcast_to_friends(users, json.dumps({"from": index, "seq": seq, "at": time.time()}))
+            await asyncio.sleep(0.001)
+        # 같은 이벤트를 두 번 발행 (재전송으로 인한 중복 흉내)
+        duplicate = BusEvent(
+            id=f"{manager.worker_id}:retry",
+            origin=manager.worker_id,
+            user_ids=tuple(users),
+            text=json.dumps({"from": index, "seq": "retry", "at": time.time()}),
+        )
+        await bus.publish(duplicate)
+        await bus.publish(duplicate)
+
+        expected = workers * count + (workers - 1)
+        try:
+            await _wait_for(lambda: all(len(ws.sent) >= expected for ws in sockets), timeout=20)
+            await asyncio.sleep(0.1)  # 늦게 도착하는 중복이 없는지 확인
+        finally:
+            await manager.stop_bus()
+
+        latencies = []
+        for ws in sockets:
+            for text, received_at in zip(ws.sent, ws.received_at):
+                message = json.loads(text)
+                if message["from"] != index:
+                    latencies.append(received_at - message["at"])
+        return {
+            "received": [len(ws.sent) for ws in sockets],
+            "unique": [len({(m["from"], m["seq"]) for m in map(json.loads, ws.sent)}) for ws in sockets],
+            "duplicates": manager.duplicate_events,
+            "latencies": latencies,
+        }
+
+    return asyncio.run(run())
+
+
+def test_multi_process_delivery_is_exactly_once(tmp_path):
+    """워커 프로세스 3개: 모든 메시지가 모든 연결에 정확히 한 번 도착하고 지연이 폴링 주기 수준인지 측정"""
+    workers, count = 3, 30
+    path = str(tmp_path / "ws_events.db")
+    context = multiprocessing.get_context("spawn")
+    with context.Manager() as sync, ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        barrier = sync.Barrier(workers)
+        results = list(pool.map(
+            _bus_worker, [path] * workers, range(workers), [workers] * workers, [barrier] * workers, [count] * workers,
+        ))
+
+    expected = workers * count + (workers - 1)
+    for result in results:
+        assert result["received"] == [expected, expected]
+        assert result["unique"] == [expected, expected]
+        assert result["duplicates"] == workers - 1
+
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    assert len(latencies) == workers * 2 * (expected - count)
+    p95 = latencies[int(len(latencies) * 0.95)]
+    assert p95 < 0.5, f"p95 cross-worker latency {p95 * 1000:.1f} ms"
@@ -0,0 +1,225 @@
+"""
+ConnectionManager 전송 테스트
+
+브로드캐스트 시 메시지를 한 번만 인코딩해 모든 연결에 같은 텍스트를 보내는지,
+발신 연결 제외와 전송 실패 처리, 연결별 송신 큐(느린 연결 격리, 넘침 정책)를 검증한다.
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.websocket.base import WSServerMessage
+from app.websocket.manager import ConnectionManager
+from app.websocket.sender import OVERFLOW_CLOSE_CODE
+
+
+class _FakeWebSocket:
+    def __init__(self, fail: bool = False, delay: float = 0):
+        self.sent: list[str] = []
+        self.fail = fail
+        self.delay = delay  # 느린 네트워크 흉내 (전송마다 대기)
+        self.close_code: int | None = None
+
+    async def send_text(self, text: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("closed")
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        self.close_code = code
+
+
+@pytest.fixture
+def manager():
+    return ConnectionManager()
+
+
+@pytest.fixture
+def queue_settings(monkeypatch):
+    from app.core import config as app_config
+
+    def configure(size: int, policy: str):
+        monkeypatch.setattr(app_config.settings, "WS_SEND_QUEUE_SIZE", size)
+        monkeypatch.setattr(app_config.settings, "WS_SEND_OVERFLOW_POLICY", policy)
+
+    return configure
+
+
+@pytest.fixture
+def message():
+    return WSServerMessage(type="timer.friend_activity", payload={"action": "start"}, from_user="me")
+
+
+async def _connect(manager, user_id, count, fail=False):
+    sockets = [_FakeWebSocket(fail) for _ in range(count)]
+    for ws in sockets:
+        await manager.connect(ws, user_id)
+    return sockets
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once(manager, message):
+    friends = {f"friend-{i}": await _connect(manager, f"friend-{i}", 3) for i in range(5)}
+
+    with patch.object(WSServerMessage, "to_json", autospec=True, side_effect=WSServerMessage.to_json) as to_json:
+        sent = await manager.broadcast_to_friends([*friends, "offline"], message)
+    await manager.flush()
+
+    assert sent == 15
+    assert to_json.call_count == 1
+    texts = {text for sockets in friends.values() for ws in sockets for text in ws.sent}
+    assert texts == {message.to_json()}
+
+
+@pytest.mark.asyncio
+async def test_send_to_user_excludes_sender_and_encodes_once(manager, message):
+    sender, *others = await _connect(manager, "me", 3)
+
+    with patch.object(WSServerMessage, "to_json", autospec=True, side_effect=WSServerMessage.to_json) as to_json:
+        sent = await manager.send_to_user("me", message, exclude_websocket=sender)
+    await manager.flush()
+
+    assert sent == 2
+    assert to_json.call_count == 1
+    assert sender.sent == []
+    assert all(ws.sent == [message.to_json()] for ws in others)
+
+
+@pytest.mark.asyncio
+async def test_pre_encoded_text_sent_as_is(manager, message):
+    sockets = await _connect(manager, "friend", 2)
+    encoded = message.to_json()
+
+    with patch.object(WSServerMessage, "to_json") as to_json:
+        assert await manager.broadcast_to_friends(["friend"], encoded) == 2
+        assert await manager.send_to_websocket(sockets[0], encoded) is True
+    await manager.flush()
+
+    to_json.assert_not_called()
+    assert sockets[0].sent == [encoded, encoded]
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_does_not_stop_broadcast(manager, message):
+    broken = await _connect(manager, "friend-1", 1, fail=True)
+    healthy = await _connect(manager, "friend-2", 1)
+
+    await manager.broadcast_to_friends(["friend-1", "friend-2"], message)
+    await manager.flush()
+
+    assert broken[0].sent == []
+    assert healthy[0].sent == [message.to_json()]
+    # 전송에 실패한 연결은 송신을 멈추고 이후 브로드캐스트에서 제외
+    assert await manager.broadcast_to_friends(["friend-1", "friend-2"], message) == 1
+
+
+@pytest.mark.asyncio
+async def test_no_online_targets(manager, message):
+    assert await manager.broadcast_to_friends(["offline"], message) == 0
+    assert await manager.send_to_user("offline", message) == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_socket_does_not_block_broadcast(manager, message):
+    """느린 연결이 있어도 브로드캐스트는 네트워크를 기다리지 않고, 다른 연결은 먼저 받음"""
+    slow = await _connect(manager, "slow-friend", 1)
+    slow[0].delay = 0.2
+    fast = await _connect(manager, "fast-friend", 3)
+
+    started = time.perf_counter()
+    for _ in range(3):
+        assert await manager.broadcast_to_friends(["slow-friend", "fast-friend"], message) == 4
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.05
+    await asyncio.sleep(0.01)
+    assert all(len(ws.sent) == 3 for ws in fast)
+    assert slow[0].sent == []
+
+    await manager.flush()
+    assert len(slow[0].sent) == 3
+
+
+@pytest.mark.asyncio
+async def test_messages_keep_order_per_connection(manager):
+    sockets = await _connect(manager, "me", 1)
+    sockets[0].delay = 0.001
+    messages = [WSServerMessage(type="timer.updated", payload={"seq": i}) for i in range(20)]
+
+    for i, msg in enumerate(messages):
+        if i % 2:
+            await manager.send_to_user("me", msg)
+        else:
+            await manager.send_to_websocket(sockets[0], msg)
+    await manager.flush()
+
+    assert sockets[0].sent == [msg.to_json() for msg in messages]
+
+
+@pytest.mark.asyncio
+async def test_overflow_disconnects_slow_consumer(manager, message, queue_settings):
+    queue_settings(2, "disconnect")
+    slow = await _connect(manager, "slow-friend", 1)
+    slow[0].delay = 10
+    fast = await _connect(manager, "fast-friend", 1)
+
+    results = []
+    for _ in range(5):
+        results.append(await manager.broadcast_to_friends(["slow-friend", "fast-friend"], message))
+        await asyncio.sleep(0.001)  # writer 태스크 진행 (빠른 연결은 바로 비워짐)
+
+    # 1건은 전송 중, 2건은 큐에 대기, 4번째에서 넘쳐 연결 종료
+    assert results == [2, 2, 2, 1, 1]
+    assert slow[0].close_code == OVERFLOW_CLOSE_CODE
+    await manager.flush()
+    assert len(fast[0].sent) == 5
+
+    # 엔드포인트가 disconnect로 등록 해제
+    await manager.disconnect(slow[0])
+    assert manager.get_user_connection_count("slow-friend") == 0
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_oldest(manager, queue_settings):
+    queue_settings(2, "drop_oldest")
+    sockets = await _connect(manager, "me", 1)
+    release = asyncio.Event()
+    sent = sockets[0].sent
+
+    async def blocked_send(text):
+        await release.wait()
+        sent.append(text)
+
+    sockets[0].send_text = blocked_send
+    messages = [WSServerMessage(type="timer.updated", payload={"seq": i}) for i in range(6)]
+    for msg in messages[:1]:
+        await manager.send_to_user("me", msg)
+    await asyncio.sleep(0)  # 첫 메시지는 writer가 꺼내 전송 중
+    for msg in messages[1:]:
+        assert await manager.send_to_user("me", msg) == 1
+
+    release.set()
+    await manager.flush()
+
+    # 큐(2칸)에는 가장 최근 두 메시지만 남음
+    assert sent == [messages[0].to_json(), messages[4].to_json(), messages[5].to_json()]
+    assert manager._senders[sockets[0]].dropped == 3
+    assert sockets[0].close_code is None
+
+
+@pytest.mark.asyncio
+async def test_disconnect_stops_writer(manager, message):
+    sockets = await _connect(manager, "me", 1)
+    sockets[0].delay = 10
+    await manager.send_to_user("me", message)
+    await manager.send_to_user("me", message)
+
+    await manager.disconnect(sockets[0])
+    await asyncio.wait_for(manager.flush(), timeout=1)
+
+    assert sockets[0].sent == []
+    assert await manager.send_to_user("me", message) == 0